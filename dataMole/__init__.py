@@ -5,3 +5,6 @@ rootdir = os.getcwd()
 cwdName = os.path.basename(os.path.normpath(rootdir))
 if cwdName == 'docs':
     rootdir = os.path.join(rootdir, '..')
+if not os.path.isdir(os.path.join(rootdir, 'dataMole')):
+    # Package is used outside the project folder (e.g. from command line)
+    rootdir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+#
+# Author:       Alessandro Zangari (alessandro.zangari.code@outlook.com)
+# Copyright:    © Copyright 2020 Alessandro Zangari, Università degli Studi di Padova
+# License:      GPL-3.0-or-later
+# Date:         2020-10-04
+# Version:      1.0
+#
+# This file is part of DataMole.
+#
+# DataMole is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# DataMole is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with DataMole.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Command line interface to run saved pipelines without the graphical interface.
+
+Usage: ``dataMole run flow.pickle --input name=file.csv --output name=out.parquet``
+"""
+
+import argparse
+import sys
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from dataMole import exceptions as exp, flogging
+
+
+def _parseAssignments(values: Optional[List[str]]) -> Dict[str, str]:
+    """ Parses a list of strings in the form 'name=path' """
+    result: Dict[str, str] = dict()
+    for v in values or list():
+        name, sep, path = v.partition('=')
+        if not sep or not name or not path:
+            raise argparse.ArgumentTypeError('Expected "name=file", got "{}"'.format(v))
+        result[name] = path
+    return result
+
+
+def buildParser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='dataMole', description='dataMole pipeline runner')
+    commands = parser.add_subparsers(dest='command', required=True)
+    run = commands.add_parser('run', help='execute a pipeline saved with the graphical interface')
+    run.add_argument('flow', help='pickle file with the saved pipeline')
+    run.add_argument('-i', '--input', action='append', metavar='NAME=FILE',
+                     help='load a frame used by input operations (csv, pickle, parquet or feather)')
+    run.add_argument('-o', '--output', action='append', metavar='NAME=FILE',
+                     help='write a frame set by output operations (csv, pickle, parquet or feather)')
+    run.add_argument('-w', '--workers', type=int, default=None,
+                     help='maximum number of operations executed concurrently')
+    run.add_argument('-m', '--max-memory', type=int, default=None, metavar='MB',
+                     help='memory budget for intermediate results in megabytes')
+    run.add_argument('-p', '--processes', action='store_true',
+                     help='execute operations in a pool of WORKERS processes')
+    run.add_argument('--partitions', type=int, default=1, metavar='N',
+                     help='split tall inputs of row-local operations in up to N partitions of rows, '
+                          'which are executed concurrently')
+    run.add_argument('-c', '--chunksize', type=int, default=None, metavar='ROWS',
+                     help='read csv inputs in chunks of ROWS rows and stream them through '
+                          'operations which support it')
+    run.add_argument('--frozen', action='store_true',
+                     help='reuse the parameters fitted by operations when the flow was saved, '
+                          'instead of fitting them on the input data')
+    run.add_argument('-s', '--save', metavar='FILE', default=None,
+                     help='save the flow with the fitted parameters after the execution')
+    run.add_argument('--log', action='store_true', help='write the operation log in "logs/graph"')
+    return parser
+
+
+def run(args: argparse.Namespace) -> int:
+    # Import here to avoid loading operations when only printing help
+    from dataMole.flow.executor import FlowExecutor
+    from dataMole.flow.runner import PipelineRunner, loadFlow, loadLayout, saveFlow
+
+    try:
+        inputs = _parseAssignments(args.input)
+        outputs = _parseAssignments(args.output)
+    except argparse.ArgumentTypeError as e:
+        print(str(e), file=sys.stderr)
+        return 2
+    maxMemory = args.max_memory * 1024 * 1024 if args.max_memory else None
+    try:
+        graph = loadFlow(args.flow)
+        if args.frozen:
+            graph.freeze()
+        runner = PipelineRunner(graph, executor=FlowExecutor(maxWorkers=args.workers,
+                                                             maxMemory=maxMemory,
+                                                             processes=args.processes,
+                                                             partitions=args.partitions))
+        if args.log:
+            logger = flogging.setUpLogger(name='graph', folder='graph', fmt='%(message)s',
+                                          level=flogging.INFO)
+            logger.info('OPERATION LOG')
+            logger.info('Execution time: {}\n'.format(datetime.now()))
+            runner.graphLogger = flogging.GraphOperationLogger(logger)
+        runner.run(inputs, outputs, chunksize=args.chunksize)
+        if args.save:
+            saveFlow(graph, args.save, loadLayout(args.flow))
+    except exp.GException as e:
+        print('{}: {}'.format(e.title, e.message), file=sys.stderr)
+        return 1
+    except (OSError, ValueError) as e:
+        print(str(e), file=sys.stderr)
+        return 1
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = buildParser().parse_args(argv)
+    if args.command == 'run':
+        return run(args)
+    return 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
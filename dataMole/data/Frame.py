@@ -22,7 +22,8 @@
 # You should have received a copy of the GNU General Public License
 # along with DataMole.  If not, see <https://www.gnu.org/licenses/>.
 
-from typing import List, Union, Iterable, Dict
+import re
+from typing import List, Union, Iterable, Dict, Any, Hashable, Tuple
 
 import numpy as np
 import pandas as pd
@@ -54,9 +55,99 @@ def integerToFloat(df: pd.DataFrame) -> pd.DataFrame:
     return r
 
 
+def _columnValues(values: Any, index: pd.Index) -> Any:
+    """ Returns the array of values of a column without copying it. Series are aligned to the
+    index. Integer values are converted to float, as done in the constructor of Frame """
+    if isinstance(values, pd.Series):
+        if not values.index.equals(index):
+            values = values.reindex(index)
+        values = values.array
+    elif not isinstance(values, (np.ndarray, pd.api.extensions.ExtensionArray)):
+        values = pd.Series(values, index=index).array
+    if isinstance(values, (pd.arrays.PandasArray, pd.arrays.TimedeltaArray)) or \
+            (isinstance(values, pd.arrays.DatetimeArray) and values.tz is None):
+        # Numpy backed arrays
+        values = values.to_numpy()
+    if isinstance(values, np.ndarray) and values.dtype.kind in 'iu':
+        values = values.astype(np.float)
+    if len(values) != len(index):
+        raise ValueError('Column length {:d} does not match frame length {:d}'.format(len(values),
+                                                                                   len(index)))
+    return values
+
+
+def _pandasVersion() -> Tuple[int, ...]:
+    return tuple(int(v) for v in re.findall(r'\d+', pd.__version__)[:2])
+
+
+# Blocks are shared using pandas internals, whose interface is known only for these versions
+SHARE_BLOCKS: bool = (1, 0) <= _pandasVersion() < (1, 1)
+
+
+def _assembleFrame(df: pd.DataFrame, columns: pd.Index, sources: List[Any]) -> pd.DataFrame:
+    """
+    Builds a dataframe with the same index of 'df' and the specified columns, sharing data with
+    'df' where possible. Pandas keeps columns with the same type in a single 2D block, so a block of
+    'df' can be shared only if all its columns are kept unchanged. Other columns are copied when
+    pandas consolidates the blocks of the new frame. If blocks cannot be shared with the installed
+    version of pandas (see :data:`SHARE_BLOCKS`) every column is copied
+
+    :param df: the source dataframe
+    :param columns: the column index of the new frame
+    :param sources: for every column either the integer position of a column of 'df' to take, or a
+        numpy/pandas array with the new values
+
+    :return: the new dataframe
+    """
+    if SHARE_BLOCKS:
+        return _assembleBlocks(df, columns, sources)
+    index = df.index
+    series = [df.iloc[:, src] if isinstance(src, int) else pd.Series(src, index=index)
+              for src in sources]
+    result = pd.concat(series, axis=1) if series else pd.DataFrame(index=index)
+    result.columns = columns
+    return result
+
+
+def _assembleBlocks(df: pd.DataFrame, columns: pd.Index, sources: List[Any]) -> pd.DataFrame:
+    """ Implementation of :func:`_assembleFrame` which shares blocks of 'df' """
+    from pandas.core.internals import BlockManager, make_block
+    index = df.index
+    # Map every source column to its position in the new frame
+    taken: Dict[int, List[int]] = dict()
+    for j, src in enumerate(sources):
+        if isinstance(src, int):
+            taken.setdefault(src, list()).append(j)
+    blocks = list()
+    used: set = set()
+    for block in df._data.blocks:
+        locs = block.mgr_locs.as_array.tolist()
+        if all(len(taken.get(p, ())) == 1 for p in locs):
+            # Every column of the block is kept: share the block
+            placement = [taken[p][0] for p in locs]
+            blocks.append(block.make_block_same_class(block.values, placement=placement))
+            used.update(placement)
+    for j, src in enumerate(sources):
+        if j in used:
+            continue
+        values = _columnValues(df.iloc[:, src], index) if isinstance(src, int) else src
+        if isinstance(values, np.ndarray):
+            values = values.reshape(1, -1)
+        blocks.append(make_block(values, placement=[j], ndim=2))
+    mgr = BlockManager(blocks, [columns, index])
+    # Single column blocks are merged with blocks of the same type
+    mgr._consolidate_inplace()
+    return pd.DataFrame(mgr)
+
+
 class Frame:
     """
-    Interface for common dataframe operations
+    Interface for common dataframe operations.
+
+    Frames returned by :func:`replaceColumns` and :func:`withColumns` share unchanged data with the
+    original frame. Since the sharing is not visible to pandas, the raw dataframe
+    returned by :func:`getRawFrame` must never be modified in place. Use :func:`__setitem__` and
+    :func:`__delitem__` instead, which copy the data before writing if it is shared
     """
 
     def __init__(self, data: Union[pd.DataFrame, pd.Series, Iterable, Dict, None] = None):
@@ -68,10 +159,71 @@ class Frame:
             self.__df: pd.DataFrame = pd.DataFrame(data)
         # For simplicity every int column is treated as float
         self.__df = integerToFloat(self.__df)
+        # True if the data may be shared with some other frame
+        self.__shared: bool = False
 
     def getRawFrame(self) -> pd.DataFrame:
+        """ Returns the wrapped pandas dataframe. It must not be modified in place """
         return self.__df
 
+    def __detach(self) -> None:
+        """ Copies the dataframe if its data is shared with other frames (copy-on-write) """
+        if self.__shared:
+            self.__df = self.__df.copy(deep=True)
+            self.__shared = False
+
+    def __share(self, df: pd.DataFrame) -> 'Frame':
+        """ Wraps a dataframe which shares data with this frame """
+        f = Frame(df)
+        f.__shared = True
+        self.__shared = True
+        return f
+
+    def replaceColumns(self, columns: Dict[int, Any]) -> 'Frame':
+        """
+        Creates a new frame replacing some columns. Other columns are shared with this frame
+        without copying them, unless they are stored in the same pandas block of a replaced column
+
+        :param columns: dictionary { column position: new values }. Values can be a Series (it
+            will be aligned to the frame index), a numpy array or a pandas array
+
+        :return: the new frame
+
+        """
+        df = self.__df
+        sources = [_columnValues(columns[i], df.index) if i in columns else i
+                   for i in range(df.shape[1])]
+        return self.__share(_assembleFrame(df, df.columns, sources))
+
+    def withColumns(self, columns: Dict[Hashable, Any], drop: Iterable[Hashable] = tuple()) \
+            -> 'Frame':
+        """
+        Creates a new frame setting some columns by name, like 'df[name] = values'. Existing
+        columns are replaced in place, new ones are appended. Other columns are shared with this
+        frame as in :func:`replaceColumns`
+
+        :param columns: dictionary { column name: new values }. Values are as in
+            :func:`replaceColumns`
+        :param drop: names of columns to remove before setting new ones
+
+        :return: the new frame
+
+        """
+        df = self.__df
+        drop = set(drop)
+        names = list()
+        sources = list()
+        for i, name in enumerate(df.columns):
+            if name in drop:
+                continue
+            names.append(name)
+            sources.append(_columnValues(columns[name], df.index) if name in columns else i)
+        for name, v in columns.items():
+            if name not in names:
+                names.append(name)
+                sources.append(_columnValues(v, df.index))
+        return self.__share(_assembleFrame(df, pd.Index(names), sources))
+
     @property
     def nRows(self) -> int:
         return self.__df.shape[0]
@@ -80,6 +232,15 @@ class Frame:
     def nColumns(self) -> int:
         return self.__df.shape[1]
 
+    def memoryUsage(self, deep: bool = False) -> int:
+        """
+        Returns the memory used by the dataframe in bytes, index included
+
+        :param deep: if True the memory used by object columns is computed exactly, which is slow.
+            Otherwise it is estimated
+        """
+        return int(self.__df.memory_usage(index=True, deep=deep).sum())
+
     @staticmethod
     def fromShape(s: Shape) -> 'Frame':
         """ Produces a 'dummy' dataframe with a specified shape and 5 rows """
@@ -117,12 +278,14 @@ class Frame:
         return Frame(df)
 
     def __setitem__(self, key, value):
+        self.__detach()
         if isinstance(value, Frame):
             self.__df.__setitem__(key, value.__df)
         else:
             self.__df.__setitem__(key, value)
 
     def __delitem__(self, key):
+        self.__detach()
         self.__df.__delitem__(key)
 
     def __eq__(self, other: 'Frame') -> bool:
@@ -152,7 +315,7 @@ class Frame:
         elif isinstance(new_values, list) and len(self.colnames) == len(new_values):
             new_df = self.__df.copy(deep=False)
             new_df.columns = new_values
-            return Frame(new_df)
+            return self.__share(new_df)
         else:
             raise ValueError('Wrong input argument for rename function')
 
@@ -206,3 +369,50 @@ class Frame:
             s.colNames.append(col)
             s.colTypes.append(wrappedType)
         return s
+
+
+class ColumnView:
+    """
+    Read access to the columns of a frame where some columns can be replaced without building a
+    new frame. Column-local operations read and replace columns through this class, so that a
+    chain of them can be applied with a single call to :func:`Frame.replaceColumns`
+    """
+
+    def __init__(self, frame: Frame):
+        self.__df: pd.DataFrame = frame.getRawFrame()
+        self.__replaced: Dict[int, Any] = dict()
+
+    def __getitem__(self, position: int) -> pd.Series:
+        """ Returns the current values of the column at the specified position """
+        if position in self.__replaced:
+            return pd.Series(self.__replaced[position], index=self.__df.index,
+                             name=self.__df.columns[position], copy=False)
+        return self.__df.iloc[:, position]
+
+    @property
+    def columns(self) -> pd.Index:
+        """ The names of the columns """
+        return self.__df.columns
+
+    @property
+    def index(self) -> pd.Index:
+        return self.__df.index
+
+    @property
+    def nRows(self) -> int:
+        return self.__df.shape[0]
+
+    def replace(self, columns: Dict[int, Any]) -> None:
+        """
+        Replaces the values of some columns
+
+        :param columns: dictionary { column position: new values }, as in
+            :func:`Frame.replaceColumns`
+        """
+        for position, values in columns.items():
+            self.__replaced[position] = _columnValues(values, self.__df.index)
+
+    @property
+    def replaced(self) -> Dict[int, Any]:
+        """ The values of every replaced column, to be passed to :func:`Frame.replaceColumns` """
+        return self.__replaced
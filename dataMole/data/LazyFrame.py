@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+#
+# Author:       Alessandro Zangari (alessandro.zangari.code@outlook.com)
+# Copyright:    © Copyright 2020 Alessandro Zangari, Università degli Studi di Padova
+# License:      GPL-3.0-or-later
+# Date:         2020-10-04
+# Version:      1.0
+#
+# This file is part of DataMole.
+#
+# DataMole is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# DataMole is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with DataMole.  If not, see <https://www.gnu.org/licenses/>.
+
+import threading
+from typing import Callable, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from dataMole.data.Frame import Frame, _assembleFrame
+from dataMole.data.Shape import Shape
+
+# Number of rows read to infer the column types of a csv file
+SAMPLE_ROWS = 100
+
+
+class LazyFrame:
+    """
+    A frame which is read from file only when its data is first needed. Its shape is known without
+    reading the data, so it can be shown and used to configure operations. After loading, the data
+    can be released to free memory, and it is read again on the next access. If the source allows
+    it, a subset of columns can be read without loading the whole frame (see :func:`loadColumns`)
+    """
+
+    def __init__(self, reader: Callable[[], Frame], shape: Shape, description: str = '',
+                 columnReader: Optional[Callable[[List[int]], Frame]] = None):
+        """
+        Creates a lazy frame
+
+        :param reader: a function which reads the whole frame. It may be called more than once
+        :param shape: the expected shape of the frame
+        :param description: a text describing where data comes from, e.g. the file path
+        :param columnReader: optional function which reads only the columns at the given (sorted)
+            positions, in the same order
+        """
+        self.__reader: Callable[[], Frame] = reader
+        self.__columnReader: Optional[Callable[[List[int]], Frame]] = columnReader
+        self.__shape: Shape = shape
+        self.__frame: Optional[Frame] = None
+        # Last frame read with 'loadColumns' and the positions of the columns read
+        self.__projection: Optional[Tuple[Tuple[int, ...], Frame]] = None
+        self.__lock = threading.Lock()
+        self.description: str = description
+
+    @property
+    def shape(self) -> Shape:
+        """ The shape of the frame. Before loading it may be inferred from a sample of data, and it
+        is updated with the real shape when data is read """
+        return self.__shape
+
+    @property
+    def isLoaded(self) -> bool:
+        return self.__frame is not None
+
+    def load(self) -> Frame:
+        """ Returns the frame, reading it if it is not loaded. It is thread safe """
+        with self.__lock:
+            if self.__frame is None:
+                self.__frame = self.__reader()
+                self.__shape = self.__frame.shape
+                self.__projection = None
+            return self.__frame
+
+    @property
+    def canLoadColumns(self) -> bool:
+        """ True if a subset of columns can be read without reading the whole frame """
+        return self.__columnReader is not None
+
+    def loadColumns(self, columns: Iterable[int]) -> Frame:
+        """
+        Returns a frame with the columns of this frame, where only the columns at the specified
+        positions are read. Other columns are placeholders with missing values, which use no
+        memory. If the frame is already loaded, or it cannot read a subset of columns, the whole
+        frame is returned. The result is kept until the frame is released or different columns are
+        requested. It is thread safe
+
+        :param columns: the positions of the columns to read
+        :return: the frame with the same columns of this frame
+        """
+        if self.__columnReader is None:
+            return self.load()
+        positions = tuple(sorted(set(columns)))
+        with self.__lock:
+            if self.__frame is not None:
+                return self.__frame
+            if self.__projection is not None and self.__projection[0] == positions:
+                return self.__projection[1]
+            names = self.__shape.colNames
+            # At least one column is read to know the rows
+            read = self.__columnReader((list(positions) or [0]) if names else list())
+            df = read.getRawFrame()
+            placeholder = pd.Categorical.from_codes(np.broadcast_to(np.int8(-1), df.shape[0]),
+                                                    categories=pd.Index(list(), dtype=object))
+            # Read columns are in the order of their positions
+            taken = {p: i for i, p in enumerate(positions)}
+            sources = [taken[p] if p in taken else placeholder for p in range(len(names))]
+            frame = Frame(_assembleFrame(df, pd.Index(names), sources))
+            self.__projection = positions, frame
+            return frame
+
+    def release(self) -> int:
+        """ Discards the loaded data, which will be read again when needed
+
+        :return: the number of bytes released (estimated)
+        """
+        with self.__lock:
+            size = self.memoryUsage()
+            self.__frame = None
+            self.__projection = None
+            return size
+
+    def memoryUsage(self) -> int:
+        """ Returns the memory used by the loaded data in bytes, or 0 if it is not loaded. Columns
+        read with :func:`loadColumns` are included """
+        frame = self.__frame
+        if frame is not None:
+            return frame.memoryUsage()
+        projection = self.__projection
+        if projection is None:
+            return 0
+        df = projection[1].getRawFrame()
+        return int(sum(df.iloc[:, i].nbytes for i in projection[0] if i < df.shape[1]))
+
+    @staticmethod
+    def fromCsv(path: str, sep: str = ',', usecols: Optional[Iterable[int]] = None) -> 'LazyFrame':
+        """
+        Creates a lazy frame reading a csv file. Column types are inferred from the first rows
+
+        :param path: the csv file
+        :param sep: the column separator
+        :param usecols: positions of the columns to read. If None every column is read
+        :return: the lazy frame
+        """
+        usecols = list(usecols) if usecols is not None else None
+        sample = _readCsv(path, sep, usecols, 0, SAMPLE_ROWS)
+        return LazyFrame(lambda: _readCsv(path, sep, usecols, 0, None), sample.shape,
+                         description=path,
+                         columnReader=lambda c: _readCsv(path, sep, _fileColumns(usecols, c), 0,
+                                                         None))
+
+    @staticmethod
+    def csvChunks(path: str, chunksize: int, sep: str = ',',
+                  usecols: Optional[Iterable[int]] = None) -> List['LazyFrame']:
+        """
+        Splits a csv file in lazy frames with 'chunksize' rows each, numbered consecutively as in
+        'pandas.read_csv'. Only the first selected column is read to count the rows
+
+        :param path: the csv file
+        :param chunksize: the number of rows of every frame
+        :param sep: the column separator
+        :param usecols: positions of the columns to read. If None every column is read
+        :return: the list of lazy frames, in order
+        """
+        usecols = list(usecols) if usecols is not None else None
+        first = usecols[:1] if usecols else [0]
+        nRows = sum(c.shape[0] for c in pd.read_csv(path, sep=sep, index_col=False, usecols=first,
+                                                      chunksize=chunksize))
+        # Every chunk is assumed to have the types of the first rows
+        shape = _readCsv(path, sep, usecols, 0, min(SAMPLE_ROWS, chunksize)).shape
+
+        def reader(start: int) -> Callable[[], Frame]:
+            return lambda: _readCsv(path, sep, usecols, start, min(chunksize, nRows - start))
+
+        def columnReader(start: int) -> Callable[[List[int]], Frame]:
+            return lambda c: _readCsv(path, sep, _fileColumns(usecols, c), start,
+                                      min(chunksize, nRows - start))
+
+        return [LazyFrame(reader(i), shape.clone(), description=path, columnReader=columnReader(i))
+                for i in range(0, nRows, chunksize)]
+
+
+def _fileColumns(usecols: Optional[List[int]], columns: List[int]) -> List[int]:
+    """ Converts positions of columns of a frame read from csv to positions in the file """
+    if usecols is None:
+        return columns
+    # Pandas reads selected columns in the order of the file
+    fileColumns = sorted(usecols)
+    return [fileColumns[c] for c in columns]
+
+
+def _readCsv(path: str, sep: str, usecols: Optional[List[int]], firstRow: int,
+             nRows: Optional[int]) -> Frame:
+    """ Reads 'nRows' rows of a csv file starting from row 'firstRow' (header excluded) """
+    df = pd.read_csv(path, sep=sep, index_col=False, usecols=usecols,
+                     skiprows=range(1, firstRow + 1) if firstRow else None, nrows=nRows)
+    if firstRow:
+        df.index = pd.RangeIndex(firstRow, firstRow + df.shape[0])
+    return Frame(df)
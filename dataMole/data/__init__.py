@@ -2,5 +2,6 @@
 Data structures and utilities
 """
 
-from dataMole.data.Frame import Frame
+from dataMole.data.Frame import Frame, ColumnView
+from dataMole.data.LazyFrame import LazyFrame
 from dataMole.data.Shape import Shape
@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+#
+# Author:       Alessandro Zangari (alessandro.zangari.code@outlook.com)
+# Copyright:    © Copyright 2020 Alessandro Zangari, Università degli Studi di Padova
+# License:      GPL-3.0-or-later
+# Date:         2020-10-04
+# Version:      1.0
+#
+# This file is part of DataMole.
+#
+# DataMole is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# DataMole is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with DataMole.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Accounting of the memory used by frames, with a global ceiling. When the ceiling is exceeded the
+least recently used frames are moved to disk, and they are read again when accessed
+"""
+
+import atexit
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+import weakref
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+from dataMole import flogging
+from dataMole.data.Frame import Frame
+from dataMole.data.LazyFrame import LazyFrame
+
+# Environment variable with the memory ceiling in megabytes
+LIMIT_VARIABLE = 'DATAMOLE_MAX_MEMORY'
+
+
+class Spillable:
+    """ Interface of objects holding frames whose memory is accounted by a :class:`MemoryManager` """
+
+    def memoryUsage(self) -> int:
+        """ Returns the memory used in bytes """
+        raise NotImplementedError
+
+    def spill(self, directory: str, required: int) -> int:
+        """
+        Frees memory, moving data to disk if it cannot be read again from its source
+
+        :param directory: the folder where spilled data can be written
+        :param required: the number of bytes which should be freed. Implementations may free more
+        :return: the number of bytes freed
+        """
+        raise NotImplementedError
+
+
+def spillFrame(frame: Frame, directory: str) -> LazyFrame:
+    """
+    Writes a frame to disk, and returns a lazy frame which reads it back. Frames without object
+    columns are written in Feather format if 'pyarrow' is installed, and are memory-mapped when read
+    back. Other frames are pickled, since Arrow would not preserve their values exactly (e.g. missing
+    values in string columns)
+
+    :param frame: the frame to write
+    :param directory: the destination folder
+    :return: the lazy frame. Its 'description' is the path of the file
+    """
+    os.makedirs(directory, exist_ok=True)
+    df = frame.getRawFrame()
+    if not any(t.kind == 'O' for t in df.dtypes) and df.index.dtype.kind != 'O':
+        try:
+            import pyarrow
+            import pyarrow.feather
+        except ImportError:
+            pyarrow = None
+        if pyarrow is not None:
+            path = _tempPath(directory, '.feather')
+            try:
+                pyarrow.feather.write_feather(pyarrow.Table.from_pandas(df), path,
+                                              compression='uncompressed')
+                return LazyFrame(
+                    lambda: Frame(pyarrow.feather.read_table(path, memory_map=True).to_pandas()),
+                    frame.shape, description=path)
+            except Exception as e:
+                # E.g. column names which are not strings
+                flogging.appLogger.debug('Cannot spill frame to Feather: {}'.format(str(e)))
+                removeSpilled(path)
+    path = _tempPath(directory, '.pickle')
+    with open(path, 'wb') as file:
+        pickle.dump(df, file, protocol=4)
+
+    def read() -> Frame:
+        with open(path, 'rb') as f:
+            return Frame(pickle.load(f))
+
+    return LazyFrame(read, frame.shape, description=path)
+
+
+def removeSpilled(path: str) -> None:
+    """ Deletes a file written by :func:`spillFrame` """
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _tempPath(directory: str, suffix: str) -> str:
+    fd, path = tempfile.mkstemp(suffix=suffix, dir=directory)
+    os.close(fd)
+    return path
+
+
+class MemoryManager:
+    """ Tracks the memory used by registered objects, and spills the least recently used ones to
+    disk when the total exceeds a ceiling. Objects are referenced weakly, so registration does not
+    keep them alive. This class is thread safe """
+
+    def __init__(self, maxBytes: Optional[int] = None, spillDir: Optional[str] = None):
+        """
+        :param maxBytes: the memory ceiling in bytes. If None memory is not bounded
+        :param spillDir: folder for spilled data. If None a temporary folder is created when needed
+            and deleted on exit
+        """
+        self.maxBytes: Optional[int] = maxBytes
+        self.__spillDir: Optional[str] = spillDir
+        # { id: (weak reference, size in bytes) }, least recently used first
+        self.__holders: 'OrderedDict[int, Tuple[weakref.ref, int]]' = OrderedDict()
+        self.__lock = threading.RLock()
+
+    @property
+    def spillDir(self) -> str:
+        with self.__lock:
+            if self.__spillDir is None:
+                self.__spillDir = tempfile.mkdtemp(prefix='dataMole-')
+                atexit.register(shutil.rmtree, self.__spillDir, True)
+            return self.__spillDir
+
+    @property
+    def usage(self) -> int:
+        """ Total memory used by registered objects in bytes, as last measured """
+        with self.__lock:
+            return sum(size for _, size in self.__holders.values())
+
+    def __len__(self) -> int:
+        return len(self.__holders)
+
+    def __contains__(self, holder: Spillable) -> bool:
+        return id(holder) in self.__holders
+
+    def register(self, holder: Spillable) -> None:
+        """ Starts tracking an object and enforces the ceiling """
+        key = id(holder)
+        with self.__lock:
+            if key not in self.__holders:
+                ref = weakref.ref(holder, lambda _: self.__forget(key))
+                self.__holders[key] = (ref, 0)
+        self.update(holder)
+
+    def unregister(self, holder: Spillable) -> None:
+        self.__forget(id(holder))
+
+    def __forget(self, key: int) -> None:
+        with self.__lock:
+            self.__holders.pop(key, None)
+
+    def touch(self, holder: Spillable) -> None:
+        """ Marks an object as recently used """
+        with self.__lock:
+            if id(holder) in self.__holders:
+                self.__holders.move_to_end(id(holder))
+
+    def update(self, holder: Spillable) -> None:
+        """ Measures the memory used by a registered object, marks it as recently used and enforces
+        the ceiling. Other objects are spilled if needed """
+        size = holder.memoryUsage()
+        with self.__lock:
+            key = id(holder)
+            if key not in self.__holders:
+                return
+            self.__holders[key] = (self.__holders[key][0], size)
+            self.__holders.move_to_end(key)
+        self.enforce(keep=holder)
+
+    def enforce(self, keep: Optional[Spillable] = None) -> int:
+        """
+        Spills least recently used objects until the ceiling is respected
+
+        :param keep: an object which must not be spilled, e.g. because it is being used
+        :return: the number of bytes freed
+        """
+        if self.maxBytes is None:
+            return 0
+        with self.__lock:
+            excess = sum(size for _, size in self.__holders.values()) - self.maxBytes
+            if excess <= 0:
+                return 0
+            victims: List[Tuple[int, Spillable]] = list()
+            for key, (ref, size) in self.__holders.items():
+                holder = ref()
+                if holder is not None and holder is not keep and size > 0:
+                    victims.append((key, holder))
+        # Holders are not called with the lock, since they may use their own locks
+        freed = 0
+        for key, holder in victims:
+            if freed >= excess:
+                break
+            try:
+                n = holder.spill(self.spillDir, excess - freed)
+            except Exception as e:
+                flogging.appLogger.warning('Cannot free memory: {}'.format(str(e)))
+                continue
+            freed += n
+            with self.__lock:
+                if key in self.__holders:
+                    self.__holders[key] = (self.__holders[key][0], holder.memoryUsage())
+        flogging.appLogger.debug('Memory ceiling exceeded by {:d} bytes, {:d} freed'.format(excess,
+                                                                                           freed))
+        return freed
+
+
+def _limitFromEnvironment() -> Optional[int]:
+    value = os.environ.get(LIMIT_VARIABLE, None)
+    try:
+        return int(float(value) * 1024 * 1024) if value else None
+    except ValueError:
+        flogging.appLogger.warning('Invalid memory limit {}="{}"'.format(LIMIT_VARIABLE, value))
+        return None
+
+
+# Memory manager of the application, bounded by the environment variable 'DATAMOLE_MAX_MEMORY'
+manager = MemoryManager(maxBytes=_limitFromEnvironment())
@@ -59,6 +59,10 @@ class Type(abc.ABC):
         # Disable deepcopy
         return self
 
+    def __reduce__(self):
+        # Types are singletons, so they are pickled by code (e.g. to send them to other processes)
+        return Type.fromCode, (self.code,)
+
 
 class Categorical(Type):
     pass
@@ -145,6 +149,9 @@ class IndexType(Type):
     def __hash__(self) -> int:
         return hash((self.name, self.__type))
 
+    def __reduce__(self):
+        return IndexType, (self.__type,)
+
 
 class Types:
     Ordinal = Ordinal()
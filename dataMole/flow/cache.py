@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+#
+# Author:       Alessandro Zangari (alessandro.zangari.code@outlook.com)
+# Copyright:    © Copyright 2020 Alessandro Zangari, Università degli Studi di Padova
+# License:      GPL-3.0-or-later
+# Date:         2020-10-04
+# Version:      1.0
+#
+# This file is part of DataMole.
+#
+# DataMole is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# DataMole is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with DataMole.  If not, see <https://www.gnu.org/licenses/>.
+
+import hashlib
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from dataMole import data, flogging
+from dataMole.data import memory
+
+# Default memory budget of the result cache (bytes)
+DEFAULT_CACHE_SIZE = 512 * 1024 * 1024
+
+
+class _CacheEntry:
+    def __init__(self, fingerprint: str, result: Any, size: int):
+        self.fingerprint: str = fingerprint
+        self.result: Any = result
+        self.size: int = size
+        # Path of the pickle file when the result was spilled to disk
+        self.path: Optional[str] = None
+
+
+class ResultCache(memory.Spillable):
+    """ Keeps the last output of every node of a flow, together with a fingerprint of everything
+    which determined it: the operation type, its options and the fingerprints of its inputs. When a
+    flow is executed again only nodes whose fingerprint changed are recomputed.
+
+    The memory used by cached results is bounded: least recently used results are evicted
+    first, or moved to disk if a spill folder is set. The cache can also be registered in a
+    :class:`~dataMole.data.memory.MemoryManager`, which moves results to disk when the memory of
+    the application is exceeded """
+
+    def __init__(self, maxBytes: Optional[int] = DEFAULT_CACHE_SIZE, spillDir: Optional[str] = None):
+        """
+        Creates an empty cache
+
+        :param maxBytes: maximum memory used by cached results in bytes. If None the cache is not
+            bounded. If 0 the cache is disabled
+        :param spillDir: optional folder where evicted results are saved as pickle files
+
+        """
+        self.maxBytes: Optional[int] = maxBytes
+        self.spillDir: Optional[str] = spillDir
+        self.__entries: 'OrderedDict[int, _CacheEntry]' = OrderedDict()
+        self.__size: int = 0
+        self.__lock = threading.RLock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxBytes is None or self.maxBytes > 0
+
+    @property
+    def size(self) -> int:
+        """ Memory used by results held in memory (bytes) """
+        return self.__size
+
+    def __contains__(self, uid: int) -> bool:
+        return uid in self.__entries
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    @staticmethod
+    def _hash(*parts: Any) -> str:
+        h = hashlib.sha1()
+        for p in parts:
+            try:
+                b = pickle.dumps(p, protocol=4)
+            except Exception:
+                b = repr(p).encode('utf-8')
+            h.update(b)
+            h.update(b'|')
+        return h.hexdigest()
+
+    @staticmethod
+    def _typeName(node: 'OperationNode') -> str:
+        t = type(node.operation)
+        return '{}.{}'.format(t.__module__, t.__qualname__)
+
+    @staticmethod
+    def _state(node: 'OperationNode') -> Any:
+        """ Returns the options of the operation and, if it is frozen, its fitted parameters """
+        from dataMole.operation.interface.graph import StatefulGraphOperation
+        op = node.operation
+        if isinstance(op, StatefulGraphOperation) and op.frozen:
+            return op.getOptions(), op.fittedParameters()
+        return op.getOptions()
+
+    def inputFingerprint(self, node: 'OperationNode') -> Optional[str]:
+        """ Computes the fingerprint of an input node from its options and the version of the data
+        it reads (see :func:`~dataMole.operation.interface.graph.InputGraphOperation.sourceVersion`).
+        Input frames are not referenced, so they can be released or spilled to disk
+
+        :return: the fingerprint or None if the version of the data is unknown
+        """
+        version = node.operation.sourceVersion()
+        if version is None:
+            return None
+        return self._hash(self._typeName(node), node.operation.getOptions(), version)
+
+    def fingerprint(self, node: 'OperationNode', parents: Dict[int, str]) -> Optional[str]:
+        """
+        Computes the fingerprint of a node which has inputs
+
+        :param node: the node
+        :param parents: the fingerprint of every parent node
+
+        :return: the fingerprint or None if some parent fingerprint is missing
+        """
+        ordered: List[Tuple[int, str]] = list()
+        for uid, pos in node.inputOrder.items():
+            fp = parents.get(uid, None)
+            if fp is None:
+                return None
+            ordered.append((pos, fp))
+        ordered.sort()
+        return self._hash(self._typeName(node), self._state(node), [fp for _, fp in ordered])
+
+    def get(self, uid: int, fingerprint: str) -> Optional[Any]:
+        """ Returns the result of a node if it is cached with the same fingerprint, None otherwise """
+        with self.__lock:
+            entry = self.__entries.get(uid, None)
+            if entry is None or entry.fingerprint != fingerprint:
+                return None
+            self.__entries.move_to_end(uid)
+            if entry.result is None and entry.path:
+                try:
+                    with open(entry.path, 'rb') as file:
+                        result = pickle.load(file)
+                except (OSError, pickle.PickleError, EOFError) as e:
+                    flogging.appLogger.warning('Cannot read cached result: {}'.format(str(e)))
+                    self.__remove(uid)
+                    return None
+                return result
+            return entry.result
+
+    def put(self, uid: int, fingerprint: str, result: Any) -> None:
+        """
+        Caches the result of a node, replacing the previous one
+
+        :param uid: the node id
+        :param fingerprint: the fingerprint of the node
+        :param result: the output of the node
+
+        """
+        if not self.enabled:
+            return
+        size = result.memoryUsage(deep=True) if isinstance(result, data.Frame) else 0
+        with self.__lock:
+            self.__remove(uid)
+            entry = _CacheEntry(fingerprint, result, size)
+            self.__entries[uid] = entry
+            self.__size += size
+            self.__evict()
+        memory.manager.update(self)
+
+    def invalidate(self, uid: int) -> None:
+        """ Removes the result of a node """
+        with self.__lock:
+            self.__remove(uid)
+
+    def clear(self) -> None:
+        """ Removes every cached result """
+        with self.__lock:
+            for uid in list(self.__entries.keys()):
+                self.__remove(uid)
+
+    def __remove(self, uid: int) -> None:
+        entry = self.__entries.pop(uid, None)
+        if entry is None:
+            return
+        if entry.result is not None:
+            self.__size -= entry.size
+        if entry.path:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+
+    def __evict(self) -> None:
+        """ Evicts least recently used results until the memory budget is respected """
+        if self.maxBytes is None:
+            return
+        for uid in list(self.__entries.keys()):
+            if self.__size <= self.maxBytes:
+                break
+            entry = self.__entries[uid]
+            if entry.result is None:
+                # Already on disk
+                continue
+            if self.spillDir and self.__spill(uid, entry, self.spillDir):
+                continue
+            self.__remove(uid)
+
+    def memoryUsage(self) -> int:
+        return self.size
+
+    def spill(self, directory: str, required: int) -> int:
+        """ Moves least recently used results to disk until 'required' bytes are freed. Results are
+        written in the spill folder of the cache if it is set, otherwise in 'directory' """
+        freed = 0
+        with self.__lock:
+            for uid, entry in list(self.__entries.items()):
+                if freed >= required:
+                    break
+                if entry.result is None or entry.size == 0:
+                    continue
+                if self.__spill(uid, entry, self.spillDir or directory):
+                    freed += entry.size
+        return freed
+
+    def __spill(self, uid: int, entry: _CacheEntry, directory: str) -> bool:
+        """ Moves a result to disk. Returns True if it succeeded """
+        try:
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, '{:d}-{}.pickle'.format(uid, entry.fingerprint))
+            with open(path, 'wb') as file:
+                pickle.dump(entry.result, file, protocol=4)
+        except (OSError, pickle.PickleError) as e:
+            flogging.appLogger.warning('Cannot spill cached result: {}'.format(str(e)))
+            return False
+        entry.path = path
+        entry.result = None
+        self.__size -= entry.size
+        return True
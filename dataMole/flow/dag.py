@@ -21,12 +21,15 @@
 # You should have received a copy of the GNU General Public License
 # along with DataMole.  If not, see <https://www.gnu.org/licenses/>.
 
+import heapq
 from typing import Any, Dict, List, Optional, Set
 
 import networkx as nx
 
 from dataMole import data, flogging, exceptions as exp
+from dataMole.data import memory
 from dataMole.utils import UIdGenerator
+from .cache import ResultCache
 
 
 class OperationDag:
@@ -37,15 +40,74 @@ class OperationDag:
 
     def __init__(self, graph: nx.DiGraph = None):
         self.__G = nx.DiGraph() if not graph else graph
+        # Position of every node in a topological order, kept updated when edges are added
+        self.__order: Dict[int, int] = dict()
+        self.__nextPosition: int = 0
+        self.__resetOrder()
+        # Results of the last execution
+        self.cache: ResultCache = ResultCache()
+        memory.manager.register(self.cache)
 
     def getNxGraph(self) -> nx.DiGraph:
         """ Returns a reference to the NetworkX graph """
         return self.__G
 
+    def __resetOrder(self) -> None:
+        """ Computes the topological order of the whole graph """
+        self.__order = {n: i for i, n in enumerate(nx.topological_sort(self.__G))}
+        self.__nextPosition = len(self.__order)
+
+    def topologicalOrder(self) -> List[int]:
+        """ Returns the ids of the nodes in a topological order """
+        return sorted(self.__order.keys(), key=self.__order.__getitem__)
+
+    def __reorder(self, source_id: int, target_id: int) -> bool:
+        """
+        Updates the topological order for a new edge 'source -> target', which must not be in the
+        graph yet. Only nodes positioned between the target and the source are visited (algorithm
+        of Pearce and Kelly)
+
+        :return: False if the edge would create a cycle. In this case the order is not changed
+        """
+        order = self.__order
+        sourcePosition, targetPosition = order[source_id], order[target_id]
+        if sourcePosition < targetPosition:
+            # Order is already valid
+            return True
+        if source_id == target_id:
+            return False
+        # Descendants of target which do not follow source
+        forward = self.__visit(target_id, self.__G.successors,
+                               lambda n: order[n] <= sourcePosition)
+        if source_id in forward:
+            return False
+        # Ancestors of source which do not precede target
+        backward = self.__visit(source_id, self.__G.predecessors,
+                                lambda n: order[n] >= targetPosition)
+        # Ancestors take the first positions, keeping their relative order
+        nodes = sorted(backward, key=order.__getitem__) + sorted(forward, key=order.__getitem__)
+        positions = sorted(order[n] for n in nodes)
+        for n, position in zip(nodes, positions):
+            order[n] = position
+        return True
+
+    @staticmethod
+    def __visit(start: int, neighbours, accept) -> Set[int]:
+        """ Nodes reachable from 'start' through nodes satisfying 'accept', including 'start' """
+        visited = {start}
+        stack = [start]
+        while stack:
+            for n in neighbours(stack.pop()):
+                if n not in visited and accept(n):
+                    visited.add(n)
+                    stack.append(n)
+        return visited
+
     def __update_descendants(self, parent_id: int) -> Set[int]:
         """
-        Recursively update the descendants of a provided node. Updates the input shape and unset
-        options if the input shape changed
+        Update the descendants of a provided node. Updates the input shape and unset options if the
+        input shape changed. Nodes are visited once in topological order, so that every node is
+        updated after all its parents
 
         :param parent_id: the id of the parent node
 
@@ -53,17 +115,26 @@ class OperationDag:
 
         """
         updated = set()
-        for child_id in self.__G.successors(parent_id):  # Direct successors
-            child_node = self[child_id]
-            newParentOutputShape = self[parent_id].operation.getOutputShape()
-            oldParentOutputShape = child_node.inputShapeFrom(parent_id)
-            if newParentOutputShape != oldParentOutputShape:
-                child_node.operation.unsetOptions()
-                child_node.addInputShape(newParentOutputShape, parent_id)
-                # Child was updated, now try with its descendants
-                updated.add(child_id)
-                updated |= self.__update_descendants(child_id)
-            # Else shape is the same, so nothing to update
+        queue = [(self.__order[parent_id], parent_id)]
+        while queue:
+            _, node_id = heapq.heappop(queue)
+            children = list(self.__G.successors(node_id))
+            if not children:
+                continue
+            # Memoized: computed once for all children
+            newParentOutputShape = self[node_id].outputShape
+            for child_id in children:
+                child_node = self[child_id]
+                oldParentOutputShape = child_node.inputShapeFrom(node_id)
+                if newParentOutputShape != oldParentOutputShape:
+                    child_node.operation.unsetOptions()
+                    # Also invalidates the memoized output shape
+                    child_node.addInputShape(newParentOutputShape, node_id)
+                    # Child was updated, its descendants are updated later
+                    if child_id not in updated:
+                        updated.add(child_id)
+                        heapq.heappush(queue, (self.__order[child_id], child_id))
+                # Else shape is the same, so nothing to update
         return updated
 
     def updateNodeOptions(self, node_id: int, *options: Any, **kwoptions: Any) -> Set[int]:
@@ -84,11 +155,33 @@ class OperationDag:
         # Set options for operation
         node: 'OperationNode' = self[node_id]
         node.operation.setOptions(*options, **kwoptions)
+        # Cached result and output shape are no longer valid
+        self.cache.invalidate(node_id)
+        node.invalidateShape()
         # Update every connected node
         updated = self.__update_descendants(node_id)
         updated.add(node_id)
         return updated
 
+    def freeze(self, frozen: bool = True) -> Set[int]:
+        """ Sets the frozen mode of every operation with fitted parameters. Frozen operations reuse
+        the parameters fitted in the last execution, so that the flow can be applied to new data.
+        Operations which were never fitted are fitted once in the next execution
+
+        :param frozen: True to freeze operations, False to fit them on every execution
+
+        :return: the ids of updated nodes
+
+        """
+        from dataMole.operation.interface.graph import StatefulGraphOperation
+        updated = set()
+        for node_id in self.__G.nodes:
+            op = self[node_id].operation
+            if isinstance(op, StatefulGraphOperation):
+                op.setFrozen(frozen)
+                updated.add(node_id)
+        return updated
+
     def addNode(self, node: 'OperationNode') -> bool:
         """ Adds a node to the graph. Must not be already in the graph
 
@@ -102,6 +195,9 @@ class OperationDag:
                 'GraphNode uid={:d} is already present in the graph'.format(node.uid))
             return False
         self.__G.add_node(node.uid, op=node)
+        # Nodes without edges can be last
+        self.__order[node.uid] = self.__nextPosition
+        self.__nextPosition += 1
         return True
 
     def addConnection(self, source_id: int, target_id: int, slot: int) -> bool:
@@ -152,19 +248,18 @@ class OperationDag:
             raise exp.DagException(message='GraphEdge {}->{} not created it already exists'
                                    .format(source_node.operation.name(), target_node.operation.name()))
 
-        # Add connection
-        self.__G.add_edge(source_id, target_id)
         # If the edge forms a cycle do nothing and return False
-        if not nx.is_directed_acyclic_graph(self.__G):
-            self.__G.remove_edge(source_id, target_id)
+        if not self.__reorder(source_id, target_id):
             flogging.appLogger.debug(
                 'GraphEdge ({}->{}) not created because it creates a cycle'.format(source_id, target_id))
             raise exp.DagException(
                 message='GraphEdge "{}->{}" not created because resulting graph is not acyclic'
                     .format(source_node.operation.name(), target_node.operation.name()))
+        # Add connection
+        self.__G.add_edge(source_id, target_id)
 
         target_node.setSourceOperationInputPosition(source_id, slot)
-        target_node.addInputShape(source_node.operation.getOutputShape(), source_id)
+        target_node.addInputShape(source_node.outputShape, source_id)
 
         # Update input shapes in descendants
         self.__update_descendants(target_id)
@@ -192,6 +287,7 @@ class OperationDag:
         target_node.unsetSourceOperationInputPosition(source_id)
         # Unset options which depends on the input shape
         target_node.operation.unsetOptions()
+        target_node.invalidateShape()
         # Updates (remove) input shapes (and options) in descendants
         updated = self.__update_descendants(target_id)
         updated.add(target_id)
@@ -213,8 +309,10 @@ class OperationDag:
         for v in list(self.__G.successors(op_id)):
             updated |= self.removeConnection(op_id, v)
 
-        # Remove node
+        # Remove node. The order of other nodes is still topological
         self.__G.remove_node(op_id)
+        del self.__order[op_id]
+        self.cache.invalidate(op_id)
         return updated
 
     def __getitem__(self, uid: int) -> 'OperationNode':
@@ -249,8 +347,12 @@ class OperationDag:
             for edge in edges:
                 source_id, target_id = edge
                 graph.__G.add_edge(source_id, target_id)
+            graph.__resetOrder()
         except (AttributeError, KeyError) as e:
             raise exp.DagException('Error during deserialization', str(e))
+        except nx.NetworkXUnfeasible as e:
+            raise exp.DagException('Error during deserialization', 'The graph has cycles: {}'
+                                   .format(str(e)))
         return graph
 
 
@@ -264,6 +366,9 @@ class OperationNode:
         self.__inputs: List = None
         # Input mapper { operation_id: position }
         self.__input_order: Dict[int, int] = dict()
+        # Memoized output shape of the operation
+        self.__outputShape: Optional[data.Shape] = None
+        self.__shapeValid: bool = False
         if operation is not None:
             self.__op_uid = UIdGenerator().getUniqueId()
             self.operation = operation
@@ -279,17 +384,42 @@ class OperationNode:
         """ Returns the integer unique identifier of one node """
         return self.__op_uid
 
+    @property
+    def outputShape(self) -> Optional[data.Shape]:
+        """ The output shape of the operation. It is computed once and memoized until the input
+        shapes or the options of the operation change. Options set without using
+        :func:`~dataMole.flow.dag.OperationDag.updateNodeOptions` require a call to
+        :func:`invalidateShape`. The shape of input operations is never memoized, since the
+        frames they read can change outside the flow """
+        from dataMole.operation.interface.graph import InputGraphOperation
+        if isinstance(self.operation, InputGraphOperation):
+            return self.operation.getOutputShape()
+        if not self.__shapeValid:
+            self.__outputShape = self.operation.getOutputShape()
+            self.__shapeValid = True
+        return self.__outputShape
+
+    def invalidateShape(self) -> None:
+        """ Discards the memoized output shape """
+        self.__outputShape = None
+        self.__shapeValid = False
+
     def serialize(self) -> Dict:
+        from dataMole.operation.interface.graph import StatefulGraphOperation
         d = dict()
         d['type'] = type(self.operation)
         d['shapes'] = [s.serialize() if s else None for s in self.operation.shapes]
         d['options'] = self.operation.getOptions()
         d['order'] = self.__input_order
         d['uid'] = self.uid
+        if isinstance(self.operation, StatefulGraphOperation):
+            d['fitted'] = self.operation.fittedParameters()
+            d['frozen'] = self.operation.frozen
         return d
 
     @staticmethod
     def deserialize(state: Dict) -> 'OperationNode':
+        from dataMole.operation.interface.graph import StatefulGraphOperation
         node = OperationNode(None)
         node.operation = state['type']()
         node.operation._shapes = [data.Shape.deserialize(s) if s else None for s in state['shapes']]
@@ -307,6 +437,10 @@ class OperationNode:
             # Thus just ignore the configuration (just log a warning)
             flogging.appLogger.warning('An un-configured operation "{}" has been deserialized'.format(
                 state['type'].__name__))
+        if isinstance(node.operation, StatefulGraphOperation):
+            # Flows saved with older versions have no fitted parameters
+            node.operation.setFittedParameters(state.get('fitted', None))
+            node.operation.setFrozen(state.get('frozen', False))
         return node
 
     def inputShapeFrom(self, node_id: int) -> Optional[data.Shape]:
@@ -365,6 +499,7 @@ class OperationNode:
         """
         pos = self.__input_order.get(op_id, None)
         self.operation.addInputShape(shape, pos)
+        self.invalidateShape()
 
     def removeInputShape(self, op_id: int) -> None:
         """ Remove the input shape coming from specified operation
@@ -374,6 +509,7 @@ class OperationNode:
         """
         pos = self.__input_order.get(op_id)
         self.operation.removeInputShape(pos)
+        self.invalidateShape()
 
     def clearInputArgument(self) -> None:
         """ Delete all input arguments cached in a node """
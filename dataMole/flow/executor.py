@@ -0,0 +1,499 @@
+# -*- coding: utf-8 -*-
+#
+# Author:       Alessandro Zangari (alessandro.zangari.code@outlook.com)
+# Copyright:    © Copyright 2020 Alessandro Zangari, Università degli Studi di Padova
+# License:      GPL-3.0-or-later
+# Date:         2020-10-04
+# Version:      1.0
+#
+# This file is part of DataMole.
+#
+# DataMole is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# DataMole is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with DataMole.  If not, see <https://www.gnu.org/licenses/>.
+
+import copy
+import heapq
+import os
+import traceback
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, Future, wait, \
+    FIRST_COMPLETED
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Any, Union
+
+import networkx as nx
+
+from dataMole import data, flogging, exceptions as exp
+from . import transport
+from .cache import ResultCache
+from .fusion import FusedNode, FusedOperation, FusedOperationError, findFusableChains
+from .partition import MIN_PARTITION_ROWS, splitRows, concatRows
+from .projection import ProjectedNode, findProjections
+
+# Callback types
+StartCallback = Callable[[int], None]
+SuccessCallback = Callable[[int, Any], None]
+ErrorCallback = Callable[[int, Tuple[type, Exception, str]], None]
+
+
+def findInputNodes(graph: nx.DiGraph) -> List['OperationNode']:
+    """ Returns the input nodes of a flow, i.e. the nodes without predecessors that do not accept
+    inputs """
+    start_nodes_id = [n for (n, deg) in graph.in_degree() if deg == 0]
+    return [node for node in map(lambda nid: graph.nodes[nid]['op'], start_nodes_id) if
+            node.operation.maxInputNumber() == 0]
+
+
+def findExecutionSet(graph: nx.DiGraph, input_nodes: List['OperationNode']) -> Set[int]:
+    """
+    Find the set of nodes reachable from the input nodes. Additionally checks that every node to
+    execute has its options set
+
+    :param graph: the NetworkX graph of the flow
+    :param input_nodes: the input nodes of the flow
+
+    :return: the set of ids of every node to execute (input nodes included)
+
+    :raise HandlerException: if the flow is not ready for execution
+
+    """
+    if not input_nodes:
+        flogging.appLogger.error('Flow not started: there are no input operations')
+        raise exp.HandlerException('Flow not started', 'There are no input nodes')
+    # Find the set of reachable nodes from the input operations
+    reachable = set()
+    for node in input_nodes:
+        # Also check that input nodes have options set, or raise error
+        if not node.operation.hasOptions():
+            flogging.appLogger.error(
+                'Flow not started: input operation "{}-{}" is not configured'.format(
+                    node.operation.name(), node.uid))
+            raise exp.HandlerException('Flow not started',
+                                       'Input operation "{}" has options to set'.format(
+                                           node.operation.name()))
+        # All descendants of input node are reachable
+        reachable = reachable.union(nx.dag.descendants(graph, node.uid))
+    # Check if all reachable nodes have options set
+    for node_id in reachable:
+        node: 'OperationNode' = graph.nodes[node_id]['op']
+        if not node.operation.hasOptions():
+            flogging.appLogger.error('Flow not started: operation "{}-{}" has options to set'.format(
+                node.operation.name(), node.uid))
+            raise exp.HandlerException('Flow not started',
+                                       'Operation "{}" has options to set'.format(
+                                           node.operation.name()))
+    return reachable | set(map(lambda x: x.uid, input_nodes))
+
+
+class Schedule:
+    """ Static execution plan computed over a set of nodes of a DAG, before the execution starts.
+    It provides a topological order, the nodes grouped by level (nodes in the same level are
+    independent and can run concurrently) and the priority of every node, which is the length of the
+    longest path from the node to a sink (its 'bottom level'). Nodes along the critical path have the
+    highest priority """
+
+    def __init__(self, graph: nx.DiGraph, nodes: Iterable[int],
+                 cost: Optional[Callable[[int], float]] = None):
+        """
+        Computes the schedule
+
+        :param graph: the NetworkX graph of the flow
+        :param nodes: the ids of nodes to schedule
+        :param cost: optional function giving the estimated cost of a node. Defaults to 1 for every node
+
+        """
+        sub: nx.DiGraph = graph.subgraph(nodes)
+        cost = cost if cost else (lambda _: 1)
+        self.order: List[int] = list(nx.topological_sort(sub))
+        # Level of every node is the length of the longest path from a source
+        level: Dict[int, int] = dict()
+        for n in self.order:
+            level[n] = max([level[p] + 1 for p in sub.predecessors(n)], default=0)
+        self.levels: List[List[int]] = [list() for _ in range(max(level.values(), default=-1) + 1)]
+        for n in self.order:
+            self.levels[level[n]].append(n)
+        # Priority is the cost of the most expensive path from the node to a sink
+        self.priority: Dict[int, float] = dict()
+        for n in reversed(self.order):
+            self.priority[n] = cost(n) + max([self.priority[c] for c in sub.successors(n)], default=0)
+        # Critical path follows the successor with highest priority
+        self.criticalPath: List[int] = list()
+        sources = [n for n in self.order if sub.in_degree(n) == 0]
+        current = max(sources, key=lambda n: self.priority[n], default=None)
+        while current is not None:
+            self.criticalPath.append(current)
+            current = max(sub.successors(current), key=lambda n: self.priority[n], default=None)
+        self.__position: Dict[int, int] = {n: i for i, n in enumerate(self.order)}
+
+    def sortKey(self, node_id: int) -> Tuple[float, int]:
+        """ Key to use to sort ready nodes. Nodes with highest priority come first, ties are broken
+        with the topological order """
+        return -self.priority[node_id], self.__position[node_id]
+
+
+def frameSize(frame: Any) -> int:
+    """ Returns the memory size of a frame in bytes, or 0 if the argument is not a frame """
+    if isinstance(frame, data.Frame):
+        return frame.memoryUsage()
+    return 0
+
+
+def estimateOutputSize(node: 'OperationNode') -> int:
+    """ Estimates the memory allocated by the result of a node, in bytes. Its inputs are not
+    counted, since they are held as results of its parents. The result is assumed to be as large as
+    the largest input frame, scaled by the ratio of output and input columns if the output shape is
+    known """
+    frames = [i for i in node.inputs or list() if isinstance(i, data.Frame)]
+    if not frames:
+        return 0
+    largest = max(frames, key=frameSize)
+    size = frameSize(largest)
+    shape: Optional[data.Shape] = node.outputShape
+    if shape is not None and largest.nColumns:
+        size = size * shape.nColumns // largest.nColumns
+    return size
+
+
+def _members(operation: 'GraphOperation') -> List['GraphOperation']:
+    """ Returns the operations executed by an operation, which are many if it is fused """
+    return operation.operations if isinstance(operation, FusedOperation) else [operation]
+
+
+def _executeOperation(operation: 'GraphOperation', inputs: List[Any]) \
+        -> Tuple[Any, List[Tuple[Optional[str], Optional[str], Optional[Dict]]]]:
+    """ Function used to run an operation in a separate process. Input frames are read from shared
+    memory, and the resulting frame is sent back in the same way where shared blocks persist after
+    being closed (not on Windows). Since the operation is a copy of the original one, execution logs
+    and fitted parameters of every executed operation must be sent back with the result """
+    from dataMole.operation.interface.graph import StatefulGraphOperation
+    result = operation.execute(*map(transport.receive, inputs))
+    states = list()
+    for op in _members(operation):
+        fitted = op.fittedParameters() if isinstance(op, StatefulGraphOperation) else None
+        states.append((getattr(op, '_logOptionsString', None),
+                       getattr(op, '_logExecutionString', None), fitted))
+    if transport.PERSISTENT_BLOCKS:
+        result = transport.share(result)
+        if isinstance(result, transport.SharedFrame):
+            # The block is released by the main process after reading it
+            result.close()
+    return result, states
+
+
+class FlowExecutor:
+    """ Executes a DAG of operation nodes. Nodes are started following a :class:`Schedule`, so that
+    the critical path is always prioritised, and independent branches run concurrently on a
+    bounded pool of threads (or processes). Row-local operations with a tall input can also be
+    executed on partitions of rows concurrently. Optionally, chains of column-local operations are
+    fused in a single pass (see :mod:`~dataMole.flow.fusion`), and input operations only read the
+    columns which some output depends on (see :mod:`~dataMole.flow.projection`). An optional memory
+    budget limits the number of nodes running at the same time. This class does not depend on Qt """
+
+    def __init__(self, maxWorkers: Optional[int] = None, maxMemory: Optional[int] = None,
+                 processes: bool = False, partitions: int = 1,
+                 minPartitionRows: int = MIN_PARTITION_ROWS, fusion: bool = False,
+                 checkFusion: bool = False, projection: bool = False):
+        """
+        Configures the executor
+
+        :param maxWorkers: maximum number of nodes executed concurrently. Defaults to the number of
+            CPUs
+        :param maxMemory: memory budget in bytes. A node is not started if the memory held by
+            intermediate results plus the memory estimated for the results of running nodes (see
+            :func:`estimateOutputSize`) would exceed this value, unless no other node is running.
+            If None memory is not bounded
+        :param processes: if True operations are executed in a pool of processes, and frames are
+            moved between processes through shared memory. Only operations which are safe to run in
+            a process are executed there (see :func:`~dataMole.operation.interface.graph
+            .GraphOperation.isProcessSafe`), while the others run in the current process
+        :param partitions: maximum number of row partitions of the input of row-local operations
+            (see :func:`~dataMole.operation.interface.graph.GraphOperation.isRowLocal`). Partitions
+            are executed concurrently and their results are concatenated. 1 disables partitioning
+        :param minPartitionRows: minimum number of rows of every partition
+        :param fusion: if True chains of column-local operations (see
+            :func:`~dataMole.operation.interface.graph.GraphOperation.isColumnLocal`) are executed
+            in a single pass. Only the last node of a chain has a result, so other nodes of the
+            chain are not logged with their result and their results are not cached. Disabled by
+            default
+        :param checkFusion: if True fused chains are also executed one operation at a time, and
+            they fail if results differ. Used to test the fusion
+        :param projection: if True input operations only read the columns needed by the flow.
+            Other columns hold placeholders with missing values until they are dropped, so they
+            also appear in logs and cached results of intermediate nodes. Disabled by default
+
+        """
+        self.maxWorkers: int = maxWorkers if maxWorkers and maxWorkers > 0 else (os.cpu_count() or 1)
+        self.maxMemory: Optional[int] = maxMemory
+        self.processes: bool = processes
+        self.partitions: int = max(partitions, 1)
+        self.minPartitionRows: int = minPartitionRows
+        self.fusion: bool = fusion
+        self.checkFusion: bool = checkFusion
+        self.projection: bool = projection
+
+    def _runsInProcess(self, node: 'OperationNode') -> bool:
+        """ Whether the node should be executed in the process pool """
+        op = node.operation
+        return self.processes and op.isProcessSafe() and op.maxInputNumber() != 0 and \
+               op.maxOutputNumber() != 0
+
+    def _partitions(self, node: 'OperationNode') -> Optional[List[data.Frame]]:
+        """ Splits the input of a node in row partitions, if the node can be executed in partitions.
+        Returns None otherwise """
+        op = node.operation
+        inputs = [i for i in node.inputs if i is not None]
+        if self.partitions < 2 or len(inputs) != 1 or not isinstance(inputs[0], data.Frame) or \
+                op.maxOutputNumber() == 0 or not op.isRowLocal():
+            return None
+        parts = splitRows(inputs[0], self.partitions, self.minPartitionRows)
+        return parts if len(parts) > 1 else None
+
+    def _submit(self, node: 'OperationNode', inputs: Optional[List[Any]],
+                threadPool: ThreadPoolExecutor, processPool: Optional[ProcessPoolExecutor]) \
+            -> Tuple[Future, List[Any]]:
+        """ Starts the execution of a node, with its own inputs or with a partition of them. Returns
+        the future and the inputs shared with the process pool """
+        if not self._runsInProcess(node):
+            if inputs is None:
+                return threadPool.submit(node.execute), list()
+            return threadPool.submit(node.operation.execute, *inputs), list()
+        if inputs is None:
+            inputs = [i for i in node.inputs if i is not None]
+        shared = [transport.share(i) for i in inputs]
+        try:
+            return processPool.submit(_executeOperation, self._processCopy(node.operation),
+                                      shared), shared
+        except Exception:
+            for i in shared:
+                transport.release(i)
+            raise
+
+    def _collect(self, node: 'OperationNode', future: Future) -> Any:
+        """ Returns the result of a future started with :func:`_submit`. State of operations
+        executed in a process is copied in the original operation """
+        result = future.result()
+        if not self._runsInProcess(node):
+            return result
+        from dataMole.operation.interface.graph import StatefulGraphOperation
+        sharedResult, states = result
+        try:
+            result = transport.receive(sharedResult)
+        finally:
+            transport.release(sharedResult)
+        for op, (optionsLog, executionLog, fitted) in zip(_members(node.operation), states):
+            if isinstance(op, flogging.Loggable):
+                op._logOptionsString = optionsLog
+                op._logExecutionString = executionLog
+            if isinstance(op, StatefulGraphOperation):
+                op.setFittedParameters(fitted)
+        return result
+
+    @staticmethod
+    def _processCopy(operation: 'GraphOperation') -> 'GraphOperation':
+        """ Returns a copy of the operation which can be pickled. The workbench is a Qt model, and it
+        is not used by operations which are safe to run in a process """
+        if isinstance(operation, FusedOperation):
+            return FusedOperation([FlowExecutor._processCopy(op) for op in operation.operations],
+                                  operation.check)
+        op = copy.copy(operation)
+        op._workbench = None
+        return op
+
+    def run(self, graph: nx.DiGraph, toExecute: Set[int], onStart: Optional[StartCallback] = None,
+            onSuccess: Optional[SuccessCallback] = None,
+            onError: Optional[ErrorCallback] = None, cache: Optional[ResultCache] = None) -> bool:
+        """
+        Executes all nodes in 'toExecute'. Nodes without predecessors in the set are started first.
+        Execution stops at the first error, but running nodes are waited for. Callbacks are always
+        invoked in the calling thread.
+
+        :param graph: the NetworkX graph of the flow
+        :param toExecute: set of node ids to execute
+        :param onStart: called with node id when a node is started
+        :param onSuccess: called with node id and its result when a node completes, before its
+            inputs are cleared. The result is None for nodes fused with their child
+        :param onError: called with node id and a tuple (exception type, exception, traceback string)
+            when a node fails
+        :param cache: optional cache of results. Nodes whose result is cached with the same
+            fingerprint are not executed again
+
+        :return: True if every node completed, False otherwise
+
+        """
+        schedule = Schedule(graph, toExecute)
+        ready: List[Tuple[Tuple[float, int], int]] = list()
+        for nid in schedule.order:
+            if not any(p in toExecute for p in graph.predecessors(nid)):
+                heapq.heappush(ready, (schedule.sortKey(nid), nid))
+        # Number of children which still need the result of a node, and memory held by results
+        consumers: Dict[int, int] = {nid: len([c for c in graph.successors(nid) if c in toExecute])
+                                     for nid in toExecute}
+        held: Dict[int, int] = dict()
+        # Running futures, with the node id, the memory needed and the partition index (if any)
+        running: Dict[Future, Tuple[int, int, Optional[int]]] = dict()
+        # Inputs sent to the process pool, released when the node completes
+        shared: Dict[Future, List[Any]] = dict()
+        # Results of nodes executed in row partitions, until every partition is completed
+        partial: Dict[int, List[Optional[data.Frame]]] = dict()
+        # Fingerprint of every executed node
+        fingerprints: Dict[int, Optional[str]] = dict()
+        # Chains of fused nodes by id of the first node, and the objects executing rewritten nodes
+        chains: Dict[int, List[int]] = dict()
+        tasks: Dict[int, Union[FusedNode, ProjectedNode]] = dict()
+        if self.fusion:
+            chains = {c[0]: c for c in findFusableChains(graph, toExecute)}
+            tasks.update({nid: FusedNode([graph.nodes[n]['op'] for n in c], self.checkFusion)
+                          for nid, c in chains.items()})
+        if self.projection:
+            tasks.update({nid: ProjectedNode(graph.nodes[nid]['op'], columns)
+                          for nid, columns in findProjections(graph, toExecute).items()})
+        failed = False
+
+        def complete(nid: int, result: Any, propagate: bool = True) -> None:
+            """ Passes the result of a completed node to its children. Nodes fused with their child
+            do not propagate their result """
+            node: 'OperationNode' = graph.nodes[nid]['op']
+            if onSuccess:
+                onSuccess(nid, result)
+            # Release parents' results if this was the last child to consume them
+            for parent in graph.predecessors(nid):
+                if parent in consumers:
+                    consumers[parent] -= 1
+                    if consumers[parent] <= 0:
+                        held.pop(parent, None)
+            node.clearInputArgument()
+            if failed or not propagate:
+                return
+            # Put result in all child nodes
+            if consumers[nid]:
+                held[nid] = frameSize(result)
+            for child_id in graph.successors(nid):
+                if child_id not in toExecute:
+                    continue
+                child: 'OperationNode' = graph.nodes[child_id]['op']
+                child.addInputArgument(result, op_id=nid)
+                # Check if child has all it needs to start
+                if graph.in_degree(child_id) == child.nInputs:
+                    heapq.heappush(ready, (schedule.sortKey(child_id), child_id))
+
+        def completeChain(chain: List[int], result: Any) -> None:
+            """ Completes every node of a chain, where only the last node has a result """
+            for i, member in enumerate(chain):
+                if i and onStart:
+                    onStart(member)
+                isLast = i == len(chain) - 1
+                complete(member, result if isLast else None, propagate=isLast)
+
+        def cacheable(node: 'OperationNode') -> bool:
+            # Output operations have side effects, so they are always executed
+            return cache is not None and cache.enabled and node.operation.maxOutputNumber() != 0
+
+        threadPool = ThreadPoolExecutor(max_workers=self.maxWorkers)
+        processPool = ProcessPoolExecutor(max_workers=self.maxWorkers) if self.processes else None
+        try:
+            while ready or running:
+                # Start as many ready nodes as allowed
+                while ready and not failed and len(running) < self.maxWorkers:
+                    nid = ready[0][1]
+                    node: 'OperationNode' = graph.nodes[nid]['op']
+                    chain = chains.get(nid, [nid])
+                    task = tasks.get(nid, node)
+                    if cacheable(node) and node.operation.maxInputNumber() == 0:
+                        # Input frames are not cached. The version of their data is read before
+                        # executing them, so that later changes are not attributed to this result
+                        fingerprints[nid] = cache.inputFingerprint(node)
+                    elif cacheable(node):
+                        # The result of a fused chain is the result of its last node
+                        for member in chain:
+                            fingerprints[member] = cache.fingerprint(graph.nodes[member]['op'],
+                                                                     fingerprints)
+                        last = chain[-1]
+                        result = cache.get(last, fingerprints[last]) if fingerprints[last] else None
+                        if result is not None:
+                            # Skip execution
+                            heapq.heappop(ready)
+                            flogging.appLogger.debug('Node {} result taken from cache'.format(last))
+                            if onStart:
+                                onStart(nid)
+                            completeChain(chain, result)
+                            continue
+                    need = estimateOutputSize(node)
+                    used = sum(held.values()) + sum(r[1] for r in running.values())
+                    if self.maxMemory is not None and running and used + need > self.maxMemory:
+                        # Wait for some node to complete
+                        break
+                    heapq.heappop(ready)
+                    parts = self._partitions(task)
+                    if parts is None:
+                        future, inputs = self._submit(task, None, threadPool, processPool)
+                        running[future] = (nid, need, None)
+                        shared[future] = inputs
+                    else:
+                        partial[nid] = [None] * len(parts)
+                        for i, part in enumerate(parts):
+                            future, inputs = self._submit(task, [part], threadPool, processPool)
+                            running[future] = (nid, need // len(parts), i)
+                            shared[future] = inputs
+                    if onStart:
+                        onStart(nid)
+                if not running:
+                    break
+                done, _ = wait(list(running.keys()), return_when=FIRST_COMPLETED)
+                for future in done:
+                    nid, _, part = running.pop(future)
+                    node: 'OperationNode' = graph.nodes[nid]['op']
+                    chain = chains.get(nid, [nid])
+                    for i in shared.pop(future, tuple()):
+                        transport.release(i)
+                    if part is not None and nid not in partial:
+                        # Another partition of the node failed
+                        continue
+                    try:
+                        result = self._collect(tasks.get(nid, node), future)
+                    except Exception as e:
+                        failed = True
+                        partial.pop(nid, None)
+                        trace = ''.join(traceback.format_exception(type(e), e, e.__traceback__))
+                        flogging.appLogger.error(trace)
+                        failedId, error = nid, e
+                        if isinstance(e, FusedOperationError):
+                            # Nodes of the chain before the failed one completed
+                            failedId, error = chain[e.position], e.error
+                            for i, member in enumerate(chain[:e.position + 1]):
+                                if i and onStart:
+                                    onStart(member)
+                                if member != failedId:
+                                    complete(member, None, propagate=False)
+                        if onError:
+                            onError(failedId, (type(error), error, trace))
+                        node.clearInputArgument()
+                        continue
+                    if part is not None:
+                        partial[nid][part] = result
+                        if any(r is None for r in partial[nid]):
+                            continue
+                        result = data.Frame(concatRows([r.getRawFrame() for r in partial.pop(nid)]))
+                    if cacheable(node) and node.operation.maxInputNumber() != 0 and \
+                            fingerprints.get(chain[-1], None):
+                        cache.put(chain[-1], fingerprints[chain[-1]], result)
+                    completeChain(chain, result)
+        finally:
+            threadPool.shutdown(wait=True)
+            if processPool:
+                processPool.shutdown(wait=True)
+            for inputs in shared.values():
+                for i in inputs:
+                    transport.release(i)
+            if failed:
+                # Clear input set in successors
+                for nid in toExecute:
+                    graph.nodes[nid]['op'].clearInputArgument()
+        return not failed
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+#
+# Author:       Alessandro Zangari (alessandro.zangari.code@outlook.com)
+# Copyright:    © Copyright 2020 Alessandro Zangari, Università degli Studi di Padova
+# License:      GPL-3.0-or-later
+# Date:         2020-10-04
+# Version:      1.0
+#
+# This file is part of DataMole.
+#
+# DataMole is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# DataMole is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with DataMole.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Fusion of chains of column-local operations (see
+:func:`~dataMole.operation.interface.graph.GraphOperation.isColumnLocal`). Every operation of a
+chain reads and replaces columns through a single :class:`~dataMole.data.Frame.ColumnView`, so
+that only the frame of the last operation is built. Results are the same of executing the
+operations one at a time
+"""
+
+from typing import List, Set, Any
+
+import networkx as nx
+
+from dataMole import data
+
+
+class FusedOperationError(Exception):
+    """ Raised when an operation of a fused chain fails. It holds the position of the operation in
+    the chain and the original error """
+
+    def __init__(self, position: int, error: Exception):
+        super().__init__(position, error)
+        self.position: int = position
+        self.error: Exception = error
+
+
+class FusionMismatchError(Exception):
+    """ Raised when the result of a fused chain differs from the result of the same operations
+    executed one at a time """
+    pass
+
+
+class FusedOperation:
+    """ Executes a chain of column-local operations in a single pass. It provides the methods of
+    :class:`~dataMole.operation.interface.graph.GraphOperation` used by the flow executor """
+
+    def __init__(self, operations: List['GraphOperation'], check: bool = False):
+        """
+        Creates the fused operation
+
+        :param operations: the operations of the chain, in execution order
+        :param check: if True the operations are also executed one at a time, and the results are
+            compared (see :class:`FusionMismatchError`). Used to test the fusion
+
+        """
+        self.operations: List['GraphOperation'] = operations
+        self.check: bool = check
+
+    def execute(self, df: data.Frame) -> data.Frame:
+        """
+        Applies every operation to the columns of the frame and builds the result once
+
+        :param df: the input of the first operation
+        :return: the output of the last operation
+        :raise FusedOperationError: if some operation fails
+        :raise FusionMismatchError: in check mode, if the fused result is different
+
+        """
+        columns = data.ColumnView(df)
+        for position, operation in enumerate(self.operations):
+            try:
+                columns.replace(operation.executeColumns(columns))
+            except Exception as e:
+                raise FusedOperationError(position, e) from e
+        result = df.replaceColumns(columns.replaced)
+        if self.check:
+            expected = df
+            for operation in self.operations:
+                expected = operation.execute(expected)
+            if result != expected:
+                raise FusionMismatchError('Fused execution of operations {} gives a different '
+                                          'result'.format(', '.join(op.name() for op in
+                                                                    self.operations)))
+        return result
+
+    def name(self) -> str:
+        return '+'.join(op.name() for op in self.operations)
+
+    def isProcessSafe(self) -> bool:
+        return all(op.isProcessSafe() for op in self.operations)
+
+    def isRowLocal(self) -> bool:
+        return all(op.isRowLocal() for op in self.operations)
+
+    @staticmethod
+    def maxInputNumber() -> int:
+        return 1
+
+    @staticmethod
+    def maxOutputNumber() -> int:
+        return -1
+
+
+class FusedNode:
+    """ Replaces the nodes of a fused chain in the executor. Its inputs are the inputs of the first
+    node """
+
+    def __init__(self, nodes: List['OperationNode'], check: bool = False):
+        self.nodes: List['OperationNode'] = nodes
+        self.operation = FusedOperation([n.operation for n in nodes], check)
+
+    @property
+    def uid(self) -> int:
+        return self.nodes[0].uid
+
+    @property
+    def inputs(self) -> List[Any]:
+        return self.nodes[0].inputs
+
+    def execute(self) -> data.Frame:
+        return self.operation.execute(*[i for i in self.inputs if i is not None])
+
+
+def isFusable(node: 'OperationNode') -> bool:
+    """ Tells if the operation of a node can be part of a fused chain """
+    op = node.operation
+    return op.maxInputNumber() == 1 and op.maxOutputNumber() != 0 and op.isColumnLocal()
+
+
+def findFusableChains(graph: nx.DiGraph, toExecute: Set[int]) -> List[List[int]]:
+    """
+    Finds the chains of column-local operations which can be executed in a single pass. In a chain
+    every node but the last has a single child, and every node but the first has a single parent
+
+    :param graph: the NetworkX graph of the flow
+    :param toExecute: the ids of nodes to execute
+    :return: the list of chains with at least two nodes. Every chain is the list of node ids in
+        execution order
+
+    """
+    chains: List[List[int]] = list()
+    chainOf = dict()
+    for nid in nx.topological_sort(graph.subgraph(toExecute)):
+        if not isFusable(graph.nodes[nid]['op']):
+            continue
+        parents = list(graph.predecessors(nid))
+        if len(parents) == 1 and parents[0] in chainOf and graph.out_degree(parents[0]) == 1:
+            chain = chainOf[parents[0]]
+            chain.append(nid)
+        else:
+            chain = [nid]
+            chains.append(chain)
+        chainOf[nid] = chain
+    return [c for c in chains if len(c) > 1]
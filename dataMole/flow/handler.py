@@ -22,24 +22,43 @@
 # along with DataMole.  If not, see <https://www.gnu.org/licenses/>.
 
 from datetime import datetime
-from typing import Tuple, List, Set
+from typing import Tuple, List, Set, Optional
 
 import networkx as nx
-from PySide2.QtCore import QThreadPool, Slot, QObject, Signal, Qt
+from PySide2.QtCore import QThreadPool, QObject, Signal
 
-from dataMole import data, exceptions as exp
+from dataMole import data
 from dataMole import flogging
+from dataMole.data import memory
 from dataMole.status import NodeStatus
 from dataMole.threads import Worker
 from . import dag
-
+from .cache import ResultCache
+from .executor import FlowExecutor, findInputNodes, findExecutionSet
 
 class OperationHandler:
-    """ Executes a DAG """
+    """ Executes a DAG. The flow is scheduled by a :class:`~dataMole.flow.executor.FlowExecutor`,
+    which runs in a background thread of the global thread pool """
 
-    def __init__(self, graph: 'dag.OperationDag'):
+    def __init__(self, graph: 'dag.OperationDag', executor: Optional[FlowExecutor] = None,
+                 processes: int = 0, partitions: int = 1):
+        """
+        Prepares the execution of a flow
+
+        :param graph: the flow to execute
+        :param executor: the executor of the flow. If None an executor is configured with the
+            following parameters, whose memory budget is the ceiling of the application
+        :param processes: number of processes used to execute operations. If 0 operations are
+            executed in threads of the current process
+        :param partitions: maximum number of row partitions of the input of row-local operations.
+            If 1 frames are not partitioned
+        """
         self.graph: nx.DiGraph = graph.getNxGraph()
-        self.__qtSlots = _HandlerSlots(self)
+        self.cache: ResultCache = graph.cache
+        if executor is None:
+            executor = FlowExecutor(maxWorkers=processes, maxMemory=memory.manager.maxBytes,
+                                    processes=processes > 0, partitions=partitions)
+        self.executor: FlowExecutor = executor
         self.signals = HandlerSignals()
         self.toExecute: Set[int] = set()
         self.graphLogger: flogging.GraphOperationLogger = None
@@ -51,9 +70,7 @@ class OperationHandler:
         :raise HandlerException if the flow is not ready to start
         """
         # Find input nodes
-        start_nodes_id = [n for (n, deg) in self.graph.in_degree() if deg == 0]
-        input_nodes = [node for node in map(lambda nid: self.graph.nodes[nid]['op'], start_nodes_id) if
-                       node.operation.maxInputNumber() == 0]
+        input_nodes = findInputNodes(self.graph)
         self._canExecute(input_nodes)
 
         # Create a logger for the execution
@@ -62,16 +79,8 @@ class OperationHandler:
         logger.info('OPERATION LOG')
         logger.info('Execution time: {}\n'.format(datetime.now()))
         self.graphLogger = flogging.GraphOperationLogger(logger)
-        # Start execution of all input nodes
-        for node in input_nodes:
-            self.startNode(node)
-
-    def startNode(self, node: 'OperationNode'):
-        worker = Worker(node, identifier=node.uid)
-        # Connect
-        worker.signals.result.connect(self.__qtSlots.nodeCompleted, Qt.AutoConnection)
-        worker.signals.error.connect(self.__qtSlots.nodeErrored, Qt.AutoConnection)
-        self.signals.statusChanged.emit(node.uid, NodeStatus.PROGRESS)
+        # Start execution of the whole flow in a separate thread
+        worker = Worker(_FlowTask(self))
         QThreadPool.globalInstance().start(worker)
 
     def _canExecute(self, input_nodes: List['OperationNode']) -> bool:
@@ -81,34 +90,52 @@ class OperationHandler:
 
         :raise HandlerException if the flow is not ready for execution
         """
-        if not input_nodes:
-            flogging.appLogger.error('Flow not started: there are no input operations')
-            raise exp.HandlerException('Flow not started', 'There are no input nodes')
-        # Find the set of reachable nodes from the input operations
-        reachable = set()
-        for node in input_nodes:
-            # Also check that input nodes have options set, or raise error
-            if not node.operation.hasOptions():
-                flogging.appLogger.error(
-                    'Flow not started: input operation "{}-{}" is not configured'.format(
-                        node.operation.name(), node.uid))
-                raise exp.HandlerException('Flow not started',
-                                           'Input operation "{}" has options to set'.format(
-                                               node.operation.name()))
-            # All descendants of input node are reachable
-            reachable = reachable.union(nx.dag.descendants(self.graph, node.uid))
-        # Check if all reachable nodes have options set
-        for node_id in reachable:
-            node: 'OperationNode' = self.graph.nodes[node_id]['op']
-            if not node.operation.hasOptions():
-                flogging.appLogger.error('Flow not started: operation "{}-{}" has options to set'.format(
-                    node.operation.name(), node.uid))
-                raise exp.HandlerException('Flow not started',
-                                           'Operation "{}" has options to set'.format(
-                                               node.operation.name()))
-        self.toExecute = reachable | set(map(lambda x: x.uid, input_nodes))
+        self.toExecute = findExecutionSet(self.graph, input_nodes)
         return True
 
+    def nodeStarted(self, node_id: int) -> None:
+        self.signals.statusChanged.emit(node_id, NodeStatus.PROGRESS)
+
+    def nodeCompleted(self, node_id: int, result: data.Frame) -> None:
+        flogging.appLogger.debug('nodeCompleted SUCCESS')
+        # Emit node finished
+        self.signals.statusChanged.emit(node_id, NodeStatus.SUCCESS)
+        # Log operation
+        node = self.graph.nodes[node_id]['op']
+        self.graphLogger.log(node, result)
+        # Remove from task list
+        self.toExecute.discard(node_id)
+
+    def nodeErrored(self, node_id: int, error: Tuple[type, Exception, str]) -> None:
+        self.signals.statusChanged.emit(node_id, NodeStatus.ERROR)
+        msg = str(error[1])
+        eName = error[0].__name__
+        self.toExecute.discard(node_id)
+        node = self.graph.nodes[node_id]['op']
+        flogging.appLogger.error('GraphOperation {} failed with exception {}: {} - trace: {}'.format(
+            node.operation.name(), eName, msg, error[2]))
+        self.signals.failedWithMessage.emit(node_id, 'Exception "{}" in "{}": {}'
+                                            .format(eName, node.operation.name(), msg))
+        # Log operation
+        self.graphLogger.log(node, None)
+
+
+class _FlowTask:
+    """ Runs the executor loop. Used as the executable of a Worker """
+
+    def __init__(self, handler: OperationHandler):
+        self.handler: OperationHandler = handler
+
+    def execute(self) -> bool:
+        h = self.handler
+        try:
+            return h.executor.run(h.graph, set(h.toExecute), onStart=h.nodeStarted,
+                                  onSuccess=h.nodeCompleted, onError=h.nodeErrored, cache=h.cache)
+        finally:
+            # Reset execution queue (set) and emit finished signal
+            h.toExecute = set()
+            h.signals.allFinished.emit()
+
 
 class HandlerSignals(QObject):
     """
@@ -121,60 +148,3 @@ class HandlerSignals(QObject):
     statusChanged = Signal(int, NodeStatus)
     failedWithMessage = Signal(int, str)
     allFinished = Signal()
-
-
-class _HandlerSlots(QObject):
-    def __init__(self, handler: OperationHandler, parent: QObject = None):
-        super().__init__(parent)
-        self.handler: OperationHandler = handler
-
-    @Slot(object, object)
-    def nodeCompleted(self, node_id: int, result: data.Frame):
-        flogging.appLogger.debug('nodeCompleted SUCCESS')
-        # Emit node finished
-        self.handler.signals.statusChanged.emit(node_id, NodeStatus.SUCCESS)
-        # Clear eventual input, since now I have result
-        node = self.handler.graph.nodes[node_id]['op']
-        # Log operation
-        self.handler.graphLogger.log(node, result)
-        # Delete inputs
-        node.clearInputArgument()
-        # Remove from task list
-        self.handler.toExecute.remove(node_id)
-        # Check if it was the last one
-        if not len(self.handler.toExecute):
-            # All tasks were completed
-            self.handler.signals.allFinished.emit()
-            return
-        # Put result in all child nodes
-        for child_id in self.handler.graph.successors(node_id):
-            child: 'OperationNode' = self.handler.graph.nodes[child_id]['op']
-            child.addInputArgument(result, op_id=node_id)
-            # Check if child has all it needs to start
-            if self.handler.graph.in_degree(child_id) == child.nInputs:
-                # If so, add the worker to thread pool
-                self.handler.startNode(child)
-
-    @Slot(object, tuple)
-    def nodeErrored(self, node_id: int, error: Tuple[type, Exception, str]):
-        self.handler.signals.statusChanged.emit(node_id, NodeStatus.ERROR)
-        msg = str(error[1])
-        eName = error[0].__name__
-        if self.handler.toExecute:
-            # If a node has already failed the set is empty
-            self.handler.toExecute.remove(node_id)
-        node = self.handler.graph.nodes[node_id]['op']
-        node.clearInputArgument()
-        flogging.appLogger.error('GraphOperation {} failed with exception {}: {} - trace: {}'.format(
-            node.operation.name(), eName, msg, error[2]))
-        self.handler.signals.failedWithMessage.emit(node_id, 'Exception "{}" in "{}": {}'
-                                                    .format(eName, node.operation.name(), msg))
-        # Log operation
-        self.handler.graphLogger.log(node, None)
-        # Clear input set in successors and reset execution queue (set)
-        for uid in self.handler.toExecute:
-            node = self.handler.graph.nodes[uid]['op']
-            node.clearInputArgument()
-        self.handler.toExecute = set()
-        # Emit finished signal
-        self.handler.signals.allFinished.emit()
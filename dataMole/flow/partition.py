@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+#
+# Author:       Alessandro Zangari (alessandro.zangari.code@outlook.com)
+# Copyright:    © Copyright 2020 Alessandro Zangari, Università degli Studi di Padova
+# License:      GPL-3.0-or-later
+# Date:         2020-10-04
+# Version:      1.0
+#
+# This file is part of DataMole.
+#
+# DataMole is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# DataMole is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with DataMole.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Row partitions of frames. Row-local operations (see
+:func:`~dataMole.operation.interface.graph.GraphOperation.isRowLocal`) can be executed on every
+partition independently, and their results are concatenated in the original order
+"""
+
+from typing import Dict, List, Tuple
+
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from dataMole import data
+
+# Frames are not split in partitions with fewer rows than this
+MIN_PARTITION_ROWS = 100000
+
+
+def partitionBounds(nRows: int, parts: int, minRows: int = MIN_PARTITION_ROWS) \
+        -> List[Tuple[int, int]]:
+    """
+    Computes the bounds of row partitions of similar size
+
+    :param nRows: number of rows to split
+    :param parts: maximum number of partitions
+    :param minRows: minimum number of rows in every partition
+    :return: the list of (start, stop) positions of every partition. A single partition is returned
+        if the rows are too few to split
+    """
+    parts = max(1, min(parts, nRows // max(minRows, 1)))
+    step, extra = divmod(nRows, parts)
+    bounds = list()
+    start = 0
+    for i in range(parts):
+        stop = start + step + (1 if i < extra else 0)
+        bounds.append((start, stop))
+        start = stop
+    return bounds
+
+
+def splitRows(frame: data.Frame, parts: int, minRows: int = MIN_PARTITION_ROWS) -> List[data.Frame]:
+    """
+    Splits a frame in partitions of consecutive rows. Partitions are views of the frame, which is
+    not copied
+
+    :param frame: the frame to split
+    :param parts: maximum number of partitions
+    :param minRows: minimum number of rows in every partition
+    :return: the list of partitions, in order
+    """
+    df = frame.getRawFrame()
+    bounds = partitionBounds(df.shape[0], parts, minRows)
+    if len(bounds) == 1:
+        return [frame]
+    return [data.Frame(df.iloc[start:stop]) for start, stop in bounds]
+
+
+def concatRows(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Concatenates frames with the same columns, keeping their index. Unordered categorical columns
+    whose categories were inferred from the values of every frame (and thus differ) are merged with
+    the union of sorted categories, as if they were inferred on the whole frame
+
+    :param frames: the frames to concatenate, with at least one element
+    :return: the concatenated frame
+    """
+    if len(frames) == 1:
+        return frames[0]
+    result = pd.concat(frames)
+    merged: Dict[int, pd.Categorical] = dict()
+    for j, dtype in enumerate(frames[0].dtypes):
+        if not isinstance(dtype, pd.CategoricalDtype) or dtype.ordered:
+            continue
+        columns = [f.iloc[:, j] for f in frames]
+        if all(isinstance(c.dtype, pd.CategoricalDtype) and not c.dtype.ordered for c in columns) \
+                and any(c.dtype != dtype for c in columns):
+            merged[j] = union_categoricals(columns, sort_categories=True)
+    if merged:
+        result = data.Frame(result).replaceColumns(merged).getRawFrame()
+    return result
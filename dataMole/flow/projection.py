@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+#
+# Author:       Alessandro Zangari (alessandro.zangari.code@outlook.com)
+# Copyright:    © Copyright 2020 Alessandro Zangari, Università degli Studi di Padova
+# License:      GPL-3.0-or-later
+# Date:         2020-10-04
+# Version:      1.0
+#
+# This file is part of DataMole.
+#
+# DataMole is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# DataMole is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with DataMole.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Projection pushdown. The columns needed by every node are computed walking the flow backward from
+its sinks (see :func:`~dataMole.operation.interface.graph.GraphOperation.neededColumns`), so that
+input operations only read the columns which some output depends on (see
+:func:`~dataMole.operation.interface.graph.InputGraphOperation.executeProjection`). Columns which
+are not read are kept as placeholders, so that positions of columns set in the options of
+operations remain valid
+"""
+
+from typing import Dict, Optional, Set, Any, List
+
+import networkx as nx
+
+from dataMole import data
+
+
+class ProjectedNode:
+    """ Replaces an input node in the executor, reading only the needed columns """
+
+    def __init__(self, node: 'OperationNode', columns: Set[int]):
+        self.node: 'OperationNode' = node
+        self.columns: Set[int] = columns
+
+    @property
+    def operation(self) -> 'InputGraphOperation':
+        return self.node.operation
+
+    @property
+    def inputs(self) -> List[Any]:
+        return self.node.inputs
+
+    def execute(self) -> data.Frame:
+        return self.node.operation.executeProjection(self.columns)
+
+
+def findNeededColumns(graph: nx.DiGraph, toExecute: Set[int]) -> Dict[int, Optional[Set[int]]]:
+    """
+    Computes the columns of the output of every node which are needed by its children
+
+    :param graph: the NetworkX graph of the flow
+    :param toExecute: the ids of nodes to execute
+    :return: for every node the positions of the needed output columns, or None if every column is
+        needed. Every column of nodes without children is needed
+
+    """
+    needed: Dict[int, Optional[Set[int]]] = dict()
+    for nid in reversed(list(nx.topological_sort(graph.subgraph(toExecute)))):
+        children = [c for c in graph.successors(nid) if c in toExecute]
+        columns: Optional[Set[int]] = set() if children else None
+        for child in children:
+            childColumns = graph.nodes[child]['op'].operation.neededColumns(needed[child])
+            if childColumns is None:
+                columns = None
+                break
+            columns |= childColumns
+        needed[nid] = columns
+    return needed
+
+
+def findProjections(graph: nx.DiGraph, toExecute: Set[int]) -> Dict[int, Set[int]]:
+    """
+    Finds the input nodes whose output is not entirely needed
+
+    :param graph: the NetworkX graph of the flow
+    :param toExecute: the ids of nodes to execute
+    :return: the positions of the needed columns of every input node which can read less columns
+
+    """
+    from dataMole.operation.interface.graph import InputGraphOperation
+    needed = findNeededColumns(graph, toExecute)
+    return {nid: needed[nid] for nid in toExecute
+            if needed[nid] is not None and
+            isinstance(graph.nodes[nid]['op'].operation, InputGraphOperation)}
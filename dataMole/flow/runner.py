@@ -0,0 +1,323 @@
+# -*- coding: utf-8 -*-
+#
+# Author:       Alessandro Zangari (alessandro.zangari.code@outlook.com)
+# Copyright:    © Copyright 2020 Alessandro Zangari, Università degli Studi di Padova
+# License:      GPL-3.0-or-later
+# Date:         2020-10-04
+# Version:      1.0
+#
+# This file is part of DataMole.
+#
+# DataMole is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# DataMole is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with DataMole.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Execution of saved pipelines without the graphical interface
+"""
+
+import os
+import pickle
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+import pandas as pd
+
+from dataMole import data, flogging, exceptions as exp
+from dataMole.operation.input import SetInput
+from dataMole.operation.output import ToVariableOp
+from dataMole.operation.readwrite.parquet import isColumnar, readColumnar, writeColumnar
+from dataMole.utils import UIdGenerator
+from . import dag
+from .executor import FlowExecutor, findInputNodes, findExecutionSet
+from .streaming import ChunkSink, ChunkSource, StreamingExecutor, StreamPlan
+
+
+class FrameHandle:
+    """ Minimal replacement of a workbench frame model, which holds a named frame or lazy frame """
+
+    def __init__(self, frame: Union[data.Frame, data.LazyFrame], name: str):
+        self.__frame: Union[data.Frame, data.LazyFrame] = frame
+        self.name: str = name
+        # Identifier of the current frame, as in frame models
+        self.version: int = UIdGenerator().getUniqueId()
+
+    def setFrame(self, frame: Union[data.Frame, data.LazyFrame]) -> None:
+        self.__frame = frame
+        self.version = UIdGenerator().getUniqueId()
+
+    @property
+    def frame(self) -> data.Frame:
+        if isinstance(self.__frame, data.LazyFrame):
+            return self.__frame.load()
+        return self.__frame
+
+    def projection(self, columns: Iterable[int]) -> data.Frame:
+        if isinstance(self.__frame, data.LazyFrame):
+            return self.__frame.loadColumns(columns)
+        return self.__frame
+
+    @property
+    def source(self) -> Union[data.Frame, data.LazyFrame]:
+        return self.__frame
+
+    @property
+    def shape(self) -> data.Shape:
+        return self.__frame.shape
+
+
+class HeadlessWorkbench:
+    """ Stores named frames with the same interface used by operations to access the workbench
+    (see :class:`~dataMole.gui.workbench.WorkbenchModel`), but without Qt models """
+
+    def __init__(self):
+        self.__frames: Dict[str, FrameHandle] = dict()
+
+    @property
+    def names(self) -> List[str]:
+        return list(self.__frames.keys())
+
+    @property
+    def modelDict(self) -> Dict[str, FrameHandle]:
+        return self.__frames
+
+    def rowCount(self) -> int:
+        return len(self.__frames)
+
+    def getDataframeModelByName(self, name: str) -> FrameHandle:
+        return self.__frames[name]
+
+    def setDataframeByName(self, name: str, value: Union[data.Frame, data.LazyFrame]) -> bool:
+        handle = self.__frames.get(name, None)
+        if handle is not None:
+            if handle.source is value:
+                return False
+            handle.setFrame(value)
+        else:
+            self.__frames[name] = FrameHandle(value, name)
+        return True
+
+    def removeByName(self, name: str) -> bool:
+        return self.__frames.pop(name, None) is not None
+
+
+def readFrame(path: str) -> data.Frame:
+    """
+    Reads a dataframe from file. Format is inferred from the extension: 'csv', 'pickle' (or 'pkl'),
+    'parquet' and 'feather' are supported. Parquet and Feather files are memory-mapped
+
+    :param path: the path of the file to read
+    :raise ValueError: if the file extension is not supported
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if isColumnar(path):
+        return readColumnar(path)
+    elif ext == '.csv':
+        df = pd.read_csv(path, index_col=False)
+    elif ext in ('.pickle', '.pkl'):
+        df = pd.read_pickle(path)
+    else:
+        raise ValueError('Unsupported file format "{}"'.format(ext))
+    return data.Frame(df)
+
+
+def writeFrame(frame: data.Frame, path: str) -> None:
+    """
+    Writes a dataframe to file. Format is inferred from the extension, like in :func:`readFrame`.
+    The index is not written to csv files, since it is not read back
+
+    :param frame: the frame to write
+    :param path: the destination path
+    :raise ValueError: if the file extension is not supported
+    """
+    ext = os.path.splitext(path)[1].lower()
+    df = frame.getRawFrame()
+    if isColumnar(path):
+        writeColumnar(frame, path)
+    elif ext == '.csv':
+        df.to_csv(path, index=False)
+    elif ext in ('.pickle', '.pkl'):
+        df.to_pickle(path)
+    else:
+        raise ValueError('Unsupported file format "{}"'.format(ext))
+
+
+def isChunkable(path: str) -> bool:
+    """ Tells if a file can be read and written in chunks of rows. Only csv files are supported """
+    return os.path.splitext(path)[1].lower() == '.csv'
+
+
+def readChunks(path: str, chunksize: int) -> Iterator[data.Frame]:
+    """
+    Reads a csv file in chunks. Rows of all chunks are numbered consecutively
+
+    :param path: the path of the csv file
+    :param chunksize: the number of rows of every chunk
+    """
+    for df in pd.read_csv(path, index_col=False, chunksize=chunksize):
+        yield data.Frame(df)
+
+
+class CsvChunkWriter:
+    """ Writes the chunks of a frame to a csv file, one after the other """
+
+    def __init__(self, path: str):
+        self.path: str = path
+        self.__first: bool = True
+
+    def __call__(self, frame: data.Frame) -> None:
+        frame.getRawFrame().to_csv(self.path, mode='w' if self.__first else 'a', header=self.__first,
+                                   index=False)
+        self.__first = False
+
+
+def _readSerialization(path: str) -> Dict:
+    try:
+        with open(path, 'rb') as file:
+            return pickle.load(file)
+    except pickle.PickleError as e:
+        raise exp.DagException('Pickle error', str(e))
+
+
+def loadFlow(path: str) -> 'dag.OperationDag':
+    """
+    Reads a pipeline saved from the graphical interface
+
+    :param path: the pickle file with the serialized flow
+    :raise DagException: if the file does not contain a valid pipeline
+    """
+    return dag.OperationDag.deserialize(_readSerialization(path))
+
+
+def loadLayout(path: str) -> Dict[int, Tuple[float, float]]:
+    """ Reads the position of every node in the scene from a saved pipeline """
+    nodes: Dict[int, Dict] = _readSerialization(path).get('nodes', dict())
+    return {nodeId: node['pos'] for nodeId, node in nodes.items() if 'pos' in node}
+
+
+def saveFlow(graph: 'dag.OperationDag', path: str,
+             layout: Optional[Dict[int, Tuple[float, float]]] = None) -> None:
+    """
+    Saves a pipeline in the format used by the graphical interface, including the parameters
+    fitted by operations
+
+    :param graph: the pipeline
+    :param path: the destination pickle file
+    :param layout: the position of nodes in the scene. Nodes without position are put at the origin
+    """
+    serialization = graph.serialize()
+    layout = layout if layout else dict()
+    for nodeId, node in serialization['nodes'].items():
+        node['pos'] = layout.get(nodeId, (0.0, 0.0))
+    with open(path, 'wb') as file:
+        pickle.dump(serialization, file)
+
+
+class PipelineRunner:
+    """ Executes a pipeline in the current thread, reading input frames from files and writing
+    output frames to files """
+
+    def __init__(self, graph: 'dag.OperationDag', executor: Optional[FlowExecutor] = None,
+                 workbench: Optional[HeadlessWorkbench] = None):
+        self.graph = graph
+        self.executor: FlowExecutor = executor if executor else FlowExecutor()
+        self.workbench: HeadlessWorkbench = workbench if workbench is not None else HeadlessWorkbench()
+        self.graphLogger: Optional[flogging.GraphOperationLogger] = None
+        self.errors: List[Tuple[int, str]] = list()
+        # Set the workbench in every operation
+        g = self.graph.getNxGraph()
+        for nodeId in g.nodes:
+            g.nodes[nodeId]['op'].operation._workbench = self.workbench
+
+    def _nodeCompleted(self, node_id: int, result: data.Frame) -> None:
+        if self.graphLogger:
+            self.graphLogger.log(self.graph[node_id], result)
+
+    def _nodeErrored(self, node_id: int, error: Tuple[type, Exception, str]) -> None:
+        node = self.graph[node_id]
+        msg = 'Exception "{}" in "{}": {}'.format(error[0].__name__, node.operation.name(),
+                                                  str(error[1]))
+        self.errors.append((node_id, msg))
+        if self.graphLogger:
+            self.graphLogger.log(node, None)
+
+    def _stream(self, toExecute: Set[int], inputs: Dict[str, str], outputs: Dict[str, str],
+                chunksize: int) -> Tuple[Set[int], Set[str], Set[str]]:
+        """
+        Executes the nodes which can be streamed, reading csv inputs in chunks and writing csv
+        outputs one chunk at a time. Results needed by other nodes are set as their input
+
+        :return: the ids of executed nodes, the names of frames read in chunks and the names of
+            frames already written
+        """
+        g = self.graph.getNxGraph()
+        sources: Dict[int, ChunkSource] = dict()
+        sinks: Dict[int, ChunkSink] = dict()
+        names: Dict[int, str] = dict()
+        for nid in toExecute:
+            op = g.nodes[nid]['op'].operation
+            if isinstance(op, SetInput):
+                name = op.getOptions()['inputF']
+                if name in inputs and isChunkable(inputs[name]):
+                    sources[nid] = lambda path=inputs[name]: readChunks(path, chunksize)
+                    names[nid] = name
+            elif isinstance(op, ToVariableOp):
+                name = op.getOptions()[0]
+                if name in outputs and isChunkable(outputs[name]):
+                    sinks[nid] = CsvChunkWriter(outputs[name])
+                    names[nid] = name
+        plan = StreamPlan(g, toExecute, sources.keys(), sinks.keys())
+        results = StreamingExecutor().run(g, plan, sources, sinks, onSuccess=self._nodeCompleted,
+                                          onError=self._nodeErrored)
+        if results is None:
+            raise exp.HandlerException('Flow failed', '\n'.join(m for _, m in self.errors))
+        for nid, frame in results.items():
+            for child in g.successors(nid):
+                if child in toExecute and child not in plan.streamed:
+                    g.nodes[child]['op'].addInputArgument(frame, op_id=nid)
+        return plan.streamed, {names[n] for n in sources}, \
+               {names[n] for n in sinks if n in plan.streamed}
+
+    def run(self, inputs: Dict[str, str], outputs: Dict[str, str],
+            chunksize: Optional[int] = None) -> None:
+        """
+        Executes the pipeline
+
+        :param inputs: dictionary { frame name: path } of frames to load before execution. Names
+            must match the ones used in input operations
+        :param outputs: dictionary { frame name: path } of frames to write after execution. Names
+            must match the ones used in output operations
+        :param chunksize: if set, csv inputs are read in chunks with this number of rows and
+            operations which support it are executed one chunk at a time (streaming mode). Other
+            operations receive the whole frame
+        :raise HandlerException: if the pipeline cannot be started or some operation failed
+        """
+        g = self.graph.getNxGraph()
+        toExecute = findExecutionSet(g, findInputNodes(g))
+        self.errors = list()
+        streamedInputs: Set[str] = set()
+        written: Set[str] = set()
+        if chunksize:
+            streamed, streamedInputs, written = self._stream(toExecute, inputs, outputs, chunksize)
+            toExecute = toExecute - streamed
+        for name, path in inputs.items():
+            if name not in streamedInputs:
+                self.workbench.setDataframeByName(name, readFrame(path))
+        if not self.executor.run(g, toExecute, onSuccess=self._nodeCompleted,
+                                 onError=self._nodeErrored):
+            raise exp.HandlerException('Flow failed', '\n'.join(m for _, m in self.errors))
+        for name, path in outputs.items():
+            if name in written:
+                continue
+            if name not in self.workbench.names:
+                raise exp.HandlerException('Missing output',
+                                           'Frame "{}" was not produced by the flow'.format(name))
+            writeFrame(self.workbench.getDataframeModelByName(name).frame, path)
@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+#
+# Author:       Alessandro Zangari (alessandro.zangari.code@outlook.com)
+# Copyright:    © Copyright 2020 Alessandro Zangari, Università degli Studi di Padova
+# License:      GPL-3.0-or-later
+# Date:         2020-10-04
+# Version:      1.0
+#
+# This file is part of DataMole.
+#
+# DataMole is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# DataMole is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with DataMole.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Streaming execution of flows, where input frames are processed one chunk of rows at a time
+"""
+
+import traceback
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+import networkx as nx
+import pandas as pd
+
+from dataMole import data, flogging
+from .executor import StartCallback, SuccessCallback, ErrorCallback
+from .partition import concatRows
+
+# Returns a new iterable over the chunks of an input frame. It is called once for every pass
+ChunkSource = Callable[[], Iterable[data.Frame]]
+# Receives the chunks of an output frame, in order
+ChunkSink = Callable[[data.Frame], None]
+
+
+def isStreamable(node: 'OperationNode') -> bool:
+    """ Tells if a node can be executed one chunk at a time, i.e. if its operation is row-local or
+    supports partial fitting with the current options """
+    from dataMole.operation.interface.graph import StatefulGraphOperation
+    op = node.operation
+    if op.isRowLocal():
+        return True
+    return isinstance(op, StatefulGraphOperation) and op.supportsPartialFit()
+
+
+class StreamPlan:
+    """ Decides which nodes of a flow are executed in streaming mode. A node is streamed if it is a
+    source, or if it has a single input which is streamed and its operation can be executed one
+    chunk at a time. Output nodes are streamed only if they are sinks. Every other node is
+    materialized: it is executed with whole frames, after the chunks of its streamed parents are
+    concatenated.
+
+    Stateful operations are fitted in passes over the input chunks: the first stateful node of a
+    chain is fitted in pass 0, the next one in pass 1 (since it needs the output of the first one
+    to be transformed), and so on. Chunks are transformed in a final pass """
+
+    def __init__(self, graph: nx.DiGraph, toExecute: Set[int], sources: Iterable[int],
+                 sinks: Iterable[int]):
+        """
+        Computes the plan
+
+        :param graph: the NetworkX graph of the flow
+        :param toExecute: the ids of nodes to execute
+        :param sources: ids of input nodes whose frame can be read in chunks
+        :param sinks: ids of output nodes which can write their frame in chunks
+
+        """
+        sub: nx.DiGraph = graph.subgraph(toExecute)
+        sources = set(sources)
+        sinks = set(sinks)
+        # Streamed nodes in topological order
+        self.order: List[int] = list()
+        # The source of every streamed node
+        self.source: Dict[int, int] = dict()
+        # The pass where every stateful node is fitted
+        self.fitPass: Dict[int, int] = dict()
+        # Number of stateful nodes preceding a node
+        depth: Dict[int, int] = dict()
+        for nid in nx.topological_sort(sub):
+            node: 'OperationNode' = graph.nodes[nid]['op']
+            parents = list(graph.predecessors(nid))
+            if nid in sources:
+                depth[nid] = 0
+                self.source[nid] = nid
+            elif len(parents) == 1 and parents[0] in depth:
+                isOutput = node.operation.maxOutputNumber() == 0
+                if (isOutput and nid not in sinks) or (not isOutput and not isStreamable(node)):
+                    continue
+                parent = parents[0]
+                depth[nid] = depth[parent] + (1 if parent in self.fitPass else 0)
+                self.source[nid] = self.source[parent]
+                if not isOutput and not node.operation.isRowLocal():
+                    self.fitPass[nid] = depth[nid]
+            else:
+                continue
+            self.order.append(nid)
+        self.streamed: Set[int] = set(self.order)
+        # Number of passes needed to fit every stateful node
+        self.passes: int = max(self.fitPass.values(), default=-1) + 1
+        # Streamed nodes whose whole result is needed by materialized nodes
+        self.materialized: Set[int] = {n for n in self.order
+                                       if any(c not in self.streamed for c in sub.successors(n))}
+
+
+class _StreamError(Exception):
+    """ Wraps an exception raised by a node """
+
+    def __init__(self, nodeId: int, error: Exception):
+        super().__init__(str(error))
+        self.nodeId: int = nodeId
+        self.error: Exception = error
+
+
+class StreamingExecutor:
+    """ Executes the streamed nodes of a :class:`StreamPlan`. Only one chunk of every source is held
+    in memory at a time, except for results which must be materialized. Sources are read once per
+    fitting pass, plus once to transform the chunks. This class does not depend on Qt """
+
+    def run(self, graph: nx.DiGraph, plan: StreamPlan, sources: Dict[int, ChunkSource],
+            sinks: Dict[int, ChunkSink], onStart: Optional[StartCallback] = None,
+            onSuccess: Optional[SuccessCallback] = None,
+            onError: Optional[ErrorCallback] = None) -> Optional[Dict[int, data.Frame]]:
+        """
+        Executes the streamed nodes. Materialized nodes are not executed
+
+        :param graph: the NetworkX graph of the flow
+        :param plan: the streaming plan
+        :param sources: function giving the chunks of every source node
+        :param sinks: function receiving the chunks of every sink node
+        :param onStart: called with node id when the execution starts
+        :param onSuccess: called with node id and None when every chunk was processed
+        :param onError: called with node id and a tuple (exception type, exception, traceback string)
+            when a node fails
+
+        :return: the whole result of every node in 'plan.materialized', or None if some node failed
+
+        """
+        if onStart:
+            for nid in plan.order:
+                onStart(nid)
+        try:
+            # Fit stateful nodes
+            for i in range(plan.passes):
+                targets = {n for n, p in plan.fitPass.items() if p == i}
+                for nid in targets:
+                    self.__call(nid, graph.nodes[nid]['op'].operation.resetFit)
+                needed = set(targets)
+                for nid in targets:
+                    needed.update(nx.ancestors(graph, nid) & plan.streamed)
+                self.__stream(graph, plan, sources, sinks, needed, targets, None)
+                for nid in targets:
+                    self.__call(nid, graph.nodes[nid]['op'].operation.finalizeFit)
+            # Transform the chunks
+            chunks: Dict[int, List[pd.DataFrame]] = {n: list() for n in plan.materialized}
+            self.__stream(graph, plan, sources, sinks, plan.streamed, set(), chunks)
+        except _StreamError as e:
+            trace = ''.join(traceback.format_exception(type(e.error), e.error, e.error.__traceback__))
+            flogging.appLogger.error(trace)
+            if onError:
+                onError(e.nodeId, (type(e.error), e.error, trace))
+            return None
+        if onSuccess:
+            for nid in plan.order:
+                onSuccess(nid, None)
+        return {n: data.Frame(concatRows(c) if c else pd.DataFrame()) for n, c in chunks.items()}
+
+    @staticmethod
+    def __call(nid: int, f: Callable, *args):
+        try:
+            return f(*args)
+        except Exception as e:
+            raise _StreamError(nid, e)
+
+    def __stream(self, graph: nx.DiGraph, plan: StreamPlan, sources: Dict[int, ChunkSource],
+                 sinks: Dict[int, ChunkSink], nodes: Set[int], fitting: Set[int],
+                 chunks: Optional[Dict[int, List[pd.DataFrame]]]) -> None:
+        """ Reads every chunk of the sources and passes it through the specified nodes. Nodes in
+        'fitting' are partially fitted with their input, while chunks produced by nodes in 'chunks'
+        are collected """
+        for sourceId in plan.order:
+            if sourceId not in sources or not any(plan.source[n] == sourceId for n in nodes):
+                continue
+            iterator = iter(self.__call(sourceId, sources[sourceId]))
+            while True:
+                # Errors while reading are attributed to the source
+                chunk = self.__call(sourceId, next, iterator, None)
+                if chunk is None:
+                    break
+                results: Dict[int, data.Frame] = {sourceId: chunk}
+                for nid in plan.order:
+                    if nid not in nodes or plan.source[nid] != sourceId or nid == sourceId:
+                        continue
+                    op = graph.nodes[nid]['op'].operation
+                    inputFrame = results[next(graph.predecessors(nid))]
+                    if nid in fitting:
+                        self.__call(nid, op.partialFit, inputFrame)
+                    elif nid in sinks:
+                        self.__call(nid, sinks[nid], inputFrame)
+                    elif nid in plan.fitPass:
+                        results[nid] = self.__call(nid, op.transform, inputFrame)
+                    else:
+                        results[nid] = self.__call(nid, op.execute, inputFrame)
+                if chunks is not None:
+                    for nid, frames in chunks.items():
+                        if plan.source[nid] == sourceId:
+                            frames.append(results[nid].getRawFrame())
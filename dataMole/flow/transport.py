@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+#
+# Author:       Alessandro Zangari (alessandro.zangari.code@outlook.com)
+# Copyright:    © Copyright 2020 Alessandro Zangari, Università degli Studi di Padova
+# License:      GPL-3.0-or-later
+# Date:         2020-10-04
+# Version:      1.0
+#
+# This file is part of DataMole.
+#
+# DataMole is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# DataMole is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with DataMole.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Transport of frames between processes. The buffers of columns with a fixed size dtype are copied in a
+single block of shared memory, so that only a small description of the frame is pickled when it is
+sent to a process of the pool (or received back from it)
+"""
+
+import os
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from dataMole import data
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:
+    # Python < 3.8
+    shared_memory = None
+
+# Offset of every buffer in the shared block is a multiple of this value
+_ALIGNMENT = 8
+
+# On Windows a block of shared memory is destroyed when its last handle is closed, so a block can
+# only be read while the process which created it keeps it open
+PERSISTENT_BLOCKS: bool = os.name == 'posix'
+
+
+class SharedFrame:
+    """
+    A frame whose column buffers are stored in a block of shared memory. Categorical columns are
+    stored as codes, and datetime columns with a timezone as UTC timestamps. Columns of other types
+    (e.g. strings), categories and the index (unless it is numeric) are pickled with the object.
+    The process which creates the shared frame owns the block, and must call :func:`release` when
+    it is no longer needed. Any process can read the frame with :func:`load`
+    """
+
+    def __init__(self, frame: data.Frame):
+        """
+        Copies the frame in a new block of shared memory
+
+        :param frame: the frame to share
+        """
+        df = frame.getRawFrame()
+        self.__columns: pd.Index = df.columns
+        self.__name: Optional[str] = None
+        self.__memory: Optional['shared_memory.SharedMemory'] = None
+        arrays: List[Tuple[int, np.ndarray]] = list()
+        size = 0
+
+        def packed(values: np.ndarray) -> Tuple[int, str, int]:
+            nonlocal size
+            offset = size
+            size += -(-values.nbytes // _ALIGNMENT) * _ALIGNMENT
+            arrays.append((offset, values))
+            return offset, values.dtype.str, values.shape[0]
+
+        # Every column is described by a tuple (kind, buffer, extra)
+        self.__specs: List[Tuple[str, Optional[Tuple[int, str, int]], Any]] = list()
+        for j in range(df.shape[1]):
+            column: pd.Series = df.iloc[:, j]
+            dtype = column.dtype
+            if isinstance(dtype, pd.CategoricalDtype):
+                self.__specs.append(('category', packed(column.cat.codes.to_numpy()),
+                                     (dtype.categories, dtype.ordered)))
+            elif isinstance(dtype, pd.DatetimeTZDtype):
+                self.__specs.append(('datetimetz', packed(pd.DatetimeIndex(column).asi8), dtype.tz))
+            elif isinstance(dtype, np.dtype) and dtype.kind in 'biufcmM':
+                self.__specs.append(('array', packed(column.to_numpy()), None))
+            else:
+                self.__specs.append(('object', None, column.array))
+        index = df.index
+        if index.dtype.kind in 'iuf' and not isinstance(index, (pd.RangeIndex, pd.MultiIndex)):
+            self.__index: Tuple[Any, Any] = (packed(index.to_numpy()), index.name)
+        else:
+            self.__index: Tuple[Any, Any] = (None, index)
+        if not arrays:
+            return
+        # Empty blocks are not allowed, e.g. with frames without rows
+        self.__memory = shared_memory.SharedMemory(create=True, size=max(size, _ALIGNMENT))
+        self.__name = self.__memory.name
+        try:
+            for offset, values in arrays:
+                np.ndarray(values.shape, dtype=values.dtype, buffer=self.__memory.buf,
+                           offset=offset)[:] = values
+        except Exception:
+            self.release()
+            raise
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # The handle of the block is never sent to other processes
+        state['_SharedFrame__memory'] = None
+        return state
+
+    @property
+    def nbytes(self) -> int:
+        """ The size of the shared block in bytes """
+        return self.__memory.size if self.__memory is not None else 0
+
+    def load(self) -> data.Frame:
+        """ Reads the frame, copying its buffers out of shared memory """
+        block = self.__memory
+        if block is None and self.__name is not None:
+            block = shared_memory.SharedMemory(name=self.__name)
+        try:
+            columns = {j: self.__unpack(spec, block) for j, spec in enumerate(self.__specs)}
+            buffer, index = self.__index
+            if buffer is not None:
+                index = pd.Index(_copyBuffer(buffer, block), name=index)
+        finally:
+            if block is not None and block is not self.__memory:
+                block.close()
+        df = pd.DataFrame(columns, index=index)
+        df.columns = self.__columns
+        return data.Frame(df)
+
+    def close(self) -> None:
+        """ Closes the handle of the owner process without destroying the block. After closing the
+        frame can still be loaded by any process, provided that blocks are persistent
+        (see 'PERSISTENT_BLOCKS') """
+        if self.__memory is not None:
+            self.__memory.close()
+            self.__memory = None
+
+    def release(self) -> None:
+        """ Destroys the shared block. Afterwards the frame cannot be loaded anymore """
+        if self.__name is None:
+            return
+        block = self.__memory
+        if block is None:
+            try:
+                block = shared_memory.SharedMemory(name=self.__name)
+            except FileNotFoundError:
+                # Already released
+                self.__name = None
+                return
+        self.__memory = None
+        self.__name = None
+        block.close()
+        block.unlink()
+
+    @staticmethod
+    def __unpack(spec: Tuple[str, Optional[Tuple[int, str, int]], Any],
+                 block: Optional['shared_memory.SharedMemory']) -> Any:
+        kind, buffer, extra = spec
+        if kind == 'object':
+            return extra
+        values = _copyBuffer(buffer, block)
+        if kind == 'category':
+            categories, ordered = extra
+            return pd.Categorical.from_codes(values, dtype=pd.CategoricalDtype(categories, ordered))
+        if kind == 'datetimetz':
+            return pd.DatetimeIndex(values.view('M8[ns]')).tz_localize('UTC').tz_convert(extra)
+        return values
+
+
+def _copyBuffer(buffer: Tuple[int, str, int], block: 'shared_memory.SharedMemory') -> np.ndarray:
+    """ Copies an array out of the shared block, so that the block can be closed afterwards """
+    offset, dtype, length = buffer
+    return np.array(np.ndarray((length,), dtype=np.dtype(dtype), buffer=block.buf, offset=offset))
+
+
+def share(value: Any) -> Any:
+    """
+    Prepares a value to be sent to another process. Frames are copied in shared memory, while
+    other values are returned unchanged, and will be pickled
+
+    :param value: any value
+    :return: a :class:`SharedFrame` if the value is a frame and shared memory is supported,
+        otherwise the same value
+    """
+    if shared_memory is not None and isinstance(value, data.Frame):
+        return SharedFrame(value)
+    return value
+
+
+def receive(value: Any) -> Any:
+    """ Reads a value sent with :func:`share`. Shared blocks are not released """
+    if isinstance(value, SharedFrame):
+        return value.load()
+    return value
+
+
+def release(value: Any) -> None:
+    """ Destroys the shared block of a value returned by :func:`share`, if it has one """
+    if isinstance(value, SharedFrame):
+        value.release()
@@ -1,11 +1,8 @@
 """
-Classes and widgets used for the graphical interface
+Classes and widgets used for the graphical interface. Submodules are not imported with the
+package, so that modules which only need Qt models do not load widgets and charts
 """
 
-from dataMole.gui import widgets, window
-from dataMole.gui.widgets.notifications import Notifier
-from dataMole.gui.widgets.statusbar import StatusBar
-
 # Access variable for singleton GUI objects
-statusBar: StatusBar = None
-notifier: Notifier = None
+statusBar: 'StatusBar' = None
+notifier: 'Notifier' = None
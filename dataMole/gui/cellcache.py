@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+#
+# Author:       Alessandro Zangari (alessandro.zangari.code@outlook.com)
+# Copyright:    © Copyright 2020 Alessandro Zangari, Università degli Studi di Padova
+# License:      GPL-3.0-or-later
+# Date:         2020-10-04
+# Version:      1.0
+#
+# This file is part of DataMole.
+#
+# DataMole is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# DataMole is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with DataMole.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Cache of formatted cells, used to render large frames. Cells are formatted in rectangular tiles
+with a vectorized conversion of every column, and the most recently used tiles are kept. When a tile
+is formatted, the neighbouring tiles are formatted in background, so that scrolling finds them ready
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from dataMole import flogging
+from dataMole.threads import Worker, RequestScheduler, Priority
+
+# Size of tiles of formatted cells
+TILE_ROWS = 256
+TILE_COLUMNS = 16
+# Default number of tiles kept in memory
+DEFAULT_MAX_TILES = 64
+
+
+def formatColumn(column: pd.Series) -> List[str]:
+    """ Converts every value of a column to string, as 'str' does with single values """
+    if column.dtype.kind in 'fiub':
+        # Numpy formats numbers as their scalars do
+        return column.to_numpy().astype(str).tolist()
+    return [str(v) for v in column.tolist()]
+
+
+def formatIndex(index: pd.Index) -> List[str]:
+    """ Converts every label of an index to string. Levels of multi-indices are separated by 2
+    spaces """
+    if isinstance(index, pd.MultiIndex):
+        return ['  '.join(str(v) for v in label) for label in index.tolist()]
+    return [str(v) for v in index.tolist()]
+
+
+class CellCache:
+    """
+    LRU cache of formatted cells and index labels of a frame. It is thread safe
+    """
+
+    def __init__(self, source: Callable[[], pd.DataFrame], maxTiles: int = DEFAULT_MAX_TILES,
+                 prefetch: bool = True):
+        """
+        :param source: a function returning the dataframe to format. It is called only when tiles
+            are formatted
+        :param maxTiles: the maximum number of tiles kept
+        :param prefetch: whether to format neighbouring tiles in background
+        """
+        self.__source: Callable[[], pd.DataFrame] = source
+        self.maxTiles: int = maxTiles
+        self.prefetch: bool = prefetch
+        # { (row tile, column tile): formatted columns }. Index tiles have column tile -1
+        self.__tiles: 'OrderedDict[Tuple[int, int], List[List[str]]]' = OrderedDict()
+        # Positions of the rows to show, or None to show every row in order
+        self.__rows: Optional[np.ndarray] = None
+        # Incremented when the cache is cleared, so that tiles of old frames are discarded
+        self.__generation: int = 0
+        self.__lock = threading.Lock()
+        self.__scheduler = RequestScheduler(Priority.Interactive)
+
+    def __len__(self) -> int:
+        return len(self.__tiles)
+
+    def clear(self) -> None:
+        """ Removes every tile. Must be called when the frame changes """
+        with self.__lock:
+            self.__tiles.clear()
+            self.__generation += 1
+        self.__scheduler.cancelAll()
+
+    def setRows(self, rows: Optional[np.ndarray]) -> None:
+        """ Sets the rows to show and clears the cache. Row numbers of cells are positions in this
+        array
+
+        :param rows: positions of rows in the dataframe, or None to show every row in order
+        """
+        with self.__lock:
+            self.__rows = rows
+        self.clear()
+
+    def cell(self, row: int, column: int) -> str:
+        """ Returns the formatted value of a cell """
+        key = (row // TILE_ROWS, column // TILE_COLUMNS)
+        return self.__tile(key)[column % TILE_COLUMNS][row % TILE_ROWS]
+
+    def indexLabel(self, row: int) -> str:
+        """ Returns the formatted index label of a row """
+        return self.__tile((row // TILE_ROWS, -1))[0][row % TILE_ROWS]
+
+    def __tile(self, key: Tuple[int, int]) -> List[List[str]]:
+        with self.__lock:
+            tile = self.__tiles.get(key, None)
+            if tile is not None:
+                self.__tiles.move_to_end(key)
+                return tile
+            generation = self.__generation
+            rows = self.__rows
+        tile = self.formatTile(self.__source(), key, rows)
+        self.__store(key, tile, generation)
+        if self.prefetch:
+            self.__prefetch(key, rows, generation)
+        return tile
+
+    def __store(self, key: Tuple[int, int], tile: List[List[str]], generation: int) -> None:
+        with self.__lock:
+            if generation != self.__generation:
+                return
+            self.__tiles[key] = tile
+            self.__tiles.move_to_end(key)
+            while len(self.__tiles) > self.maxTiles:
+                self.__tiles.popitem(last=False)
+
+    @staticmethod
+    def formatTile(df: pd.DataFrame, key: Tuple[int, int], positions: Optional[np.ndarray] = None) \
+            -> List[List[str]]:
+        """ Formats a tile of a dataframe
+
+        :param df: the dataframe
+        :param key: the position of the tile (row tile, column tile). If the column tile is -1 the
+            index labels are formatted
+        :param positions: positions of the rows to show. If None every row is shown in order
+        :return: the formatted columns of the tile
+        """
+        rowTile, colTile = key
+        rows = slice(rowTile * TILE_ROWS, (rowTile + 1) * TILE_ROWS)
+        if positions is not None:
+            rows = positions[rows]
+        if colTile < 0:
+            return [formatIndex(df.index[rows])]
+        block = df.iloc[rows, colTile * TILE_COLUMNS:(colTile + 1) * TILE_COLUMNS]
+        return [formatColumn(block.iloc[:, j]) for j in range(block.shape[1])]
+
+    def __prefetch(self, key: Tuple[int, int], rows: Optional[np.ndarray], generation: int) -> None:
+        """ Formats the tiles above and below in background. The last request wins """
+        rowTile, colTile = key
+        with self.__lock:
+            missing = [k for k in ((rowTile + 1, colTile), (rowTile - 1, colTile))
+                       if k[0] >= 0 and k not in self.__tiles]
+        if not missing:
+            return
+        task = _PrefetchTask(self, missing, rows, generation)
+        self.__scheduler.submit('prefetch', Worker(task, identifier=(generation, key)))
+
+    def _prefetched(self, keys: List[Tuple[int, int]], rows: Optional[np.ndarray],
+                    generation: int) -> None:
+        df = self.__source()
+        nRows = df.shape[0] if rows is None else rows.shape[0]
+        for key in keys:
+            if key[0] * TILE_ROWS >= nRows:
+                continue
+            with self.__lock:
+                if generation != self.__generation or key in self.__tiles:
+                    continue
+            self.__store(key, self.formatTile(df, key, rows), generation)
+        flogging.appLogger.debug('Prefetched tiles {}'.format(keys))
+
+
+class _PrefetchTask:
+    def __init__(self, cache: CellCache, keys: List[Tuple[int, int]], rows: Optional[np.ndarray],
+                 generation: int):
+        self.__cache = cache
+        self.__keys = keys
+        self.__rows = rows
+        self.__generation = generation
+
+    def execute(self) -> None:
+        self.__cache._prefetched(self.__keys, self.__rows, self.__generation)
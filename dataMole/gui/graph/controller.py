@@ -57,6 +57,9 @@ class GraphController(QWidget):
         self.__executing = False
         # A reference to the handler must be kept while computation runs
         self.__handler = None
+        # Number of processes and row partitions used to execute the flow (see OperationHandler)
+        self.processes: int = 0
+        self.partitions: int = 1
         # Connections
         self._scene.editModeEnabled.connect(self.startEditNode)
         self._view.deleteSelected.connect(self.removeItems)
@@ -211,7 +214,8 @@ class GraphController(QWidget):
         self._view.setAcceptDrops(False)
         self._scene.disableEdit = True
         # Execute
-        self.__handler = OperationHandler(self._operation_dag)
+        self.__handler = OperationHandler(self._operation_dag, processes=self.processes,
+                                          partitions=self.partitions)
         self.__handler.signals.statusChanged.connect(self.onStatusChanged)
         self.__handler.signals.failedWithMessage.connect(self.onErrorException)
         self.__handler.signals.allFinished.connect(self.flowCompleted)
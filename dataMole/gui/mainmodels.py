@@ -24,9 +24,10 @@
 import abc
 from typing import Any, List, Union, Dict, Tuple, Optional, Set, Iterable
 
+import numpy as np
 from PySide2 import QtGui
 from PySide2.QtCore import QAbstractTableModel, QModelIndex, Qt, Signal, Slot, QAbstractItemModel, \
-    QSortFilterProxyModel, QItemSelection, QThreadPool, QEvent, QRect, QPoint, \
+    QSortFilterProxyModel, QItemSelection, QEvent, QRect, QPoint, \
     QRegularExpression, QIdentityProxyModel, QAbstractProxyModel, QMutex, QTimer
 from PySide2.QtGui import QPainter
 from PySide2.QtWidgets import QWidget, QTableView, QLineEdit, QVBoxLayout, QHeaderView, QLabel, \
@@ -34,24 +35,31 @@ from PySide2.QtWidgets import QWidget, QTableView, QLineEdit, QVBoxLayout, QHead
     QStyledItemDelegate, QMessageBox
 
 from dataMole import gui, flogging
-from dataMole.data import Frame, Shape
+from dataMole.data import Frame, LazyFrame, Shape, memory
 from dataMole.data.types import Types, Type, ALL_TYPES
-from dataMole.operation.computations.statistics import AttributeStatistics, Hist
-from dataMole.threads import Worker
+from dataMole.gui.cellcache import CellCache
+from dataMole.operation.computations.rowview import RowView, RowFilter, SortKey
+from dataMole.operation.computations.statistics import FrameStatistics, Hist, SortAttribute, \
+    SortedColumn
+from dataMole.operation.interface.operation import Operation
+from dataMole.threads import Worker, RequestScheduler, Priority
+from dataMole.utils import UIdGenerator
 
 
-class FrameModel(QAbstractTableModel):
-    """ Table model for a single dataframe """
+class FrameModel(QAbstractTableModel, memory.Spillable):
+    """ Table model for a single dataframe. The frame may be a :class:`~dataMole.data.LazyFrame`,
+    which is read only when its data is accessed through :func:`frame`. When registered in the
+    memory manager, the frame may be moved to disk and it is read again when accessed """
 
     # This role returns frame header data as a tuple (Name, Type)
     DataRole = Qt.UserRole
     statisticsComputed = Signal(tuple)
     statisticsError = Signal(tuple)
 
-    def __init__(self, parent: QWidget = None, frame: Union[Frame, Shape] = Frame()):
+    def __init__(self, parent: QWidget = None, frame: Union[Frame, LazyFrame, Shape] = Frame()):
         super().__init__(parent)
-        if isinstance(frame, Frame):
-            self.__frame: Frame = frame
+        if isinstance(frame, (Frame, LazyFrame)):
+            self.__frame: Union[Frame, LazyFrame] = frame
             self.__shape: Shape = self.__frame.shape
         elif isinstance(frame, Shape):  # it's a Shape
             self.__frame: Frame = Frame()
@@ -59,30 +67,146 @@ class FrameModel(QAbstractTableModel):
         else:
             self.__frame: Frame = Frame()
             self.__shape: Shape = Shape()
-        # Dictionary { attributeIndex: value }
+        # Memory used by the frame (bytes) and file where it was spilled
+        self.__size: int = self.__measure()
+        self.__spillPath: Optional[str] = None
+        # Dictionary { attributeIndex: value }. Statistics are replaced and never modified, so that
+        # they can be read while workers set them
         self._statistics: Dict[int, Dict[str, object]] = dict()
         self._histogram: Dict[int, Dict[Any, int]] = dict()
+        # Changes every time the frame changes, and it is unique among all frame models. Results
+        # computed on older frames are discarded
+        self.__version: int = UIdGenerator().getUniqueId()
+        # Attributes whose statistics were requested while they were computed
+        self.__waitingStatistics: Set[int] = set()
+        # Sorted values of numeric and datetime attributes, used to compute histograms with any
+        # number of bins, and the number of bins last requested while values are sorted
+        self._sortedColumns: Dict[int, SortedColumn] = dict()
+        self.__requestedBins: Dict[int, int] = dict()
         # Dataframe name
         self.name: str = ''
-        # Set of alive workers by identifier (attribute number, type, operation)
-        self._runningWorkers: Set[Tuple] = set()
+        # Formatted cells shown in views
+        self._cells = CellCache(lambda: self.frame.getRawFrame())
+        # Background requests: one for statistics and one for histograms, the latest request wins
+        self._scheduler = RequestScheduler(Priority.Interactive)
         self._dataAccessMutex = QMutex()
 
     @property
     def frame(self) -> Frame:
+        """ The frame, which is loaded if it is lazy """
+        if isinstance(self.__frame, LazyFrame):
+            if self.__frame.isLoaded:
+                memory.manager.touch(self)
+            else:
+                self.__frame.load()
+                # Shape of a lazy frame is updated when it is loaded
+                self.__shape = self.__frame.shape
+                self.__size = self.__measure()
+                memory.manager.update(self)
+            # The frame is kept if it is spilled again while in use
+            return self.__frame.load()
+        memory.manager.touch(self)
+        return self.__frame
+
+    def projection(self, columns: Iterable[int]) -> Frame:
+        """ Returns the frame where only the columns at the specified positions are needed. If the
+        frame is lazy and not loaded only those columns are read, and the others hold placeholder
+        values (see :func:`~dataMole.data.LazyFrame.LazyFrame.loadColumns`). Otherwise it is the
+        same of :func:`frame` """
+        f = self.__frame
+        if not isinstance(f, LazyFrame) or f.isLoaded or not f.canLoadColumns:
+            return self.frame
+        frame = f.loadColumns(columns)
+        # Columns read are released with the lazy frame
+        self.__size = f.memoryUsage()
+        memory.manager.update(self)
+        return frame
+
+    @property
+    def source(self) -> Union[Frame, LazyFrame]:
+        """ The frame or lazy frame set in the model, without loading it """
         return self.__frame
 
+    @property
+    def isLoaded(self) -> bool:
+        """ False if the frame is lazy and its data is not in memory """
+        return not isinstance(self.__frame, LazyFrame) or self.__frame.isLoaded
+
+    def release(self) -> int:
+        """ Frees the memory used by a lazy frame, which is read again when needed
+
+        :return: the number of bytes released, which is 0 if the frame is not lazy
+        """
+        if isinstance(self.__frame, LazyFrame):
+            self.__size = 0
+            freed = self.__frame.release()
+            memory.manager.update(self)
+            return freed
+        return 0
+
+    def __measure(self) -> int:
+        """ Measures the memory used by the frame, including strings """
+        f = self.__frame
+        if isinstance(f, LazyFrame):
+            return f.load().memoryUsage(deep=True) if f.isLoaded else 0
+        return f.memoryUsage(deep=True)
+
+    def memoryUsage(self) -> int:
+        """ Returns the memory used by the frame in bytes, as measured when it was set, plus the
+        memory used by sorted attributes """
+        return self.__size + sum(c.values.nbytes for c in list(self._sortedColumns.values()))
+
+    def spill(self, directory: str, required: int) -> int:
+        """ Frees the memory used by the frame. Lazy frames are released, while other frames are
+        written to disk first. It may be called from any thread """
+        self._dataAccessMutex.lock()
+        try:
+            freed = self.memoryUsage()
+            # Sorted attributes are computed again when needed
+            self._sortedColumns = dict()
+            if isinstance(self.__frame, LazyFrame):
+                # It is read again from its source
+                self.__frame.release()
+            elif self.__size > 0:
+                lazy = memory.spillFrame(self.__frame, directory)
+                self.__spillPath = lazy.description
+                self.__frame = lazy
+            self.__size = 0
+        finally:
+            self._dataAccessMutex.unlock()
+        return freed
+
+    def __removeSpilled(self) -> None:
+        if self.__spillPath:
+            memory.removeSpilled(self.__spillPath)
+            self.__spillPath = None
+
     @property
     def shape(self) -> Shape:
         return self.__shape
 
-    def setFrame(self, frame: Frame) -> None:
+    def setFrame(self, frame: Union[Frame, LazyFrame]) -> None:
         self.beginResetModel()
+        self.__removeSpilled()
         self.__frame = frame
         self.__shape: Shape = self.__frame.shape
+        self.__size = self.__measure()
+        # Results on the previous frame are not needed anymore
+        self._scheduler.cancelAll()
+        self._cells.clear()
+        self._dataAccessMutex.lock()
+        self.__version = UIdGenerator().getUniqueId()
         self._statistics = dict()
         self._histogram = dict()
+        self._sortedColumns = dict()
+        self.__requestedBins = dict()
+        waiting = bool(self.__waitingStatistics)
+        self._dataAccessMutex.unlock()
         self.endResetModel()
+        memory.manager.update(self)
+        if waiting:
+            # Statistics were requested while the previous frame was described
+            self.computeAllStatistics()
 
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
         if parent.isValid():
@@ -97,9 +221,13 @@ class FrameModel(QAbstractTableModel):
     def data(self, index: QModelIndex, role: int = ...) -> Any:
         if index.isValid():
             if role == Qt.DisplayRole:
-                return str(self.__frame.getRawFrame().iloc[index.row(), index.column()])
+                return self._cells.cell(index.row(), index.column())
         return None
 
+    def indexLabel(self, row: int) -> str:
+        """ Returns the index label of a row as displayed. Levels are separated by 2 spaces """
+        return self._cells.indexLabel(row)
+
     def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
         if orientation == Qt.Horizontal:
             if role == Qt.DisplayRole:
@@ -115,9 +243,9 @@ class FrameModel(QAbstractTableModel):
             -> bool:
         """ Change column name """
         if orientation == Qt.Horizontal and role == Qt.EditRole and section < self.columnCount():
-            names = self.__frame.colnames
-            names[section] = value
-            self.__frame = self.__frame.rename({self.headerData(section, orientation,
+            frame = self.frame
+            self.__removeSpilled()
+            self.__frame = frame.rename({self.headerData(section, orientation,
                                                                 FrameModel.DataRole)[0]: value})
             self.__shape.colNames[section] = value
             self.headerDataChanged.emit(orientation, section, section)
@@ -134,66 +262,124 @@ class FrameModel(QAbstractTableModel):
 
     def existsRunningTask(self, identifier) -> bool:
         # Check if a task is already running for this attribute
-        exists: bool = False
-        if identifier in self._runningWorkers:
-            exists = True
-        return exists
+        return self._scheduler.isPending(identifier)
+
+    @property
+    def version(self) -> int:
+        """ Identifier of the current frame, which changes every time a frame is set. It is unique
+        among all frame models, so it also identifies the frame in the cache of flow results """
+        return self.__version
 
     def computeStatistics(self, attribute: int) -> None:
-        """ Compute statistics for a given attribute """
+        """ Compute statistics for a given attribute. Statistics of every attribute are computed
+        together, so that they are available when other attributes are requested """
         flogging.appLogger.debug('computeStatistics() called, attribute {:d}'.format(attribute))
         attType = self.__shape.colTypes[attribute]
         identifier = (attribute, attType, 'stat')
-        if self.__frame.nRows == 0:
+        if self.frame.nRows == 0:
             return self.onWorkerError((attribute, attType, 'stat'), tuple())
-        # Check if a task is already running for this attribute
-        if self.existsRunningTask(identifier):
+        self._dataAccessMutex.lock()
+        computed = attribute in self._statistics
+        if not computed:
+            self.__waitingStatistics.add(attribute)
+        self._dataAccessMutex.unlock()
+        if computed:
+            self.statisticsComputed.emit(identifier)
+        else:
+            self.computeAllStatistics()
+
+    def computeAllStatistics(self) -> None:
+        """ Starts the computation of the statistics of every attribute in background, unless they
+        are already computed or being computed """
+        if self.__shape.nColumns == 0 or self._statistics:
             return
-        # Create a new task
-        stats = AttributeStatistics()
-        stats.setOptions(attribute=attribute)
-        statWorker = Worker(stats, args=(self.__frame,), identifier=identifier)
-        rc = statWorker.signals.result.connect(self.onWorkerSuccess, Qt.DirectConnection)
-        ec = statWorker.signals.error.connect(self.onWorkerError, Qt.DirectConnection)
-        fc = statWorker.signals.finished.connect(self.onWorkerFinished, Qt.DirectConnection)
-        flogging.appLogger.debug('Connected stat worker: {:b}, {:b}, {:b}'.format(rc, ec, fc))
-        # Remember which computations are already in progress
-        self._runningWorkers.add(identifier)
-        QThreadPool.globalInstance().start(statWorker)
+        if self.frame.nRows == 0:
+            return
+        # Replaces the computation on the previous frame, if any
+        self.__submit('stat', FrameStatistics(), (self.__version, None, 'all'))
 
     def computeHistogram(self, attribute: int, histBins: int) -> None:
+        """ Compute the histogram of an attribute. Numeric and datetime attributes are sorted in
+        background only once, and then histograms with any number of bins are computed immediately """
         flogging.appLogger.debug('computeHistogram() called, attribute {:d}'.format(attribute))
         attType = self.__shape.colTypes[attribute]
         identifier = (attribute, attType, 'hist')
-        if self.__frame.nRows == 0:
+        if self.frame.nRows == 0:
             return self.onWorkerError((attribute, attType, 'hist'), tuple())
-        # Check if a task is already running for this attribute
-        if self.existsRunningTask(identifier):
-            return
-        # Create a new task
-        hist = Hist()
-        hist.setOptions(attribute=attribute, attType=attType, bins=histBins)
-        histWorker = Worker(hist, args=(self.__frame,), identifier=identifier)
-        rc = histWorker.signals.result.connect(self.onWorkerSuccess, Qt.DirectConnection)
-        ec = histWorker.signals.error.connect(self.onWorkerError, Qt.DirectConnection)
-        fc = histWorker.signals.finished.connect(self.onWorkerFinished, Qt.DirectConnection)
-        flogging.appLogger.debug('Connected hist worker: {:b}, {:b}, {:b}'.format(rc, ec, fc))
-        # Remember computations in progress
-        self._runningWorkers.add(identifier)
-        QThreadPool.globalInstance().start(histWorker)
+        if attType == Types.Numeric or attType == Types.Datetime:
+            self._dataAccessMutex.lock()
+            sortedColumn = self._sortedColumns.get(attribute, None)
+            if sortedColumn is None:
+                # Only the last request is computed when values are sorted
+                self.__requestedBins[attribute] = histBins
+            self._dataAccessMutex.unlock()
+            if sortedColumn is not None:
+                self.__setHistogram(attribute, sortedColumn.histogram(histBins))
+                self.statisticsComputed.emit(identifier)
+                return
+            task = SortAttribute()
+            task.setOptions(attribute=attribute)
+            identifier = (attribute, self.__version, 'sort')
+        else:
+            task = Hist()
+            task.setOptions(attribute=attribute, attType=attType, bins=histBins)
+        # The histogram of the previously selected attribute is not needed anymore
+        self.__submit('hist', task, identifier)
+
+    def __submit(self, key: str, task: Operation, identifier: Tuple) -> None:
+        """ Starts a background computation on the frame, cancelling the previous one with the
+        same key. Nothing is done if the same computation is already in progress """
+        worker = Worker(task, args=(self.frame,), identifier=identifier)
+        rc = worker.signals.result.connect(self.onWorkerSuccess, Qt.DirectConnection)
+        ec = worker.signals.error.connect(self.onWorkerError, Qt.DirectConnection)
+        fc = worker.signals.finished.connect(self.onWorkerFinished, Qt.DirectConnection)
+        flogging.appLogger.debug('Connected {} worker: {:b}, {:b}, {:b}'.format(key, rc, ec, fc))
+        if not self._scheduler.submit(key, worker):
+            flogging.appLogger.debug('Computation {} is already in progress'.format(identifier))
+
+    def __setHistogram(self, attribute: int, histogram: Dict[Any, int]) -> None:
+        self._dataAccessMutex.lock()
+        self._histogram[attribute] = histogram
+        self._dataAccessMutex.unlock()
 
     @Slot(object, object)
     def onWorkerSuccess(self, identifier: Tuple[int, Type, str], result: Dict[Any, Any]) -> None:
         attribute, attType, mode = identifier
-        if mode == 'stat':
+        if mode == 'all':
             self._dataAccessMutex.lock()
-            self._statistics[attribute] = result
+            if attribute != self.__version:
+                # Frame was changed
+                self._dataAccessMutex.unlock()
+                return
+            statistics = dict(self._statistics)
+            statistics.update(result)
+            self._statistics = statistics
+            waiting = self.__waitingStatistics
+            self.__waitingStatistics = set()
             self._dataAccessMutex.unlock()
             flogging.appLogger.debug('Statistics computation succeeded')
-        elif mode == 'hist':
+            for a in waiting:
+                if a < self.__shape.nColumns:
+                    self.statisticsComputed.emit((a, self.__shape.colTypes[a], 'stat'))
+            return
+        elif mode == 'sort':
             self._dataAccessMutex.lock()
-            self._histogram[attribute] = result
+            if attType != self.__version:
+                # Frame was changed
+                self._dataAccessMutex.unlock()
+                return
+            self._sortedColumns[attribute] = result
+            bins = self.__requestedBins.pop(attribute, None)
             self._dataAccessMutex.unlock()
+            memory.manager.update(self)
+            if bins is None:
+                # Histogram was already set by an earlier worker sorting the same attribute
+                return
+            self.__setHistogram(attribute, result.histogram(bins))
+            flogging.appLogger.debug('Histogram computation succeeded')
+            identifier = (attribute, self.__shape.colTypes[attribute], 'hist')
+        elif mode == 'hist':
+            self.__setHistogram(attribute, result)
             flogging.appLogger.debug('Histogram computation succeeded')
         self.statisticsComputed.emit(identifier)
 
@@ -203,12 +389,27 @@ class FrameModel(QAbstractTableModel):
         if error:
             flogging.appLogger.error('Statistics computation (mode "{}") failed with {}: {}\n{}'.format(
                 identifier[2], *error))
+        if identifier[2] == 'all':
+            self._dataAccessMutex.lock()
+            waiting = self.__waitingStatistics if identifier[0] == self.__version else set()
+            self.__waitingStatistics = set() if waiting else self.__waitingStatistics
+            self._dataAccessMutex.unlock()
+            for a in waiting:
+                if a < self.__shape.nColumns:
+                    self.statisticsError.emit((a, self.__shape.colTypes[a], 'stat'))
+            return
+        if identifier[2] == 'sort':
+            if identifier[1] != self.__version:
+                return
+            self._dataAccessMutex.lock()
+            self.__requestedBins.pop(identifier[0], None)
+            self._dataAccessMutex.unlock()
+            identifier = (identifier[0], self.__shape.colTypes[identifier[0]], 'hist')
         self.statisticsError.emit(identifier)
 
     @Slot(object)
     def onWorkerFinished(self, identifier: Tuple[int, Type, str]) -> None:
         flogging.appLogger.debug('Worker (mode "{}") finished'.format(identifier[2]))
-        self._runningWorkers.remove(identifier)
 
     # def checkWorkerFinished(self, identifier: Tuple[int, Type, str]) -> None:
     #     """ Delete worker with specified identifier from worker dictionary if the worker
@@ -248,10 +449,14 @@ class IncrementalRenderFrameModel(QIdentityProxyModel):
     def setBatchColSize(self, size: int) -> None:
         self._batchCols = size
 
+    def _totalRows(self) -> int:
+        """ The number of rows which can be shown """
+        return self.sourceModel().rowCount()
+
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
         if parent.isValid() or not self.sourceModel():
             return 0
-        return min(self._loadedRows, self.sourceModel().rowCount())
+        return min(self._loadedRows, self._totalRows())
 
     def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
         if parent.isValid() or not self.sourceModel():
@@ -262,13 +467,8 @@ class IncrementalRenderFrameModel(QIdentityProxyModel):
         if not self.sourceModel():
             return None
         if orientation == Qt.Vertical:
-            indexes: List = self.sourceModel().frame.indexValues
-            indexLen: int = self.sourceModel().shape.nIndexLevels
             if role == Qt.DisplayRole:
-                if indexLen == 1:
-                    return str(indexes[section])
-                else:
-                    return '  '.join([str(i) for i in indexes[section]])
+                return self.sourceModel().indexLabel(section)
         return super().headerData(section, orientation, role)
 
     def canFetchMore(self, parent: QModelIndex) -> bool:
@@ -276,7 +476,7 @@ class IncrementalRenderFrameModel(QIdentityProxyModel):
         if not self.sourceModel():
             return False
         return self._loadedCols < self.sourceModel().columnCount() if self._scrollMode == 'column' \
-            else self._loadedRows < self.sourceModel().rowCount()
+            else self._loadedRows < self._totalRows()
 
     def fetchMore(self, parent: QModelIndex):
         if self._scrollMode == 'column':
@@ -286,13 +486,134 @@ class IncrementalRenderFrameModel(QIdentityProxyModel):
             self._loadedCols += colsToFetch
             self.endInsertColumns()
         elif self._scrollMode == 'row':
-            remainder = self.sourceModel().rowCount() - self._loadedRows
+            remainder = self._totalRows() - self._loadedRows
             rowsToFetch = min(remainder, self._batchRows)
             self.beginInsertRows(parent, self._loadedRows, self._loadedRows + rowsToFetch - 1)
             self._loadedRows += rowsToFetch
             self.endInsertRows()
 
 
+class SortFilterFrameModel(IncrementalRenderFrameModel):
+    """
+    Shows the rows of a frame model sorted and filtered. Rows are selected in background with
+    pandas, and only the positions of the rows to show are kept. Cells of selected rows are
+    formatted in tiles as in :class:`FrameModel`
+    """
+    # Emitted with True when rows start to be selected and with False when they are shown
+    viewComputing = Signal(bool)
+    # Emitted with the error message if rows cannot be selected
+    viewError = Signal(str)
+
+    def __init__(self, rowBatch: int = IncrementalRenderFrameModel.DEFAULT_ROW_BATCH_SIZE,
+                 colBatch: int = IncrementalRenderFrameModel.DEFAULT_COL_BATCH_SIZE,
+                 parent: QWidget = None):
+        super().__init__(rowBatch, colBatch, parent)
+        self._rows: Optional[np.ndarray] = None
+        self._cells = CellCache(lambda: self.sourceModel().frame.getRawFrame())
+        self.__keys: List[SortKey] = list()
+        self.__filters: List[RowFilter] = list()
+        self.__request: Optional[Tuple] = None
+        self.__scheduler = RequestScheduler(Priority.Interactive)
+
+    @property
+    def sortKeys(self) -> List[SortKey]:
+        return self.__keys
+
+    @property
+    def filters(self) -> List[RowFilter]:
+        return self.__filters
+
+    @property
+    def shownRows(self) -> Optional[np.ndarray]:
+        """ Positions of shown rows in the frame, or None if every row is shown in order """
+        return self._rows
+
+    def setSourceModel(self, sourceModel: FrameModel) -> None:
+        if self.sourceModel():
+            self.sourceModel().modelReset.disconnect(self.onSourceReset)
+        self.__keys = list()
+        self.__filters = list()
+        self.setRows(None)
+        super().setSourceModel(sourceModel)
+        if sourceModel:
+            sourceModel.modelReset.connect(self.onSourceReset)
+
+    @Slot()
+    def onSourceReset(self) -> None:
+        # Rows are selected again in the new frame
+        self.setRows(None)
+        self.refresh()
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder) -> None:
+        """ Sorts rows by a column. A negative column restores the frame order """
+        self.setSortKeys([(column, order == Qt.AscendingOrder)] if column >= 0 else list())
+
+    def setSortKeys(self, keys: List[SortKey]) -> None:
+        """ Sorts rows by many columns, the most important first """
+        self.__keys = list(keys)
+        self.refresh()
+
+    def setFilters(self, filters: List[RowFilter]) -> None:
+        """ Shows only rows which satisfy every filter """
+        self.__filters = list(filters)
+        self.refresh()
+
+    def refresh(self) -> None:
+        """ Selects rows to show in background. Only the last request is shown """
+        if not self.sourceModel():
+            return
+        if not self.__keys and not self.__filters:
+            self.__scheduler.cancelAll()
+            self.__request = None
+            self.setRows(None)
+            self.viewComputing.emit(False)
+            return
+        task = RowView()
+        task.setOptions(keys=self.__keys, filters=self.__filters)
+        self.__request = (self.sourceModel().version, tuple(self.__keys), tuple(self.__filters))
+        worker = Worker(task, args=(self.sourceModel().frame,), identifier=self.__request)
+        worker.signals.result.connect(self.onViewComputed)
+        worker.signals.error.connect(self.onViewError)
+        self.viewComputing.emit(True)
+        self.__scheduler.submit('view', worker)
+
+    @Slot(object, object)
+    def onViewComputed(self, identifier: Tuple, rows: Optional[np.ndarray]) -> None:
+        if identifier != self.__request:
+            # Options were changed
+            return
+        self.setRows(rows)
+        self.viewComputing.emit(False)
+
+    @Slot(object, tuple)
+    def onViewError(self, identifier: Tuple, error: Tuple[type, Exception, str]) -> None:
+        if identifier != self.__request:
+            return
+        self.viewComputing.emit(False)
+        self.viewError.emit(str(error[1]))
+
+    def setRows(self, rows: Optional[np.ndarray]) -> None:
+        """ Sets the positions of the rows to show, or None to show every row in order """
+        self.beginResetModel()
+        self._rows = rows
+        self._cells.setRows(rows)
+        self._loadedRows = self._batchRows
+        self.endResetModel()
+
+    def _totalRows(self) -> int:
+        return self._rows.shape[0] if self._rows is not None else super()._totalRows()
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if self._rows is not None and index.isValid() and role == Qt.DisplayRole:
+            return self._cells.cell(index.row(), index.column())
+        return super().data(index, role)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        if self._rows is not None and orientation == Qt.Vertical and role == Qt.DisplayRole:
+            return self._cells.indexLabel(section)
+        return super().headerData(section, orientation, role)
+
+
 class AbstractAttributeModel(abc.ABC):
     """ Interface for models used to display attributes information """
 
@@ -78,6 +78,8 @@ class AttributePanel(QWidget):
         # Reconnect new model
         self._frameModel.statisticsComputed.connect(self.onComputationFinished)
         self._frameModel.statisticsError.connect(self.onComputationError)
+        # Describe every attribute in background, so that they are ready when selected
+        self._frameModel.computeAllStatistics()
         # Reset attribute panel
         self.onAttributeSelectionChanged(-1)
 
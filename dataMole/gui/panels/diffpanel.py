@@ -21,13 +21,15 @@
 # You should have received a copy of the GNU General Public License
 # along with DataMole.  If not, see <https://www.gnu.org/licenses/>.
 
-from PySide2.QtCore import Slot
+from PySide2.QtCore import Slot, Qt
 from PySide2.QtWidgets import QWidget, QTableView, QSplitter, QHBoxLayout, QComboBox, QVBoxLayout, \
-    QPushButton, QCheckBox, QScrollBar
+    QPushButton, QCheckBox, QScrollBar, QLineEdit, QProgressBar
 
+from dataMole import flogging
 from dataMole.data import Frame
 from dataMole.gui.mainmodels import IncrementalRenderFrameModel, SearchableAttributeTableWidget, \
-    FrameModel
+    FrameModel, SortFilterFrameModel
+from dataMole.operation.computations import rowview
 from dataMole.gui.workbench import WorkbenchModel
 
 
@@ -36,10 +38,23 @@ class DataframeView(QWidget):
         super().__init__(parent)
         layout = QVBoxLayout(self)
         self.inputCB = QComboBox(self)
+        self.filterEdit = QLineEdit(self)
+        self.filterEdit.setPlaceholderText('Filter rows, e.g. col1 >= 10; col2 contains text; '
+                                           'col3 between 1, 5; col4 is nan')
+        self.filterEdit.setClearButtonEnabled(True)
+        # Busy indicator shown while rows are sorted or filtered
+        self.progressBar = QProgressBar(self)
+        self.progressBar.setRange(0, 0)
+        self.progressBar.setMaximumHeight(6)
+        self.progressBar.setTextVisible(False)
+        self.progressBar.hide()
         self.dataView = QTableView(self)
         layout.addWidget(self.inputCB)
+        layout.addWidget(self.filterEdit)
+        layout.addWidget(self.progressBar)
         layout.addWidget(self.dataView)
         self._workbench: WorkbenchModel = None
+        self.filterEdit.editingFinished.connect(self.applyFilters)
 
     def setWorkbench(self, w: WorkbenchModel) -> None:
         self.inputCB.setModel(w)
@@ -49,13 +64,41 @@ class DataframeView(QWidget):
     @Slot(str)
     def setDataframe(self, name: str) -> None:
         if not self.dataView.model():
-            self.dataView.setModel(IncrementalRenderFrameModel(parent=self))
+            model = SortFilterFrameModel(parent=self)
+            model.viewComputing.connect(self.progressBar.setVisible)
+            model.viewError.connect(self.onViewError)
+            self.dataView.setModel(model)
             self.dataView.horizontalScrollBar().valueChanged.connect(self.onHorizontalScroll)
             self.dataView.verticalScrollBar().valueChanged.connect(self.onVerticalScroll)
+            # Header clicks sort rows. No column is sorted at first
+            self.dataView.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+            self.dataView.setSortingEnabled(True)
         # Get frame model and set it in the table
         frameModel = self._workbench.getDataframeModelByName(name)
+        self.dataView.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        self.filterEdit.clear()
         self.dataView.model().setSourceModel(frameModel)
 
+    @Slot()
+    def applyFilters(self) -> None:
+        model: SortFilterFrameModel = self.dataView.model()
+        if not model or not model.sourceModel():
+            return
+        try:
+            filters = rowview.parseFilters(self.filterEdit.text(),
+                                           model.sourceModel().shape.colNames)
+        except ValueError as e:
+            self.onViewError(str(e))
+            return
+        self.filterEdit.setToolTip('')
+        if filters != model.filters:
+            model.setFilters(filters)
+
+    @Slot(str)
+    def onViewError(self, message: str) -> None:
+        flogging.appLogger.warning('Rows cannot be shown: {}'.format(message))
+        self.filterEdit.setToolTip('Error: {}'.format(message))
+
     @Slot(int)
     def onVerticalScroll(self, *_) -> None:
         self.dataView.model().setScrollMode('row')
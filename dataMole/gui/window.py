@@ -44,6 +44,7 @@ from dataMole.gui.widgets.operationmenu import OperationMenu
 from dataMole.gui.workbench import WorkbenchModel, WorkbenchView
 from dataMole.operation.actionwrapper import OperationAction
 from dataMole.operation.readwrite.csv import CsvLoader, CsvWriter
+from dataMole.operation.readwrite.parquet import ParquetLoader, ParquetWriter
 from dataMole.operation.readwrite.pickle import PickleLoader, PickleWriter
 
 
@@ -116,12 +117,14 @@ class MainWidget(QWidget):
         # Reuse MainWindow actions
         csvAction = self.parentWidget().aWriteCsv
         pickleAction = self.parentWidget().aWritePickle
+        parquetAction = self.parentWidget().aWriteParquet
         # Set correct args for the clicked row
         csvAction.setOperationArgs(w=self.workbenchModel, frameName=frameName)
         pickleAction.setOperationArgs(w=self.workbenchModel, frameName=frameName)
+        parquetAction.setOperationArgs(w=self.workbenchModel, frameName=frameName)
         deleteAction = QAction('Remove', pMenu)
         deleteAction.triggered.connect(lambda: self.workbenchModel.removeRow(index.row()))
-        pMenu.addActions([csvAction, pickleAction, deleteAction])
+        pMenu.addActions([csvAction, pickleAction, parquetAction, deleteAction])
         pMenu.popup(QtGui.QCursor.pos())
 
     def createNewFlow(self, graph: flow.dag.OperationDag) -> None:
@@ -191,6 +194,7 @@ class MainWindow(QMainWindow):
         # Slot called when workbench selection change
         self.aWriteCsv.setOperationArgs(w=self.centralWidget().workbenchModel, frameName=newName)
         self.aWritePickle.setOperationArgs(w=self.centralWidget().workbenchModel, frameName=newName)
+        self.aWriteParquet.setOperationArgs(w=self.centralWidget().workbenchModel, frameName=newName)
 
     @Slot(int, str)
     def operationStateChanged(self, uid: int, state: str) -> None:
@@ -258,12 +262,17 @@ class MainWindow(QMainWindow):
         self.aWritePickle = OperationAction(PickleWriter, fileMenu, 'To pickle',
                                             self.mapToGlobal(self.rect().center()),
                                             w=self.centralWidget().workbenchModel)
+        aLoadParquet = OperationAction(ParquetLoader, fileMenu, 'From parquet/feather',
+                                       self.rect().center(), self.centralWidget().workbenchModel)
+        self.aWriteParquet = OperationAction(ParquetWriter, fileMenu, 'To parquet/feather',
+                                             self.mapToGlobal(self.rect().center()),
+                                             w=self.centralWidget().workbenchModel)
         aCompareFrames = QAction('Compare dataframes', viewMenu)
         aLogDir = QAction('Open log directory', helpMenu)
         aClearLogs = QAction('Delete old logs', helpMenu)
         fileMenu.addActions([aAppendEmpty, aQuit])
-        exportMenu.addActions([self.aWriteCsv, self.aWritePickle])
-        importMenu.addActions([aLoadCsv, aLoadPickle])
+        exportMenu.addActions([self.aWriteCsv, self.aWritePickle, self.aWriteParquet])
+        importMenu.addActions([aLoadCsv, aLoadPickle, aLoadParquet])
 
         self._aStartFlow = QAction('Execute', flowMenu)
         self._aResetFlow = QAction('Reset', flowMenu)
@@ -280,6 +289,8 @@ class MainWindow(QMainWindow):
         aLoadPickle.setStatusTip('Load a Pickle file in the workbench')
         self.aWriteCsv.setStatusTip('Write a dataframe to a csv file')
         self.aWritePickle.setStatusTip('Serializes a dataframe into a pickle file')
+        aLoadParquet.setStatusTip('Load a Parquet or Feather file in the workbench')
+        self.aWriteParquet.setStatusTip('Write a dataframe to a Parquet or Feather file')
         aCompareFrames.setStatusTip('Open two dataframes side by side')
         self._aStartFlow.setStatusTip('Start flow-graph execution')
         self._aResetFlow.setStatusTip('Reset the node status in flow-graph')
@@ -301,6 +312,8 @@ class MainWindow(QMainWindow):
         aLoadPickle.stateChanged.connect(self.operationStateChanged)
         self.aWriteCsv.stateChanged.connect(self.operationStateChanged)
         self.aWritePickle.stateChanged.connect(self.operationStateChanged)
+        aLoadParquet.stateChanged.connect(self.operationStateChanged)
+        self.aWriteParquet.stateChanged.connect(self.operationStateChanged)
 
     @Slot()
     def openLogDirectory(self) -> None:
@@ -21,7 +21,7 @@
 # You should have received a copy of the GNU General Public License
 # along with DataMole.  If not, see <https://www.gnu.org/licenses/>.
 
-from typing import Any, List, Optional, Dict
+from typing import Any, List, Optional, Dict, Union
 
 from PySide2 import QtGui
 from PySide2.QtCore import QAbstractListModel, QObject, QModelIndex, Qt, Slot, Signal, QItemSelection, \
@@ -29,6 +29,7 @@ from PySide2.QtCore import QAbstractListModel, QObject, QModelIndex, Qt, Slot, S
 from PySide2.QtWidgets import QListView, QTableView, QHeaderView
 
 import dataMole.data as d
+from dataMole.data import memory
 from dataMole.gui.mainmodels import FrameModel
 
 _EMPTY_ROW_NAME = ' '
@@ -97,11 +98,12 @@ class WorkbenchModel(QAbstractListModel):
     def getDataframeModelByName(self, name: str) -> FrameModel:
         return self.__workbench[self.__nameToIndex[name]]
 
-    def setDataframeByName(self, name: str, value: d.Frame) -> bool:
+    def setDataframeByName(self, name: str, value: Union[d.Frame, d.LazyFrame]) -> bool:
+        """ Sets a frame in the workbench. A lazy frame is not read until its data is needed """
         listPos: int = self.__nameToIndex.get(name, None)
         if listPos is not None:
             # Name already exists
-            if self.__workbench[listPos].frame is value:
+            if self.__workbench[listPos].source is value:
                 return False
             frame_model = self.getDataframeModelByIndex(listPos)
             # This will reset any view currently showing the frame
@@ -114,6 +116,7 @@ class WorkbenchModel(QAbstractListModel):
             row = self.rowCount()
             f = FrameModel(None, value)  # No parent is set
             f.name = name
+            memory.manager.register(f)
             self.beginInsertRows(QModelIndex(), row, row)
             self.__workbench.append(f)
             self.__nameToIndex[name] = row
@@ -136,6 +139,7 @@ class WorkbenchModel(QAbstractListModel):
         self.beginRemoveRows(parent, row, row)
         # Update views showing the frame
         frame_model = self.getDataframeModelByIndex(row)
+        memory.manager.unregister(frame_model)
         # Reset connected models by showing an empty frame. This also delete their reference
         frame_model.setFrame(frame=d.Frame())
         # Now delete row
@@ -152,6 +156,7 @@ class WorkbenchModel(QAbstractListModel):
         # Create a dummy entry
         f = FrameModel()
         f.name = _EMPTY_ROW_NAME
+        memory.manager.register(f)
         self.beginInsertRows(QModelIndex(), row, row)
         self.__workbench.append(f)
         self.__nameToIndex[f.name] = row
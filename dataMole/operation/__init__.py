@@ -6,32 +6,44 @@ Collection of classes to define every operation and related utilities
 import html
 import json
 import xml.etree.ElementTree as eTree
-from typing import Dict
+from typing import Dict, Optional
 import os
 from dataMole import rootdir
 
-# 1 - Read operation description file
-from PySide2.QtCore import QFile
+# 1 - Operation descriptions, read from resources when first needed (see description())
+_descriptions: Optional[Dict[str, str]] = None
 
-# noinspection PyUnresolvedReferences
-from dataMole import qt_resources
 
-descFile = QFile(':/resources/descriptions.html')
-descFile.open(QFile.ReadOnly)
-fileStr: str = str(descFile.readAll(), encoding='utf-8')
-parsedStr = html.unescape(fileStr)
-root = eTree.fromstring(parsedStr)
-descFile.close()
+def _readDescriptions() -> Dict[str, str]:
+    """ Reads the description file from Qt resources """
+    from PySide2.QtCore import QFile
+    # noinspection PyUnresolvedReferences
+    from dataMole import qt_resources
 
-# Take first element (which must be style) and put it inside every section
-style = list(root)[0]
-root.remove(style)
-for e in root:
-    e.insert(0, style)
+    descFile = QFile(':/resources/descriptions.html')
+    descFile.open(QFile.ReadOnly)
+    fileStr: str = str(descFile.readAll(), encoding='utf-8')
+    parsedStr = html.unescape(fileStr)
+    root = eTree.fromstring(parsedStr)
+    descFile.close()
+
+    # Take first element (which must be style) and put it inside every section
+    style = list(root)[0]
+    root.remove(style)
+    for e in root:
+        e.insert(0, style)
+
+    return {e.get('name'): eTree.tostring(e, encoding='unicode', method='xml').replace('\n', '')
+            .replace('\t', '').replace('\r', '') for e in list(root)}
+
+
+def description(name: str) -> Optional[str]:
+    """ Returns the description of an operation class, or None if it has no description """
+    global _descriptions
+    if _descriptions is None:
+        _descriptions = _readDescriptions()
+    return _descriptions.get(name, None)
 
-descriptions: Dict[str, str] = {
-    e.get('name'): eTree.tostring(e, encoding='unicode', method='xml').replace('\n', '')
-        .replace('\t', '').replace('\r', '') for e in list(root)}
 
 # 2 - Read operation modules (only names)
 with open(os.path.join(rootdir, 'dataMole/config/operations.json'), 'r') as config:
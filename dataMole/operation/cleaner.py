@@ -31,35 +31,13 @@ from dataMole import exceptions as exp
 from dataMole.gui.editor import AbsOperationEditor, OptionsEditorFactory
 from dataMole.gui.mainmodels import FrameModel
 from dataMole.operation.interface.graph import GraphOperation
-from .utils import numpy_equal
+from .utils import duplicateColumns
 
 
 def find_duplicates(df: pd.DataFrame) -> List[str]:
-    # Convert categories to str
-    catTypes: List[str] = df.select_dtypes(include='category').columns.to_list()
-    notCat: List[str] = df.select_dtypes(exclude='category').columns.to_list()
-
-    if catTypes:
-        copy_df = df[catTypes].astype(object)
-        copy_df = pd.concat([copy_df, df[notCat]], axis=1)
-    else:
-        copy_df = df
-
-    groups = copy_df.columns.to_series().groupby(copy_df.dtypes).groups
-    duplicates = list()
-
-    for t, v in groups.items():
-        cs = copy_df[v].columns
-        vs = copy_df[v]
-        lcs = len(cs)
-        for i in range(lcs):
-            ia = vs.iloc[:, i].values
-            for j in range(i + 1, lcs):
-                ja = vs.iloc[:, j].values
-                if numpy_equal(ia, ja):
-                    duplicates.append(cs[j])
-                    break
-    return duplicates
+    """ Returns the names of columns with the same type and values of some previous column. See
+    :func:`~dataMole.operation.utils.duplicateColumns` """
+    return df.columns[duplicateColumns(df)].to_list()
 
 
 class RemoveBijections(GraphOperation, flogging.Loggable):
@@ -75,25 +53,21 @@ class RemoveBijections(GraphOperation, flogging.Loggable):
         return tt.get_string(vrules=pt.ALL, border=True)
 
     def execute(self, df: data.Frame) -> data.Frame:
-        df = df.getRawFrame()
-        colOrder: List[str] = df.columns.to_list()
-
-        subDf = df.iloc[:, self.__selected]
+        subDf = df.getRawFrame().iloc[:, self.__selected]
 
         duplicates = find_duplicates(subDf)
 
-        if duplicates:
-            df = df.copy(True)
-            df = df.drop(duplicates, axis=1)
-            # Keep original order
-            order = [c for c in colOrder if c not in duplicates]
-            df = df[order]
-        return data.Frame(df)
+        # Drop duplicates keeping original order, sharing the other columns
+        return df.withColumns(dict(), drop=duplicates)
 
     @staticmethod
     def name() -> str:
         return 'RemoveBijections'
 
+    @staticmethod
+    def isProcessSafe() -> bool:
+        return True
+
     @staticmethod
     def shortDescription() -> str:
         return 'Removes columns with the same values but with different names. Only selected columns ' \
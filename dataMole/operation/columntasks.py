@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+#
+# Author:       Alessandro Zangari (alessandro.zangari.code@outlook.com)
+# Copyright:    © Copyright 2020 Alessandro Zangari, Università degli Studi di Padova
+# License:      GPL-3.0-or-later
+# Date:         2020-10-04
+# Version:      1.0
+#
+# This file is part of DataMole.
+#
+# DataMole is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# DataMole is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with DataMole.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Execution of independent per-column tasks on a shared pool of threads. Operations which transform
+every selected column separately (e.g. a type conversion) use :func:`mapColumns`, so that columns
+are processed concurrently, while results are always returned in the order of the columns.
+Vectorised pandas and numpy kernels release the GIL for most of their work, so this scales with the
+number of cores when columns are large
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional
+
+from dataMole import flogging
+
+# Environment variable with the number of threads used to process columns
+THREADS_VARIABLE = 'DATAMOLE_COLUMN_THREADS'
+
+# Columns with fewer rows are processed in the calling thread, since they are too small to make
+# concurrency worth its overhead
+MIN_PARALLEL_ROWS = 10000
+
+_lock = threading.Lock()
+# Pool of threads and the process it belongs to (threads do not survive a fork)
+_pool: Optional[ThreadPoolExecutor] = None
+_poolPid: Optional[int] = None
+_parallelism: Optional[int] = None
+# Set in threads which are running a column task
+_local = threading.local()
+
+
+def _parallelismFromEnvironment() -> Optional[int]:
+    value = os.environ.get(THREADS_VARIABLE, None)
+    try:
+        return max(int(value), 1) if value else None
+    except ValueError:
+        flogging.appLogger.warning('Invalid number of threads {}="{}"'.format(THREADS_VARIABLE, value))
+        return None
+
+
+def parallelism() -> int:
+    """ Returns the maximum number of columns processed at the same time. It defaults to the value
+    of the environment variable 'DATAMOLE_COLUMN_THREADS', or to the number of CPUs """
+    if _parallelism is not None:
+        return _parallelism
+    return _parallelismFromEnvironment() or os.cpu_count() or 1
+
+
+def setParallelism(threads: Optional[int]) -> None:
+    """
+    Sets the maximum number of columns processed at the same time. Tasks which are already running
+    are not affected
+
+    :param threads: number of threads. 1 disables concurrency, while None restores the default
+    """
+    global _parallelism, _pool
+    with _lock:
+        _parallelism = max(threads, 1) if threads is not None else None
+        if _pool is not None:
+            _pool.shutdown(wait=False)
+            _pool = None
+
+
+def _executor() -> ThreadPoolExecutor:
+    global _pool, _poolPid
+    with _lock:
+        if _pool is None or _poolPid != os.getpid():
+            _pool = ThreadPoolExecutor(max_workers=parallelism(), thread_name_prefix='columns')
+            _poolPid = os.getpid()
+        return _pool
+
+
+def _runTask(function: Callable[[Hashable], Any], key: Hashable) -> Any:
+    _local.running = True
+    try:
+        return function(key)
+    finally:
+        _local.running = False
+
+
+def mapColumns(function: Callable[[Hashable], Any], keys: Iterable[Hashable],
+               rows: Optional[int] = None) -> Dict[Hashable, Any]:
+    """
+    Calls a function once for every key, concurrently. Tasks must be independent of each other and
+    must not modify shared state. Tasks started by a column task run sequentially in its thread
+
+    :param function: the task, which takes a key (usually a column position or name)
+    :param keys: the keys to process. Keys must be unique
+    :param rows: the number of rows of the columns. If it is smaller than 'MIN_PARALLEL_ROWS',
+        columns are processed in the calling thread
+    :return: the dictionary { key: result } with keys in the same order as 'keys'
+
+    :raise Exception: the exception raised by the first failing task, in the order of keys. Other
+        tasks are always completed
+    """
+    keys: List[Hashable] = list(keys)
+    if len(keys) < 2 or parallelism() < 2 or getattr(_local, 'running', False) or \
+            (rows is not None and rows < MIN_PARALLEL_ROWS):
+        return {k: function(k) for k in keys}
+    pool = _executor()
+    futures = [pool.submit(_runTask, function, k) for k in keys]
+    # Wait for every task, even if one fails, so that no task is left running
+    errors = [f.exception() for f in futures]
+    error = next((e for e in errors if e is not None), None)
+    if error is not None:
+        raise error
+    return {k: f.result() for k, f in zip(keys, futures)}
@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+#
+# Author:       Alessandro Zangari (alessandro.zangari.code@outlook.com)
+# Copyright:    © Copyright 2020 Alessandro Zangari, Università degli Studi di Padova
+# License:      GPL-3.0-or-later
+# Date:         2020-10-04
+# Version:      1.0
+#
+# This file is part of DataMole.
+#
+# DataMole is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# DataMole is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with DataMole.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Sorting and filtering of the rows shown in a table. Rows are never copied: the result is the
+array of positions of the selected rows, in display order
+"""
+
+import operator
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..interface.operation import Operation
+from ... import data, threads
+
+# Row filter (column position, operator, value)
+RowFilter = Tuple[int, str, Any]
+# Sort key (column position, ascending)
+SortKey = Tuple[int, bool]
+
+_comparisons: Dict[str, Callable] = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge
+}
+
+# Supported operators. 'between' expects two values, 'is nan' and 'not nan' no value
+OPERATORS = ('==', '!=', '<', '<=', '>', '>=', 'between', 'contains', 'is nan', 'not nan')
+
+
+def parseFilters(text: str, columns: List[str]) -> List[RowFilter]:
+    """
+    Parses row filters written as 'column operator value', separated by ';'. Values of 'between'
+    are separated by a comma, e.g. 'age between 10, 20'. Column names are matched exactly, the
+    longest name first
+
+    :param text: the filters
+    :param columns: the names of the columns
+    :return: the list of filters
+    :raise ValueError: if a filter is not valid
+    """
+    filters = list()
+    names = sorted(enumerate(columns), key=lambda c: len(str(c[1])), reverse=True)
+    for expression in text.split(';'):
+        expression = expression.strip()
+        if not expression:
+            continue
+        match = next(((i, str(n)) for i, n in names if expression.startswith(str(n))), None)
+        if match is None:
+            raise ValueError('Filter "{}" does not start with a column name'.format(expression))
+        rest = expression[len(match[1]):].strip()
+        # Longest operators first, so that '<=' is not read as '<'
+        op = next((o for o in sorted(OPERATORS, key=len, reverse=True) if rest.startswith(o)), None)
+        if op is None:
+            raise ValueError('Filter "{}" has no valid operator'.format(expression))
+        value: Any = rest[len(op):].strip().strip('\'"')
+        if op in ('is nan', 'not nan'):
+            value = None
+        elif op == 'between':
+            value = tuple(v.strip().strip('\'"') for v in value.split(','))
+            if len(value) != 2 or not all(value):
+                raise ValueError('Filter "{}" needs 2 values separated by a comma'.format(expression))
+        elif not value:
+            raise ValueError('Filter "{}" is incomplete'.format(expression))
+        filters.append((match[0], op, value))
+    return filters
+
+
+def _coerce(column: pd.Series, value: Any) -> Any:
+    """ Converts a value to the type of a column, so that they can be compared """
+    if pd.api.types.is_datetime64_any_dtype(column.dtype):
+        value = pd.Timestamp(value)
+        if column.dt.tz is not None and value.tz is None:
+            value = value.tz_localize(column.dt.tz)
+        return value
+    if pd.api.types.is_numeric_dtype(column.dtype) and not pd.api.types.is_bool_dtype(column.dtype):
+        return float(value)
+    return value
+
+
+def _matches(column: pd.Series, op: str, value: Any) -> np.ndarray:
+    """ Returns the mask of values satisfying a filter. Missing values satisfy only 'is nan' """
+    if op == 'is nan':
+        return column.isna().to_numpy()
+    if op == 'not nan':
+        return column.notna().to_numpy()
+    if op == 'contains':
+        notNa = column.notna().to_numpy()
+        return column.astype(str).str.contains(str(value), regex=False).to_numpy(dtype=bool) & notNa
+    if op == 'between':
+        low, high = (_coerce(column, v) for v in value)
+        return ((column >= low) & (column <= high)).to_numpy(dtype=bool)
+    if op not in _comparisons:
+        raise ValueError('Operator "{}" is not supported'.format(op))
+    if pd.api.types.is_categorical_dtype(column.dtype) and op in ('==', '!='):
+        # Categories may not be strings
+        column = column.astype(str)
+    return _comparisons[op](column, _coerce(column, value)).to_numpy(dtype=bool)
+
+
+def filterRows(df: pd.DataFrame, filters: List[RowFilter]) -> np.ndarray:
+    """
+    Selects the rows satisfying every filter
+
+    :param df: the dataframe
+    :param filters: the filters
+    :return: the positions of selected rows, in increasing order
+    """
+    mask = np.ones(df.shape[0], dtype=bool)
+    for col, op, value in filters:
+        if threads.cancellationRequested():
+            raise threads.Cancelled()
+        mask &= _matches(df.iloc[:, col], op, value)
+    return np.flatnonzero(mask)
+
+
+def _sortCodes(column: pd.Series, ascending: bool) -> np.ndarray:
+    """ Integer keys with the order of the values of a column. Missing values are last """
+    try:
+        codes, uniques = pd.factorize(column, sort=True)
+    except TypeError:
+        # Values of different types are sorted as strings
+        codes, uniques = pd.factorize(column.astype(str).where(column.notna()), sort=True)
+    codes = codes.astype(np.int64)
+    if not ascending:
+        codes = np.where(codes >= 0, len(uniques) - 1 - codes, codes)
+    codes[codes < 0] = len(uniques)
+    return codes
+
+
+def sortRows(df: pd.DataFrame, keys: List[SortKey], rows: Optional[np.ndarray] = None) \
+        -> np.ndarray:
+    """
+    Sorts rows by many columns. The sort is stable, and missing values are last
+
+    :param df: the dataframe
+    :param keys: the sort keys, the most important first
+    :param rows: positions of the rows to sort. If None every row is sorted
+    :return: the positions of the rows in sorted order
+    """
+    if rows is None:
+        rows = np.arange(df.shape[0])
+    if not keys:
+        return rows
+    if len(keys) == 1 and df.dtypes.iloc[keys[0][0]].kind == 'f':
+        # Numpy sorts nan last
+        values = df.iloc[:, keys[0][0]].to_numpy()[rows]
+        return rows[np.argsort(values if keys[0][1] else -values, kind='stable')]
+    codes = list()
+    # The last key is the most important in 'lexsort'
+    for col, ascending in reversed(keys):
+        if threads.cancellationRequested():
+            raise threads.Cancelled()
+        codes.append(_sortCodes(df.iloc[rows, col], ascending))
+    return rows[np.lexsort(codes)]
+
+
+class RowView(Operation):
+    """ Filters and sorts the rows of a frame, returning the positions of rows to show. See
+    :func:`filterRows` and :func:`sortRows` """
+
+    def __init__(self):
+        super().__init__()
+        self.__keys: List[SortKey] = list()
+        self.__filters: List[RowFilter] = list()
+
+    def execute(self, df: data.Frame) -> Optional[np.ndarray]:
+        """ Returns the positions of rows to show, or None if every row is shown in its order """
+        if not self.__keys and not self.__filters:
+            return None
+        raw = df.getRawFrame()
+        rows = filterRows(raw, self.__filters) if self.__filters else None
+        return sortRows(raw, self.__keys, rows)
+
+    def setOptions(self, keys: List[SortKey], filters: List[RowFilter]) -> None:
+        self.__keys = list(keys)
+        self.__filters = list(filters)
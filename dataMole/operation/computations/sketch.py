@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+#
+# Author:       Alessandro Zangari (alessandro.zangari.code@outlook.com)
+# Copyright:    © Copyright 2020 Alessandro Zangari, Università degli Studi di Padova
+# License:      GPL-3.0-or-later
+# Date:         2020-10-04
+# Version:      1.0
+#
+# This file is part of DataMole.
+#
+# DataMole is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# DataMole is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with DataMole.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Mergeable sketch to compute approximate quantiles of large or streamed columns in bounded memory
+"""
+
+from typing import List
+
+import numpy as np
+
+
+class QuantileSketch:
+    """
+    Approximate quantiles of a stream of numbers, with the compactor scheme of Karnin, Lang and
+    Liberty (KLL). Items at level h stand for 2^h values. When a level is full it is sorted and
+    every other item is promoted to the next level, starting from a random position. The memory is
+    O(k log(n / k)) and the rank error is proportional to 1 / k. Sketches of different chunks can
+    be merged with the same accuracy of a single sketch. Minimum and maximum are exact
+    """
+
+    def __init__(self, k: int = 200, seed: int = 0):
+        """
+        :param k: size of the largest level, which controls the accuracy
+        :param seed: seed of the random promotions, so that results are reproducible
+        """
+        self.k: int = k
+        self.count: int = 0
+        self.min: float = np.nan
+        self.max: float = np.nan
+        self.__levels: List[np.ndarray] = [np.empty(0)]
+        self.__random = np.random.RandomState(seed)
+
+    def __capacity(self, level: int) -> int:
+        """ Lower levels are smaller, since their items have lower weight """
+        depth = len(self.__levels) - level - 1
+        return max(int(np.ceil(self.k * (2.0 / 3.0) ** depth)), 2)
+
+    def update(self, values: np.ndarray) -> None:
+        """ Adds numbers to the sketch. Nan values are ignored """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[~np.isnan(values)]
+        if not values.size:
+            return
+        self.count += values.size
+        self.min = np.fmin(self.min, values.min())
+        self.max = np.fmax(self.max, values.max())
+        self.__levels[0] = np.concatenate((self.__levels[0], values))
+        self.__compress()
+
+    def merge(self, other: 'QuantileSketch') -> None:
+        """ Adds the numbers summarized by another sketch """
+        if not other.count:
+            return
+        self.count += other.count
+        self.min = np.fmin(self.min, other.min)
+        self.max = np.fmax(self.max, other.max)
+        for h, items in enumerate(other.__levels):
+            if h == len(self.__levels):
+                self.__levels.append(np.empty(0))
+            self.__levels[h] = np.concatenate((self.__levels[h], items))
+        self.__compress()
+
+    def __compress(self) -> None:
+        h = 0
+        while h < len(self.__levels):
+            items = self.__levels[h]
+            if items.size > self.__capacity(h):
+                if h + 1 == len(self.__levels):
+                    self.__levels.append(np.empty(0))
+                # Levels above 0 are made of sorted runs, which a stable sort merges in linear time
+                items = np.sort(items, kind='stable' if h else 'quicksort')
+                # An odd item is left at this level, so that the total weight does not change
+                keep = items[:items.size % 2]
+                promoted = items[keep.size + self.__random.randint(2)::2]
+                self.__levels[h] = keep
+                self.__levels[h + 1] = np.concatenate((self.__levels[h + 1], promoted))
+            h += 1
+
+    def quantiles(self, q: np.ndarray) -> np.ndarray:
+        """
+        Computes approximate quantiles. Quantiles 0 and 1 are the exact minimum and maximum
+
+        :param q: probabilities in [0, 1]
+        :return: the quantiles, or nan if the sketch is empty
+        """
+        q = np.asarray(q, dtype=np.float64)
+        if not self.count:
+            return np.full(q.shape, np.nan)
+        items = np.concatenate(self.__levels)
+        weights = np.concatenate([np.full(items.size, 2 ** h, dtype=np.float64)
+                                  for h, items in enumerate(self.__levels)])
+        order = np.argsort(items, kind='mergesort')
+        items = items[order]
+        # Fraction of values lower or equal than every item
+        ranks = np.cumsum(weights[order]) / weights.sum()
+        result = items[np.minimum(np.searchsorted(ranks, q, side='left'), items.size - 1)]
+        result[q <= 0] = self.min
+        result[q >= 1] = self.max
+        return result
@@ -21,15 +21,158 @@
 # You should have received a copy of the GNU General Public License
 # along with DataMole.  If not, see <https://www.gnu.org/licenses/>.
 
-import re
-from typing import Dict
+from typing import Dict, List, Optional
 
+import numpy as np
 import pandas as pd
 
 from ..interface.operation import Operation
-from ... import data
+from ... import data, threads
 from ...data.types import Types, Type
 
+# Centiles shown for numeric columns, as in 'pandas.Series.describe'
+CENTILES = (25, 50, 75)
+# Maximum size in bytes of a block of numeric columns described together
+BATCH_BYTES = 64 * 1024 * 1024
+
+
+def nanQuantiles(block: np.ndarray, q: np.ndarray,
+                 counts: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Computes quantiles of every column of a 2-D float array, ignoring nan values. Values are
+    interpolated linearly as in 'numpy.percentile', but only the needed positions of every column
+    are sorted. Columns are sorted one at a time in a single buffer
+
+    :param block: the 2-D array
+    :param q: the probabilities in [0, 1]
+    :param counts: the number of non-nan values of every column, if already known
+    :return: a 2-D array with a row for every quantile and a column for every column of 'block'.
+        Columns with no values have nan quantiles
+    """
+    q = np.asarray(q, dtype=np.float64)
+    if counts is None:
+        counts = block.shape[0] - np.isnan(block).sum(axis=0)
+    result = np.full((q.size, block.shape[1]), np.nan)
+    column = np.empty(block.shape[0], dtype=np.float64)
+    for j, n in enumerate(counts):
+        if not n:
+            continue
+        indices = q * (n - 1)
+        below = np.floor(indices).astype(np.intp)
+        above = np.minimum(below + 1, n - 1)
+        # Nan values are sorted last
+        np.copyto(column, block[:, j])
+        column.partition(np.union1d(below, above))
+        weightsAbove = indices - below
+        result[:, j] = column[below] * (1 - weightsAbove) + column[above] * weightsAbove
+    return result
+
+
+def _numericStatistics(block: np.ndarray) -> List[Dict[str, object]]:
+    """ Statistics of every column of a 2-D float array, computed together. Besides the nan mask
+    a single array of the size of 'block' is allocated, and reused for every statistic """
+    nanMask = np.isnan(block)
+    counts = block.shape[0] - nanMask.sum(axis=0)
+    buffer = np.empty_like(block)
+    np.copyto(buffer, block)
+    np.copyto(buffer, 0, where=nanMask)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = buffer.sum(axis=0) / counts
+        np.subtract(block, means, out=buffer)
+        np.copyto(buffer, 0, where=nanMask)
+        np.square(buffer, out=buffer)
+        stds = np.sqrt(buffer.sum(axis=0) / (counts - 1))
+    del buffer
+    stds[counts < 2] = np.nan
+    # fmin and fmax ignore nan
+    mins = np.fmin.reduce(block, axis=0)
+    maxs = np.fmax.reduce(block, axis=0)
+    centiles = nanQuantiles(block, np.array(CENTILES) / 100, counts)
+    result = list()
+    for j in range(block.shape[1]):
+        desc: Dict[str, object] = {'Min': mins[j], 'Max': maxs[j]}
+        desc.update({'Centile {:d}%'.format(c): centiles[i, j] for i, c in enumerate(CENTILES)})
+        desc['Nan count'] = _nanCount(block.shape[0] - counts[j], block.shape[0])
+        desc['Mean'] = '{:.3f}'.format(means[j])
+        desc['Std'] = '{:.3f}'.format(stds[j])
+        result.append(desc)
+    return result
+
+
+def _categoricalStatistics(column: pd.Series, topK: int) -> Dict[str, object]:
+    """ Statistics of a categorical, string, boolean or datetime column """
+    if pd.api.types.is_categorical_dtype(column.dtype):
+        # Categories are counted from codes
+        codes = column.values.codes
+        counts = pd.Series(np.bincount(codes[codes >= 0], minlength=len(column.cat.categories)),
+                           index=column.cat.categories)
+        counts = counts[counts > 0].sort_values(ascending=False, kind='mergesort')
+    else:
+        counts = column.value_counts()
+    nRows = column.shape[0]
+    desc: Dict[str, object] = {'Unique': counts.size}
+    if pd.api.types.is_datetime64_any_dtype(column.dtype) and counts.size:
+        desc['First'] = counts.index.min()
+        desc['Last'] = counts.index.max()
+    if counts.size:
+        desc['Most frequent'] = ', '.join('{} (n={})'.format(v, n)
+                                          for v, n in counts.iloc[:topK].items())
+    desc['Nan count'] = _nanCount(nRows - int(counts.sum()), nRows)
+    return desc
+
+
+def _nanCount(nanCount: int, nRows: int) -> str:
+    return '{:d} ({:.2f}%)'.format(nanCount, nanCount / nRows * 100 if nRows else 0)
+
+
+def frameStatistics(df: pd.DataFrame, columns: Optional[List[int]] = None,
+                    topK: int = 1) -> Dict[int, Dict[str, object]]:
+    """
+    Computes descriptive statistics of many columns. Statistics of numeric columns (count, mean,
+    standard deviation, minimum, maximum and centiles) are computed together on 2-D arrays of at
+    most :data:`BATCH_BYTES` bytes, with a single pass for every statistic. Other columns are
+    described by the number of distinct values and the most frequent ones
+
+    :param df: the dataframe
+    :param columns: positions of the columns to describe. If None every column is described
+    :param topK: the number of most frequent values to show for non-numeric columns
+    :return: the statistics of every column as a dictionary { name: value }, indexed by position
+    """
+    if columns is None:
+        columns = list(range(df.shape[1]))
+    dtypes = df.dtypes
+    numeric = [c for c in columns if pd.api.types.is_numeric_dtype(dtypes.iloc[c]) and not
+               pd.api.types.is_bool_dtype(dtypes.iloc[c])]
+    result: Dict[int, Dict[str, object]] = dict()
+    # Numeric columns are described in batches, to bound the memory used by temporary arrays
+    batchSize = max(1, BATCH_BYTES // max(1, 8 * df.shape[0]))
+    for i in range(0, len(numeric), batchSize):
+        if threads.cancellationRequested():
+            raise threads.Cancelled()
+        batch = numeric[i:i + batchSize]
+        block = df.iloc[:, batch].to_numpy(dtype=np.float64)
+        result.update(zip(batch, _numericStatistics(block)))
+    for c in columns:
+        if c not in result:
+            if threads.cancellationRequested():
+                raise threads.Cancelled()
+            result[c] = _categoricalStatistics(df.iloc[:, c], topK)
+    return {c: result[c] for c in columns}
+
+
+class FrameStatistics(Operation):
+    """ Computes the statistics of every column of a frame. See :func:`frameStatistics` """
+
+    def __init__(self):
+        super().__init__()
+        self.__topK: int = 1
+
+    def execute(self, df: data.Frame) -> Dict[int, Dict[str, object]]:
+        return frameStatistics(df.getRawFrame(), topK=self.__topK)
+
+    def setOptions(self, topK: int = 1) -> None:
+        self.__topK = topK
+
 
 class AttributeStatistics(Operation):
     def __init__(self):
@@ -37,29 +180,118 @@ class AttributeStatistics(Operation):
         self.__attribute: int = -1
 
     def execute(self, df: data.Frame) -> Dict[str, object]:
-        desc: Dict[str, object] = df.getRawFrame().iloc[:, self.__attribute].describe().to_dict()
-        # Rename centiles
-        centiles = [(k, v) for k, v in desc.items() if re.fullmatch('.*%', k)]
-        for k, v in centiles:
-            desc['Centile ' + k] = desc.pop(k)
-        # Rename Top and Freq
-        if desc.get('top', None) is not None and desc.get('freq', None) is not None:
-            desc['Most frequent'] = '{} (n={})'.format(desc.pop('top'), desc.pop('freq'))
-        # Add Nan count
-        nan_count = df.nRows - int(desc['count'])
-        del desc['count']
-        desc['Nan count'] = '{:d} ({:.2f}%)'.format(nan_count, nan_count / df.nRows * 100)
-        if desc.get('mean', None) is not None and desc.get('std', None) is not None:
-            desc['Mean'] = '{:.3f}'.format(desc.pop('mean'))
-            desc['Std'] = '{:.3f}'.format(desc.pop('std'))
-        # Uppercase letter
-        desc = dict(map(lambda t: (t[0][0].upper() + t[0][1:], t[1]), desc.items()))
-        return desc
+        return frameStatistics(df.getRawFrame(), columns=[self.__attribute])[self.__attribute]
 
     def setOptions(self, attribute: int) -> None:
         self.__attribute: int = attribute
 
 
+class SortedColumn:
+    """
+    The values of a numeric or datetime column sorted and without missing values. Histograms with
+    any number of bins are computed with a binary search of the bin edges in the sorted values,
+    without reading the column again. Bins are the same computed by 'pandas.cut'
+    """
+
+    def __init__(self, column: pd.Series):
+        """ Sorts the values of a column. If it is run in a worker which is cancelled before sorting,
+        :class:`~dataMole.threads.Cancelled` is raised
+
+        :param column: a numeric or datetime column
+        """
+        self.__tz = None
+        if pd.api.types.is_datetime64_any_dtype(column.dtype):
+            if pd.api.types.is_datetime64tz_dtype(column.dtype):
+                self.__tz = column.dtype.tz
+            # Datetimes are compared as nanoseconds (UTC for datetimes with timezone) converted to
+            # float, like 'pandas.cut' does
+            values = pd.DatetimeIndex(column).asi8
+            values = values[values != pd.NaT.value].astype(np.float64)
+            self.isDatetime: bool = True
+        else:
+            values = column.to_numpy(dtype=np.float64)
+            values = values[~np.isnan(values)]
+            self.isDatetime: bool = False
+        if threads.cancellationRequested():
+            raise threads.Cancelled()
+        self.values: np.ndarray = np.sort(values)
+
+    def edges(self, bins: int) -> np.ndarray:
+        """ Returns the edges of 'bins' bins of equal width, as computed by 'pandas.cut'. The first
+        edge is lowered by 0.1% of the range, so that every bin is closed on the right. Duplicate
+        edges are dropped """
+        if not self.values.size:
+            return np.empty(0)
+        mn, mx = self.values[0], self.values[-1]
+        if mn == mx:
+            adjust = .001 * abs(mn) if mn != 0 else .001
+            edges = np.linspace(mn - adjust, mx + adjust, bins + 1, endpoint=True)
+        else:
+            edges = np.linspace(mn, mx, bins + 1, endpoint=True)
+            edges[0] -= (mx - mn) * .001
+        return pd.unique(edges)
+
+    def counts(self, edges: np.ndarray) -> np.ndarray:
+        """ Counts the values in every bin (edges[i], edges[i + 1]] """
+        return np.diff(np.searchsorted(self.values, edges, side='right'))
+
+    def histogram(self, bins: int) -> Dict[str, int]:
+        """
+        Counts values in bins of equal width
+
+        :param bins: the number of bins
+        :return: the number of values in every bin, indexed by the formatted left edge of the bin
+        """
+        edges = self.edges(bins)
+        if edges.size < 2:
+            return dict()
+        counts = self.counts(edges)
+        if threads.cancellationRequested():
+            raise threads.Cancelled()
+        if self.isDatetime:
+            fmt = '%Y-%m-%d %H:%M'
+            labels = [pd.Timestamp(e, tz=self.__tz).strftime(fmt)
+                      for e in edges[:-1].astype(np.int64)]
+        else:
+            # Edges are rounded as in labels of 'pandas.cut'
+            precision = _inferPrecision(3, edges)
+            labels = ['{:.2f}'.format(_roundFraction(e, precision)) for e in edges[:-1]]
+        return dict(zip(labels, counts.tolist()))
+
+
+def _roundFraction(x: float, precision: int) -> float:
+    """ Rounds a number to 'precision' digits, or to 'precision' significant digits if it is
+    smaller than 1 in absolute value """
+    if not np.isfinite(x) or x == 0:
+        return x
+    frac, whole = np.modf(x)
+    digits = -int(np.floor(np.log10(abs(frac)))) - 1 + precision if whole == 0 else precision
+    return np.around(x, digits)
+
+
+def _inferPrecision(basePrecision: int, edges: np.ndarray) -> int:
+    """ Returns the smallest precision which keeps rounded edges distinct """
+    for precision in range(basePrecision, 20):
+        if pd.unique(np.array([_roundFraction(e, precision) for e in edges])).size == edges.size:
+            return precision
+    return basePrecision
+
+
+class SortAttribute(Operation):
+    """ Sorts a numeric or datetime column of a frame, returning a :class:`SortedColumn`. It stops
+    early if its worker is cancelled """
+
+    def __init__(self):
+        super().__init__()
+        self.__attribute: int = None
+
+    def execute(self, df: data.Frame) -> SortedColumn:
+        return SortedColumn(df.getRawFrame().iloc[:, self.__attribute])
+
+    def setOptions(self, attribute: int) -> None:
+        self.__attribute = attribute
+
+
 class Hist(Operation):
     def __init__(self):
         super().__init__()
@@ -71,17 +303,12 @@ class Hist(Operation):
         col = df.getRawFrame().iloc[:, self.__attribute]
         if self.__type == Types.Numeric or self.__type == Types.Datetime:
             # Differently from value_counts, this handles the case where all values are nan
-            cuts = pd.cut(col, bins=self.__nBins, duplicates='drop')
-            values = cuts.value_counts(sort=False)
-            if self.__type == Types.Numeric:
-                values.index = values.index.map(lambda i: '{:.2f}'.format(i.left))
-            else:
-                # Datetime
-                fmt = '%Y-%m-%d %H:%M'
-                values.index = values.index.map(lambda i: i.left.strftime(fmt))
-            return values.to_dict()
+            return SortedColumn(col).histogram(self.__nBins)
         else:
-            return col.value_counts(sort=False).to_dict()
+            counts = col.value_counts(sort=False)
+            if threads.cancellationRequested():
+                raise threads.Cancelled()
+            return counts.to_dict()
 
     def setOptions(self, attribute: int, attType: Type, bins: int = None) -> None:
         self.__attribute = attribute
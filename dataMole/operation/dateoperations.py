@@ -22,8 +22,9 @@
 # along with DataMole.  If not, see <https://www.gnu.org/licenses/>.
 
 import datetime as dt
-from typing import List, Tuple, Optional, Dict, Set, Union
+from typing import List, Tuple, Optional, Dict, Union, Set
 
+import numpy as np
 import pandas as pd
 import prettytable as pt
 from PySide2.QtCore import Slot, QModelIndex, QAbstractItemModel, QDateTime, QDate, QEvent, QObject, \
@@ -40,9 +41,31 @@ from dataMole.data.types import Types, Type
 from dataMole.flogging import Loggable
 from dataMole.gui.editor import AbsOperationEditor, OptionsEditorFactory
 from dataMole.gui.mainmodels import FrameModel
+from dataMole.operation import columntasks
 from dataMole.operation.interface.graph import GraphOperation
 from dataMole.operation.utils import splitString, joinList
 
+_NS_PER_DAY = 24 * 60 * 60 * 10 ** 9
+
+
+def _timeOfDay(values: np.ndarray, date: dt.date) -> np.ndarray:
+    """ Moves every timestamp to the same date, keeping its time of day. NaT values are kept """
+    ns = values.view('i8')
+    # Floor division keeps the time of day positive for dates before 1970
+    timeOfDay = np.mod(ns, _NS_PER_DAY)
+    result = (np.datetime64(date, 'ns').astype('i8') + timeOfDay).view('datetime64[ns]')
+    result[np.isnat(values)] = np.datetime64('NaT')
+    return result
+
+
+def _cut(values: np.ndarray, edges: List[pd.Timestamp], labels: List[str]) -> pd.Categorical:
+    """ Assigns every timestamp to the interval (edges[k], edges[k+1]] containing it, with a binary
+    search. Values outside intervals and NaT are set to NaN """
+    bins = np.array([np.datetime64(e, 'ns') for e in edges], dtype='datetime64[ns]')
+    codes = np.searchsorted(bins, values, side='left') - 1
+    codes[(codes < 0) | (codes >= len(labels)) | np.isnat(values)] = -1
+    return pd.Categorical.from_codes(codes, categories=labels, ordered=True)
+
 
 class DateDiscretizer(GraphOperation, Loggable):
     def __init__(self, *args, **kwargs):
@@ -70,53 +93,63 @@ class DateDiscretizer(GraphOperation, Loggable):
         return tt.get_string(border=True, vrules=pt.ALL) + suffixStr
 
     def execute(self, df: data.Frame) -> data.Frame:
+        results = self.__discretize(data.ColumnView(df))
+        if not self.__attributesSuffix:
+            # Replace processed columns, sharing the others
+            return df.replaceColumns(results)
         columns = df.colnames
-        df = df.getRawFrame().copy(True)
+        processedDict = {columns[i] + self.__attributesSuffix: processed
+                         for i, processed in results.items()}
+        # New columns are appended, replacing existing columns with the same name
+        return df.withColumns(processedDict, drop=processedDict.keys())
 
+    def executeColumns(self, columns: data.ColumnView) -> Dict[int, pd.Series]:
+        if self.__attributesSuffix:
+            return super().executeColumns(columns)
+        return self.__discretize(columns)
+
+    def __discretize(self, columns: data.ColumnView) -> Dict[int, pd.Series]:
         # Notice that this timestamps are already set to a proper format (with default time/date) by
         # the editor
-        intervals: Dict[int, pd.IntervalIndex] = \
-            {i: pd.IntervalIndex([pd.Interval(a, b, closed='right') for a, b in zip(opts[0],
-                                                                                    opts[0][1:])])
-             for i, opts in self.__attributes.items()}
-
-        processedDict = dict()
-        for i, opts in self.__attributes.items():
-            _, labels, byDate, byTime = opts
-            applyCol = df.iloc[:, i]
+        def discretize(i: int) -> pd.Series:
+            timestamps, labels, byDate, byTime = self.__attributes[i]
+            applyCol = columns[i]
+            if pd.api.types.is_datetime64tz_dtype(applyCol.dtype):
+                # Compare local times
+                applyCol = applyCol.dt.tz_localize(None)
+            elif not pd.api.types.is_datetime64_dtype(applyCol.dtype):
+                # Strings are parsed as timestamps
+                applyCol = pd.to_datetime(applyCol)
+            values = np.asarray(applyCol, dtype='datetime64[ns]')
             if byTime and not byDate:
                 # Replace the date part with the default date in a way that every ts has the
                 # same date, but retains its original time. Nan values are propagated
-                applyCol = applyCol \
-                    .map(lambda ts:
-                         pd.Timestamp(QDateTime(_IntervalWidget.DEFAULT_DATE,
-                                                toQtDateTime(ts.to_pydatetime()).time()).toPython()),
-                         na_action='ignore')
-            name = columns[i]
-            if self.__attributesSuffix:
-                name += self.__attributesSuffix
-            categoriesMap = dict(zip(intervals[i], labels))
-            processedDict[name] = pd.cut(applyCol, bins=intervals[i]).cat.rename_categories(
-                categoriesMap)
-
-        if self.__attributesSuffix:
-            duplicateColumns: Set[str] = set(processedDict.keys()) & set(columns)
-        else:
-            duplicateColumns: List[str] = list(processedDict.keys())
-        if duplicateColumns:
-            df = df.drop(columns=duplicateColumns)
-        processed = pd.DataFrame(processedDict).set_index(df.index)
+                values = _timeOfDay(values, _IntervalWidget.DEFAULT_DATE.toPython())
+            return pd.Series(_cut(values, timestamps, labels), index=columns.index)
 
-        df = pd.concat([df, processed], ignore_index=False, axis=1)
-        if not self.__attributesSuffix:
-            # Reorder columns
-            df = df[columns]
-        return data.Frame(df)
+        return columntasks.mapColumns(discretize, self.__attributes.keys(), rows=columns.nRows)
 
     @staticmethod
     def name() -> str:
         return 'DateDiscretizer'
 
+    @staticmethod
+    def isProcessSafe() -> bool:
+        return True
+
+    def isRowLocal(self) -> bool:
+        return True
+
+    def isColumnLocal(self) -> bool:
+        # New columns with a suffix are appended
+        return not self.__attributesSuffix
+
+    def neededColumns(self, columns: Optional[Set[int]]) -> Optional[Set[int]]:
+        if columns is None or self.__attributesSuffix:
+            return None
+        # Only discretized columns are read
+        return columns | set(self.__attributes.keys())
+
     @staticmethod
     def shortDescription() -> str:
         return 'Discretize date and times based on ranges'
@@ -21,9 +21,8 @@
 # You should have received a copy of the GNU General Public License
 # along with DataMole.  If not, see <https://www.gnu.org/licenses/>.
 
-import copy
 from enum import Enum
-from typing import Iterable, List, Dict, Optional, Tuple, Union
+from typing import Iterable, List, Dict, Optional, Tuple, Union, Set
 
 import numpy as np
 import pandas as pd
@@ -38,7 +37,10 @@ from dataMole.data.types import Types, Type
 from dataMole.gui.editor import OptionsEditorFactory, OptionValidatorDelegate, \
     AbsOperationEditor
 from dataMole.gui.mainmodels import FrameModel
-from dataMole.operation.interface.graph import GraphOperation
+from dataMole.operation import columntasks
+from dataMole.operation.computations.sketch import QuantileSketch
+from dataMole.operation.computations.statistics import nanQuantiles
+from dataMole.operation.interface.graph import GraphOperation, StatefulGraphOperation
 from dataMole.operation.utils import NumericListValidator, MixedListValidator, splitString, \
     joinList, isFloat
 
@@ -47,14 +49,71 @@ class BinStrategy(Enum):
     Uniform = 'uniform'
     Quantile = 'quantile'
     Kmeans = 'kmeans'
+    # Quantiles estimated with a sketch, which can be computed on chunks
+    ApproximateQuantile = 'approximate quantile'
+
+
+def _binsColumn(codes: np.ndarray, index: pd.Index, k: int) -> pd.Series:
+    """ Builds the categorical column with the bin number of every row. Rows with code -1 are set
+    to nan """
+    # Categories are strings
+    return pd.Series(pd.Categorical.from_codes(codes, categories=[str(float(i)) for i in range(k)],
+                                               ordered=True), index=index)
+
+
+def _uniformEdges(block: np.ndarray, ks: List[int]) -> List[np.ndarray]:
+    """ Computes 'k' bins of equal width for every column of a 2-D array. Nan values are ignored """
+    # fmin and fmax ignore nan
+    mins = np.fmin.reduce(block, axis=0)
+    maxs = np.fmax.reduce(block, axis=0)
+    return [_constantEdges() if not lo < hi else np.linspace(lo, hi, k + 1)
+            for lo, hi, k in zip(mins, maxs, ks)]
+
+
+def _quantileEdges(block: np.ndarray, ks: List[int]) -> List[np.ndarray]:
+    """ Computes 'k' bins with the same number of values for every column of a 2-D array. Nan
+    values are ignored. Quantiles are interpolated as in 'numpy.percentile' """
+    edges: List[np.ndarray] = list()
+    for j, k in enumerate(ks):
+        e = nanQuantiles(block[:, j:j + 1], np.true_divide(np.linspace(0, 100, k + 1), 100))[:, 0]
+        if not e[0] < e[-1]:
+            # Constant column or no values
+            edges.append(_constantEdges())
+        else:
+            edges.append(_dropNarrowBins(e))
+    return edges
+
+
+def _sketchEdges(sketch: QuantileSketch, k: int) -> np.ndarray:
+    if not sketch.count or sketch.min == sketch.max:
+        return _constantEdges()
+    return _dropNarrowBins(sketch.quantiles(np.linspace(0, 1, k + 1)))
+
+
+def _constantEdges() -> np.ndarray:
+    """ A single bin, used for constant columns """
+    return np.array([-np.inf, np.inf])
 
 
-class BinsDiscretizer(GraphOperation, flogging.Loggable):
+def _dropNarrowBins(edges: np.ndarray) -> np.ndarray:
+    """ Removes bins of repeated quantiles, as in sklearn """
+    return edges[np.ediff1d(edges, to_begin=np.inf) > 1e-8]
+
+
+class BinsDiscretizer(StatefulGraphOperation, flogging.Loggable):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.__strategy: BinStrategy = BinStrategy.Uniform
         self.__attributes: Dict[int, int] = dict()
         self.__attributeSuffix: Optional[str] = '_discretized'
+        # Partial fit state { attr_index: (data_min, data_max) }
+        self.__dataRange: Dict[int, Tuple[float, float]] = dict()
+        # Partial fit state with approximate quantiles { attr_index: sketch }
+        self.__sketches: Dict[int, QuantileSketch] = dict()
+        # Fitted bin edges { attr_index: edges }
+        self.__fitted: Dict[int, np.ndarray] = dict()
+        # Column names seen while fitting
+        self.__fitColumns: List[str] = list()
 
     def __logExecution(self, columns: List[str], binEdges: Dict[int, List[float]]) -> None:
         optPt = pt.PrettyTable(field_names=['Option', 'Value'])
@@ -71,34 +130,101 @@ class BinsDiscretizer(GraphOperation, flogging.Loggable):
         self._logOptionsString = optPt.get_string(border=True, vrules=pt.ALL)
         self._logExecutionString = binsPt.get_string(border=True, vrules=pt.ALL)
 
-    def execute(self, df: data.Frame) -> data.Frame:
-        frame = copy.deepcopy(df)
-        f = frame.getRawFrame()
-        # Operation ignores nan values
-        nanRows = f.iloc[:, list(self.__attributes.keys())].isnull()
-        # For every column, transform every non-nan row
+    def fit(self, df: data.Frame) -> None:
+        if self.__strategy == BinStrategy.ApproximateQuantile:
+            super().fit(df)
+            return
+        f = df.getRawFrame()
+        self.__fitted = dict()
+        columns = list(self.__attributes.keys())
+        ks = list(self.__attributes.values())
+        if self.__strategy == BinStrategy.Kmeans:
+            edges = list()
+            for col, k in self.__attributes.items():
+                column = f.iloc[:, col]
+                # Operation ignores nan values
+                notNa = column.notna().values
+                discretizer = skp.KBinsDiscretizer(n_bins=k, encode='ordinal',
+                                                   strategy=self.__strategy.value)
+                discretizer.fit(column.values[notNa].reshape(-1, 1))
+                edges.append(discretizer.bin_edges_[0])
+        else:
+            # Edges of every column are computed together
+            block = f.iloc[:, columns].to_numpy(dtype=np.float64)
+            if self.__strategy == BinStrategy.Uniform:
+                edges = _uniformEdges(block, ks)
+            else:
+                edges = _quantileEdges(block, ks)
+        self.__fitted = dict(zip(columns, edges))
+        # Log what has been done
+        self.__logExecution(f.columns, {c: e.tolist() for c, e in self.__fitted.items()})
+
+    def supportsPartialFit(self) -> bool:
+        # Exact quantiles and clusters can't be computed incrementally
+        return self.__strategy in (BinStrategy.Uniform, BinStrategy.ApproximateQuantile)
+
+    def resetFit(self) -> None:
+        self.__dataRange = dict()
+        self.__sketches = dict()
+        self.__fitted = dict()
+
+    def partialFit(self, df: data.Frame) -> None:
+        f = df.getRawFrame()
+        self.__fitColumns = f.columns.to_list()
+        for col in self.__attributes.keys():
+            column = f.iloc[:, col]
+            if self.__strategy == BinStrategy.ApproximateQuantile:
+                self.__sketches.setdefault(col, QuantileSketch()).update(column.values)
+                continue
+            cMin, cMax = column.min(), column.max()
+            if col in self.__dataRange:
+                # Nan values are ignored
+                cMin = np.fmin(cMin, self.__dataRange[col][0])
+                cMax = np.fmax(cMax, self.__dataRange[col][1])
+            self.__dataRange[col] = (cMin, cMax)
+
+    def finalizeFit(self) -> None:
+        # Same edges computed by sklearn with uniform strategy
+        self.__fitted = dict()
+        for col, k in self.__attributes.items():
+            if self.__strategy == BinStrategy.ApproximateQuantile:
+                self.__fitted[col] = _sketchEdges(self.__sketches.get(col, QuantileSketch()), k)
+                continue
+            cMin, cMax = self.__dataRange.get(col, (np.nan, np.nan))
+            if cMin == cMax:
+                # Constant column: a single bin
+                self.__fitted[col] = _constantEdges()
+            else:
+                self.__fitted[col] = np.linspace(cMin, cMax, k + 1)
+        self.__logExecution(self.__fitColumns, {c: e.tolist() for c, e in self.__fitted.items()})
+
+    def transform(self, df: data.Frame) -> data.Frame:
+        f = df.getRawFrame()
         columns = f.columns
-        edges: Dict[int, List[float]] = dict()
+        discretized: Dict[str, pd.Series] = dict()
         for col, k in self.__attributes.items():
-            colName = columns[col]
-            notNa = (~nanRows.loc[:, colName]).to_list()
-            discretizer = skp.KBinsDiscretizer(n_bins=k, encode='ordinal',
-                                               strategy=self.__strategy.value)
-            # Discretize and convert to string (since categories are strings)
-            result = discretizer.fit_transform(f.loc[notNa, colName].values.reshape(-1, 1)).astype(str)
-            name: str = colName
+            edges = self.__fitted[col]
+            x = f.iloc[:, col].values
+            # Values on the edges are put in the right bin as done in sklearn
+            codes = np.searchsorted(edges[1:], x + 1.e-8 + 1.e-5 * np.abs(x), side='right')
+            codes = np.clip(codes, 0, edges.size - 2)
+            # Nan rows are left as nan
+            codes[np.isnan(x)] = -1
+            name: str = columns[col]
             if self.__attributeSuffix:
-                # Make a new column with all nans
-                name = colName + self.__attributeSuffix
-                f.loc[:, name] = np.nan
-            # Assign column
-            f.loc[notNa, [name]] = result
-            f.loc[:, name] = f[name].astype(
-                pd.CategoricalDtype(categories=[str(float(i)) for i in range(k)], ordered=True))
-            edges[col] = discretizer.bin_edges_[0].tolist()
-        # Log what has been done
-        self.__logExecution(columns, edges)
-        return data.Frame(f)
+                # Make a new column
+                name = name + self.__attributeSuffix
+            discretized[name] = _binsColumn(codes, f.index, k)
+        # Set discretized columns, sharing the others
+        return df.withColumns(discretized)
+
+    def fittedParameters(self) -> Optional[Dict[int, List[float]]]:
+        # { attr_index: bin edges }
+        return {c: e.tolist() for c, e in self.__fitted.items()} if self.__fitted else None
+
+    def setFittedParameters(self, params: Optional[Dict[int, List[float]]]) -> None:
+        self.__fitted = {c: np.array(e, dtype=np.float) for c, e in params.items()} if params \
+            else dict()
 
     def acceptedTypes(self) -> List[Type]:
         return [Types.Numeric]
@@ -107,6 +233,10 @@ class BinsDiscretizer(GraphOperation, flogging.Loggable):
     def name() -> str:
         return 'KBinsDiscretizer'
 
+    @staticmethod
+    def isProcessSafe() -> bool:
+        return True
+
     @staticmethod
     def shortDescription() -> str:
         return 'Discretize numeric values into equal sized bins'
@@ -116,6 +246,7 @@ class BinsDiscretizer(GraphOperation, flogging.Loggable):
 
     def unsetOptions(self) -> None:
         self.__attributes = dict()
+        self.resetFit()
 
     def needsOptions(self) -> bool:
         return True
@@ -166,6 +297,8 @@ class BinsDiscretizer(GraphOperation, flogging.Loggable):
             self.__attributes[r] = k
         self.__strategy = strategy
         self.__attributeSuffix = suffix[1] if suffix[0] else None
+        # Fitted parameters depend on options
+        self.resetFit()
 
     def getEditor(self) -> AbsOperationEditor:
         factory = OptionsEditorFactory()
@@ -240,14 +373,29 @@ class RangeDiscretizer(GraphOperation, flogging.Loggable):
         return tt.get_string(border=True, vrules=pt.ALL) + drop
 
     def execute(self, df: data.Frame) -> data.Frame:
-        f = df.getRawFrame().copy(True)
-        columns = f.columns.to_list()
-        for c, o in self.__attributes.items():
-            result = pd.cut(f.iloc[:, c], bins=o[0], labels=o[1], duplicates='drop')
+        results = self.__discretize(data.ColumnView(df))
+        if not self.__attributeSuffix:
+            # Replace discretized columns, sharing the others
+            return df.replaceColumns(results)
+        columns = df.colnames
+        discretized: Dict[str, pd.Series] = dict()
+        for c, result in results.items():
             colName: str = columns[c]
             newColName: str = colName if not self.__attributeSuffix else colName + self.__attributeSuffix
-            f.loc[:, newColName] = result
-        return data.Frame(f)
+            discretized[newColName] = result
+        # Set discretized columns, sharing the others
+        return df.withColumns(discretized)
+
+    def executeColumns(self, columns: data.ColumnView) -> Dict[int, pd.Series]:
+        if self.__attributeSuffix:
+            return super().executeColumns(columns)
+        return self.__discretize(columns)
+
+    def __discretize(self, columns: data.ColumnView) -> Dict[int, pd.Series]:
+        return columntasks.mapColumns(
+            lambda c: pd.cut(columns[c], bins=self.__attributes[c][0],
+                             labels=self.__attributes[c][1], duplicates='drop'),
+            self.__attributes.keys(), rows=columns.nRows)
 
     def getOutputShape(self) -> Optional[data.Shape]:
         if self.shapes[0] is None or not self.hasOptions():
@@ -268,6 +416,23 @@ class RangeDiscretizer(GraphOperation, flogging.Loggable):
     def name() -> str:
         return 'RangeDiscretizer'
 
+    @staticmethod
+    def isProcessSafe() -> bool:
+        return True
+
+    def isRowLocal(self) -> bool:
+        return True
+
+    def isColumnLocal(self) -> bool:
+        # New columns with a suffix are appended
+        return not self.__attributeSuffix
+
+    def neededColumns(self, columns: Optional[Set[int]]) -> Optional[Set[int]]:
+        if columns is None or self.__attributeSuffix:
+            return None
+        # Only discretized columns are read
+        return columns | set(self.__attributes.keys())
+
     @staticmethod
     def shortDescription() -> str:
         return 'Discretize numeric attributes in user defined ranges'
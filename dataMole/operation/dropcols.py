@@ -21,7 +21,7 @@
 # You should have received a copy of the GNU General Public License
 # along with DataMole.  If not, see <https://www.gnu.org/licenses/>.
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set
 
 import prettytable as pt
 
@@ -52,6 +52,20 @@ class DropColumns(GraphOperation, flogging.Loggable):
     def name() -> str:
         return 'DropColumns'
 
+    @staticmethod
+    def isProcessSafe() -> bool:
+        return True
+
+    def isRowLocal(self) -> bool:
+        return True
+
+    def neededColumns(self, columns: Optional[Set[int]]) -> Optional[Set[int]]:
+        if not self.shapes[0]:
+            return None
+        # Positions of kept columns in the input
+        kept = [i for i in range(len(self.shapes[0].colNames)) if i not in self.__selected]
+        return set(kept) if columns is None else {kept[i] for i in columns}
+
     def setOptions(self, selected: Dict[int, None]) -> None:
         if not selected:
             raise exp.OptionValidationError([('e', 'Error: no attribute is selected')])
@@ -21,7 +21,7 @@
 # You should have received a copy of the GNU General Public License
 # along with DataMole.  If not, see <https://www.gnu.org/licenses/>.
 
-from typing import Dict, Tuple, List, Optional
+from typing import Dict, Optional
 
 import prettytable as pt
 from PySide2.QtWidgets import QHeaderView
@@ -47,17 +47,20 @@ class DuplicateColumn(GraphOperation, flogging.Loggable):
         return tt.get_string(border=True, vrules=pt.ALL)
 
     def execute(self, df: data.Frame) -> data.Frame:
-        f = df.getRawFrame().copy(True)
-        pairs: List[Tuple[int, str]] = list(self.__attributes.items())
-        names = [v[1] for v in pairs]
-        indexes = [v[0] for v in pairs]
-        f[names] = f.iloc[:, indexes]
-        return data.Frame(f)
+        f = df.getRawFrame()
+        return df.withColumns({name: f.iloc[:, i] for i, name in self.__attributes.items()})
 
     @staticmethod
     def name() -> str:
         return 'DuplicateColumn'
 
+    @staticmethod
+    def isProcessSafe() -> bool:
+        return True
+
+    def isRowLocal(self) -> bool:
+        return True
+
     @staticmethod
     def shortDescription() -> str:
         return 'Makes duplicates of selected columns, giving them a new name'
@@ -21,8 +21,9 @@
 # You should have received a copy of the GNU General Public License
 # along with DataMole.  If not, see <https://www.gnu.org/licenses/>.
 
-from typing import Dict, Any, Union, Optional
+from typing import Dict, Any, Union, Optional, Tuple, Set
 
+import numpy as np
 import pandas as pd
 import prettytable as pt
 
@@ -33,11 +34,11 @@ from dataMole.flogging import Loggable
 from dataMole.gui.editor import AbsOperationEditor, OptionsEditorFactory, \
     OptionValidatorDelegate
 from dataMole.gui.mainmodels import FrameModel
-from dataMole.operation.interface.graph import GraphOperation
+from dataMole.operation.interface.graph import StatefulGraphOperation
 from dataMole.operation.utils import SingleStringValidator, isFloat
 
 
-class FillNan(GraphOperation, Loggable):
+class FillNan(StatefulGraphOperation, Loggable):
     _DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
 
     def __init__(self, *args, **kwargs):
@@ -46,6 +47,12 @@ class FillNan(GraphOperation, Loggable):
         self.__selection: Dict[int, Union[str, float, pd.Timestamp]] = dict()
         self.__method: str = None  # { bfill, ffill, mean }
         self.__byValue: bool = True  # Use values or method
+        # Partial fit state with method 'mean' { attr_index: (count, mean, isDatetime) }
+        self.__means: Dict[int, Tuple[int, float, bool]] = dict()
+        # Names of fitted columns { attr_index: column name }
+        self.__fitNames: Dict[int, str] = dict()
+        # Fitted fill values { attr_index: mean }
+        self.__fitted: Dict[int, Union[float, pd.Timestamp]] = dict()
 
     def logOptions(self) -> str:
         columns = self.shapes[0].colNames
@@ -73,29 +80,87 @@ class FillNan(GraphOperation, Loggable):
         self._logExecutionString = '\n'.join(strings)
 
     def execute(self, df: data.Frame) -> data.Frame:
-        columns = df.colnames
-        rdf = df.getRawFrame().copy(True)
-        processDf = rdf.iloc[:, list(self.__selection.keys())]
+        if self.supportsPartialFit():
+            # Mean values are fitted (or reused if frozen)
+            return super().execute(df)
+        # Replace filled columns, sharing the others
+        return df.replaceColumns(self.executeColumns(data.ColumnView(df)))
+
+    def executeColumns(self, columns: data.ColumnView) -> Dict[int, pd.Series]:
+        if self.supportsPartialFit():
+            return super().executeColumns(columns)
         if self.__byValue:
-            valueDict = {columns[k]: v for k, v in self.__selection.items()}
-            processed = processDf.fillna(valueDict, axis=0)
-        elif self.__method == 'mean':
-            # For some reason pandas can't compute mean of a dataframe so I do it by hand
-            valueDict = {k: processDf[k].mean() for k in processDf}
-            # This is the only case where we need an execution log
-            self.__logExecution(valueDict)
-            processed = processDf.fillna(valueDict, axis=0)
-        else:
-            processed = processDf.fillna(method=self.__method, axis=0)
-        # Merge result with previous frame, keeping column order
-        processed = pd.concat([processed, rdf.drop(processed.columns.values, axis=1)], axis=1,
-                              ignore_index=False)[columns]
-        return data.Frame(processed)
+            return {k: columns[k].fillna(v) for k, v in self.__selection.items()}
+        return {k: columns[k].fillna(method=self.__method) for k in self.__selection.keys()}
+
+    def isRowLocal(self) -> bool:
+        return self.__byValue or super().isRowLocal()
+
+    def isColumnLocal(self) -> bool:
+        return True
+
+    def neededColumns(self, columns: Optional[Set[int]]) -> Optional[Set[int]]:
+        # Only filled columns are read
+        return None if columns is None else columns | set(self.__selection.keys())
+
+    def supportsPartialFit(self) -> bool:
+        # Backfill and pad need values from other chunks
+        return not self.__byValue and self.__method == 'mean'
+
+    def resetFit(self) -> None:
+        self.__means = dict()
+        self.__fitNames = dict()
+        self.__fitted = dict()
+
+    def partialFit(self, df: data.Frame) -> None:
+        self.partialFitColumns(data.ColumnView(df))
+
+    def partialFitColumns(self, columns: data.ColumnView) -> None:
+        for k in self.__selection.keys():
+            column = columns[k]
+            isDate = column.dtype.kind == 'M'
+            values = column.dropna().values
+            if isDate:
+                # Mean of datetimes is computed on nanoseconds
+                values = values.view('i8')
+            if not values.size:
+                continue
+            n, mean, _ = self.__means.get(k, (0, 0.0, isDate))
+            total = n + values.size
+            self.__means[k] = (total, mean + (values.mean() - mean) * values.size / total, isDate)
+        self.__fitNames = {k: columns.columns[k] for k in self.__selection.keys()}
+
+    def finalizeFit(self) -> None:
+        self.__fitted = dict()
+        for k, name in self.__fitNames.items():
+            # Columns with only nan values have nan mean
+            _, mean, isDate = self.__means.get(k, (0, np.nan, False))
+            self.__fitted[k] = pd.Timestamp(int(round(mean))) if isDate else float(mean)
+        self.__logExecution({name: self.__fitted[k] for k, name in self.__fitNames.items()})
+
+    def transform(self, df: data.Frame) -> data.Frame:
+        # Replace filled columns, sharing the others
+        return df.replaceColumns(self.transformColumns(data.ColumnView(df)))
+
+    def transformColumns(self, columns: data.ColumnView) -> Dict[int, pd.Series]:
+        return {k: columns[k].fillna(self.__fitted[k]) if k in self.__fitted else columns[k]
+                for k in self.__selection.keys()}
+
+    def fittedParameters(self) -> Optional[Dict[int, Union[float, pd.Timestamp]]]:
+        # { attr_index: mean }
+        return dict(self.__fitted) if self.__fitted else None
+
+    def setFittedParameters(self, params: Optional[Dict[int, Union[float, pd.Timestamp]]]) -> None:
+        self.__fitted = dict(params) if params else dict()
 
     @staticmethod
     def name() -> str:
         return 'FillNan'
 
+    @staticmethod
+    def isProcessSafe() -> bool:
+        return True
+
     @staticmethod
     def shortDescription() -> str:
         return 'Fill NaN/NaT values over columns with specified method'
@@ -105,6 +170,7 @@ class FillNan(GraphOperation, Loggable):
 
     def unsetOptions(self) -> None:
         self.__selection = dict()
+        self.resetFit()
 
     def needsOptions(self) -> bool:
         return True
@@ -173,6 +239,8 @@ class FillNan(GraphOperation, Loggable):
         self.__method = fillMode
         self.__selection = selectedDict
         self.__byValue = withValue
+        # Fitted parameters depend on options
+        self.resetFit()
 
     def getEditor(self) -> AbsOperationEditor:
         factory = OptionsEditorFactory()
@@ -25,7 +25,7 @@ from typing import Iterable, List, Union, Dict
 
 from dataMole import data, flogging
 from dataMole import exceptions as exp
-from dataMole.data.types import ALL_TYPES, Type, IndexType
+from dataMole.data.types import ALL_TYPES, Type, IndexType, Types
 from dataMole.gui.editor import AbsOperationEditor, OptionsEditorFactory
 from dataMole.gui.mainmodels import FrameModel
 from dataMole.operation.interface.graph import GraphOperation
@@ -45,6 +45,10 @@ class SetIndex(GraphOperation, flogging.Loggable):
     def name() -> str:
         return 'Set index'
 
+    @staticmethod
+    def isProcessSafe() -> bool:
+        return True
+
     @staticmethod
     def shortDescription() -> str:
         return 'Sets the column index of a table'
@@ -117,7 +121,8 @@ class ResetIndex(GraphOperation, flogging.Loggable):
         indexNames = set(f.index.names)
         conflicts = columns & indexNames
         if conflicts:
-            # There are columns named as index columns. Rename index
+            # There are columns named as index columns. Rename index (without modifying input)
+            f = f.copy(deep=False)
             f.index = f.index.set_names([col + '_index' for col in conflicts], level=conflicts if len(
                 indexNames) > 1 else None)
         # Reset index adding indexes as columns. Now there cannot be naming conflicts
@@ -128,6 +133,10 @@ class ResetIndex(GraphOperation, flogging.Loggable):
     def name() -> str:
         return 'Reset index'
 
+    @staticmethod
+    def isProcessSafe() -> bool:
+        return True
+
     @staticmethod
     def shortDescription() -> str:
         return 'Sets a default numeric index on the dataframe. The old indexes are re-inserted in the ' \
@@ -151,6 +160,27 @@ class ResetIndex(GraphOperation, flogging.Loggable):
     def needsOptions(self) -> bool:
         return False
 
+    def getOutputShape(self) -> Union[data.Shape, None]:
+        if not self._shapes[0]:
+            return None
+        s = self._shapes[0].clone()
+        columns = set(s.colNames)
+        single = s.nIndexLevels == 1
+        names = list()
+        for i, name in enumerate(s.index):
+            if name == 'Unnamed':
+                # Unnamed levels are named by pandas
+                name = ('index' if 'index' not in columns else 'level_0') if single \
+                    else 'level_{:d}'.format(i)
+            elif name in columns:
+                name += '_index'
+            names.append(name)
+        s.colNames = names + s.colNames
+        s.colTypes = [t.type for t in s.indexTypes] + s.colTypes
+        s.index = ['Unnamed']
+        s.indexTypes = [IndexType(Types.Numeric)]
+        return s
+
     def getEditor(self) -> AbsOperationEditor:
         pass
 
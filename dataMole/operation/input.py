@@ -21,12 +21,10 @@
 # You should have received a copy of the GNU General Public License
 # along with DataMole.  If not, see <https://www.gnu.org/licenses/>.
 
-from typing import Optional, Union, Dict
+from typing import Optional, Union, Dict, Set, Hashable
 
 from dataMole import data, flogging
-from dataMole.gui.editor.interface import AbsOperationEditor
 from .interface.graph import InputGraphOperation
-from ..gui.editor import OptionsEditorFactory
 
 
 class SetInput(InputGraphOperation, flogging.Loggable):
@@ -38,6 +36,17 @@ class SetInput(InputGraphOperation, flogging.Loggable):
         """ Get selected dataframe from workbench """
         return self._workbench.getDataframeModelByName(self._frame_name).frame
 
+    def executeProjection(self, columns: Set[int]) -> data.Frame:
+        """ Get selected dataframe from workbench, reading only the needed columns if it was not
+        loaded yet """
+        return self._workbench.getDataframeModelByName(self._frame_name).projection(columns)
+
+    def sourceVersion(self) -> Optional[Hashable]:
+        """ The version of the selected frame in the workbench """
+        if self._frame_name not in self._workbench.names:
+            return None
+        return self._workbench.getDataframeModelByName(self._frame_name).version
+
     @staticmethod
     def name() -> str:
         return 'Copy operation'
@@ -59,12 +68,14 @@ class SetInput(InputGraphOperation, flogging.Loggable):
         if not self.hasOptions():
             return None
         else:
-            return self._workbench.getDataframeModelByName(self._frame_name).frame.shape
+            # Shape is known without loading lazy frames
+            return self._workbench.getDataframeModelByName(self._frame_name).shape.clone()
 
     def needsOptions(self) -> bool:
         return True
 
-    def getEditor(self) -> AbsOperationEditor:
+    def getEditor(self) -> 'AbsOperationEditor':
+        from dataMole.gui.editor import OptionsEditorFactory
         factory = OptionsEditorFactory()
         factory.initEditor()
         factory.withComboBox(key='inputF', label='Input frame', editable=False, model=self._workbench)
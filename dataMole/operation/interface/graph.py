@@ -22,12 +22,10 @@
 # along with DataMole.  If not, see <https://www.gnu.org/licenses/>.
 
 from abc import abstractmethod
-from typing import Union, List, Optional, Iterable
+from typing import Union, List, Optional, Iterable, Dict, Any, Set, Hashable
 
 from dataMole import data
 from dataMole.data.types import ALL_TYPES, Type
-from dataMole.gui.editor.interface import AbsOperationEditor
-from dataMole.gui.workbench import WorkbenchModel
 from .operation import Operation
 
 
@@ -36,7 +34,7 @@ class GraphOperation(Operation):
     Base interface of every graph operation
     """
 
-    def __init__(self, w: WorkbenchModel = None):
+    def __init__(self, w: 'WorkbenchModel' = None):
         """ Initialises an operation """
         # Holds the input shapes
         super().__init__(w)
@@ -88,7 +86,8 @@ class GraphOperation(Operation):
         If the shape cannot be predicted it must return
         None. This is also the case when not all options are set. By default it returns None if any
         options/input shapes are not set, and otherwise it tries to infer the output shapes by running
-        the 'execute' method with dummy frames.
+        the 'execute' method with dummy frames. Since this is expensive with wide frames, every
+        built-in operation overrides it, computing the output shape from the input shapes only.
         Additionally 'isOutputShapeKnown' should be overridden accordingly.
         See :func:`~dataMole.operation.interface.GraphOperation.isOutputShapeKnown`
         """
@@ -128,6 +127,74 @@ class GraphOperation(Operation):
         """
         return True
 
+    @staticmethod
+    def isProcessSafe() -> bool:
+        """
+        Tells if the operation can be executed in a separate process. This is only possible for pure
+        operations, whose result only depends on their options and input frames (e.g. they do not
+        access the workbench), and whose options can be pickled. Operations executed in a process
+        work on a copy, so the only state sent back is the result, the log strings and the fitted
+        parameters of :class:`~dataMole.operation.interface.graph.StatefulGraphOperation`
+
+        :return: True if the operation can run in a process pool. Defaults to False
+
+        """
+        return False
+
+    def isRowLocal(self) -> bool:
+        """
+        Tells if every row of the output only depends on the same row of the input, with the current
+        options. Operations which only transform (or filter) rows one by one must return True, and
+        are executed one chunk of rows at a time when the flow runs in streaming mode. Operations
+        which need every row at once (e.g. to compute statistics over a column) must return False.
+        See also :class:`~dataMole.operation.interface.graph.StatefulGraphOperation`
+
+        :return: True if the operation can process chunks of rows independently. Defaults to False
+
+        """
+        return False
+
+    def isColumnLocal(self) -> bool:
+        """
+        Tells if the operation only replaces some columns of its single input, with the current
+        options, and every new column only depends on the same column of the input. Operations
+        which return True must implement
+        :func:`~dataMole.operation.interface.graph.GraphOperation.executeColumns`, and chains of
+        them are executed in a single pass by the flow executor
+
+        :return: True if the operation can be applied through a column view. Defaults to False
+
+        """
+        return False
+
+    def executeColumns(self, columns: data.ColumnView) -> Dict[int, Any]:
+        """
+        Computes the columns replaced by the operation. Must be implemented by column-local
+        operations, whose 'execute' is equivalent to 'df.replaceColumns(self.executeColumns(
+        data.ColumnView(df)))'. Must not modify the columns in place
+
+        :param columns: the columns of the input frame
+        :return: dictionary { column position: new values }
+        :raise NotImplementedError: if the operation is not column-local
+
+        """
+        raise NotImplementedError('Operation {} is not column-local'.format(self.name()))
+
+    def neededColumns(self, columns: Optional[Set[int]]) -> Optional[Set[int]]:
+        """
+        Tells which columns of the input are needed to compute some columns of the output, with
+        the current options. It is used to avoid reading columns which no output depends on. The
+        other columns of the input may hold any value, so operations which read every column (e.g.
+        to filter rows) must return None. Operations with more than one input must return None
+
+        :param columns: positions of the output columns which are needed, or None if every column
+            is needed
+        :return: positions of the input columns needed, or None if every column is needed.
+            Defaults to None
+
+        """
+        return None
+
     # ----------------------------------------------------------------------------
     # --------------------------- PURE VIRTUAL METHODS ---------------------------
     # ----------------------------------------------------------------------------
@@ -213,7 +280,7 @@ class GraphOperation(Operation):
         pass
 
     @abstractmethod
-    def getEditor(self) -> AbsOperationEditor:
+    def getEditor(self) -> 'AbsOperationEditor':
         """
         Return the editor panel to configure the step
 
@@ -264,6 +331,169 @@ class GraphOperation(Operation):
         pass
 
 
+class StatefulGraphOperation(GraphOperation):
+    """
+    Base class for operations which compute some statistics over the whole input frame (e.g. the
+    mean of a column) and then use them to transform every row. In streaming mode these operations
+    are executed in two passes over the chunks: first
+    :func:`~dataMole.operation.interface.graph.StatefulGraphOperation.partialFit` is called with
+    every chunk, then :func:`~dataMole.operation.interface.graph.StatefulGraphOperation.finalizeFit`
+    once, and finally :func:`~dataMole.operation.interface.graph.StatefulGraphOperation.transform`
+    with every chunk.
+
+    Fitted parameters are kept in the operation and saved with the flow. When the operation is
+    frozen and fitted, 'execute' only transforms the input with the saved parameters, so that a
+    flow can be applied to new data without fitting it again
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__frozen: bool = False
+
+    # ----------------------------------------------------------------------------
+    # ---------------------- FINAL METHODS (PLS NO OVERRIDE) ---------------------
+    # ----------------------------------------------------------------------------
+
+    @property
+    def frozen(self) -> bool:
+        """ Whether fitted parameters are reused instead of being computed on every execution """
+        return self.__frozen
+
+    def setFrozen(self, frozen: bool) -> None:
+        """ Sets the frozen mode. Parameters must be already fitted for it to have effect """
+        self.__frozen = frozen
+
+    def isFitted(self) -> bool:
+        """ Returns True if the operation has fitted parameters """
+        return self.fittedParameters() is not None
+
+    # ---------------------------------------------------------
+    # -------------------- VIRTUAL METHODS --------------------
+    # ---------------------------------------------------------
+
+    def execute(self, df: data.Frame) -> data.Frame:
+        """ Fits the parameters on the input frame, unless the operation is frozen, and then
+        transforms it """
+        if not (self.__frozen and self.isFitted()):
+            self.fit(df)
+        return self.transform(df)
+
+    def fit(self, df: data.Frame) -> None:
+        """
+        Computes the parameters on a whole frame. By default it uses the partial fit methods with a
+        single chunk
+
+        :param df: the input frame
+
+        """
+        self.resetFit()
+        self.partialFit(df)
+        self.finalizeFit()
+
+    def isRowLocal(self) -> bool:
+        """ Frozen operations are row-local, since parameters are not fitted again """
+        return self.__frozen and self.isFitted()
+
+    def supportsPartialFit(self) -> bool:
+        """
+        Tells if statistics can be computed incrementally with the current options. If this method
+        returns False (and the operation is not row-local) the operation needs the whole frame
+
+        :return: True if the fit/transform mode is supported. Defaults to True
+
+        """
+        return True
+
+    def executeColumns(self, columns: data.ColumnView) -> Dict[int, Any]:
+        """ Column-local version of 'execute'. Fits the parameters on the columns, unless the
+        operation is frozen, and then transforms them """
+        if not (self.__frozen and self.isFitted()):
+            self.resetFit()
+            self.partialFitColumns(columns)
+            self.finalizeFit()
+        return self.transformColumns(columns)
+
+    def partialFitColumns(self, columns: data.ColumnView) -> None:
+        """
+        Column-local version of
+        :func:`~dataMole.operation.interface.graph.StatefulGraphOperation.partialFit`. Must be
+        implemented by column-local operations
+
+        :param columns: the columns of the chunk of rows
+
+        """
+        raise NotImplementedError('Operation {} is not column-local'.format(self.name()))
+
+    def transformColumns(self, columns: data.ColumnView) -> Dict[int, Any]:
+        """
+        Column-local version of
+        :func:`~dataMole.operation.interface.graph.StatefulGraphOperation.transform`. Must be
+        implemented by column-local operations
+
+        :param columns: the columns of the chunk of rows
+        :return: dictionary { column position: new values }
+
+        """
+        raise NotImplementedError('Operation {} is not column-local'.format(self.name()))
+
+    @abstractmethod
+    def resetFit(self) -> None:
+        """ Discards statistics computed by previous calls to
+        :func:`~dataMole.operation.interface.graph.StatefulGraphOperation.partialFit`. Called before
+        the first chunk is given """
+        pass
+
+    @abstractmethod
+    def partialFit(self, df: data.Frame) -> None:
+        """
+        Updates the statistics with a chunk of rows. Must not modify the input frame
+
+        :param df: the chunk of rows
+
+        """
+        pass
+
+    @abstractmethod
+    def finalizeFit(self) -> None:
+        """ Computes the final parameters after every chunk was given to
+        :func:`~dataMole.operation.interface.graph.StatefulGraphOperation.partialFit` """
+        pass
+
+    @abstractmethod
+    def fittedParameters(self) -> Optional[Dict[Any, Any]]:
+        """
+        Returns the fitted parameters. They must be picklable and must not depend on the operation
+        class, since they are serialized with the flow
+
+        :return: the fitted parameters, or None if the operation was not fitted
+
+        """
+        pass
+
+    @abstractmethod
+    def setFittedParameters(self, params: Optional[Dict[Any, Any]]) -> None:
+        """
+        Sets the fitted parameters, as returned by
+        :func:`~dataMole.operation.interface.graph.StatefulGraphOperation.fittedParameters`
+
+        :param params: the parameters or None to discard them
+
+        """
+        pass
+
+    @abstractmethod
+    def transform(self, df: data.Frame) -> data.Frame:
+        """
+        Transforms a chunk of rows with the fitted parameters. Follows the same rules of 'execute'
+
+        :param df: the chunk of rows
+
+        :return: the transformed chunk
+
+        """
+        pass
+
+
 class InputGraphOperation(GraphOperation):
     """
     Base class for operations to be used to provide input.
@@ -289,6 +519,30 @@ class InputGraphOperation(GraphOperation):
         """ Returns the single input shape which must be inferred from options """
         pass
 
+    def executeProjection(self, columns: Set[int]) -> data.Frame:
+        """
+        Like 'execute', but only the columns at the specified positions are needed by the flow.
+        Other columns must be kept in the output, but may hold placeholder values. Input operations
+        which can read a subset of columns should reimplement it. By default it calls 'execute'
+
+        :param columns: positions of the needed columns
+        :return: the frame
+
+        """
+        return self.execute()
+
+    def sourceVersion(self) -> Optional[Hashable]:
+        """
+        Identifies the data read by the operation, so that results computed from it can be reused
+        (see :class:`~dataMole.flow.cache.ResultCache`). It must change whenever the same options
+        would produce a different frame. By default it is None, meaning that it is unknown and
+        results are never reused
+
+        :return: the version of the input data, or None if it is unknown
+
+        """
+        return None
+
     def unsetOptions(self) -> None:
         """ Reimplements base operation and does nothing, since no options depends on the input shape """
         pass
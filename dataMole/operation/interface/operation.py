@@ -100,7 +100,7 @@ class Operation(ABC):
         :return: a string also with html formatting
 
         """
-        return operation.descriptions.get(self.__class__.__name__, None)
+        return operation.description(self.__class__.__name__)
 
     def hasOptions(self) -> bool:
         """
@@ -85,6 +85,10 @@ class Join(GraphOperation, flogging.Loggable):
     def name() -> str:
         return 'Join'
 
+    @staticmethod
+    def isProcessSafe() -> bool:
+        return True
+
     @staticmethod
     def shortDescription() -> str:
         return 'Join two tables on indexes or columns. Supports left, right, outer and inner join'
@@ -160,6 +164,60 @@ class Join(GraphOperation, flogging.Loggable):
             rt = rt.type
         return lt == rt or {lt, rt} <= {Types.String, Types.Ordinal, Types.Nominal}
 
+    @staticmethod
+    def _joinedType(lt: Type, rt: Type) -> Type:
+        """ Type of a column or index level obtained by joining two columns/levels. Different types
+        are joined as generic objects """
+        if lt == rt:
+            return lt
+        return IndexType(Types.String) if isinstance(lt, IndexType) else Types.String
+
+    def getOutputShape(self) -> Optional[data.Shape]:
+        if not all(self._shapes) or not self.hasOptions():
+            return None
+        sl, sr = self._shapes
+        keys = set()
+        if not self.__onIndex:
+            lOn = sl.colNames[self.__leftOn]
+            if lOn == sr.colNames[self.__rightOn]:
+                # The key column is kept once, without suffix
+                keys.add(lOn)
+        overlap = (set(sl.colNames) & set(sr.colNames)) - keys
+        s = data.Shape()
+        s.colNames = [n + self.__lSuffix if n in overlap else n for n in sl.colNames]
+        s.colTypes = [self._joinedType(t, sr.columnsDict[n]) if n in keys else t
+                      for n, t in zip(sl.colNames, sl.colTypes)]
+        for n, t in zip(sr.colNames, sr.colTypes):
+            if n not in keys:
+                s.colNames.append(n + self.__rSuffix if n in overlap else n)
+                s.colTypes.append(t)
+        if not self.__onIndex:
+            # Merge sets a default index
+            s.index = ['Unnamed']
+            s.indexTypes = [IndexType(Types.Numeric)]
+        elif sl.nIndexLevels == sr.nIndexLevels == 1:
+            # Left and right joins keep the index name of one frame, other joins only keep it if
+            # it is the same in both frames
+            if self.__type == Join.JoinType.Left:
+                name = sl.index[0]
+            elif self.__type == Join.JoinType.Right:
+                name = sr.index[0]
+            else:
+                name = sl.index[0] if sl.index[0] == sr.index[0] else 'Unnamed'
+            s.index = [name]
+            s.indexTypes = [self._joinedType(sl.indexTypes[0], sr.indexTypes[0])]
+        else:
+            # Multiindex join on common levels, other levels are kept
+            indexR = sr.indexDict
+            s.index = list(sl.index)
+            s.indexTypes = [self._joinedType(t, indexR[n]) if n in indexR else t
+                            for n, t in zip(sl.index, sl.indexTypes)]
+            for n, t in zip(sr.index, sr.indexTypes):
+                if n not in s.index:
+                    s.index.append(n)
+                    s.indexTypes.append(t)
+        return s
+
     def unsetOptions(self) -> None:
         self.__leftOn: int = None
         self.__rightOn: int = None
@@ -50,22 +50,30 @@ class OneHotEncoder(GraphOperation, flogging.Loggable):
             self.__includeNan)
 
     def execute(self, df: data.Frame) -> data.Frame:
-        pdf = df.getRawFrame().copy(deep=True)
+        pdf = df.getRawFrame()
         prefixes = itemgetter(*self.__attributes)(self.shapes[0].colNames)
         npdf = pd.get_dummies(pdf.iloc[:, self.__attributes], prefix=prefixes,
                               dummy_na=self.__includeNan, dtype=int)
         npdf = npdf.astype('category', copy=False)
-        # Replace eventual duplicate columns
-        pdf = pdf.drop(columns=npdf.columns, errors='ignore')
+        # Replace eventual duplicate columns and append the new ones, sharing the others
         # Avoid dropping original columns (just append)
-        # pdf = pdf.drop(columns[self.__attributes], axis=1, inplace=False)
-        pdf = pd.concat([pdf, npdf], axis=1)
-        return data.Frame(pdf)
+        return df.withColumns({c: npdf.iloc[:, i] for i, c in enumerate(npdf.columns)},
+                              drop=npdf.columns)
 
     @staticmethod
     def name() -> str:
         return 'One-hot encoder'
 
+    @staticmethod
+    def isProcessSafe() -> bool:
+        return True
+
+    def isRowLocal(self) -> bool:
+        # Dummy columns of categorical attributes only depend on their categories, not on values
+        shape = self.shapes[0]
+        return shape is not None and bool(self.__attributes) and \
+               all(shape.colTypes[a] in (Types.Nominal, Types.Ordinal) for a in self.__attributes)
+
     @staticmethod
     def shortDescription() -> str:
         return 'Replace every categorical value with a binary attribute'
@@ -24,12 +24,9 @@
 from typing import Optional, Iterable
 
 from PySide2.QtCore import Slot
-from PySide2.QtWidgets import QWidget
 
 from dataMole import data, flogging
-from dataMole.gui.editor.interface import AbsOperationEditor
 from .interface.graph import OutputGraphOperation
-from ..gui import utils as opw
 
 
 class ToVariableOp(OutputGraphOperation, flogging.Loggable):
@@ -60,7 +57,11 @@ class ToVariableOp(OutputGraphOperation, flogging.Loggable):
     def getOptions(self) -> Iterable:
         return [self.__var_name]
 
-    def getEditor(self) -> AbsOperationEditor:
+    def getEditor(self) -> 'AbsOperationEditor':
+        from PySide2.QtWidgets import QWidget
+        from dataMole.gui import utils as opw
+        from dataMole.gui.editor.interface import AbsOperationEditor
+
         class WriteEditor(AbsOperationEditor):
             def editorBody(self) -> QWidget:
                 self.__outputBox = opw.TextOptionWidget()
@@ -46,6 +46,7 @@ class CsvLoader(Operation):
         self.__wName: str = None
         self.__splitByRowN: int = None
         self.__selectedColumns: Set[int] = set()
+        self.__lazy: bool = False
 
     def hasOptions(self) -> bool:
         return self.__file is not None and self.__separator is not None and self.__wName
@@ -53,6 +54,18 @@ class CsvLoader(Operation):
     def execute(self) -> None:
         if not self.hasOptions():
             raise exp.InvalidOptions('Options are not set')
+        if self.__lazy:
+            # Only the first rows are read, to know the column types
+            usecols = sorted(self.__selectedColumns)
+            if self.__splitByRowN is not None:
+                frames = data.LazyFrame.csvChunks(self.__file, self.__splitByRowN,
+                                                  sep=self.__separator, usecols=usecols)
+                for i, frame in enumerate(frames):
+                    self._workbench.setDataframeByName(self.__wName + '_{:d}'.format(i), frame)
+            else:
+                self._workbench.setDataframeByName(
+                    self.__wName, data.LazyFrame.fromCsv(self.__file, self.__separator, usecols))
+            return
         pd_df = pd.read_csv(self.__file, sep=self.__separator,
                             index_col=False,
                             usecols=self.__selectedColumns,
@@ -79,10 +92,12 @@ class CsvLoader(Operation):
     def longDescription(self) -> str:
         return 'By selecting \'Split by rows\' you can load a CSV file as multiple smaller dataframes ' \
                'each one with the specified number of rows. This allows to load big files which are ' \
-               'too memory consuming to load with pandas'
+               'too memory consuming to load with pandas. With \'Load data when needed\' the file ' \
+               'is read only when its data is first used, for instance by a flow or to compute ' \
+               'statistics'
 
     def setOptions(self, file: str, separator: str, name: str, splitByRow: int,
-                   selectedCols: Set[int]) -> None:
+                   selectedCols: Set[int], lazy: bool = False) -> None:
         errors = list()
         if not name:
             errors.append(('nameError', 'Error: a valid name must be specified'))
@@ -95,12 +110,14 @@ class CsvLoader(Operation):
         self.__wName = name
         self.__splitByRowN = splitByRow if (splitByRow and splitByRow > 0) else None
         self.__selectedColumns = selectedCols
+        self.__lazy = lazy
 
     def needsOptions(self) -> bool:
         return True
 
     def getOptions(self) -> Iterable:
-        return self.__file, self.__separator, self.__wName, self.__splitByRowN, self.__selectedColumns
+        return self.__file, self.__separator, self.__wName, self.__splitByRowN, \
+               self.__selectedColumns, self.__lazy
 
     def getEditor(self) -> 'AbsOperationEditor':
         return LoadCSVEditor()
@@ -184,7 +201,7 @@ class CsvWriter(Operation):
             raise exp.OptionValidationError(errors)
 
         # Save selected column names
-        columns: List[str] = self.workbench.getDataframeModelByName(frame).frame.colnames
+        columns: List[str] = self.workbench.getDataframeModelByName(frame).shape.colNames
 
         self.__frame_name = frame
         self.__path = file
@@ -292,12 +309,14 @@ class LoadCSVEditor(AbsOperationEditor):
                 splitRowLayout.addWidget(self.checkSplit)
                 splitRowLayout.addWidget(self.numberRowsChunk)
                 self.checkSplit.stateChanged.connect(self.toggleSplitRows)
+                self.checkLazy = QCheckBox('Load data when needed', self)
 
                 layout = QVBoxLayout()
                 layout.addLayout(self.file_layout)
                 layout.addWidget(lab)
                 layout.addLayout(button_layout)
                 layout.addLayout(splitRowLayout)
+                layout.addWidget(self.checkLazy)
                 layout.addWidget(QLabel('Preview'))
                 layout.addWidget(self.tablePreview)
                 self.setLayout(layout)
@@ -384,12 +403,14 @@ class LoadCSVEditor(AbsOperationEditor):
             else None
         varName: str = self.mywidget.nameField.text()
         selectedColumns: Set[int] = self.mywidget.tablePreview.model().checked
-        return path, sep_s, varName, chunksize, selectedColumns
+        lazy: bool = self.mywidget.checkLazy.isChecked()
+        return path, sep_s, varName, chunksize, selectedColumns, lazy
 
     def setOptions(self, path: Optional[str], sep: Optional[str], name: Optional[str],
-                   splitByRow: Optional[int], selectedColumns: Set[int]) -> None:
+                   splitByRow: Optional[int], selectedColumns: Set[int], lazy: bool = False) -> None:
         self.mywidget.filePath.setText('')
         self.mywidget.default_button.click()
         self.mywidget.nameField.setText('')
         self.mywidget.checkSplit.setChecked(False)
         self.mywidget.toggleSplitRows(self.mywidget.checkSplit.checkState())
+        self.mywidget.checkLazy.setChecked(bool(lazy))
@@ -0,0 +1,411 @@
+# -*- coding: utf-8 -*-
+#
+# Author:       Alessandro Zangari (alessandro.zangari.code@outlook.com)
+# Copyright:    © Copyright 2020 Alessandro Zangari, Università degli Studi di Padova
+# License:      GPL-3.0-or-later
+# Date:         2020-10-04
+# Version:      1.0
+#
+# This file is part of DataMole.
+#
+# DataMole is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# DataMole is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with DataMole.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Columnar storage of frames in Parquet and Feather (Arrow IPC) files. Files are memory-mapped and
+only the selected columns are read. Parquet files are split in row groups, and row groups whose
+statistics do not satisfy the row filters are skipped.
+
+These formats require the optional package 'pyarrow', which is imported only when needed
+"""
+
+import operator
+import os
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+from PySide2.QtCore import Slot
+
+from dataMole import data, exceptions as exp
+from dataMole.operation.interface.operation import Operation
+
+# Row filter (column name, comparison operator, value)
+Filter = Tuple[str, str, Any]
+
+_operators = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge
+}
+
+# Number of rows in every row group of written Parquet files
+DEFAULT_ROW_GROUP_SIZE = 64 * 1024
+
+
+def _pyarrow():
+    """ Imports pyarrow, which is an optional dependency """
+    try:
+        import pyarrow
+        import pyarrow.feather
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError('Parquet and Feather files require the "pyarrow" package. Install it with '
+                          '"python -m pip install pyarrow"') from e
+    return pyarrow
+
+
+def isColumnar(path: str) -> bool:
+    """ Tells if a file is a Parquet or Feather file, by looking at its extension """
+    return os.path.splitext(path)[1].lower() in ('.parquet', '.feather')
+
+
+def _isFeather(path: str) -> bool:
+    return os.path.splitext(path)[1].lower() == '.feather'
+
+
+def parseFilters(text: str) -> List[Filter]:
+    """
+    Parses row filters written as 'column op value', separated by ';'. Supported operators are
+    '==', '!=', '<', '<=', '>', '>='. Values are kept as strings, since their type depends on the
+    column (see :func:`coerceFilters`)
+
+    :param text: the filters
+    :return: the list of filters
+    :raise ValueError: if a filter is not valid
+    """
+    filters = list()
+    for expression in text.split(';'):
+        expression = expression.strip()
+        if not expression:
+            continue
+        # Longest operators first, so that '<=' is not read as '<'
+        for op in sorted(_operators.keys(), key=len, reverse=True):
+            column, sep, value = expression.partition(op)
+            if sep:
+                break
+        else:
+            raise ValueError('Filter "{}" has no valid operator'.format(expression))
+        column = column.strip()
+        value = value.strip().strip('\'"')
+        if not column or not value:
+            raise ValueError('Filter "{}" is incomplete'.format(expression))
+        filters.append((column, op, value))
+    return filters
+
+
+def _coerce(dtype: Any, value: str) -> Any:
+    """ Converts a value to a column type, so that they can be compared """
+    if pd.api.types.is_categorical_dtype(dtype):
+        return _coerce(dtype.categories.dtype, value)
+    if pd.api.types.is_bool_dtype(dtype):
+        if value.lower() not in ('true', 'false'):
+            raise ValueError('not a boolean')
+        return value.lower() == 'true'
+    if pd.api.types.is_integer_dtype(dtype):
+        try:
+            return int(value)
+        except ValueError:
+            # E.g. 'age < 30.5'
+            return float(value)
+    if pd.api.types.is_numeric_dtype(dtype):
+        return float(value)
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        value = pd.Timestamp(value)
+        if getattr(dtype, 'tz', None) is not None and value.tz is None:
+            value = value.tz_localize(dtype.tz)
+        return value
+    return value
+
+
+def coerceFilters(filters: Iterable[Filter], dtypes: pd.Series) -> List[Filter]:
+    """
+    Converts the values of filters to the type of their columns
+
+    :param filters: the filters, as returned by :func:`parseFilters`
+    :param dtypes: the pandas types of the columns in the file (see :func:`readTypes`)
+    :return: the converted filters
+    :raise ValueError: if a column is not in the file or a value is not valid for its column
+    """
+    converted = list()
+    for column, op, value in filters:
+        if column not in dtypes.index:
+            raise ValueError('Column "{}" is not in the file'.format(column))
+        try:
+            converted.append((column, op, _coerce(dtypes[column], value)))
+        except ValueError:
+            raise ValueError('Value "{}" is not valid for column "{}" of type {}'.format(
+                value, column, dtypes[column]))
+    return converted
+
+
+def _applyFilters(df: pd.DataFrame, filters: Iterable[Filter]) -> pd.DataFrame:
+    mask = None
+    for column, op, value in filters:
+        m = _operators[op](df[column], value)
+        mask = m if mask is None else mask & m
+    return df if mask is None else df[mask.values]
+
+
+def _readEmpty(path: str) -> pd.DataFrame:
+    """ Reads the schema of a Parquet or Feather file as an empty pandas frame """
+    pa = _pyarrow()
+    if _isFeather(path):
+        # The schema is in the footer of the memory-mapped file
+        with pa.memory_map(path, 'r') as source:
+            schema = pa.ipc.open_file(source).schema
+    else:
+        schema = pa.parquet.read_schema(path, memory_map=True)
+    return schema.empty_table().to_pandas()
+
+
+def readSchema(path: str) -> data.Frame:
+    """ Reads the columns of a Parquet or Feather file, without reading its data
+
+    :param path: the file
+    :return: an empty frame with the columns of the file
+    """
+    return data.Frame(_readEmpty(path))
+
+
+def readTypes(path: str) -> pd.Series:
+    """ Reads the pandas types of the columns of a Parquet or Feather file, as stored in the
+    file. Unlike :func:`readSchema` integer columns are not converted
+
+    :param path: the file
+    :return: the type of every column, indexed by column name
+    """
+    return _readEmpty(path).dtypes
+
+
+def readColumnar(path: str, columns: Optional[List[str]] = None,
+                 filters: Optional[List[Filter]] = None) -> data.Frame:
+    """
+    Reads a Parquet or Feather file, depending on its extension. The file is memory-mapped, and
+    numeric columns without missing values are converted to pandas without copying them
+
+    :param path: the file to read
+    :param columns: names of the columns to read. If None every column is read
+    :param filters: optional row filters. Every filter must be satisfied. In Parquet files only
+        row groups which may contain matching rows are read. Values are converted to the type of
+        their column
+    :return: the frame
+    :raise ValueError: if some filter is not valid for the columns of the file
+    """
+    pa = _pyarrow()
+    filters = coerceFilters(filters, readTypes(path)) if filters else None
+    if _isFeather(path):
+        # Feather has no statistics to skip rows: filter columns are read and then dropped
+        extra = [c for c, _, _ in (filters or ()) if columns is not None and c not in columns]
+        toRead = columns + list(dict.fromkeys(extra)) if columns is not None else None
+        table = pa.feather.read_table(path, columns=toRead, memory_map=True)
+    else:
+        table = pa.parquet.read_table(path, columns=columns, filters=filters, memory_map=True)
+        # Rows are already filtered
+        filters = extra = None
+    df = table.to_pandas(split_blocks=True)
+    if filters:
+        df = _applyFilters(df, filters)
+        if extra:
+            df = df.drop(columns=extra)
+    return data.Frame(df)
+
+
+def writeColumnar(frame: data.Frame, path: str, compression: Optional[str] = 'snappy',
+                  index: bool = True, rowGroupSize: int = DEFAULT_ROW_GROUP_SIZE) -> None:
+    """
+    Writes a frame to a Parquet or Feather file, depending on its extension
+
+    :param frame: the frame to write
+    :param path: the destination file
+    :param compression: the compression codec, or None to write uncompressed data. Feather files
+        only support 'lz4' and 'zstd' and are written uncompressed with other codecs
+    :param index: whether to write the index of the frame
+    :param rowGroupSize: the number of rows in every row group of Parquet files. Smaller groups
+        allow to skip more rows when reading with filters
+    """
+    pa = _pyarrow()
+    table = pa.Table.from_pandas(frame.getRawFrame(), preserve_index=index)
+    if _isFeather(path):
+        if compression not in ('lz4', 'zstd'):
+            compression = 'uncompressed'
+        pa.feather.write_feather(table, path, compression=compression)
+    else:
+        pa.parquet.write_table(table, path, compression=compression or 'none',
+                               row_group_size=rowGroupSize)
+
+
+class ParquetLoader(Operation):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__file: str = None
+        self.__frameName: str = None
+        self.__columns: List[str] = list()
+        self.__selected: Dict[int, None] = dict()
+        self.__filters: str = ''
+
+    def hasOptions(self) -> bool:
+        return self.__file is not None and bool(self.__frameName)
+
+    def execute(self) -> None:
+        if not self.hasOptions():
+            raise exp.InvalidOptions('Options are not set')
+        frame = readColumnar(self.__file, columns=self.__columns,
+                             filters=parseFilters(self.__filters))
+        self._workbench.setDataframeByName(self.__frameName, frame)
+
+    @staticmethod
+    def name() -> str:
+        return 'Load Parquet'
+
+    @staticmethod
+    def shortDescription() -> str:
+        return 'Loads a dataframe from a Parquet or Feather file'
+
+    def longDescription(self) -> str:
+        return 'Only selected columns are read. Rows can be filtered with conditions like ' \
+               '"age > 30; country == IT", and in Parquet files only the parts of the file ' \
+               'which may contain matching rows are read. Requires package "pyarrow"'
+
+    def setOptions(self, file: str, frameName: str, selected: Dict[int, None],
+                   filters: str) -> None:
+        errors = list()
+        frameName = frameName.strip()
+        if not file:
+            errors.append(('file', 'Error: no file name is specified'))
+        if not frameName:
+            errors.append(('nameError', 'Error: a valid frame name must be specified'))
+        if not selected:
+            errors.append(('noSelection', 'Error: at least 1 attribute must be selected'))
+        try:
+            parsed = parseFilters(filters)
+        except ValueError as e:
+            errors.append(('filters', 'Error: {}'.format(str(e))))
+        if errors:
+            raise exp.OptionValidationError(errors)
+        try:
+            dtypes = readTypes(file)
+        except (ImportError, OSError) as e:
+            raise exp.OptionValidationError([('file', 'Error: {}'.format(str(e)))])
+        try:
+            coerceFilters(parsed, dtypes)
+        except ValueError as e:
+            raise exp.OptionValidationError([('filters', 'Error: {}'.format(str(e)))])
+        names = dtypes.index.tolist()
+
+        self.__file = file
+        self.__frameName = frameName
+        self.__selected = selected
+        self.__columns = [names[i] for i in selected.keys()]
+        self.__filters = filters
+
+    def getOptions(self) -> Dict:
+        return {'file': self.__file, 'frameName': self.__frameName, 'selected': self.__selected,
+                'filters': self.__filters}
+
+    def needsOptions(self) -> bool:
+        return True
+
+    def getEditor(self) -> 'AbsOperationEditor':
+        from dataMole.gui.editor import OptionsEditorFactory, AbsOperationEditor
+        from dataMole.gui.mainmodels import FrameModel
+
+        class ParquetLoadEditor(AbsOperationEditor):
+            @Slot(str)
+            def setNameFromFile(self, path: str) -> None:
+                if path and not self.frameName.text():
+                    name: str = os.path.splitext(os.path.basename(path))[0]
+                    self.frameName.setText(name)
+
+            @Slot(str)
+            def loadSchema(self, path: str) -> None:
+                if not os.path.isfile(path) or not isColumnar(path):
+                    return
+                try:
+                    schema = readSchema(path)
+                except (ImportError, OSError):
+                    return
+                self.selected.setSourceFrameModel(FrameModel(self, schema))
+                self.selected.model().setAllChecked(True)
+
+        factory = OptionsEditorFactory()
+        factory.initEditor(subclass=ParquetLoadEditor)
+        factory.withFileChooser(key='file', label='Select a file',
+                                extensions='Parquet (*.parquet);;Feather (*.feather)', mode='load')
+        factory.withTextField(key='frameName', label='Dataframe name')
+        factory.withAttributeTable(key='selected', checkbox=True, nameEditable=False, showTypes=True,
+                                   options=None, types=self.acceptedTypes())
+        factory.withTextField(key='filters', label='Row filters')
+        return factory.getEditor()
+
+    def injectEditor(self, editor: 'AbsOperationEditor') -> None:
+        editor.file.textChanged.connect(editor.setNameFromFile)
+        editor.file.textChanged.connect(editor.loadSchema)
+        editor.filters.setPlaceholderText('E.g. col1 >= 10; col2 == a')
+
+
+class ParquetWriter(Operation):
+    def __init__(self, frameName: str = None, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__file: str = None
+        self.__frame: str = frameName
+        self.__compression: str = 'snappy'
+        self.__index: bool = True
+
+    @staticmethod
+    def name() -> str:
+        return 'Write Parquet'
+
+    def execute(self) -> None:
+        frame: data.Frame = self._workbench.getDataframeModelByName(self.__frame).frame
+        writeColumnar(frame, self.__file,
+                      compression=self.__compression if self.__compression != 'none' else None,
+                      index=self.__index)
+
+    def setOptions(self, file: str, frame: str, compression: str, index: bool) -> None:
+        errors = list()
+        if not file:
+            errors.append(('file', 'Error: no file name is specified'))
+        if not frame:
+            errors.append(('frame', 'Error: input frame must be valid'))
+        if errors:
+            raise exp.OptionValidationError(errors)
+        self.__file = file
+        self.__frame = frame
+        self.__compression = compression
+        self.__index = index
+
+    @staticmethod
+    def shortDescription() -> str:
+        return 'Write a dataframe to a Parquet or Feather file'
+
+    def getOptions(self) -> Dict:
+        return {'frame': self.__frame, 'file': self.__file, 'compression': self.__compression,
+                'index': self.__index}
+
+    def needsOptions(self) -> bool:
+        return True
+
+    def getEditor(self) -> 'AbsOperationEditor':
+        from dataMole.gui.editor import OptionsEditorFactory
+        factory = OptionsEditorFactory()
+        factory.initEditor()
+        factory.withComboBox('Frame to write', 'frame', False, model=self.workbench)
+        factory.withFileChooser(key='file', label='Write to',
+                                extensions='Parquet (*.parquet);;Feather (*.feather)', mode='save')
+        factory.withComboBox('Compression', 'compression', False,
+                             strings=['snappy', 'gzip', 'zstd', 'lz4', 'none'])
+        factory.withCheckBox('Write index values', 'index')
+        return factory.getEditor()
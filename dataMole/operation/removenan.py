@@ -53,7 +53,7 @@ class RemoveNanRows(GraphOperation, flogging.Loggable):
         if self.__thresholdPercentage is not None and self.__thresholdNumber is not None:
             raise exp.InvalidOptions(
                 'Can\'t have both threshold set')
-        pf = df.getRawFrame().copy()
+        pf = df.getRawFrame()
         if self.__thresholdPercentage:
             # By percentage
             pf = pf.loc[pf.isnull().mean(axis=1) <= self.__thresholdPercentage]
@@ -66,6 +66,13 @@ class RemoveNanRows(GraphOperation, flogging.Loggable):
     def name() -> str:
         return 'Remove nan rows'
 
+    @staticmethod
+    def isProcessSafe() -> bool:
+        return True
+
+    def isRowLocal(self) -> bool:
+        return True
+
     @staticmethod
     def shortDescription() -> str:
         return 'Remove all rows with a specified number or percentage of nan values'
@@ -142,7 +149,7 @@ class RemoveNanColumns(GraphOperation, flogging.Loggable):
         # Assume everything to go is set
         if self.__thresholdPercentage is not None and self.__thresholdNumber is not None:
             raise exp.InvalidOptions('Can\'t have both threshold set')
-        pf = df.getRawFrame().copy()
+        pf = df.getRawFrame()
         if self.__thresholdPercentage:
             # By percentage
             pf = pf.loc[:, pf.isnull().mean() <= self.__thresholdPercentage]
@@ -155,6 +162,10 @@ class RemoveNanColumns(GraphOperation, flogging.Loggable):
     def name() -> str:
         return 'Remove nan columns'
 
+    @staticmethod
+    def isProcessSafe() -> bool:
+        return True
+
     @staticmethod
     def shortDescription() -> str:
         return 'Remove all columns with a specified number or percentage of nan values'
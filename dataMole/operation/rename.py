@@ -22,7 +22,7 @@
 # along with DataMole.  If not, see <https://www.gnu.org/licenses/>.
 
 import copy
-from typing import Union, Dict, List, Any
+from typing import Union, Dict, List, Any, Optional, Set
 
 import prettytable as pt
 from PySide2.QtCore import Qt, QModelIndex
@@ -56,14 +56,24 @@ class RenameColumns(GraphOperation, flogging.Loggable):
         names: List[str] = df.colnames
         for k, v in self.__names.items():
             names[k] = v
-        new_df = df.getRawFrame().copy(deep=False)
-        new_df.columns = names
-        return data.Frame(new_df)
+        # Data is shared with the input frame
+        return df.rename(names)
 
     @staticmethod
     def name() -> str:
         return 'Rename columns'
 
+    @staticmethod
+    def isProcessSafe() -> bool:
+        return True
+
+    def isRowLocal(self) -> bool:
+        return True
+
+    def neededColumns(self, columns: Optional[Set[int]]) -> Optional[Set[int]]:
+        # Columns keep their positions
+        return columns
+
     @staticmethod
     def shortDescription() -> str:
         return 'This operation can rename the attributes'
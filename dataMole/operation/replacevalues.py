@@ -21,9 +21,10 @@
 # You should have received a copy of the GNU General Public License
 # along with DataMole.  If not, see <https://www.gnu.org/licenses/>.
 
-from typing import Iterable, List, Any, Tuple, Dict, Optional
+from typing import Iterable, List, Any, Tuple, Dict, Optional, Set
 
 import numpy as np
+import pandas as pd
 import prettytable as pt
 from PySide2.QtWidgets import QHeaderView
 
@@ -33,6 +34,7 @@ from dataMole.data.types import Types, Type
 from dataMole.gui.editor import OptionsEditorFactory, OptionValidatorDelegate, \
     AbsOperationEditor
 from dataMole.gui.mainmodels import FrameModel
+from dataMole.operation import columntasks
 from dataMole.operation.interface.graph import GraphOperation
 from dataMole.operation.utils import ManyMixedListsValidator, MixedListValidator, splitString, \
     parseNan, joinList, isFloat
@@ -63,6 +65,111 @@ def floatList(values: List, invalid: str) -> List:
     return floatValues
 
 
+class _ReplacePlan:
+    """ Replacement of values in a column, compiled from a list of substitutions. Substitutions are
+    applied in order, so a value replaced by a substitution can be replaced again by the following
+    ones. The final value of every value is computed once, and the column is then replaced in a
+    single pass """
+
+    # Values which are not in any substitution
+    __OTHER = object()
+
+    def __init__(self, valueLists: List[List], replaceValues: List, inverted: bool):
+        """
+        :param valueLists: the values to replace with every value in 'replaceValues'
+        :param replaceValues: the new values
+        :param inverted: if True every substitution replaces values which are not in its list
+        """
+        self.__valueLists: List[List] = valueLists
+        self.__replaceValues: List = replaceValues
+        self.__inverted: bool = inverted
+        rules = [({v for v in values if not pd.isna(v)}, any(pd.isna(v) for v in values), r)
+                 for values, r in zip(valueLists, replaceValues)]
+
+        def final(value: Any) -> Tuple[Any, bool]:
+            replaced = False
+            for values, withNan, r in rules:
+                found = value is not self.__OTHER and (
+                    (withNan and pd.isna(value)) or (not pd.isna(value) and value in values))
+                if found != inverted:
+                    value = r
+                    replaced = True
+            return value, replaced
+
+        keys = list(dict.fromkeys(v for values in valueLists for v in values if not pd.isna(v)))
+        # { value: final value }
+        self.mapping: Dict[Any, Any] = {k: final(k)[0] for k in keys}
+        # Final value of missing values, and whether they are replaced
+        self.nanValue, self.replacesNan = final(np.nan)
+        # Final value of every other value, or __OTHER if they are not replaced
+        self.otherValue: Any = final(self.__OTHER)[0]
+
+    @property
+    def replacesOthers(self) -> bool:
+        return self.otherValue is not self.__OTHER
+
+    def apply(self, column: pd.Series) -> pd.Series:
+        """ Returns a new column with replaced values """
+        if pd.api.types.is_categorical_dtype(column.dtype):
+            return self.__applyCategorical(column)
+        values = column.values
+        keys = list(self.mapping.keys())
+        new = list(self.mapping.values())
+        # Positions in 'new' of the final value of every row, or -1 if the value is not replaced
+        positions = pd.Index(keys).get_indexer(values) if keys else \
+            np.full(values.shape[0], -1, dtype=np.intp)
+        missing = pd.isna(values)
+        if self.replacesOthers:
+            new.append(self.otherValue)
+            positions[(positions < 0) & ~missing] = len(new) - 1
+        if self.replacesNan:
+            new.append(self.nanValue)
+            positions[missing] = len(new) - 1
+        else:
+            # Missing values are kept as they are (e.g. None)
+            positions[missing] = -1
+        if values.dtype.kind in 'iuf' and all(isinstance(v, float) for v in new):
+            result = values.astype(np.result_type(values.dtype, np.float64))
+        else:
+            result = values.astype(object)
+        mask = positions >= 0
+        result[mask] = np.array(new, dtype=result.dtype)[positions[mask]]
+        result = pd.Series(result, index=column.index, name=column.name)
+        # Like pandas, the type of objects is inferred again (e.g. only NaN are left)
+        return result.infer_objects() if result.dtype == object else result
+
+    def __applyCategorical(self, column: pd.Series) -> pd.Series:
+        """ Replaces the categories of a categorical column, and maps its codes to the new ones.
+        Substitutions are applied to categories as pandas does, so that their order is the same """
+        cat: pd.Categorical = column.values
+        categories: List = cat.categories.to_list()
+        # { original category: its current value }
+        image: Dict[Any, Any] = {c: c for c in categories}
+        for values, replaceVal in zip(self.__valueLists, self.__replaceValues):
+            if self.__inverted:
+                toReplace = [c for c in categories if c not in values]
+            else:
+                toReplace = [v for v in dict.fromkeys(values) if not pd.isna(v)]
+            for old in toReplace:
+                if old == replaceVal or old not in categories:
+                    continue
+                if pd.isna(replaceVal) or replaceVal in categories:
+                    # Removed, or merged into an existing category
+                    categories.remove(old)
+                else:
+                    categories[categories.index(old)] = replaceVal
+                image = {c: (replaceVal if i == old else i) for c, i in image.items()}
+        if not pd.isna(self.nanValue) and self.nanValue not in categories:
+            categories.append(self.nanValue)
+        position = {c: k for k, c in enumerate(categories)}
+        # Last element maps missing values (code -1)
+        remap = np.array([position.get(i, -1) if not pd.isna(i) else -1
+                          for i in list(image.values()) + [self.nanValue]], dtype=np.int64)
+        return pd.Series(pd.Categorical.from_codes(remap[cat.codes], categories=categories,
+                                                   ordered=cat.ordered),
+                         index=column.index, name=column.name)
+
+
 class ReplaceValues(GraphOperation, flogging.Loggable):
     """ Merge values of one attribute into a single value """
     Nan = np.nan
@@ -86,22 +193,13 @@ class ReplaceValues(GraphOperation, flogging.Loggable):
         return tt.get_string(vrules=pt.ALL, border=True) + inverted
 
     def execute(self, df: data.Frame) -> data.Frame:
-        pd_df = df.getRawFrame().copy(True)
-        for c, colOptions in self.__attributes.items():
-            for valueList, replaceVal in zip(*colOptions):
-                if self.__invertedReplace:
-                    valuesToReplace: List = pd_df.iloc[:, c].unique().tolist()
-                    for a in valueList:
-                        try:
-                            valuesToReplace.remove(a)
-                        except ValueError:
-                            pass  # Value not in list (ignore)
-                else:
-                    valuesToReplace = valueList
-                pd_df.iloc[:, c] = pd_df.iloc[:, c].replace(to_replace=valuesToReplace,
-                                                            value=replaceVal,
-                                                            inplace=False)
-        return data.Frame(pd_df)
+        # Replace modified columns, sharing the others
+        return df.replaceColumns(self.executeColumns(data.ColumnView(df)))
+
+    def executeColumns(self, columns: data.ColumnView) -> Dict[int, pd.Series]:
+        return columntasks.mapColumns(
+            lambda c: _ReplacePlan(*self.__attributes[c], inverted=self.__invertedReplace).apply(
+                columns[c]), self.__attributes.keys(), rows=columns.nRows)
 
     def getOutputShape(self) -> Optional[data.Shape]:
         if self.hasOptions() and self.shapes[0] is not None:
@@ -112,6 +210,20 @@ class ReplaceValues(GraphOperation, flogging.Loggable):
     def name() -> str:
         return 'ReplaceValues'
 
+    @staticmethod
+    def isProcessSafe() -> bool:
+        return True
+
+    def isRowLocal(self) -> bool:
+        return True
+
+    def isColumnLocal(self) -> bool:
+        return True
+
+    def neededColumns(self, columns: Optional[Set[int]]) -> Optional[Set[int]]:
+        # Only modified columns are read
+        return None if columns is None else columns | set(self.__attributes.keys())
+
     @staticmethod
     def shortDescription() -> str:
         return 'Substitute all specified values in a attribute and substitute them with a single value'
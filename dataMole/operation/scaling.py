@@ -21,27 +21,40 @@
 # You should have received a copy of the GNU General Public License
 # along with DataMole.  If not, see <https://www.gnu.org/licenses/>.
 
-from typing import Iterable, Tuple, List, Dict, Optional
+from typing import Iterable, Tuple, List, Dict, Optional, Set
 
-import pandas as pd
+import numpy as np
 import prettytable as pt
 from PySide2.QtCore import QModelIndex, Qt, QAbstractItemModel
 from PySide2.QtWidgets import QStyledItemDelegate, QLineEdit, QHeaderView, QWidget
-from sklearn.preprocessing import minmax_scale, scale
 
 from dataMole import data, flogging, exceptions as exp
 from dataMole.data.types import Type, Types
 from dataMole.gui.editor import AbsOperationEditor, OptionsEditorFactory
 from dataMole.gui.mainmodels import FrameModel
-from dataMole.operation.interface.graph import GraphOperation
+from dataMole.operation import columntasks
+from dataMole.operation.interface.graph import StatefulGraphOperation
 from dataMole.operation.utils import isFloat, splitString, NumericListValidator
 
 
-class MinMaxScaler(GraphOperation, flogging.Loggable):
+def _columnName(fitColumns: List[str], shape: Optional[data.Shape], k: int) -> str:
+    """ Name of a column seen while fitting. If no data was fitted the name is taken from the input
+    shape, if set, otherwise the position of the column is used """
+    names = fitColumns or (shape.colNames if shape else list())
+    return names[k] if k < len(names) else str(k)
+
+
+class MinMaxScaler(StatefulGraphOperation, flogging.Loggable):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         # { attr_index: (min, max) }
         self.__attributes: Dict[int, Tuple[float, float]] = dict()
+        # Partial fit state { attr_index: (data_min, data_max) }
+        self.__dataRange: Dict[int, Tuple[float, float]] = dict()
+        # Fitted parameters { attr_index: (scale, offset) }
+        self.__fitted: Dict[int, Tuple[float, float]] = dict()
+        # Column names seen while fitting
+        self.__fitColumns: List[str] = list()
 
     def logOptions(self) -> str:
         dfColumns = self.shapes[0].colNames
@@ -51,32 +64,70 @@ class MinMaxScaler(GraphOperation, flogging.Loggable):
             tt.add_row([dfColumns[k], '[{:G}, {:G}]'.format(*v)])
         return tt.get_string(border=True, vrules=pt.ALL)
 
-    def execute(self, df: data.Frame) -> data.Frame:
-        columns = df.getRawFrame().columns.to_list()
-        # Execute
-        pdf = df.getRawFrame().copy(True)
-        fr = set(self.__attributes.values())
-        if len(fr) == 1:
-            # All ranges are the same, shortcut
-            toProcess = pdf.iloc[:, list(self.__attributes.keys())]
-            processedColNames = toProcess.columns
-            scaled = minmax_scale(toProcess, feature_range=fr.pop(), axis=0, copy=True)
-            processed = pd.DataFrame(scaled).set_index(pdf.index)
-            processed.columns = processedColNames
-        else:
-            processed = dict()
-            for k, fr in self.__attributes.items():
-                processed[columns[k]] = minmax_scale(pdf.iloc[:, k], feature_range=fr, axis=0, copy=True)
-            processed = pd.DataFrame(processed).set_index(pdf.index)
-        # Merge result with other columns preserving order
-        pdf = pdf.drop(columns=processed.columns)
-        result = pd.concat([pdf, processed], ignore_index=False, axis=1)[columns]
-        return data.Frame(result)
+    def resetFit(self) -> None:
+        self.__dataRange = dict()
+        self.__fitted = dict()
+        self.__fitColumns = list()
+
+    def partialFit(self, df: data.Frame) -> None:
+        self.partialFitColumns(data.ColumnView(df))
+
+    def partialFitColumns(self, columns: data.ColumnView) -> None:
+        self.__fitColumns = columns.columns.to_list()
+        for k in self.__attributes.keys():
+            column = columns[k]
+            cMin, cMax = column.min(), column.max()
+            if k in self.__dataRange:
+                # Nan values are ignored
+                cMin = np.fmin(cMin, self.__dataRange[k][0])
+                cMax = np.fmax(cMax, self.__dataRange[k][1])
+            self.__dataRange[k] = (cMin, cMax)
+
+    def finalizeFit(self) -> None:
+        # Same parameters computed by sklearn
+        self.__fitted = dict()
+        tt = pt.PrettyTable(field_names=['Column', 'Min', 'Max'])
+        for k, (a, b) in self.__attributes.items():
+            dataMin, dataMax = self.__dataRange.get(k, (np.nan, np.nan))
+            dataRange = dataMax - dataMin
+            scale = (b - a) / (dataRange if dataRange != 0 else 1.0)
+            self.__fitted[k] = (float(scale), float(a - dataMin * scale))
+            tt.add_row([_columnName(self.__fitColumns, self.shapes[0], k), '{:G}'.format(dataMin),
+                        '{:G}'.format(dataMax)])
+        self._logExecutionString = 'Fitted ranges:\n' + tt.get_string(border=True, vrules=pt.ALL)
+
+    def transform(self, df: data.Frame) -> data.Frame:
+        # Replace scaled columns, sharing the others
+        return df.replaceColumns(self.transformColumns(data.ColumnView(df)))
+
+    def transformColumns(self, columns: data.ColumnView) -> Dict[int, np.ndarray]:
+        fitted = self.__fitted
+        return columntasks.mapColumns(
+            lambda k: columns[k].values * fitted[k][0] + fitted[k][1], fitted.keys(),
+            rows=columns.nRows)
+
+    def isColumnLocal(self) -> bool:
+        return True
+
+    def neededColumns(self, columns: Optional[Set[int]]) -> Optional[Set[int]]:
+        # Only scaled columns are read
+        return None if columns is None else columns | set(self.__attributes.keys())
+
+    def fittedParameters(self) -> Optional[Dict[int, Tuple[float, float]]]:
+        # { attr_index: (scale, offset) }
+        return dict(self.__fitted) if self.__fitted else None
+
+    def setFittedParameters(self, params: Optional[Dict[int, Tuple[float, float]]]) -> None:
+        self.__fitted = dict(params) if params else dict()
 
     @staticmethod
     def name() -> str:
         return 'MinMaxScaler'
 
+    @staticmethod
+    def isProcessSafe() -> bool:
+        return True
+
     @staticmethod
     def shortDescription() -> str:
         return 'Scales columns as <code>[(X - X_min) / (X_max - X_min)] * (max - min) + min</code>'
@@ -89,6 +140,7 @@ class MinMaxScaler(GraphOperation, flogging.Loggable):
 
     def unsetOptions(self) -> None:
         self.__attributes = dict()
+        self.resetFit()
 
     def needsOptions(self) -> bool:
         return True
@@ -114,6 +166,8 @@ class MinMaxScaler(GraphOperation, flogging.Loggable):
             selectedAttributes[k] = vRange
         # Set options
         self.__attributes = selectedAttributes
+        # Fitted parameters depend on options
+        self.resetFit()
 
     def getOutputShape(self) -> Optional[data.Shape]:
         if not self.hasOptions() or not self.shapes[0]:
@@ -157,11 +211,17 @@ class MinMaxScaler(GraphOperation, flogging.Loggable):
         return -1
 
 
-class StandardScaler(GraphOperation, flogging.Loggable):
+class StandardScaler(StatefulGraphOperation, flogging.Loggable):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         # List of attr_indexes
         self.__attributes: List[int] = list()
+        # Partial fit state { attr_index: (count, mean, sum of squared differences from the mean) }
+        self.__moments: Dict[int, Tuple[int, float, float]] = dict()
+        # Fitted parameters { attr_index: (mean, std) }
+        self.__fitted: Dict[int, Tuple[float, float]] = dict()
+        # Column names seen while fitting
+        self.__fitColumns: List[str] = list()
 
     def logOptions(self) -> None:
         dfColumns = self.shapes[0].colNames
@@ -171,23 +231,75 @@ class StandardScaler(GraphOperation, flogging.Loggable):
             tt.add_row([dfColumns[attr]])
         return tt.get_string(border=True, vrules=pt.ALL)
 
-    def execute(self, df: data.Frame) -> data.Frame:
-        columns = df.getRawFrame().columns.to_list()
-        # Execute
-        pdf = df.getRawFrame().copy(True)
-        processedColNames = pdf.iloc[:, self.__attributes].columns
-        scaled = scale(pdf.iloc[:, self.__attributes], with_mean=True, with_std=True, copy=True)
-        processed = pd.DataFrame(scaled).set_index(pdf.index)
-        processed.columns = processedColNames
-        # Merge result with other columns preserving order
-        pdf = pdf.drop(columns=processedColNames)
-        result = pd.concat([pdf, processed], ignore_index=False, axis=1)[columns]
-        return data.Frame(result)
+    def resetFit(self) -> None:
+        self.__moments = dict()
+        self.__fitted = dict()
+        self.__fitColumns = list()
+
+    def partialFit(self, df: data.Frame) -> None:
+        self.partialFitColumns(data.ColumnView(df))
+
+    def partialFitColumns(self, columns: data.ColumnView) -> None:
+        self.__fitColumns = columns.columns.to_list()
+        for k in self.__attributes:
+            values = columns[k].values
+            values = values[~np.isnan(values)]
+            if not values.size:
+                continue
+            n, mean, m2 = self.__moments.get(k, (0, 0.0, 0.0))
+            # Merge moments of the chunk with the previous ones (Chan et al.)
+            cMean = values.mean()
+            cM2 = np.square(values - cMean).sum()
+            total = n + values.size
+            delta = cMean - mean
+            self.__moments[k] = (total, mean + delta * values.size / total,
+                                 m2 + cM2 + delta ** 2 * n * values.size / total)
+
+    def finalizeFit(self) -> None:
+        self.__fitted = dict()
+        tt = pt.PrettyTable(field_names=['Column', 'Mean', 'Std'])
+        for k in self.__attributes:
+            n, mean, m2 = self.__moments.get(k, (0, np.nan, np.nan))
+            # Population standard deviation, as computed by sklearn
+            std = np.sqrt(m2 / n) if n else np.nan
+            self.__fitted[k] = (float(mean), float(std) if std != 0 else 1.0)
+            tt.add_row([_columnName(self.__fitColumns, self.shapes[0], k), '{:G}'.format(mean),
+                        '{:G}'.format(std)])
+        self._logExecutionString = 'Fitted parameters:\n' + tt.get_string(border=True,
+                                                                           vrules=pt.ALL)
+
+    def transform(self, df: data.Frame) -> data.Frame:
+        # Replace scaled columns, sharing the others
+        return df.replaceColumns(self.transformColumns(data.ColumnView(df)))
+
+    def transformColumns(self, columns: data.ColumnView) -> Dict[int, np.ndarray]:
+        fitted = self.__fitted
+        return columntasks.mapColumns(
+            lambda k: (columns[k].values - fitted[k][0]) / fitted[k][1], fitted.keys(),
+            rows=columns.nRows)
+
+    def isColumnLocal(self) -> bool:
+        return True
+
+    def neededColumns(self, columns: Optional[Set[int]]) -> Optional[Set[int]]:
+        # Only scaled columns are read
+        return None if columns is None else columns | set(self.__attributes)
+
+    def fittedParameters(self) -> Optional[Dict[int, Tuple[float, float]]]:
+        # { attr_index: (mean, std) }
+        return dict(self.__fitted) if self.__fitted else None
+
+    def setFittedParameters(self, params: Optional[Dict[int, Tuple[float, float]]]) -> None:
+        self.__fitted = dict(params) if params else dict()
 
     @staticmethod
     def name() -> str:
         return 'StandardScaler'
 
+    @staticmethod
+    def isProcessSafe() -> bool:
+        return True
+
     @staticmethod
     def shortDescription() -> str:
         return '<p>Scales columns as (X - &mu;) / &sigma;</p>'
@@ -200,6 +312,7 @@ class StandardScaler(GraphOperation, flogging.Loggable):
 
     def unsetOptions(self) -> None:
         self.__attributes = dict()
+        self.resetFit()
 
     def needsOptions(self) -> bool:
         return True
@@ -213,6 +326,8 @@ class StandardScaler(GraphOperation, flogging.Loggable):
             raise exp.OptionValidationError([('noOptions', 'Error: no attributes are selected')])
         # Set options
         self.__attributes = list(attributes.keys())
+        # Fitted parameters depend on options
+        self.resetFit()
 
     def getOutputShape(self) -> Optional[data.Shape]:
         if not self.hasOptions() or not self.shapes[0]:
@@ -21,7 +21,7 @@
 # You should have received a copy of the GNU General Public License
 # along with DataMole.  If not, see <https://www.gnu.org/licenses/>.
 
-from typing import List, Union, Iterable, Dict, Optional, Tuple, Any
+from typing import List, Union, Iterable, Dict, Optional, Tuple, Any, Set
 
 import numpy as np
 import pandas as pd
@@ -33,6 +33,7 @@ from dataMole import data, flogging
 from dataMole import exceptions as exp
 from dataMole.data.types import Types, Type
 from dataMole.gui.editor.interface import AbsOperationEditor
+from . import columntasks
 from .interface.graph import GraphOperation
 from .utils import MixedListValidator, splitString, joinList, SingleStringValidator
 from ..gui.editor.OptionsEditorFactory import OptionsEditorFactory, OptionValidatorDelegate
@@ -61,27 +62,32 @@ class ToNumeric(GraphOperation, flogging.Loggable):
             self.__errorMode)
 
     def execute(self, df: data.Frame) -> data.Frame:
-        # Deep copy
-        raw_df = df.getRawFrame().copy(deep=True)
-        allCols: List[str] = raw_df.columns.to_list()
+        # Replace converted columns, sharing the others
+        return df.replaceColumns(self.executeColumns(data.ColumnView(df)))
 
-        converted: Dict[str, np.ndarray] = dict()
-        processedCols = list()
-        for a in self.__attributes:
-            view = raw_df.iloc[:, a]
-            colName = allCols[a]
-            converted[colName] = pd.to_numeric(view.values, errors=self.__errorMode, downcast='float')
-            processedCols.append(colName)
-        raw_df = raw_df.drop(columns=processedCols)
-        # Get processed frame and set back its index
-        processed = pd.DataFrame(converted).set_index(raw_df.index)
-        raw_df = pd.concat([processed, raw_df], ignore_index=False, axis=1)[allCols]
-        return data.Frame(raw_df)
+    def executeColumns(self, columns: data.ColumnView) -> Dict[int, np.ndarray]:
+        return columntasks.mapColumns(
+            lambda a: pd.to_numeric(columns[a].values, errors=self.__errorMode, downcast='float'),
+            self.__attributes, rows=columns.nRows)
 
     @staticmethod
     def name() -> str:
         return 'toNumeric'
 
+    @staticmethod
+    def isProcessSafe() -> bool:
+        return True
+
+    def isRowLocal(self) -> bool:
+        return True
+
+    def isColumnLocal(self) -> bool:
+        return True
+
+    def neededColumns(self, columns: Optional[Set[int]]) -> Optional[Set[int]]:
+        # Only converted columns are read
+        return None if columns is None else columns | set(self.__attributes)
+
     @staticmethod
     def shortDescription() -> str:
         return 'Convert one attribute to Numeric values. All types except Datetime can be converted'
@@ -172,29 +178,43 @@ class ToCategorical(GraphOperation, flogging.Loggable):
         return tt.get_string(border=True, vrules=pt.ALL)
 
     def execute(self, df: data.Frame) -> data.Frame:
-        # Deep copy
-        raw_df = df.getRawFrame().copy(deep=True)
-        # To string
-        columnIndexes = list(self.__attributes.keys())
-        isNan = raw_df.iloc[:, columnIndexes].isnull()
-        raw_df.iloc[:, columnIndexes] = raw_df.iloc[:, columnIndexes] \
-            .astype(dtype=str, errors='raise')
-        # Set to nan where values where nan
-        raw_df.iloc[:, columnIndexes] = raw_df.iloc[:, columnIndexes].mask(isNan, np.nan)
-        colNames = df.shape.colNames
-        # To category
-        conversions: Dict[str, CategoricalDtype] = dict([
-            (lambda i, opts: (colNames[i], CategoricalDtype(categories=opts[0],  # can be None
-                                                            ordered=opts[1])))(index, info)
-            for index, info in self.__attributes.items()
-        ])
-        raw_df = raw_df.astype(dtype=conversions, copy=True, errors='raise')
-        return data.Frame(raw_df)
+        # Replace converted columns, sharing the others
+        return df.replaceColumns(self.executeColumns(data.ColumnView(df)))
+
+    def executeColumns(self, columns: data.ColumnView) -> Dict[int, pd.Series]:
+        def convert(index: int) -> pd.Series:
+            opts = self.__attributes[index]
+            column = columns[index]
+            # To string
+            isNan = column.isnull()
+            column = column.astype(dtype=str, errors='raise')
+            # Set to nan where values where nan
+            column = column.mask(isNan, np.nan)
+            # To category (categories can be None)
+            return column.astype(CategoricalDtype(categories=opts[0], ordered=opts[1]),
+                                 copy=False, errors='raise')
+
+        return columntasks.mapColumns(convert, self.__attributes.keys(), rows=columns.nRows)
 
     @staticmethod
     def name() -> str:
         return 'toCategory'
 
+    @staticmethod
+    def isProcessSafe() -> bool:
+        return True
+
+    def isRowLocal(self) -> bool:
+        # Categories inferred from values depend on the whole column
+        return all(bool(opts[0]) for opts in self.__attributes.values())
+
+    def isColumnLocal(self) -> bool:
+        return True
+
+    def neededColumns(self, columns: Optional[Set[int]]) -> Optional[Set[int]]:
+        # Only converted columns are read
+        return None if columns is None else columns | set(self.__attributes.keys())
+
     @staticmethod
     def shortDescription() -> str:
         return 'Convert one attribute to categorical type. Every different value will be considered a ' \
@@ -302,16 +322,33 @@ class ToTimestamp(GraphOperation, flogging.Loggable):
             self.__errorMode)
 
     def execute(self, df: data.Frame) -> data.Frame:
-        pdf = df.getRawFrame().copy(True)
-        for attr, dateFormat in self.__attributes.items():
-            pdf.iloc[:, attr] = pd.to_datetime(pdf.iloc[:, attr], errors=self.__errorMode,
-                                               infer_datetime_format=True, format=dateFormat)
-        return data.Frame(pdf)
+        # Replace converted columns, sharing the others
+        return df.replaceColumns(self.executeColumns(data.ColumnView(df)))
+
+    def executeColumns(self, columns: data.ColumnView) -> Dict[int, pd.Series]:
+        return columntasks.mapColumns(
+            lambda attr: pd.to_datetime(columns[attr], errors=self.__errorMode,
+                                        infer_datetime_format=True, format=self.__attributes[attr]),
+            self.__attributes.keys(), rows=columns.nRows)
 
     @staticmethod
     def name() -> str:
         return 'toDatetime'
 
+    @staticmethod
+    def isProcessSafe() -> bool:
+        return True
+
+    def isRowLocal(self) -> bool:
+        return True
+
+    def isColumnLocal(self) -> bool:
+        return True
+
+    def neededColumns(self, columns: Optional[Set[int]]) -> Optional[Set[int]]:
+        # Only converted columns are read
+        return None if columns is None else columns | set(self.__attributes.keys())
+
     def acceptedTypes(self) -> List[Type]:
         return [Types.String]
 
@@ -410,21 +447,38 @@ class ToString(GraphOperation, flogging.Loggable):
         return tt.get_string(border=True, vrules=pt.ALL)
 
     def execute(self, df: data.Frame) -> data.Frame:
-        # Deep copy
-        raw_df = df.getRawFrame().copy(deep=True)
-        # To string
-        isNan = raw_df.iloc[:, self.__attributes].isnull()
-        processed = raw_df.iloc[:, self.__attributes].astype(dtype=str, errors='raise')
-        # Set to nan where values where nan
-        processed = processed.mask(isNan, np.nan)
-        colNames = df.shape.colNames
-        raw_df.iloc[:, self.__attributes] = processed
-        return data.Frame(raw_df)
+        # Replace converted columns, sharing the others
+        return df.replaceColumns(self.executeColumns(data.ColumnView(df)))
+
+    def executeColumns(self, columns: data.ColumnView) -> Dict[int, pd.Series]:
+        def convert(index: int) -> pd.Series:
+            column = columns[index]
+            # To string
+            isNan = column.isnull()
+            column = column.astype(dtype=str, errors='raise')
+            # Set to nan where values where nan
+            return column.mask(isNan, np.nan)
+
+        return columntasks.mapColumns(convert, self.__attributes, rows=columns.nRows)
 
     @staticmethod
     def name() -> str:
         return 'toString'
 
+    @staticmethod
+    def isProcessSafe() -> bool:
+        return True
+
+    def isRowLocal(self) -> bool:
+        return True
+
+    def isColumnLocal(self) -> bool:
+        return True
+
+    def neededColumns(self, columns: Optional[Set[int]]) -> Optional[Set[int]]:
+        # Only converted columns are read
+        return None if columns is None else columns | set(self.__attributes)
+
     @staticmethod
     def shortDescription() -> str:
         return 'Convert a column of any type to string'
@@ -21,10 +21,13 @@
 # You should have received a copy of the GNU General Public License
 # along with DataMole.  If not, see <https://www.gnu.org/licenses/>.
 
+import hashlib
 import re
-from typing import List
+from collections import defaultdict
+from typing import Dict, Hashable, List, Tuple
 
 import numpy as np
+import pandas as pd
 from PySide2.QtCore import QLocale
 from PySide2.QtGui import QValidator, QIntValidator, QDoubleValidator
 
@@ -36,6 +39,71 @@ def numpy_equal(a: np.array, b: np.array) -> bool:
     return ((a == b) | ((a != a) & (b != b))).all()
 
 
+def _columnValues(column: pd.Series) -> np.ndarray:
+    """ Values of a column as compared by :func:`numpy_equal`. Categories are compared as objects """
+    if pd.api.types.is_categorical_dtype(column.dtype):
+        return np.asarray(column.values, dtype=object)
+    return column.values
+
+
+def columnFingerprint(column: pd.Series) -> Tuple[str, Hashable]:
+    """
+    Computes a fingerprint of the values of a column. Columns which are equal according to
+    :func:`numpy_equal` have the same fingerprint, and different columns have different fingerprints
+    with high probability. Values are hashed in a single vectorized pass. Categorical columns are
+    fingerprinted as object columns, but only their categories are hashed.
+
+    :param column: the column
+    :return: the fingerprint, which is a tuple (dtype name, digest). Columns of objects which are not
+        all strings are not hashed, since equal values may be hashed differently, and their digest
+        is None
+    """
+    values = column.values
+    if pd.api.types.is_categorical_dtype(column.dtype):
+        categories = np.asarray(values.categories, dtype=object)
+        if pd.api.types.infer_dtype(categories, skipna=True) not in ('string', 'empty'):
+            return 'object', None
+        # Missing values have code -1, which selects the hash of NaN appended to categories
+        hashes = pd.util.hash_array(np.append(categories, np.nan))[values.codes]
+        dtype = 'object'
+    else:
+        dtype = values.dtype.name
+        if values.dtype.kind == 'O':
+            if pd.api.types.infer_dtype(values, skipna=True) not in ('string', 'empty'):
+                return dtype, None
+        elif values.dtype.kind == 'f':
+            # Every NaN is hashed as the same value, and -0.0 as 0.0
+            values = np.where(np.isnan(values), np.nan, values + 0.0)
+        elif values.dtype.kind not in 'biumM':
+            return dtype, None
+        hashes = pd.util.hash_array(values)
+    return dtype, hashlib.blake2b(hashes.tobytes(), digest_size=16).digest()
+
+
+def duplicateColumns(df: pd.DataFrame) -> List[int]:
+    """
+    Finds columns which have the same type and values of some previous column in the dataframe.
+    Every column is hashed once and only columns with the same fingerprint are compared, so the
+    time is linear in the number of columns, unless there are many duplicates
+
+    :param df: the dataframe
+    :return: the positions of duplicate columns, in increasing order. The first column of every
+        group of equal columns is not included
+    """
+    buckets: Dict[Tuple[str, Hashable], List[int]] = defaultdict(list)
+    duplicates: List[int] = list()
+    for i in range(df.shape[1]):
+        column = df.iloc[:, i]
+        # Columns with the same fingerprint are compared with the distinct columns already seen
+        distinct = buckets[columnFingerprint(column)]
+        values = _columnValues(column)
+        if any(numpy_equal(_columnValues(df.iloc[:, j]), values) for j in distinct):
+            duplicates.append(i)
+        else:
+            distinct.append(i)
+    return duplicates
+
+
 def splitString(string: str, sep: str) -> List[str]:
     """
     Split a string on a separator, trimming spaces. Parts within double quotes are not parsed
@@ -0,0 +1,2696 @@
+# -*- coding: utf-8 -*-
+
+# Resource object code
+#
+# Created: Sat Oct 17 04:30:58 2026
+#      by: The Resource Compiler for PySide2 (Qt v5.13.2)
+#
+# WARNING! All changes made in this file will be lost!
+
+from PySide2 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x00$\
+Q\
+Splitter::handle\
+ {\x0a\x09color: black\
+;\x0a}\
+\x00\x00J\xb0\
+<\
+html>\x0a<!-- @form\
+atter:off -->\x0a<s\
+tyle>\x0a    table,\
+ th, td {\x0a      \
+border: 1px soli\
+d black;\x0a    }\x0a \
+   th, td {\x0a    \
+  padding: 0.3em\
+;\x0a    }\x0a</style>\
+\x0a<!-- @formatter\
+:on -->\x0a<section\
+ name=\x22RangeDisc\
+retizer\x22>\x0a    <h\
+2>RangeDiscretiz\
+er</h2>\x0a    Disc\
+retize numeric c\
+olumns into user\
+ specified conti\
+guous ranges <br\
+/>\x0a    <b>Input \
+types</b>: Numer\
+ic<br/>\x0a    <b>O\
+utput types</b>:\
+ Ordinal\x0a    <h3\
+>Table options</\
+h3>\x0a    Bin edge\
+s can be specifi\
+ed in the \x22Bin e\
+dges\x22 column. Bi\
+n edges must be \
+numbers and must\
+ be\x0a    separate\
+d by a single sp\
+ace. Bin labels \
+must be specifie\
+d and their numb\
+er must be exact\
+ly the\x0a    numbe\
+r of intervals s\
+pecified, which \
+is the number of\
+ edges -1.\x0a    <\
+br/>\x0a    <em>Exa\
+mple:</em>\x0a    <\
+br/>\x0a    <table>\
+\x0a        <tr>\x0a  \
+          <th>Bi\
+n edges</th>\x0a   \
+         <th>Lab\
+els</th>\x0a       \
+ </tr>\x0a        <\
+tr>\x0a            \
+<td>1.0 1.5 4 5.\
+1</td>\x0a         \
+   <td>Low Mediu\
+m High</td>\x0a    \
+    </tr>\x0a    </\
+table>\x0a    In th\
+e example bins a\
+re set for inter\
+vals: (1.0, 1.5]\
+, (1.5, 4.0], (4\
+.0, 5.1]\x0a    <h3\
+>Create new attr\
+ibute</h3>\x0a    I\
+f selected the o\
+peration will pr\
+oduce one new co\
+lumn for every a\
+ttribute to be d\
+iscretized, and\x0a\
+    each column \
+will have the or\
+iginal name foll\
+owed by the prov\
+ided suffix. Not\
+ice that if the\x0a\
+    dataframe co\
+ntains columns w\
+ith the exact sa\
+me name of the n\
+ew columns, thes\
+e columns will b\
+e\x0a    replaced.<\
+br/>\x0a    If the \
+option is select\
+ed the original \
+column will not \
+be touched, othe\
+rwise it is\x0a    \
+replaced.\x0a</sect\
+ion>\x0a<section na\
+me=\x22BinsDiscreti\
+zer\x22>\x0a    <h2>Bi\
+nDiscretizer</h2\
+>\x0a    Discretize\
+ a numeric colum\
+n into a defined\
+ number of bins\x0a\
+    <b>Input typ\
+es</b>: Numeric<\
+br/>\x0a    <b>Outp\
+ut type</b>: Ord\
+inal\x0a    <h3>Tab\
+le options</h3>\x0a\
+    The number o\
+f bins can be sp\
+ecified in colum\
+n \x22K\x22.<br/>\x0a    \
+<em>Example:</em\
+>\x0a    <br/>\x0a    \
+<table>\x0a        \
+<tr>\x0a           \
+ <th>Column</th>\
+\x0a            <th\
+>Type</th>\x0a     \
+       <th>K</th\
+>\x0a        </tr>\x0a\
+        <tr>\x0a   \
+         <td>Att\
+ribute1</td>\x0a   \
+         <td>Num\
+eric</td>\x0a      \
+      <td>6</td>\
+\x0a        </tr>\x0a \
+       <tr>\x0a    \
+        <td>Attr\
+ibute2</td>\x0a    \
+        <td>Nume\
+ric</td>\x0a       \
+     <td>9</td>\x0a\
+        </tr>\x0a  \
+  </table>\x0a    T\
+he above configu\
+ration discretiz\
+e the two attrib\
+utes with 6 and \
+9 bins respectiv\
+ely.\x0a    <h3>Str\
+ategy</h3>\x0a    <\
+ul>\x0a        <li>\
+<b>Uniform</b>: \
+all bins in each\
+ feature have id\
+entical widths</\
+li>\x0a        <li>\
+<b>Quantile</b>:\
+ all bins in eac\
+h feature have t\
+he same number o\
+f points</li>\x0a  \
+      <li><b>Kme\
+ans</b>: all bin\
+s in each featur\
+e have the same \
+nearest center o\
+f a 1D k-means\x0a \
+           clust\
+er\x0a        </li>\
+\x0a    </ul>\x0a    <\
+h3>Create new at\
+tribute</h3>\x0a   \
+ If selected the\
+ operation will \
+produce one new \
+column for every\
+ attribute to be\
+ discretized, an\
+d\x0a    each colum\
+n will have the \
+original name fo\
+llowed by the pr\
+ovided suffix. N\
+otice that if th\
+e\x0a    dataframe \
+contains columns\
+ with the exact \
+same name of the\
+ new columns, th\
+ese columns will\
+ be\x0a    replaced\
+.<br/>\x0a    If th\
+e option is sele\
+cted the origina\
+l column will no\
+t be touched, ot\
+herwise it is\x0a  \
+  replaced.\x0a</se\
+ction>\x0a<section \
+name=\x22DateDiscre\
+tizer\x22>\x0a    <h2>\
+DateDiscretizer<\
+/h2>\x0a    Discret\
+ize a datetime a\
+ttribute into us\
+er specified con\
+tiguous ranges, \
+optionally using\
+ both date\x0a    a\
+nd time componen\
+ts.<br/>\x0a    <b>\
+Input types</b>:\
+ Datetime<br/>\x0a \
+   <b>Output typ\
+es</b>: Ordinal\x0a\
+    <h3>Table op\
+tions</h3>\x0a    D\
+atetime bins can\
+ be specified in\
+ the \x22Ranges\x22 co\
+lumn, while \x22Lab\
+els\x22 must contai\
+n one string\x0a   \
+ label for every\
+ attribute type,\
+ each separated \
+by a blank space\
+. To use a strin\
+g with space\x0a   \
+ inside the stri\
+ng must be doubl\
+e quoted (\x22)<br/\
+>\x0a    <em>Exampl\
+e:</em>\x0a    <br/\
+>\x0a    <table>\x0a  \
+      <tr>\x0a     \
+       <th>Colum\
+n</th>\x0a         \
+   <th>Type</th>\
+\x0a            <th\
+>Ranges</th>\x0a   \
+         <th>Lab\
+els</th>\x0a       \
+ </tr>\x0a        <\
+tr>\x0a            \
+<td>Attribute1</\
+td>\x0a            \
+<td>Datetime</td\
+>\x0a            <t\
+d>(2000-01-01, 2\
+001-01-01]<br/>(\
+2001-01-01, 2002\
+-01-01]</td>\x0a   \
+         <td>00/\
+01 01/02</td>\x0a  \
+      </tr>\x0a    \
+</table>\x0a    The\
+ above configura\
+tion produce one\
+ Ordinal attribu\
+te with all date\
+s in (2000-01-01\
+, 2001-01-01]\x0a  \
+  labelled with \
+\x2200/01\x22 and all \
+dates in (2001-0\
+1-01, 2002-01-01\
+] labelled as \x220\
+1/02\x22. There is \
+no\x0a    way of ex\
+cluding an inter\
+val from discret\
+ization, since a\
+ll ranges are co\
+ntiguous. The on\
+ly way to\x0a    ac\
+hieve this is by\
+ labelling all t\
+he unwanted date\
+s with a specifi\
+c category and t\
+hen replacing\x0a  \
+  all the catego\
+ries values with\
+ NaN using the o\
+peration <i>Repl\
+aceValues</i>.\x0a \
+   <h3>Create ne\
+w attribute</h3>\
+\x0a    If selected\
+ the operation w\
+ill produce one \
+new column for e\
+very attribute t\
+o be discretized\
+, and\x0a    each c\
+olumn will have \
+the original nam\
+e followed by th\
+e provided suffi\
+x. Notice that i\
+f the\x0a    datafr\
+ame contains col\
+umns with the ex\
+act same name of\
+ the new columns\
+, these columns \
+will be\x0a    repl\
+aced.<br/>\x0a    I\
+f the option is \
+selected the ori\
+ginal column wil\
+l not be touched\
+, otherwise it i\
+s\x0a    replaced.\x0a\
+</section>\x0a<sect\
+ion name=\x22Remove\
+Bijections\x22>\x0a   \
+ <h2>RemoveBijec\
+tions</h2>\x0a    R\
+emoves from sele\
+ction all column\
+s with the same \
+values but with \
+different names.\
+<br/>\x0a    <b>Inp\
+ut types</b>: Al\
+l<br/>\x0a    <b>Ou\
+tput type</b>: S\
+ame\x0a    <h3>Tabl\
+e options</h3>\x0a \
+   Column to con\
+sider for remova\
+l must be select\
+ed in the table.\
+ Unchecked colum\
+ns will not be\x0a \
+   dropped, even\
+ if duplicated.\x0a\
+</section>\x0a<sect\
+ion name=\x22Extrac\
+tTimeSeries\x22>\x0a  \
+  <h2>ExtractTim\
+eSeries</h2>\x0a   \
+ Normalizes a da\
+taset containing\
+ time series inf\
+ormation. <br/>\x0a\
+    <h3>Requirem\
+ents</h3>\x0a    <h\
+4>Motivation</h4\
+>\x0a    This featu\
+re is tailored f\
+or longitudinal \
+datasets, which \
+means dataset in\
+ this form:\x0a    \
+<table>\x0a        \
+<tr>\x0a           \
+ <th>A_wave1</th\
+>\x0a            <t\
+h>A_wave2</th>\x0a \
+           <th>A\
+_wave3</th>\x0a    \
+        <th>B_wa\
+ve1</th>\x0a       \
+     <th>B_wave2\
+</th>\x0a          \
+  <th>B_wave3</t\
+h>\x0a        </tr>\
+\x0a        <tr>\x0a  \
+          <td>12\
+.1</td>\x0a        \
+    <td>12.4</td\
+>\x0a            <t\
+d>11.0</td>\x0a    \
+        <td>0.10\
+</td>\x0a          \
+  <td>1.23</td>\x0a\
+            <td>\
+4.53</td>\x0a      \
+  </tr>\x0a    </ta\
+ble>\x0a    In this\
+ dataset the sam\
+e attribute \x22A\x22 \
+and \x22B\x22 are meas\
+ured at differen\
+t times, but eac\
+h\x0a    measuremen\
+t is codified as\
+ a different col\
+umn. This operat\
+ion allow to obt\
+ain a normalised\
+ dataset\x0a    tha\
+t can be visuali\
+sed with the tim\
+e series feature\
+s. It generates \
+a new dataset wi\
+th this form:\x0a  \
+  <table>\x0a      \
+  <tr>\x0a         \
+   <th>Time</th>\
+\x0a            <th\
+>A</th>\x0a        \
+    <th>B</th>\x0a \
+       </tr>\x0a   \
+     <tr>\x0a      \
+      <td>wave1<\
+/td>\x0a           \
+ <td>12.1</td>\x0a \
+           <td>0\
+.10</td>\x0a       \
+ </tr>\x0a        <\
+tr>\x0a            \
+<td>wave2</td>\x0a \
+           <td>1\
+2.4</td>\x0a       \
+     <td>1.23</t\
+d>\x0a        </tr>\
+\x0a        <tr>\x0a  \
+          <td>wa\
+ve3</td>\x0a       \
+     <td>11.0</t\
+d>\x0a            <\
+td>4.53</td>\x0a   \
+     </tr>\x0a    <\
+/table>\x0a    <h4>\
+With ID</h4>\x0a   \
+ It's also possi\
+ble that a measu\
+rement is perfor\
+med at the same \
+time for many in\
+dividuals. In th\
+is\x0a    case ever\
+y individual mus\
+t be identifiabl\
+e by an ID which\
+ remains consist\
+ent through time\
+. The\x0a    datase\
+t will look like\
+ this:\x0a    <tabl\
+e>\x0a        <tr>\x0a\
+            <th>\
+Id</th>\x0a        \
+    <th>A_wave1<\
+/th>\x0a           \
+ <th>A_wave2</th\
+>\x0a            <t\
+h>A_wave3</th>\x0a \
+           <th>B\
+_wave1</th>\x0a    \
+        <th>B_wa\
+ve2</th>\x0a       \
+     <th>B_wave3\
+</th>\x0a        </\
+tr>\x0a        <tr>\
+\x0a            <td\
+>id1</td>\x0a      \
+      <td>12.1</\
+td>\x0a            \
+<td>12.4</td>\x0a  \
+          <td>11\
+.0</td>\x0a        \
+    <td>0.10</td\
+>\x0a            <t\
+d>1.23</td>\x0a    \
+        <td>4.53\
+</td>\x0a        </\
+tr>\x0a        <tr>\
+\x0a            <td\
+>id2</td>\x0a      \
+      <td>1.02</\
+td>\x0a            \
+<td>12.4</td>\x0a  \
+          <td>1.\
+02</td>\x0a        \
+    <td>3.45</td\
+>\x0a            <t\
+d>2.31</td>\x0a    \
+        <td>4.99\
+</td>\x0a        </\
+tr>\x0a    </table>\
+\x0a    In this cas\
+e this operation\
+ can transform t\
+he dataset in th\
+is fashion:\x0a    \
+<table>\x0a        \
+<tr>\x0a           \
+ <th>Id</th>\x0a   \
+         <th>Tim\
+e</th>\x0a         \
+   <th>A</th>\x0a  \
+          <th>B<\
+/th>\x0a        </t\
+r>\x0a        <tr>\x0a\
+            <td>\
+id1</td>\x0a       \
+     <td>wave1</\
+td>\x0a            \
+<td>12.1</td>\x0a  \
+          <td>0.\
+10</td>\x0a        \
+</tr>\x0a        <t\
+r>\x0a            <\
+td>id1</td>\x0a    \
+        <td>wave\
+2</td>\x0a         \
+   <td>12.4</td>\
+\x0a            <td\
+>1.23</td>\x0a     \
+   </tr>\x0a       \
+ <tr>\x0a          \
+  <td>id1</td>\x0a \
+           <td>w\
+ave3</td>\x0a      \
+      <td>11.0</\
+td>\x0a            \
+<td>4.53</td>\x0a  \
+      </tr>\x0a    \
+    <tr>\x0a       \
+     <td>id2</td\
+>\x0a            <t\
+d>wave1</td>\x0a   \
+         <td>1.0\
+2</td>\x0a         \
+   <td>3.45</td>\
+\x0a        </tr>\x0a \
+       <tr>\x0a    \
+        <td>id2<\
+/td>\x0a           \
+ <td>wave2</td>\x0a\
+            <td>\
+12.4</td>\x0a      \
+      <td>2.31</\
+td>\x0a        </tr\
+>\x0a        <tr>\x0a \
+           <td>i\
+d2</td>\x0a        \
+    <td>wave2</t\
+d>\x0a            <\
+td>1.02</td>\x0a   \
+         <td>4.9\
+9</td>\x0a        <\
+/tr>\x0a    </table\
+>\x0a    <h3>Usage<\
+/h3>\x0a    <h4>Tab\
+le options</h4>\x0a\
+    The first st\
+ep is the specif\
+ication of the a\
+ttributes (serie\
+s) to create. Th\
+is must be done \
+in the\x0a    \x22Seri\
+es name\x22 table. \
+Then you must de\
+fine how to crea\
+te every series:\
+ from every rele\
+vant dataset\x0a   \
+ you must select\
+ which attribute\
+ represent the t\
+ime measurements\
+ of the series y\
+ou are building.\
+\x0a    With respec\
+t to the previou\
+s example (which\
+ had only one da\
+taset) for time \
+series \x22A\x22 you s\
+hould\x0a    have s\
+elected attribut\
+es \x22A_wave1\x22, \x22A\
+_wave2\x22, \x22A_wave\
+3\x22 and for serie\
+s \x22B\x22 you should\
+ have selected\x0a \
+   \x22B_wave1\x22, \x22B\
+_wave2\x22, \x22B_wave\
+3\x22. After this, \
+you must associa\
+te every time en\
+try (in this cas\
+e for\x0a    wave1,\
+ wave2 and wave3\
+) with a label, \
+which should be \
+something that e\
+asily identifies\
+ a time\x0a    poin\
+t, like a time o\
+r a date. To do \
+this we must add\
+ to the \x22Time la\
+bels\x22 3 labels: \
+\x22wave1\x22,\x0a    \x22wa\
+ve2\x22 and \x22wave3\x22\
+. Be careful! La\
+bels <em>order m\
+atters</em>. Lab\
+els will be adde\
+d to an Ordinal\x0a\
+    column, orde\
+red exactly as s\
+hown in list. Fo\
+r this reason it\
+'s possible to d\
+rag labels to re\
+order\x0a    them a\
+s required. Afte\
+r that every sel\
+ected attribute \
+must be associat\
+ed with the defi\
+ned time\x0a    lab\
+els. In this exa\
+mple \x22A_wave1\x22 w\
+ill be placed at\
+ time \x22wave1\x22, \x22\
+A_wave2\x22 at time\
+ \x22wave2\x22,\x0a    \x22B\
+_wave1\x22 at \x22wave\
+1\x22, \x22B_wave3\x22 at\
+ \x22wave3\x22 and so \
+on.\x0a</section>\x0a<\
+section name=\x22Dr\
+opColumns\x22>\x0a    \
+<h2>Drop</h2>\x0a  \
+  Remove columns\
+ from dataframe<\
+br/>\x0a    <b>Inpu\
+t types</b>: All\
+<br/>\x0a    <b>Out\
+put types</b>: S\
+ame\x0a    <h3>Tabl\
+e options</h3>\x0a \
+   All selected \
+columns will be \
+removed from dat\
+aframe.\x0a</sectio\
+n>\x0a<section name\
+=\x22DuplicateColum\
+n\x22>\x0a    <h2>Dupl\
+icateColumn</h2>\
+\x0a    Duplicate d\
+ataframe columns\
+<br/>\x0a    <b>Inp\
+ut types</b>: Al\
+l<br/>\x0a    <b>Ou\
+tput types</b>: \
+Same\x0a    <h3>Tab\
+le options</h3>\x0a\
+    Select the c\
+olumns to duplic\
+ate and specify \
+their new name. \
+Only non existin\
+g column names c\
+an be\x0a    used, \
+otherwise an err\
+or will be shown\
+.\x0a</section>\x0a<se\
+ction name=\x22Fill\
+Nan\x22>\x0a    <h2>Fi\
+llNan</h2>\x0a    F\
+ill NaN/NaT valu\
+es over columns \
+with specified m\
+ethod<br/>\x0a    <\
+b>Input types</b\
+>: All<br/>\x0a    \
+<b>Output types<\
+/b>: Same\x0a    <h\
+3>Table options<\
+/h3>\x0a    Columns\
+ to be processed\
+ must be selecte\
+d. The \x22Fill val\
+ue\x22 column is re\
+levant only if t\
+he selected\x0a    \
+strategy is \x22Val\
+ues\x22, in which c\
+ase it can not b\
+e empty.\x0a    <h3\
+>Strategy</h3>\x0a \
+   <ul>\x0a        \
+<li><b>Backfill<\
+/b>: fill with n\
+ext valid observ\
+ation</li>\x0a     \
+   <li><b>Pad</b\
+>: propagate las\
+t valid observat\
+ion forward up t\
+o the next one</\
+li>\x0a        <li>\
+<b>Mean</b>: fil\
+l gaps with the \
+mean of column (\
+only for Numeric\
+ and Datetime)</\
+li>\x0a        <li>\
+<b>Value</b>: fi\
+ll gaps in every\
+ column with a s\
+pecified value</\
+li>\x0a    </ul>\x0a</\
+section>\x0a<sectio\
+n name=\x22SetIndex\
+\x22>\x0a    <h2>Set i\
+ndex</h2>\x0a    Se\
+t an index to th\
+e dataframe<br/>\
+\x0a    <h3>Table o\
+ptions</h3>\x0a    \
+Selected columns\
+ will replace th\
+e current index \
+column(s). After\
+ this, they will\
+ not be visible \
+as\x0a    columns, \
+but they can be \
+reinserted in th\
+e dataframe with\
+ the ResetIndex \
+operation.\x0a</sec\
+tion>\x0a<section n\
+ame=\x22ResetIndex\x22\
+>\x0a    <h2>Reset \
+index</h2>\x0a    R\
+eset the index o\
+f the dataframe.\
+ All named index\
+ levels will be \
+inserted in the \
+dataframe as\x0a   \
+ columns. Unname\
+d index levels a\
+re dropped.\x0a</se\
+ction>\x0a<section \
+name=\x22Join\x22>\x0a   \
+ <h2>Join</h2>\x0a \
+   Join two data\
+frames on index \
+or columns.\x0a    \
+<h3>Join type</h\
+3>\x0a    Supports \
+all SQL-style jo\
+in: left, right,\
+ inner, outer.\x0a \
+   <h3>Join on i\
+ndex</h3>\x0a    If\
+ selected the tw\
+o dataframes wil\
+l be joined over\
+ their index, wh\
+ich will be pres\
+erved. Otherwise\
+\x0a    it's necess\
+ary to select on\
+e column from bo\
+th dataframe and\
+ the join will b\
+e done on those\x0a\
+    columns. In \
+this case the in\
+dex is not prese\
+rved, and a defa\
+ult one will be \
+set.\x0a    <h3>Suf\
+fixes</h3>\x0a    I\
+f some columns h\
+ave the same nam\
+e in both datafr\
+ames they will b\
+e renamed with t\
+hese suffixes to\
+\x0a    distinguish\
+ them.\x0a</section\
+>\x0a<section name=\
+\x22OneHotEncoder\x22>\
+\x0a    <h2>One-hot\
+ encoder</h2>\x0a  \
+  Encode categor\
+ical or string c\
+olumn as a one-h\
+ot array<br/>\x0a  \
+  <b>Input types\
+</b>: Categorica\
+l, String<br/>\x0a \
+   <b>Output typ\
+es</b>: Nominal\x0a\
+    <h3>Table op\
+tions</h3>\x0a    F\
+or every selecte\
+d column a set o\
+f new columns wi\
+ll be appended t\
+o the dataframe,\
+ one for every\x0a \
+   distinct cate\
+gory or string v\
+alue found in th\
+e original colum\
+n. These columns\
+ will have the s\
+ame\x0a    original\
+ name, with the \
+distinct value a\
+s suffix. The ne\
+w columns will h\
+ave type Nominal\
+\x0a    and will co\
+ntain binary val\
+ues.\x0a    <h3>Col\
+umn for nan</h3>\
+\x0a    Whether to \
+add a column als\
+o for NaN values\
+. If selected it\
+ is added regard\
+less of the pres\
+ence of\x0a    NaN \
+values.\x0a</sectio\
+n>\x0a<section name\
+=\x22RemoveNanColum\
+ns\x22>\x0a    <h2>Rem\
+oveNanColumns</h\
+2>\x0a    Remove co\
+lumns with NaN v\
+alues.<br/>\x0a    \
+<b>Input types</\
+b>: All<br/>\x0a   \
+ <b>Output types\
+</b>: Same\x0a    <\
+h3>Usage</h3>\x0a  \
+  Can operate in\
+ one of two mode\
+s:\x0a    <ul>\x0a    \
+    <li>By remov\
+ing every column\
+ with more than \
+a minimum number\
+ of NaN values</\
+li>\x0a        <li>\
+By removing ever\
+y column with Na\
+N ratio > thresh\
+old</li>\x0a    </u\
+l>\x0a</section>\x0a<s\
+ection name=\x22Rem\
+oveNanRows\x22>\x0a   \
+ <h2>RemoveNanCo\
+lumns</h2>\x0a    R\
+emove columns wi\
+th NaN values.<b\
+r/>\x0a    <b>Input\
+ types</b>: All<\
+br/>\x0a    <b>Outp\
+ut types</b>: Sa\
+me\x0a    <h3>Usage\
+</h3>\x0a    Can op\
+erate in one of \
+two modes:\x0a    <\
+ul>\x0a        <li>\
+By removing rows\
+ with more than \
+a minimum number\
+ of NaN values o\
+ver all columns<\
+/li>\x0a        <li\
+>By removing row\
+s with NaN ratio\
+ > threshold ove\
+r all columns</l\
+i>\x0a    </ul>\x0a</s\
+ection>\x0a<section\
+ name=\x22RenameCol\
+umns\x22>\x0a    <h2>R\
+ename column</h2\
+>\x0a    Rename col\
+umns of the data\
+frame.<br/>\x0a    \
+<b>Input types</\
+b>: All<br/>\x0a   \
+ <b>Output types\
+</b>: Same\x0a    <\
+h3>Usage</h3>\x0a  \
+  Double click a\
+ column name to \
+start editing an\
+d insert the new\
+ name. All colum\
+n names should b\
+e\x0a    unique.\x0a</\
+section>\x0a<sectio\
+n name=\x22ReplaceV\
+alues\x22>\x0a    <h2>\
+Replace values</\
+h2>\x0a    Replace \
+values in datafr\
+ame columns.<br/\
+>\x0a    <b>Input t\
+ypes</b>: String\
+, Categorical, N\
+umeric<br/>\x0a    \
+<b>Output types<\
+/b>: Same\x0a    <h\
+3>Table options<\
+/h3>\x0a    Replace\
+ values in the d\
+ataframe.\x0a</sect\
+ion>\x0a<section na\
+me=\x22MinMaxScaler\
+\x22>\x0a    <h2>Min m\
+ax scaler</h2>\x0a \
+   Scales column\
+s as\x0a    <code>[\
+(X - X_min) / (X\
+_max - X_min)] *\
+ (max - min) + m\
+in</code>\x0a    , \
+where <code>X_mi\
+n</code> and <co\
+de>X_max</code> \
+are the column-w\
+ise minimum and \
+maximum and\x0a    \
+<code>[min, max]\
+</code> is the s\
+pecified feature\
+ range (inclusiv\
+e).<br/>\x0a    <b>\
+Input types</b>:\
+ Numeric<br/>\x0a  \
+  <b>Output type\
+s</b>: Numeric\x0a \
+   <h3>Table opt\
+ions</h3>\x0a    Al\
+l selected colum\
+ns will be scale\
+d and will repla\
+ce the original \
+column. If you w\
+ant to preserve\x0a\
+    the original\
+ columns you wil\
+l need to make a\
+ copy of them wi\
+th the \x22Duplicat\
+e columns\x22\x0a    o\
+peration. <br/>\x0a\
+    The feature \
+range must be fo\
+r every selected\
+ column in the \x22\
+Range\x22 column as\
+ numbers separat\
+ed by\x0a    a blan\
+k space. The dec\
+imal separator i\
+s set to \x22.\x22.\x0a</\
+section>\x0a<sectio\
+n name=\x22Standard\
+Scaler\x22>\x0a    <h2\
+>Standard scaler\
+</h2>\x0a    Scales\
+ column values a\
+s (X - &mu;) / &\
+sigma;, with &si\
+gma;=std and &mu\
+;=mean.<br/>\x0a   \
+ <b>Input types<\
+/b>: Numeric<br/\
+>\x0a    <b>Output \
+types</b>: Numer\
+ic\x0a    <h3>Table\
+ options</h3>\x0a  \
+  All selected c\
+olumns will be s\
+caled and will r\
+eplace the origi\
+nal column. If y\
+ou want to prese\
+rve\x0a    the orig\
+inal columns you\
+ will need to ma\
+ke a copy of the\
+m with the \x22Dupl\
+icate columns\x22\x0a \
+   operation. No\
+ additional opti\
+ons are required\
+.\x0a</section>\x0a<se\
+ction name=\x22ToNu\
+meric\x22>\x0a    <h2>\
+To numeric</h2>\x0a\
+    Convert colu\
+mns to Numeric t\
+ype (floating po\
+int).<br/>\x0a    <\
+b>Input types</b\
+>: String, Categ\
+orical<br/>\x0a    \
+<b>Output types<\
+/b>: Numeric\x0a   \
+ <h3>Table optio\
+ns</h3>\x0a    All \
+selected columns\
+ will be convert\
+ed to numeric, i\
+f possible. The \
+handling of conv\
+ersion errors\x0a  \
+  depend on the \
+\x22Error mode\x22 opt\
+ion.\x0a    <h3>Err\
+or mode</h3>\x0a   \
+ <ul>\x0a        <l\
+i><b>Raise</b>: \
+invalid parsing \
+will stop the op\
+eration with an \
+error and no col\
+umn is\x0a         \
+   changed\x0a     \
+   </li>\x0a       \
+ <li><b>Coerce</\
+b>: invalid pars\
+ed values will b\
+e set as NaN</li\
+>\x0a    </ul>\x0a</se\
+ction>\x0a<section \
+name=\x22ToCategori\
+cal\x22>\x0a    <h2>To\
+ categorical</h2\
+>\x0a    Convert co\
+lumns to Categor\
+ical type. This \
+conversion is co\
+nvenient to enco\
+de columns with \
+a small\x0a    set \
+of distinct valu\
+es. It can also \
+be used to conve\
+rt between Ordin\
+al and Nominal a\
+nd to change\x0a   \
+ the valid categ\
+ories.<br/>\x0a    \
+<b>Input types</\
+b>: String, Nume\
+ric, Categorical\
+<br/>\x0a    <b>Out\
+put types</b>: O\
+rdinal or Nomina\
+l\x0a    <h3>Table \
+options</h3>\x0a   \
+ Selected column\
+s allow to input\
+ the exact categ\
+ories to be cons\
+idered, as strin\
+gs separated by \
+a\x0a    space. Dur\
+ing conversion, \
+encountered valu\
+es which were no\
+t specified will\
+ be set to NaN. \
+If the\x0a    \x22Cate\
+gories\x22 column i\
+s left empty, al\
+l distinct value\
+s will be consid\
+ered categories.\
+<br/>\x0a    The \x22O\
+rdered\x22 column c\
+ontrols whether \
+the column will \
+be Nominal (with\
+ False) or Ordin\
+al (with\x0a    Tru\
+e). Ordinal cate\
+gories are sorte\
+d as specified i\
+n the \x22Categorie\
+s\x22 column, or if\
+ not set, the\x0a  \
+  default lexico\
+graphical order \
+is used.\x0a    <h3\
+>Note</h3>\x0a    S\
+elected Numeric \
+columns will be \
+converted to Str\
+ing type, before\
+ being converted\
+ to Categorical.\
+\x0a</section>\x0a<sec\
+tion name=\x22ToStr\
+ing\x22>\x0a    <h2>To\
+ string</h2>\x0a   \
+ Convert columns\
+ to String type.\
+<br/>\x0a    <b>Inp\
+ut types</b>: Al\
+l<br/>\x0a    <b>Ou\
+tput types</b>: \
+String\x0a    <h3>T\
+able options</h3\
+>\x0a    Selected c\
+olumns will beco\
+me String column\
+s. No options ar\
+e required.\x0a</se\
+ction>\x0a<section \
+name=\x22ToTimestam\
+p\x22>\x0a    <h2>To d\
+atetime</h2>\x0a   \
+ Convert columns\
+ to Datetime typ\
+e.<br/>\x0a    <b>I\
+nput types</b>: \
+String<br/>\x0a    \
+<b>Output types<\
+/b>: Datetime\x0a  \
+  <h3>Table opti\
+ons</h3>\x0a    Sel\
+ected columns wi\
+ll be converted \
+using the format\
+ specified in th\
+e \x22Format\x22 colum\
+n. If this is\x0a  \
+  not set Pandas\
+ will try to inf\
+er it. Refer to\x0a\
+    <a href=\x22htt\
+ps://docs.python\
+.org/3/library/d\
+atetime.html#str\
+ftime-and-strpti\
+me-format-codes\x22\
+>\x0a        https:\
+//docs.python.or\
+g/3/library/date\
+time.html#strfti\
+me-and-strptime-\
+format-codes\x0a   \
+ </a> for inform\
+ation on how to \
+specify format.<\
+br/>\x0a    <em>Exa\
+mple: \x22%Y-%m-%d \
+%H:%M\x22</em> is t\
+he format of str\
+ings like: \x222019\
+-02-23 17:43\x22.\x0a \
+   <h3>Error mod\
+e</h3>\x0a    <ul>\x0a\
+        <li><b>R\
+aise</b>: invali\
+d parsing will s\
+top the operatio\
+n with an error \
+and no column is\
+\x0a            cha\
+nged\x0a        </l\
+i>\x0a        <li><\
+b>Coerce</b>: in\
+valid parsed dat\
+es will be set a\
+s NaT</li>\x0a    <\
+/ul>\x0a</section>\x0a\
+<section name=\x22P\
+ickleWriter\x22>\x0a  \
+  <h2>Export to \
+pickle</h2>\x0a    \
+Save a dataframe\
+ in a Python ser\
+ialized object (\
+pickle)<br/>\x0a   \
+ Useful to save \
+a dataframe with\
+out losing types\
+ information whi\
+ch would be lost\
+ by exporting to\
+ csv.\x0a    <h3>Us\
+age</h3>\x0a    Sel\
+ect the datafram\
+e to save and th\
+e file path.\x0a</s\
+ection>\x0a</html>\
+\x00\x00\x1b\xe8\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4x\xd4\xfa\
+\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\
+\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x00\x07tIME\x07\
+\xe4\x09\x04\x0a\x0c:\xa4]\x15z\x00\x00\x1buID\
+ATx\xda\xed\xdd[r\xe3:\xb2\x05P\xda\xe1\xd9\
+h\xfeC\xf1x\xdc\x1f\x1d\x8e\xe3\xaa\xb2-\x89\xc4#\
+\x1fkE\xf4\xcf\xed\xbee\x09\x0037@\x89:\x0e\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\xe8\xe8\xc5\x10\x90\xc9\xfbq|<\xfa\xbf\xbd\
+Y\xdf\x00\x02\x00=\x9a\xfe\x19\x82\x02 \x00@\xb3\xe6\
+/\x18\x00\x02\x00h\xfeB\x01 \x00\x80\xe6/\x14\x00\
+\x02\x00\x08\x00\x02\x01 \x00\x80\xe6/\x10\x00\x02\x00\x08\
+\x00\xc2\x00 \x00\x80\x00 \x0c\x00\x02\x00h\xfe\xc2\x00\
+ \x00\x80\x00 \x0c\x00\xbb\xbd\x1a\x02\x10\x82\x00\x01\x00\
+\x10\x02\x00\x01\x00\x10\x02\x00\x01\x00\x10\x02\x80\x12\xde\x0c\
+A\xce\xc2_\xf1\x83b\x9a\x1d\xc0:>m\x9c\xbc\x01\
+V\x0a\x02\x02@\xaf\xc0\x07\xec\xe5\x16@\x90\xc6w\xb6\
+\xf9i\x9a\x00\x08\x00\x8d\x1a\xbf\x10\x00\x80\x00\xd0\xb4\xf1\
+\x0b\x01\x00\x08\x00\x89\x9a\xbfQ\x00`7\x1f,*\xd6\
+\xf8\xb3~XL0\xaa9\xaf@\x5c\xbe\x06X\xac\xb1\
+\xbd\x1f\xc7\x87f\xf1X\xe3\x14:\x00\x01\x00;Z\xe1\
+\xc0\xdc\x01\xad\xd8)\x16m\xfe\xd9N\x01f\x8c\xd9\xa8\
+10\x9f\x80\x00@\xaa]\x7f\xa6\xa6\x119\x00\xec\x9e\
+k\xcd\x1f\x98\xc1-\x80\x82\x8d\xdf\xf8\xado\xca\xd6\x00\
+\x90\x8d\xaf\x01\x16n^\x9a\xd2\xda@`\xa7\x0e8\x01\
+\xd0\xf8C\xbd\xce\x9d\x8dI\x08\x01\x88\xc9\x8e\xa5IS\
+\x9b\x1d\x02|\xfea\xde\x188Y\x00\x9c\x00h\xfc\xc6\
+\xa1\x19\xcd\x1f\x10\x004\xbd\xcb\xaf\xffl3\xd1\xf0\x01\
+\x04\x00\xcd\xbfA\x08\xd0\xf0\x01\x04\x00\x8d\xdf{\x05@\
+\x00\xd0\xfc+\x9d\x02h\xfa\xd6\x0b \x00\xd0\xa8\x98W\
+\x7f\x7f>8\x07 \x00h\x8c\x082\x00\xdf\xf0$@\
+\xcd\x1f\x00\x01@\xf3\x07\x00\x01@\xf3\xdf\xc2\xd1o\xae\
+\xb1\x13 \x01\x01@\xf3\xbf\xdc\xbc>\x1b\x98\x10\x00\xc0\
+L-\x9bL\xa6\xe7\xd6\xdb]:\x01\x10\x06\x01'\x00\
+\xcd\x9a?|\xaeYA\x10p\x02P\xa4\xf9?\xd3\xf8\
+\x15\xff\xd8aj\xf5\xfc\x08\x8d\x80\x00\xd0\xa0\xf9\x0b\x01\
+\xf1\x9b\xe2\xae\xb9\x11\x04\x00\x01 I\xf3\xbcZ\xb0\x85\
+\x80\x98\x8dp\xe7\xbc\x08\x01\xc0Y\xe5\x9f\x04\x18\xa1i\
+*\xd2\xc6v\xf6\xfa\xb6\xc6\x00'\x00\xc5\x9b\xbfS\x80\
+x\x8d?\xfb\xed%@\x00\x10\x00\x92\x14\xe3\xca! \
+c\x03\xf3\xcd\x92sc#\xac\x80\x00P\xae(\xcf.\
+l\x19\x03\xc0\xcdZk5\xe6\xcf\x8c\x89 \x00\x02@\
+\x89\xa2\xbc\xaa\x98i:\xd6Z\xc4\xf9\xb82\x16\x82\x00\
+\x08\x00\x9a\x7f\xa2\xc6\xa3h\xe78\x91Y1O#\xc6\
+\xc1z\x82u\xde\x0c\x81&\xe8\xbd^\x1f\x93\xe8!\xe0\
+\xfd8>|&\x05p\x02P\xa8!\xaex\xaf\x9a~\
+\xadF8r>g\xbcg\xeb\x0d\x04\x80\xf0\x858J\
+\xa1R\x84\x85\x80\xd5\xf3\xeb\x07\x90@\x00h[\x84\xa3\
+\x15(\xf7_\x85\x80Us\xde-`\x83\x00\xa0\x00\x97\
+\x0c\x01\x8a\xac\x10\xf0\xe8\x1a\xd8\xf1\x9e\xacO\x10\x00\x9c\
+\x02\x0c~\xef\x0a\xab0\xf0\xccz\xf0{\x07 \x00(\
+\xba\x8a\x13E\x83\xc0wk\xb9\xca\x0fi\x01\x8d\x02\x80\
+\x10\x80 pm-{\xc41\x08\x00\x0a\xad\xc2D\xc3\
+\x13\x81\xe8\x01\x05\x10\x00\x84\x00\xacQ\x01\x00\x10\x00\x84\
+\x00\xacS!\x00\x10\x00\x16\x16W\x85\x09A@\x08\x00\
+\x01\xc0)\x00\x08\x02\xae5\x10\x00\x84\x00\x10\x02\x5ck\
+\x10\xc7\xabb\x01\xb1\xd7\xacu\x0b8\x01p\x0a\x80\x13\
+\x01'\x02\xae5\x10\x00\x84\x00\xac_\x5ck \x00\x84\
++\xa2\x8a\x12\x82\x80\x10\x00Q\xbd\x1a\x02\x05\x1a\x0d\x0f\
+\x10\x00\x14O\xb0\x8e\x05nh\xa0}\xf1p+\x00k\
+Y(\x02'\x00\x80\xc67\xf85i\xc8 \x00(\x9a\
+\xd0h=\x7f}-+_\x97\x93\x10x\x8c\xe6\xb7\xa8\
+h\x08\x1aTZ\xcfg\xd7\xfa\xca\xd7\xe5\x9a\x03'\x00\
+v\x0c\xb4<\x09\xd8\xd1\x00\xef\xfdMM\x19\x04\x00\xcd\
+\x1f\x8a\xed\x82\x1f\xfd[\xab^\x93k\x1b~\xd7:\x8d\
+{\x22 \xd6\xfa\x9e\xf5\xedV\x008\x01\x00\x127\xc1\
+\xb3\xff\xae\xa6\x0cN\x00\xca\xef\xfe\x15;*\xae\xfbQ\
+k\xda)\x1c8\x01\xd0\xfc!\xc9z\x1c\xb9\xa6]\x1f\
+ \x00\x94l\xfeP)\x04d~\xa8\x8f\xeb\x1e\xfe\xd5\
+*}\xaf.\x02v7T\xb8&V\xacc\xb7\x02@\
+\x00(\x13\x00\x14\x1a\x88w}\xba.\xe1?mn\x01\
+h\xfe\x80[\x01\xd0,\x00h\xfe\x10\x9fk\x07\x04\x00\
+\x05\x0c\x5cCN\x01`\xb27\xbb\x7f\xb2\xcd\x9f\xa0\x05\
+p]\xe9B\xea\xe8\xdf\xfc\x98\x17k\xc3\xda\x00\x01@\
+!i\x12\xc6\xcc\x975c\x1d@\xe3\x00\xa0\xf9k\xf8\
+\xe6\xd0\x1a2\xf7\xd0,\x00h\xfe\x1a\xbe9\xb5\xae\xcc\
+7\x08\x00\x0a\x87\xc6o\x8e\xad/\xf3\x0c\xd5\x03\x80\xdd\
+\xbf\xa6o\xbe\xad7s\x0b\x02\x80\x82\xa1\xf1\x9b{k\
+\xcf\xbc\xc27J=\x07@\xf3\xd7\xf8W\x8d\x85\x86\x01\
+8\x01\xd0\xfc5~'\x02\xb8\xb6\xc1\x09\x00\x0a\xae\x13\
+\x01\xacEp\x02`\x87`\x1c\x9d\x06\x90b-\x9a?\
+\xba\xf1c@\x0a\x83\xe6?p\x0c\x8d\xa3\xb5\x08Y\xa4\
+\xbf\x05\xa0X\x18\xbf\xa8cjGi=Bd/+\
+/\xe6\x19\x05\xd1\xd7\x83\x14\xdb\xc8\x84\x80\x1ck\xd1<\
+!\x00l\xb8\x90\xaf\x5cx\x9a\xbf\xc6/\x04X\x8f\xe6\
+\x08\xcey\xdb}!\xfb\xbdw\xcd\xbf\xcb\x98[\xd7\xd6\
+\x22\x94;\x01\xd8\xf1)|\xbb\x7f\x05\xd7i\x80\xb5h\
+N \xc8\x09\x80\xe6e\xfc\xb8?\x0f~G\x02(q\
+\x02P\xf1\x82\xbeyB\x22\xd6X\x8b\xb5h\xf7\x8f\x00\
+\xa0\xb9h\xfeXk\x9a?\xb4\xe2Q\xc0\x0an\xea&\
+\x99\xf9}v\xb9\x1d\x10m\x8e4~p\x02P\xb60\
+d\x9b\x97Y\xe3\x9ee\x1c<k\xc2XC\xaa\x00\xe0\
+\xf8_\xc1\xcd6\xce\xd1\xc7\xc67O\x8c-\x08\x00\x0a\
+D\xa99\x898\xb6\xc6\xaa\xcf8k\xfe\xf0=\x9f\x01\
+Ph[\x16\xde\xcf\xd7\xe6\x83\x92u\xd7\xa4\xc6\x0f\x13\
+N\x00\xec\xfe\x15\xda\x8ac\xe9\xb8\xba\xcexj\xfe\xe0\
+\x04\xc0.K\xc1Mw*\xd0\xfdaA\x1a?\xac\xf1\
+\xaa`\xd8\xb1*\xba\xff\xbe\x9f\xdd\xef\xc9\xad\x09\xeb\x10\
+\xc2\x05\x00\x85\x89H\x8d\xb2rCq\xadY\x870\xd3\
+\xd3\x17M\xa5\xa2d\xf7o\xa7e\xbcs\x8f\x99\xc6\x0f\
+\x0bO\x00\xd0\x8c\xba\xee2\xad<s\x02N\x00\x14\x8f\
+v\xcd_\xb1\xdd;\x07\xd6\xab5\x09[O\x00\xdc\x93\
+\xb4\xd3b\xcfx\xb8\xf6\x80\xad\x01\x00;O\xfe\x1b\x97\
+\xd5c#\x04\x00\x02@\xc3\xa6\xa6\xf9[K\xc6G \
+\x82-\x01\xc0\xbd\x7f\x85\x9b\xfdc\xa5\xe9\x01eN\x00\
+V\x16O\x1f\xa4zl\x8c4\x7f\x81\xc9\xd8@}!\
+\x1e\x05\xfcS\x81\x18\xd9\xf8\x14!c\xb4b\xfcV\x84\
+5\x8f\x0a\x06Fx\xb8\x88\xcc(l\xb7E_C\xf4\
+\xc0\x1f\x01\xa0\xe2\x9ce\x9a/_\x07\x84\xa4\x01`\xd6\
+\xc5;\xf2\xc2\xfd|\x8d\x95\x8a\x81\xe6o\xee*\xcdY\
+\x86:\x02\x9d\x94\xf9\x16\x80{\xd7\x0a\xa8\x90\x01\xd00\
+\x00(\xee\x9a\xbfP\xe5Z\x01\x12\x04\x00\x05R\x932\
+\xbe\xbd\x9a\x9f\xf5\x06\x02\x00\x01\x8a\xbab\xac\xe9\x01\x02\
+@\x99\x1d\x06t\x0c\x01\xaeQ\xc0\x09\x80\xdd\xbf])\
+-\xc3\x90\x10\x04I\x02\x80\x06Tw7\x8aS\x00@\
+\x00@\x11G\xf8\x02\x04\x004 \x00R\x04\x00;R\
+\xcd\x9f<\xf3\x90\xe5z\xb5\x16\xc1\x09\x00\xc2\x16\xb8\x86\
+\xa0K\x00\x90\xfe\xed\xb8\xcc\x87S\x00\xc0\x09\x00\x00 \
+\x00\xf4\xe4\xa7R\x9d\x02x\xff\x80\x00\x00\x00\x08\x00`\
+\x17\xfc\x9c\xce\x9f\x03\xf0\x19\x08\x10\x00\x14\xac\xc31+\
+\x00'\x02\xc0\x8c\xc6\xa4!\x01\x80\x13\x00&\x12\xb6z\
+\xcfS\x86\xa3pk\x14\x04\x00\x00@\x00\xe8\xc3\x07\x96\
+\xb0\x13\x06\x04\x004\x14\x00\x04\x00\x00@\x00\x00\x9e\xd4\
+\xf5\x16\x93[k \x00@\x1an\xdb\x00\x02\x80]\x8a\
+F\x02\xc0to\x11\x9a\x9e\xa6\x05=\xdd\x8e\xe3\xc5\x91\
+=4\x08\x00\xcf\x04\x03\xa1\x00PS\xa0x\x00pZ\
+\x00\x08\x05\x10 \x00D>\x92\xfb\xfa\xda\x5c\xbc\x80P\
+\x00\xc5N\x00\x9e\xb9x]\xb0T\xe0~\xb8P\x00+\
+\xbdV\xbd`\xbb6\x10\xa3\x00sj\x8c:\x83\x00 \
+\x04\x80\xebB\x10\x00\x01\x00@\xb0\x02\x01\xc0E\x09\x00\
+\x02\x00\x80S\x00H\x13\x002\x7f\x98\xccE\x09\x00N\
+\x00\x00l8@\x00\x00\x00~\x0d\x00\xbeS\x0e\xac\xa0\
+\xd6@\xc0\x13\x00\x17&\x004\x0c\x00B\x00\xd8]{\
+\x9d\xd04\x00\xb88\x01!\x00\x9a\x06\x80\xcf\x8b\xf3\xf3\
+?\x86-&\x9fH6\x7f\x00\x8f:\xf5k\x80\xdf\x85\
+\x00\xc5\x0b\x18u\x0a\xa0\x9e@\xd0\x00 \x14\x00\x82\x00\
+\x08\x00O\x85\x02\x175p\xa6\x86\xa8\x1b\x90(\x00<\
+\x1a\x0c\x5c\xd8\x80\x0d\x054\x08\x00\x003\x83\x81P\x00\
+M\x03\xc0\xfbq|t\xfd\xb6B\xe7\xf7\x9e}\xde\x8c\
+\x82\xd3\x02X\xc9o\x01\x04+P`\x8d\x01\x02\x00\xc0\
+ 3v\xffB\x16\x02\x00\x00 \x00Po\xa7\x83\xf9\
+\x02\x04\x80\xe1\x1c\xa3\x01\x80\x13\x806\x04\x1f\xac-@\
+\x00\x18\xac\xfb\xb1\xaace\xf3\x04\xe0\x04\x00\x00\x10\x00\
+\xc0\xee\x1f\x10\x00\xd8j\xe6\xbdZ\x0d\xc6\x9a\xc2\xb5\x00\
+\x02\x00\x80\xa0\x05\xf1\x02\x80\x8b\xc9\xce\xc7\xbc\x008\x01\
+hUd\x85\x1f\xac%@\x00\xc0n\xd3|\x00\x08\x00\
+\xa0\xf9\x03\x08\x00e\xcd>\xba\xd5x\xac!\xa1\x0b\x08\
+\x1b\x00f\x140\x17?\x1a\x11\x80\x13\x00\xa7\x00@\xf8\
+k\x15\x04\x00\x84\x00\xe3\xae!\x01\x02\x80\x9d\x05\x9a?\
+\xc6\x1e\x8a\x06\x00\x9f\x03P\x14\x11\x1a\x01'\x00\x08\x01\
+\xc6\x19@\x00\xb0\xa3\xd3\x9c4\x7f\xbb\xff\x1e\xd7'\x08\
+\x00M\x9b\x9d\x10`\xbda\x0e\xa0]\x00\x90\xb0\xd1x\
+\x5c'\xc0\x5co\x86 \xf6)\xc0\x8af\xf2~\x1c\x1f\
+\x9a\x89]g\xb4\xb1\xb2&a\xae\xb0\x17\xd8\xacB\x9a\
+\xad\xa8\xacl(\x0a\xae\xb9\x8a>N\xcf\xbc\xef\x19\xf3\
+\xe1\x1aA\x00H\x5cP3^\xc0\x1a\x8by\xd2\xfc\x9f\
+\x1b\x0f\x1b\x08\xb8\xcf-\x00\xfe)\x9c\x8a\x5c\xec\x90f\
+|\x8c=\x8c\xd0\xeek\x80\x19\x8b\xc5\xea\x86\xac\xa0>\
+7VNh\x00\x01@\xb1\x13\x02\x84I\xd7C\xd1\xb5\
+\xa4\x1e!\x00(\xdcv\xb7XC\x80\x00@\xfd\x1d\x88\
+f\xb7\x7f<\xec\xfe\x01\x01@\x08\xd8\x16\x02\xba\x17\xf3\
+]c\xe0\xe8\x19\x98\xa1\xdd\xd7\x00\xab\x14\xd6\x9d\xcd\xb8\
+cC\xda5\xde\xd6h\xef\xe0\x0d3\x85\xfd\x1a\xa0\xa3\
+\xc3\xf8\x85\xbdCQ\xb4\x0e\x81\xaa\xc2\xdd\x02p\xd4\x9c\
+gGR}\x9ev\xbf?\xbbN`\xa6P\x05\xc6\xd7\
+\xaa\xf26\xe1J\xcd*\xc2\x98f\x1fO\xc7\xff\x10_\
+\x88[\x00v\xfc\xd7\x8aS\x84\xf1\xabp[@\x98\x02\
+\x9c\x004)\xbav\xad\xc67\xda\xb89\x95r\x02\x00\
+\xe5\x03\x80c\xd6>\x857\xe28\x0bL\x02\x80\xe6\x8f\
+\x00\xd0\xb8@T\xbc\xb8\xa3\x17_\x0f3\xd2\xfc\x05\x00\
+h\x18\x00\x22\x15\x87\xca\x17v\xa6\x22<s\x1e\xb2\x8c\
+\x83[Q\xe6\x06J\x07\x00\xf7Z\x15\xe2\x19s\x94\xfd\
+}j\xfe\xe6\x06J\x07\x00\xcd_AF\xf37?\x10\
+\xcb\xd4\x07\x01E|\xa8O\xa7\x8bZ\x0137\x00[\
+\x02\x80\xa2\xeb=S\x7fN\xec\xfeA\x00\x08]\x14:\
+_\xd0\x8a\x99\xb9\xc8>f+\xc7\xcd\x1c\xd1\xc5\x94\x85\
+\xae\xf9\xdb\xad\xd1c\x0d\xee\xfe\xc5\xce\xd1\x7f_\xad@\
+\x00(\xd2d\x5c\xccB\x80u\x98w-]\x19\xb7g\
+_\x97Z\x81\x00P\xa8\xc1\xb8\xa0\x05\x01\xcd\xbf\xf6\xee\
+\x7f\xc4\xebU'\x10\x00\x0a5\x15\x17\xb4\x10\xa0\xf1k\
+\xfe\xc0}\xa5\xbe\x05\xa0h\x183c\x0a\xd0\xe8\x04@\
+\xc1u\x1a\xa0\xf1\xdb\xfd\x03\xcfySt\xf9{,\x05\
+\x01kPH\x04'\x00a\x8b\x84\xc6\xaf\xd8k\xfcv\
+\xff\xc0y)?\x03\xa0H\x18gc#\x10\x02\xcdN\
+\x004%\x0d@\xe3\xaf9\xf7\xaem(\x10\x00\x84\x00\
+\xcd@\xd37\xdf\xc6\x19b{3\x04\x9c-\xd4\xd5\x83\
+\x80\x86d\xac\xc1\x09\x80S\x00\x9a\x9c\x0aXW\xeb\xe7\
+\xd5\x98\x83\x00\xa0ph\x1a\x9a~\xc3y4\xfeP0\
+\x008\x05 b \xb0n4\x7f y\x00P@4\
+\x18\xeb\xc3\xdc\x00A\x03\x80S\x00\xd0\xfc]\xbb\x10O\
+\xfa\x1f\x03\xf2\xddt\xc8G\xf3\x87&'\x00+\x1a\xb5\
+\x82\x029\xc2\xb4k\x15\x9c\x00\x00\xcd\x9a?\xd0\xf0\x04\
+\xc0)\x00h\xfe\xae\xd1\xdck\xc4\xfc\x09\x00\xa1\x0b\xcd\
+-\xc0\x07\x1b]$h\xfe\xae\x8b\xeek\xc3|\x0b\x00\
+\xe5N\x01\x9ey\xfd.\x004\x7f\xd7\x82ua=\x08\
+\x00\xc9C\xc0\x95\xd7l\xb1\xd3\xb9\xf9\xbb\x06\xac\x0b\xeb\
+C\x00H\x9b0G\xbc^\x0b\x1c\xbb\x7f\xac\x09k\xa6\
+}\x00\xc8\x12\x02F\xbfF\x8b\x1a\xcd\x1f\xcd\xdf:\x8a\
+\xc2\xd7\x00\x17^\x10\xbejE'\x8a6#k\xe7\xe7\
+\x7f\x8cF\x81\x13\x80\xc8\xa7\x00\xbe\xae\x88pk\x8d[\
+\x0fB\xa6\x13\x80\xe4\x93\xf7\xcc\xe2^\x950\xa5X\x80\
+q'\x03F\x22a\x00\x88\x94pW/\x22\x0b\x17\xbb\
+\x7f\xb0\xa9\xda\xe9\xa5\xd3\xe4}W\x98\x22,\x1c\x05\x93\
+J\xd7\x9b\xf5\xfc\xd8\x98\xdf\x9a\xd5_\xb5T\x00\x08\xb5\
+3\xf1\xb5\x174#k9\xc2X\xdf\x0a\x7f%[-\
+\x8d\xeb\xb5\xe3\xc5\x18\xf1\xf8\xdd\x11\x16\x02F\xad1\x88\
+\xf8\xf9#\x08y\x02\xa0pH\xb0\xd4\xba\xce:\xae\xe3\
+l\x0f\x0d\xabZs\xd5\xd0\x84'\x00&M\x10\xc2u\
+\xd6a\xc7\xef\xfaG\x00@\x11\xc0\x1a\xd6\xf8a\x8b\x97\
+\xa8\x17\x95\xa9\xb1c\xa3\xc6uVq\xfdV\xf9:\xa5\
+[\x00N\x00L\x9eb\x83`I\xb0\xebq\xf6\xdfQ\
+W\x08{\x0b@q\xfa\xf7bu\xc1\xa2a\xba\x06a\
+\x94\x97\xe8\x17\x9c)\x12\x8e\xa8q\x9de]\xb7\xbb\xeb\
+P\xb4\x9f6W#\x05\x00!\xc0\x22G\x08(\xbff\
+\xa3\xd4\x9fg\xc7\xad{\xddT\x1b\x1f\xf3\x96a\x22\x85\
+\x80\xdf/r\x8b\x1d\xfan>\xd4G\xca\x9e\x00X\xe4\
+R/N\x01\xd4\x9a?\xc7-\xe2k\x8c\xb4YS\x0b\
+\x05\x00!\x00\x84\x00u&@\xedY9\xaej\xe0\xe3\
+\xde2-.\x17\xe7\xe3\x05\xccE\x00\x1a\x7f\xd4p`\
+\xbc\x9d\x00\xa4\xbfP3,jA\x00\xa7\x00\x9a\x7f\xc4\
+\xf9\x9c5\xeej\xde\xe3^\xab/\xb2\x95\xaf#\xe2\xc2\
+\xf3\xdde\xa2^c\x11\xd6\xa5kC\xd3\xed\xec-\xeb\
+b\xdbu\xe1\xde[\xe8QoU|}M.\xd6X\
+\x8d\xc6|h\xfe\xc6\x9e\x1d^,\xa29)7\xc3\x02\
+\xd7xb\xad\xcf[\xc3\x9f\xe7\xde\xf5\x9e5\xa0\xbd\xf3\
+8s\xfc\xd5\xb5&\x01 C\x91\x12\x044}! \
+\xd6{\xd6\xfc\x05\x00\xfe\xcf\xcf\x01O^L7O[\
+l\xd1\xf4G}\xd6\xc2\x5c\xcc\x9f'#a\x9e)r\
+\x020\xb3hv{\x06\xb7\xe4\x1cg>#\xccE\xa5\
+o\x03h\x08}N\x00\xd4\xb5f\x01`\xf4\x82\x9a\xb9\
+`\xa2\x17\x22\x17K\x9c\xb9\xebr\x7f|\xf6\xfb\xd4\xfc\
+\xe3\xcd_\x97kI\x00HV\xb8\xecF\x5c,\x91\xe6\
+\xa9\xc3\xfd\xf1\xce\x81\xdb\xee?\xefZ{\xe4}D\xaf\
+\xa5\xe5\x0a\xfd\xd9\xc5\xb5c\xa22<s\x5c\xc3\xef3\
+\x17\xd5\x9a\xbf\x00`\xf7?c\xdd\x9dy\xfdQkj\
+\xd9B\xff\xcc$\xed\x9c\x1c!\xc0\xb8wn\x92\xd5w\
+\xff\x9f\xef\xafj\x10\xc9\x1a\x00v\xbc\xf6\x885\xb5\xfc\
+N/\xcb\x03X\xa2\x15\x88\x9bgD\xb4\x08\x01\xbb\xc7\
+\xa9j\x00\xf8\xee}Y\x93yk\xdd\xa8\xd7\x1c\xad\xae\
+\xba\xd7\xabq\x09G\x0d\x03@\x87\xcf7D\xbb\xa5Q\
+i\x1d_\x9d\xbbL!`\xf4k\x8dT[=\x07\xa0\
+\xc9N/k\x18\xd2\xfc\xc7\x17\xa1\x8e\x1fn\x8c\xf0\x9e\
+*\xbc\xe7\xdbq\xbc\xdc\x9a|v\xacC\xfd\xd1l\x9c\
+\x06\x84,V\x1a\xff\xf8y\xe9v\xba\x14\xf5\xbb\xe6>\
+\x7f\x12{\x0cV\xfc\x9eK\x94\x10%\x00\x08\x02\xa1\x16\
+\xa8\xc6?g^:\xdeZ\x8a\xfa\x18\xe3\xce\xc1\xde\xb5\
+\x1ek.\x04\x00A@\x00(\x5c8\x22\x8dg\xb5g\
+\x1aD?\x8d\x89~T\xefZ\xdf?G\x02\x80 \x10\
+fa*\x08c\xe7\xa7s\xf3\x8f\x1e\x00f\xbc\xbe\x8c\
+\xf7\xe6]\xf3{\xe7M\x00\x10\x04\xec\xfe\x8b\x15\x0e_\
+)\xcd\x13\x94\xab\xfdz\xa4\xeb>\xd7<\x0a\x00.\x1e\
+\xbb\xff\x22EC\xe3\xef\x13\x02n\x9e\xe2*\x04\x0c\xf0\
+\xa6\x8cB\xde\x82\x19\xf5Is\x9d\xbe\xce\xfau\x1e\xae\
+\x8c\xd5\xbd9\x8c\xf6\x89\xfc\xd1\xaf\xa7\xfaS\x13#r\
+\x02 5;\x01\xa0t\xf3\xf7\x81\xbb\x9c\xbf\xbe\xd7\xb1\
+&\xac^G\x02\x80\xe6\xbf}\x11j\xfe\x0a\x98\x10P\
+\xf7\xba\xaa\xf6\xd4\xc0J\xebH\x00\x10\x00\xec\xfe)\xbf\
+\x0b^\xb5\xc6\xfc\xb0\xd8\xbc\xf1\xe9T'V\xad#\x9f\
+\x01\x00\xca6\xfe\xaf\xaf\xb1b\x03\xc9\xf6\x9e\xfe~\xbd\
+\xcf\xac\x1d\x9f\x11p\x02\x80\x13\x80\x94\x8d\xd1\xcf\xc1\xf6\
+h\x98+\xc6\xa3\xe2Zzv\xdc:\x84\x80\x15k\xc9\
+\x09\x004m\x86\xde\xef\x9c\xe6\xdc\xf1\xf9\xf9#\xdf\xdb\
+#\xe3\xd7\xe14`\xe6Zr\x02`\xf7\x1f\xa2\xa8g\
+\xbf\x80\xab\xfe\x08L\xe5\xc6\x9f\xed\x14\xa0\xeb\x91w\xc7\
+kk\xf5\xb5&\x00(b\x02\xc0\xc2\xf1\xe9\x14x\xba\
+\x86\x80Qc\xe4^\xf7s\xe3)\x04\x08\x00\x02@\xb2\
+\xe2\x1e\xfd\xa2\x9d1&\x19\x0bU\xa5\xe3\xfe\x0c'\x00\
+\x9a\xbf\x10\xb0\xe2\xfa\xf3\x19\x008\xdc\xcf66=\xc2\
+I\xf6q\xb9\xb7\x16}S\xc0\x09\x80B\xe1\x04 |\
+#\xab\xfe\x9d\xed\xce\x0d\xf6\xcc\xb8iX\xe3\xc7\xb8\xda\
+\x98\xce\xb8\x1e\x05\x00E\xac\x5c\x00\xc8\xd2\xb8\x22\x17(\
+\xcd\x7f\xcd\xd8i\xfcs\xc7Z\x08\xf8\x9d[\x00\xfcq\
+\xb1\xac,\xfc\x8a\x9f\xc6\xdfy\xad\xed|MU\xbe\xa9\
+p\xaff\xcd|\x00T\x85\xe7|8\x01P\xcc\xb65\
+\x84J'\x19\x15\x1aS\xe5{\xfd\xd1v\xff\xd5o}\
+E\xfb\xf1\xa1\xd1\xafg\xe7Oq\x8f\x9cO\x01@1\
+\xdb\xb6\xf8:\x1f\xffG\x0a\x01\xd5?\xe4\x17\xad8\xfb\
+a\xa2\xbcc\xff\xdb\xdf\xc8\xf8{\x13\x02\x80\x82\xb6m\
+A\x0a\x00{\xe7\xb3\xc3\xa7\xfb#5\x7f?K\x1c\xe3\
++\x98g^C\xb4\x93\x9dQ\xf3,\x00(h\xa5\x0a\
+b\xd6\xa6\x96\xf1\xf7\xda\x8dk\x9c\xe6\xef7\x19\xe6\xcd\
+G\xc4\xdf)\x10\x00\x04\x00\x8a56;\xc4\x9a\xbb\x7f\
+\x9fu\xd93OWv\xed\x19~\xb6x\xc4\xfc\x0b\x00\
+.\x16\x01\xa0\xc1\xdcv{\x98O\xe5\xe6\xef\x9b\x1a\xf1\
+\xc7*K\x98\x17\x00\x5c$\x9a\x7f\xe1\xf9\xed\xfa\x14\xbf\
+\x08\xbb0s\xd9\xfb\x1a\xc8\x10\x02^\xb5\x0d\xa8\x17b\
+n\xc7\xf1\xa2\xf9k\xfe\x82<N\x00\x148\x85\xa3\xc9\
+\x1c+\x9e\xfbw^#\xff~\xe7\xf9\xac0\x8e\xd1O\
+\x01\x04\x00\x05N\x00(0\xcf\x95\xc3O\xb4G\xebj\
+\xfe\x82@\xa4\x1a}\xe5=y\x140$\x084?\x15\
+\x94\x0e\x9f\x04\x1f\xfd)\xed\xe8E_\xe3\xff~<F\
+\x8c\xef\x8a\xc7\x9dg\xda\xa0YhR\xb1\x13\x00\xac\xe5\
+\x8bkL\xf3\xcf\xb3Vf\x8dq\xc6\x07z\xf9\x10 \
+\x9a?\xdb\x8ay\xa5\x07[]\xfd\xb7\xad\xe15s0\
+c\xcde\xdd\x90\x09\x00\x1a\x1ep\xe1z\x9b\xf9|y\
+\xe2\x87\x80\xcc\xa7\xb1\x02@\xf2\x0bA\xf1 \xeb\xee\xdf\
+\xfb {\x08\xc8>\xff\x02\x80 \x00\x9a\xe6\x89f\x13\
+\xf9~\xb4\x10\xd0c\x1d{\x10\x10\x82\x00$l2\xae\
+\xd5\xfdcx\xb6\x89W9\xf9\xb1\x00\xed\xb6\x14i\xac\
+\xc9\xc5\xbb\x7fk6\xd6\x9a\x8a\xf6\xac\x89Uk\xc8\x22\
+t\xa1\x08\x00X\x7f\x8b\x9a\xbf\xb5\x9a?\x04T\x0a\x00\
+n\x014\xf3y\x9b@!\x02l\x04z\xbfWM\x80\
+\xd4\xa7\x03\x82\x8c5f\xf7\xcf\xaa9\xaa\xf0\xc1\xbf\xaf\
+<\x0a\x98_\x17V\xe4\x82\xad\xa0j\xfe\x82*\xdf\x8d\
+\xb5[\x9d\x02\x00\x85C\x81\x82J\xa6\xdd?yBj\
+\xc4\xda2\xeb5\x09\x00\xa4+\x90\x9a?v\xfft8\
+\x05\x98\xbdv,L\x96\xa6k\x85\xd4\xfcw\x0a\xb7+\
+\x7fx&\xcb\xf5\xb1\xf2\xb5\xcf\x98\xb7J\x1b\x1d'\x00\
+\xd8\x09\xa1\xf9'y\xed\xf7~69\xfa5\xf6\xd3\xeb\
+\xff\xfc\xbf\xab\x11k\xc7\xc0\xd7\x00\x01&\x14\xde\xd1\xff\
+\xde#A$r\xd0\xda\xf1\xfa\xcf\xceA\xc6\x9f\xf6\x15\
+\x00\x00\x02\xec\xfew4\xff\xc8! \xe3\xeb\xef\xf0\xa1\
+O\x01\x00h_H\xab\x1d=g\xb9m\x91qng\
+\xae\x95\xd5c%\x00\x00\x04n\x10\x99\x7f\xb0&\xcak\
+\xf7\xd9\x02\x01\x00\xe0\xe1\xe6P\xe1\x08x\xe7{\xa8<\
+~U\x02\x85\x00\x00h\xfe\x85w\x9a;\x1aq\xc4\xe6\
+\xef\x14@\x00\x004\xeev\x0daeC\xf6\xc4\xc4<\
+\xe3\xe79\x00@\xcabv\xf61\xd5\x8f4\xfe\x8aM\
+l\xc5s\x02F\x8d[\xa4p\xf6\xd3\xb8Ux\xda\xa0\
+\x00\x008\x19\x08\xfc\xb7G6\x9a\x99! \xcb\xb7=\
+\x9cP\xfc\xc7-\x00\x80F\xc1fF\x03\x1c\xf9o\xba\
+W/\x00\x00li\x10Qw\x88QC@\x87\xe6\xbf\
+zM\xac\xfa{\x02\x00@\x92\xc6\x15-\x04dl\xfe\
+#\xffN\xf6\xd3\x0a\x01\x00\xa0i\xd8\xb8\xd2\xc0\x1d\xfb\
+\xe7'\x00\x00S\xf8\xb0U\xdd\x10\xa0\xf9\x0b\x00\x00\xed\
+C\xcb\xae\x06\xb6+\x04Th\xfeg\xfen\xc5@+\
+\x00\x00\xb0\xfc\xe7z\xab\xec\xfc3\x7f\xadR\x00\x00\xda\
+\x17\xdb\xac\xaf\xe7v\x1c/\xabN\x024\xffz\x04\x00\
+\x00~m\xf4\x9a\xbf\x00\x00\xd0\xaa\xf1e1\xf3'\x88\
+\xab~\x98S\x10\xf1(` i\x93V\xc0\xffmh\
+Q\x1f\xf0c\xce\x04\x00\x80\xa9;\xf6\xee\x0d&\xf2\xb3\
+\xee5\xff\xebk|\xf4\x18\x9a\x10`Y\x83\x8e\xdcp\
+2}\x050\xfa\xd8W\x1e\xa7\x9f\xde\xcb\xae1\xbf2\
+\xb6\x02\x00P\xba\x09=Z \x9f}\xbd\xd1w\xb4\xd9\
+\xc6?\xcb8E\x0b\x00W\xc6\xdb\x87\x00\x01A\xa4\xa0\
+\x08\x8d\xd7\xb1\x7f\xec\xf5.\x00\x00\xe5\x9b\xae\x10\xa0\xf9\
+\xbb\xfe\x04\x00@Q\x14\x024\x7f\xeb]\x00\x00\x10\x02\
+4\xff\x9e!@\x00\x00\x14D!@\xf3o\xb8\xe6\x05\
+\x00\x00!@\xf3oH\x00\x004\x03sc\xbe\x05\x00\
+\x00*\x9bq\x1b\xa4\xf3\xad\x15\x01\x00\x80\x96\xcd_\x08\
+\x10\x00\x00\xfe\xe0X\xb8O\xf3\x17\x02r\xaew\x01\x00\
+@\xf3\x17\x02\x9c\x00\x00\xd4\xde\x15ukP;\xde\xaf\
+\x87.\x09\x00\x00n\x054\x0d;B\x80\x00\x00p\xdc\
+\x8e\xe3E\x10\xe8\xd7\x80\x85\x00\x01\x00\xe0\x8f P!\
+\x0cDnn\x91^[\xd7q\xca\xb0\xc6\xdf\x94$ \
+\xd2.\xc9\x87\xc8\xea5\xdc\xf7\xe3\xf8\xa8\x10\xfa\x9e}\
+\x0f_\xff\xf7\x11\xe7E\x00\x00B\x17Y\x81\xa0\xcen\
+\xbb\xf3m\xa0\x88\xebZ\x00\x00\xd0\xfc\x7flX#\xff\
+\xdd\xee!\xe0\xdei\xc2\x8cP\xf0\xdbx\xfb\x0c\x00\xc0\
+\x91\xfb\xdb\x0a#\x1b\xc7\xdf\x9f\xd1\x18=.QN)\
+\x9c,\x09\x00\x00v\xfe\x8b\xc3\x91\xe6\x1b#\x84\x0a\x00\
+\x80\xa6\x99\xb4\x91\xcd:\xf6\x17\x02\x9c\x00\x00\xd0d\xe7\
+\xffH\x83\x17\x02r\xcd\xa9\x00\x000\xb0\x09Fhb\
+;\x9a\xff\xac\x10\x90\xa5\xd1V\xfc\xf0\xa2\x00\x00\x94k\
+\xcav\x89s\xc7w\xe4\x9c8\x05\x10\x00\x00R7\xd2\
+.\xcd_\x08\xa8\x13\x9e\x05\x00\x80\x86\x0dlD\x03\xcf\
+\x18\x02\x1c\xff\x0b\x00\x00\xa9\x8a\xfd\xe8\xef\xfaG\xfc\xb7\
+\x9c\x04\x08\x00\x00$h\xfeB@\xcc9\x16\x00\x00\xbb\
+\xf2\x85EwV\x01\x8f\xde\xfc3\x85\x80\x95\xb7\x19\xfe\
+\xfeO\xc4\xeb\xcao\x01\x00|\xd3\xcc\xaa\xedDW\xdc\
+\xda\xe8<n\xf7\xde\xf7w\xff\xfd\xee\xdbMN\x00\x00\
+\x92\xed0#6\xff(Mm\xc7\xdc\x9c\xfd\xb7g\x9e\
+\x10<2\x0f\x02\x00\xa0i\x17\xb6\xa3!wyvC\
+\xe4\xe3}'\x00\x80F\xd6\xb8\x89\xed|\x0f\xc6O\x00\
+\x00h%\xca\xc3z\x224\xaf(\xaf}\xc6.\xbd\xc2\
+\xc9\x91\x00\x00h\xda>\xf0W\xf6\xb5tl\xfe\x8f\x8e\
+\xb9\x00\x00hl\x83\xff\x9e\x1f\xeb\xc9\xff\xfa;|\x8e\
+\xc1\x8fl\x00v\xea\xbf\x14\xfd+\x7fs\xe5Qv\x86\
+\x86\xb5\xfa\xf5\x9f\x9d\xbb\xdf^K\x86\xd3\xa2G\xc7\xd2\
+s\x00\x00\xcd\xffN1\x8dR\xf4\xb3\xefJ\xfd\xb2\xa3\
+\x13\x00\x80\x90\x8d\x7f\xc6\xceO\xd3\xcb\xb5n\xba\xec\xfe\
+\x8f\xc3g\x00\x00\xcd\xdf{\xb0nZ\x12\x00\x80\x90\x05\
+<Z\x11\xbf\xb2\x93\xd7\x90r4\xffn\xa75\x02\x00\
+`\xf7\x06\x05\xd6\xe5\xb3\x01F\x00\x00\xec\xfa\x9d\x02\xd8\
+\xfd'\xbf\xf7\xef\x04\x00\xb0\xbb\x12\x02\xac\xa1\x85s*\
+\x00\x00 \x04\x14\x1c\xd3,\xf3u&\xc4\x08\x00\x80\x86\
+x\xac}Z\x9d\x10\x10g\xfdt\xfe\x9a\xa6\x00\x00\xe0\
+$@\xf3o8G\x02\x00`\xf7\x7fb\x178b\xe7\
+(\x04\xd8\xf9\xefZ\xbf\x02\x00\xd0\xde\x95F \x04\xd4\
+\x0d\x8e\x95\xef\xfd\x0b\x00\x80\xe6?\xa0\x81\x0b\x01\xf9\x9a\
+\x7f\x95\xa3\xff\xabk\xcf3\xaa\x81\xd2;\xb9\x99\x8d{\
+uc\xb2^\xf27\xff\xbf\xff\xfe\xce\xdf\x98\xf0k\x80\
+\x80]\x7f\xb0\x06'\x08\xe4\xdc\x91\x8fZ\x8f?\xbd\xdf\
+\xd1\xeb\xc2\x22\x03\xda\x14\xf6\xd9\x8du\xe4\xfb\x11\x02\xd6\
+\x8f\xe9\xea\xdd\xffn\x16\x18P>\x00\xac,\xbcB@\
+\xceq\x5c\xb1\x16\x05\x00\x80\xe2\xbb\xae\xd1\xef\xa9[\x10\
+\xd0\xfc\xd7\xf0-\x00\x80\x09\xc5~d\xc1\xef\xf4-\x01\
+\xcd_\x00\x00\x1a5\xcb\xcc'\x0c+\x1bc\xe5 P\
+\xfd\xfdE\xe4\x16\x00Pj\xd7\x17m\x176\xeb\xbdU\
+\xb8-0s\xde\xed\xfe\x05\x00@3\xb8T\x88\xef\xbd\
+\xae\x08\x8d&[\x18\x880\x1e\xdd\x9b\xbf\x00\x008\x05\
+\x18\xf4z\x04\x81<\xf3[\xf1\xdb'\x02\x00 \x04\x5c\
+,\xcaW^C\x94\x9dg\x94\x06\x14\xf1\xbdj\xfe\x02\
+\x00 \x00L\xfb\xfb\xd1\x9e5\xbf\xba\x19E}\x7f\x9a\
+\xbf\x00\x00\x08\x01/\xb3\xfff\xf4\x1f\x9c\x19\xd5\xa42\
+\xbd\x0f\x01@\x00\x00\x9a\x07\x80\xafE\xba\xc3'\xd1+\
+:\xd3d}\xf0O\x00\x00\x84\x80p\x8dJ\x10\x98\xdb\
+`5\xff\x7fy\x10\x10P\xa6\xc8g\x0e3~\xfc'\
+\xf7\x18e\x9c?\x01\x00 P\x08\x10\x04\x8c\xcb*\x06\
+\x14H\xdf8\xab\xeeb\xbb\xdf\x16\xc8\xf4{\x0a\x19\x03\
+\x8a\x00\x00\x08\x01\xc1\x1b[\xb7 0\xa3\x99\x0a\x00\x02\
+\x00 \x008\x0dh\xd6\xfc\x85\x00\x01\x00\x10\x02J4\
+\xbcj\xe3\xb1\xaaq\xfa&\xc0\x9f\xde\x94\x16\x80\xfd\xe1\
+\xe6\x99\xc6\xf1\xf5\x7f\x9b5\x0c\xf8P\x9f\x13\x00\x80\xf6\
+\xa7\x00\xa3\x1ac\xf41\x8a\xd0\xf4\x9d\x02\x08\x00\x80\x10\
+P\xbeQVy\xdcp\xc65\xe4\xc7\x80\x00\x84\x80p\
+\x8dd\xf4\x18f;\xcew\x0a \x00\x00\x02@\xeb \
+pfLW6\xb6\xbf_W\xa6\xe7\x02d\x08\x01\x02\
+\x00 \x04\x08\x02\xe9\xe6\xf6\xea8\xb8\x15 \x00\x00B\
+\x80 \x90t.3\x84\x00\x01\x00@\x08\x10\x02&\xcd\
+]\xe4oN\x08\x00\x00B@\xeb\x100s\x9e\xa2\x9f\
+\x04D\x9d#\x01\x00\x10\x02\x84\x80\xf4srv\x0c:\
+\xdf\x06\xf0$@\x80'\x8ax\xf7\xb0\x115|\xbd\x1f\
+\xc7\x87\x1fYr\x02\x00hDSwo\x11\x1bG\xb6\
+\xaf\xc8\xed\x1e\x87\x95\xef\xd1-\x00\x80d!\xe0\xb7\xc2\
+\x1d\xadI\x8eh2\x15v\xc4\xf7\xc6!\xcb\xad\x09\x01\
+\x00`C\x13\xcb\xf83\xbdY\xbe\x17\xbfs,v\xbc\
+\xc7\xc8\x01\xe0U\xb9\x00*\xb9Zp\x9f\xfd\xff\xaf\xf0\
+}\xfcj\xf7\xc2\xff~?\xef\xc7\xf1\xe1\xb3\x1bN\x00\
+\x00'\x01%w\xd1\x91?\x05\xbfk<\xfc\x18\x92\x00\
+\x00\x08\x02\xcb\x0a\xf5\xae\xa6s\xe6=\xd8\x15\x0b\x00\x00\
+l\x08\x1e\x02\x80\xe6\xbf\x93\xcf\x00\x004l\x00\x9a\x7f\
+\xef\xe6/\x00\x00Ln\x047'\xad\x9a\xbf\x00\x00 \
+\x08\xa0\xf9\x0b\x00\x00\xb4l<\xe6 \x06\xbf\x05\x00\xd0\
+\x8c\xfb\xff\xc2\x97\x13\x00\x00h\xd8\xfc\x05\x00\x00h\xd8\
+\xfc\x05\x00\x00h\xd8\xfc\x05\x00\x80\x02\xdc\xd3_\xd7\xf8\
++}\xe0\xd2'G\x01\x8a6\xe9H\xbf\x8a\xf7\xcc\xeb\
+\x8c\x18h*~\xd3\xc2\xb7\x00\x00\x84\x0e\x0d\xb5Y\xf3\
+w\x02\x00\xa0\x19\x87l\xa0\x11\xc6\xab\xfa\xf3\x15\x04\x00\
+\x00\x01 d\xb3\xcc\xf8\xf3\xca\x99\xb8\x05\x00\x80F\xd9\
+\xa8\xf1\x7f\xf2-\x00\x004\xe3\xa3\xdf#\x95\x05\x00\x00\
+Z\x87\x80\xae?\xd6\xe4\x16\x00\x00\xc2ECN\x00\x00\
+h\xd5\xa8\xfd<\xf3\xff\xf9\x16\x00\xc0\x02\x15\xbf\x05\xb0\
+\xba\x89^\x1dCM\xdf\x09\x00@\xf9fi\x0c\x8d\xff\
+=>\x03\x00@\xba\x10\xf0\xe8i\x80\xc6\xff3\x03\x03\
+\xb0P\xa5[\x01\x91\x9a\xeb\xfbq|h\xf6\x02\x00\x80\
+\x10\xd0,\x00 \x00\x00\x08\x02\x9a?\x02\x00\x80  \
+\x00 \x00\x00\x08\x03\x02\x00\x02\x00\x800\xa0\xf9\x0b\x00\
+\x00\x08\x04\x9a\xbf\x00\x00\x80@\xa0\xf9\x0b\x00\x004\x0e\
+\x05\x9a\xbf\x00\x00@\xa3p\xa0\xf1\x03\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\xc9\xfd\x0f\x01\xc3\xdaOj\xde\x22<\x00\x00\x00\x00I\
+END\xaeB`\x82\
+\x00\x00\x0c\x10\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x01\x90\x00\x00\x01\x90\x04\x03\x00\x00\x00r\x91+\xff\
+\x00\x00\x00\x1ePLTEGpL\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00ZU\xc4^\x00\x00\x00\x09tR\
+NS\x00\xdf\x12\xae\x8bFj\xc6+s\x1bCt\x00\
+\x00\x0b\x98IDATx\xda\xed]KS\x1bG\x10\
+^\x16=\xd67H\x1c\x88n\x12e;\xc5\x0d\x17\xd8\
+\x94nv\x0a\x1b\xef\x0d;A17R\x06*\xbaQ\
+\x89\x8d\xb37\x85\xd8\xc4\xdc\xb2\x81D\x9e\x7f\x1b;N\
+4\xb3/i\xa6g\xa6g5\xe9\xef\xac\xdd\xd5\xd7\xef\
+\x9eg\x10\x10\x08\x04\x02\x81@ \x10\x08\x04\x02\x81@\
+ \x10\x08\x04\x02\x81@ \x10\x08\x04\x02\x81@ \x10\
+\x08\x04\x822\xc2\xb7\x83\xa3\x9d\xcd\xcd\xd7\xaf77\xb7\
+vN\xf6\xcf\xe7\x92Dtq\xb4\xddaY\xacn\x9d\
+\xbc\x9b3U\x0cv\xf3$&d\x1e?\x9b\x1b\x1a\xb7\
+_T\xb1\xf8\x84\x9f\x8e\xbbsAc\x97\xcd\xc4\xf8Q\
+\xd7\x07\x1as@%\x9aaT\x22>\xff\xa1\xbe<.\
+\x12\xa6\x82\xb3QM\xd5\xb1\xcb\x141~RG\x1ew\
+\x12\xa6\x8e\xb3\xfay\xca7\x0c\x84\xab\xbd\x9a\x99\xd5C\
+\x06DZ+\xf3j\xf6\x19\x1c\xf7\xea\xc3\xa3\x950\x1d\
+\x9c\xd5\xc6\xcd;L\x0f+\xf5p\xf9[\xba<\x18\xbb\
+Y\x07&\xb7f\xfe\xcd\xe5\xe5\x99?\xb9\xee\xd6Y\x1f\
+\xe9\xea\xd6\xe3\xfd\xe7\xe7kkk\xe1\xda\xbb\xfd\xc1\xce\
+\xf6r\x8du\xd2\xaa\xe2\x91n\x1d\x9f\x17;\xc6\xa3\xbb\
+\x95~\xe28\xeeV\xf0xY\xd9r\xdc>Jj\xc8\
+\xa4Y\xfa\xa7\xd2\xfb\xcf\xa6\xb7\x8f\xe5jy\xe5\xb0\xa3\
+\x8d\xcb\xfe\xd0\xfd\xd9U\xc7\xa04\x81~\xed\x8c\xc8\xb0\
+\xcck\xa5Z\xf2\xf0\xdb2\x9b<t\xc4\xe3;\x9d\xc2\
+\xbc\xac\xe8\x1f\xbb\xa9 \x1b%>\xae\xd2*\xbd):\
+\xd8u=\x02V\xfaH\xf1\x0d\xc5\x92\xf9\x0b\x07D\x0a\
+\x8e~\xa5n\xe2/\x0aL\x1e\xa0\xf3xZ\xf0rH\
+\x07\xfe&\xaf\xd6t\xcf\xb5\x83\x00+\xd8B\xe5\x8c\xec\
+&Qb*\x9b\x15r\xea\xcfN3\x88F\x97W\xe8\
+.\x0f\x1d\x1a\x96V\xb7\x9agr\xed\xce\xb04\xbb\xee\
+<\x13<\xe3:0\x5c\xed\xe5\xfd\x04+r\xb5\x8c\xd7\
+\xdf\xb9\xae\xe6/$\x22}\xf3&\x9ds\xba\x0d\x14\x1e\
+_e\xf3\xf9\xc8\xc8K\x7f\xcdV\x8f\x18\x8do\xd4\xb1\
+\x92\x89\xb3\x95\xc2\x97\xe8\x9en\xac6\xca5i{\xc8\
+\x9en\xb0=\xcd\x86.\xfb\xfe>\xb4\x96\xbb\x1a\xa8\xf9\
+\xbda\xb1T}\x8a\x99\xdfc\x9b\xcdC\x8c\xd7\x994\
+\xac\xdaq\x0bO%b.\x1c\x8f\x8c\xbf\xfe7\xac\xac\
+\xb8h[\xf7\xa2q]!)\xc4J\x80l\xe1\xa8D\
+\xf4\x90td\xe5\x13\xbf\xa0x\x89\xa8\xf8\x1f\xed|\x22\
+L\x10\x02W\x03\xc3\x80\x17\x11T2D\x89\xf2\xb1\xf5\
+\xf4\xde\xc2)\x85\xec\x7f\xe6\x00\xa98\xb5\xfd\x9dHx\
+\xff\x9fV\x1b\x1e\xe1C\xef-\xbc\xbfg=\xf4\x96\x84\
+\xe0\xd4B\xab\x98\xa0\xf5ob\x0fzj3,\xda\x10\
+S\x95\xf2\xcd\x87y!\xf6~f\xbby\x0b;\xf6\x22\
+p\x13Q!\x19/1\x1dW\xd6\xedF\x92)\x81\xab\
+k\xcd\xd5G\xf6\x89\x04\x97\xb6\xdc\xbd\x81\xaa\x90\x8cJ\
+\xcc\x16\x5c\x07\xd8#\xcc\x96>\x18\xa2\x0f0\x0b\x15\xd7\
+\x1f\x06_\xdb\xc6\x9fv\xe5E\xf0\xd8\xca[\xaf\x90x\
+\x88\x09\xf8\x81\x0d\xd7;\xc5\x22\x22\xc4Is\xe1e\x01\
+3\x19\x16\xeb\x94\xd4\x82e\xbdG\xe3!\x9a\x81)\xdb\
+j\xba\x99:\x1e\x1a/S\x16\xdc,Kh\x18\xb7\xad\
+\xd8\x81\xabg\xdd\xfd\x81ic\xed\xa2\x12Y7\xec\x9a\
+\x0b8\xad\xfa4\xdfL\x0d;\xdd\x06.\x11a\xa8\xd9\
+D\x90\x09-\xc4se[0Qo-\xbaH\x22y\
+\xef4Q\x19]:\x5c\xa6\x17\x9b\xec\xe6\x12g\x96%\
+\xda\xd6\xa9\xc1\xd0\xf1\x1e\x9fHd0`.8\xb4,\
+\xc1\xb6\xf4\xcda\xe8\xd0\xb2D1j\x07`W\xd90\
+o\xd8\xbf\x1b\xab\xdc6\x5c\x10\xe19Q\xb7^]w\
+Tg\x15\xbfo\xca\xdb\x9c\xac\xbf\x17-B/\xd6\xf0\
+\xfad\xc9\x0d\x91\xa0c\xc6I\x1a\xce7\xa9\x0c\xcd\x98\
+\xc4\x0d\xa7\xc1\xf7#\xdaf\x9cd\xe84\xf8f\x03\xf0\
+\xa1\x11\x0b=uE\x84\xd7zKF\xc41\xab\xfa\xbc\
+8\x86\xd4\xa7\xd1\xe0\xb9|\xf5\xadc\x14\x0b\xb2\xe3\xaf\
+\xdf\x83vz}\xdc>\xfeJ\xdaIt\xdc\xf4R\xb2\
+\xf2\xfd\x0a\x14V>-\xa0\x99U1D&z\x92\xbe\
+\x9c\x8b\xfc;y\xa9Z\xc4\xf4\xe4\x9a\xbfD\xbfH\x0a\
+%\x85\xb1\x08\xeaG\xff\x9b\xbb=\x945\x0bx\xe3\xde\
+\x90t\x91\x03\x90\xc8z\x92\xff\xaf\xad\x9f\x12\x17$\x03\
+F\x1f2D0\x99L\x9f5\x07\xd6\xd4\xf7\xf6\x03\xc9\
+\x10\xde\x81XqOz\x84\xa4\xa3=\x9b\xd8\x97K\xaa\
+!d\xd4\x86\xafn\x989\xb56\xd4\xf5\xf6P\xb2\xcc\
+\x09!\x0bC{\xf2s\x847t\xbd\xbd%\xebe\x1d\
+u\x95\x84\x0a\xcf4tg\x94\xdb\xb2\x03A}u\x95\
+\xf4\x14&\xbc#\xdd\xf9\xddK\xd9\x8a\xf1RyY\x92\
+\xb8\xfeg\xb6\xc1$\x9a\xb9=\x96\x8d\x16\x8b\xca\xcb\xa7\
+{JKI\x0f4\xdb\xddD\xba\xa5\xe9(\xaa$T\
+{\xe0\x86^3\x11\xc9g\xd4\x9e\xa2J\x14\x7f\xdf\xd0\
+\x1b\xb5m\xc9?\xae(a\xc5\x9fs\x91\xfe\xa5\x17\xb4\
+\x96L\x8bXU\x81\x13\xd3\x85\x85\xadu\x05\x17S\x92\
+\xb1\xaaB\x84\xb0\xd3\xd5\x1ax\x18\x19\xb6ze\x85\xf0\
+\xf8\x0e\x1a\x80\xe8\xab\x14\x9d\x0aRVW\x08/\xc3A\
+\xd5\x96Z\x1b /fu\x85\xf0\xb0\x05\x19nl\xaa\
+\xc5<i9\x03\x14\xc2\xc3\x16d$\xa5\xa18\x9e$\
++h\x80Bx\xd8\x824\x89m\xc5\xba@R\xd2\x10\
+\x85\xf0\xb0\x05\x89\xbf\xeb\xaa}\x99\x9c\xa8A\x0a\xe1\xd5\
+\x16 \xfe*?+%k\x98B\xd4\xa5Z\xa2M\xf9\
+\xcf\xc9\x08\x1b\xa6\x10^_\x03\xea\xdfD\xb9\xbe\x91\x90\
+6P!\xbc\xeeS\xaf\x7fC@\xc59[\xdc@\x85\
+\xf0\x5c\xa0\xde\xb67\x01\xa3\xf93\xe5\x0dU\x08\x8f\xbf\
+\xea\x89\xa4\xa55VU\xf1\x1cT!\xbc^R/\xe4\
+A\xee5C\xe2p\x85\x00BO\xa1NS\x0ax\xd3\
+E\x0eW\xc8$\x19\xa8\x0f\x9b\xae\x83R\xd0T\x99k\
+(\x04\xf8wD\x11(\x16\x05\xd3\x84\xae\xa1\x10^0\
+)g\xc4!\xacL\x9b\x22u\x1d\x85\xf0\x12V\xb9\xb5\
+\x8a\x81a\xa2Z\xec:\x0a\xe1AT9\xb5'\xc0\xc0\
+])w-\x85\xf0\xb4\xa6\x9c\xda;\xd0TZ%x\
+-\x85\xf0Bc\x09\xeb\xc1*\xc9\xeb)\x04.\xd8&\
+\x5cx\xe5\xa2\xd7S\x08O\xed\x7f\xa29W\xb9\xecu\
+\x15\x02\x0e>-\x8d\x91\xa42\xe1\xeb*d\x92\x0eT\
+\x8944Z\xb2\x12\xe9k+d\x92\xa0U\x87\x1f\xda\
+:s+E\xf1k+d2\xd88\x86\x12\x01t\xfb\
+E\xf9\xeb+dRl\xa9\x12Y\xd0\x9a\xa4\xcf+@\
+_!\xe0?\xb4\xae5\x90\x9f\xd3\x80\x01\x85\x80M\xe4\
+R\xef\xbbY\x15\x18P\x08o\xf4F8A\xa2T%\
+\x06\x14\x02\x0e\xa3\x9aD2J\xd86qf\x16\x94\xc8\
+\x10\xdc\xec\x17Ub\xe4\x10(h\x86\x1e\xea\xae\x88\xec\
+\x95\x12\x01+\x84\x17\x7f\x8aDb]\x22\xa5*\xd1\xd8\
+\xf3\xd5\x04\x16\x7f\xdaDJU\xb2\xe1\x8e\x08|cU\
+\x89Jt6\xe1E@\x22}\xfd\x1db=\x93\x0a\xe1\
+D6`D4\xb6d\x16T\xa2\xb5+2tG\xa4\
+\xa0\x92\x8dy%\x92S\x89\xde6U(\x91\xc4\xc4\x11\
+T=\x83'vO\xa4r\xea\x80H\xe6\xf4H\xcd}\
+\xc3\xbaD\x96\xb4\xbe.\xac\x11\xd4\xde\xa4\xf5\x7f\xd7H\
+\xbf\xb6>\x02t\xf6\xb9\x8fZ\x94G\xea\x9a\xd9\xe7\xbe\
+\xd6\xf2\xa6\xfa\xf5\xae\x1f\x99\xfb\x0e\xd1\x9b\x9e\xdd\x9bQ\
+\x14o\xc6\xb5\xbc\x19i\xf4f\xec\xd7\x9b\xd1xo\xe6\
+G\xbc\x99\xb1Z\xac\xeb\x1c\xe2\x15R\x90\xa8\x90\xbf\xbb\
+Y]\xf8\xb2\x22\xcb\xf3\xec\xaaD\xbcY\xf9\x10\xc1\xc5\
+gw-\x8aj_\xe1\xcd\xea o\xd6k\xf9\xb3\x82\
+\xce\x9b5\x8d\xde\xac2\xf5f\xdd\xaf7+\xb1\xbdY\
+\x1b\xbf\x081J{\xbb\x15\x86\xe0x\xe7\xcd\xfe\x11o\
+v\xf4\xd4k\x8fU\xa4q4\x8a/\xbb\xde\x00\xbbJ\
+-\xeeCl\xc3\xbb\x8az\xed\x0c\xbd\xa1\xd1\xb0z\xb3\
+W\xd7\x9b\xdd\xd3\xde\xecg\xf7\xe6\x84\x01o\xce|\x98\
+T\x05c\xa3\x0a\x01\xa9\xa4md$i\xee\xcfE\xf1\
+\xe6\xa4\x1ao\xce\x0e\xf2\xe64'o\xce\xd7\xe2S\x7f\
+\xf2\xbf\xb4|\xe2\xd9\x12\x8c\xc8\xb0vg\xd0\x1d\xc2\x88\
+xs*\xa07\xe74zsr\xa67g\x99zs\
+\xba\xac?\xe7\xfdzs\x02\xb37gb\xcb\x9eR\xde\
+\xae\xfb)\xe5\xde\x9c\x1b\xef\xcfI\xfe\xb6\xefV\xf8\xa0\
+\xc93\xe9\xfaB\xe7~]\xeb\xb7]\x9c \xddv\xe1\
+\xcd\xfd#\xfe\xdc\x08\xe3\xfe\x8e\x9e\x053w\xf4xs\
+kR\xe0\xcb=V\xde\xdc,\xe6\xcf]o\xde\xdc\xbe\
+\xe7\xcd}\x88\xfe\xdcP\xe9\xcd\x9d\xa1\xde\xdc\xe2\xea\xcd\
+\xbd\xba\xfe\xdct\xec\xcd\xdd\xd3\xde\xdc\x06\xee\xcd\xfd\xec\
+\x82\x5c\x90sb\xd3\xb0-pKE\xae\xb7\xd6M{\
+g\xcc\xdc4\xbc\x89\xe9x\xc9m\x0b\xb5\x96o\x18\x8f\
+2M\xe6\xa4O\x1c\x9a\xf7\xcd\xd8E*\x11\x5c\xd3X\
+&\xe6\xb6\x95\xe2\xb9{\xcfB\xfe\x12\x84s\xea\xc0\xd5\
+\x0d\x9aAl\xb4VP\xac\x8cL\xd6xm\x86^9\
+\xc6\xcc\xc4\x98ou\xbd\x05\x9eYUD\x8b\x99\xad\xb3\
+\xfe\xc3\x01\x7f\xef\x1e\x0a\x11[\x1f\xe4\xc9\x09'\x02\x0b\
+\xe1\xc5p\x12\x16\x96\x5c\x8c\x10\x88\x5cZ\x8b\x93\xbc\x80\
+c_\xa2*\xc4t\xa1*\x94)\x08IQX\xa9b\
+\xbcu\xe0\x95\x8f\xdeQURA\xb2c\xb1\xba[D\
+TI\x8f\xd9L\xc0\x09\x9a\x97D\x1d\xab%\x91 \xa6\
+\xd4n\xe0\xfa\xc5\xae\xf2\xc5Hb\xb5y\x17?d%\
+i\x09\xc9\xd6jz\xb7\xfe\x1d\xa1\xfc\xb1Yq!|\
+F\x88\xc0\x16\x8b\xe0\x98Y\xef\xac\x1b\x8c\xd9\xefK\xc4\
+\xa5\xb7\xd7\x18\xc2\xfa\xd1R.L0\xd4.\xaa\xc4R\
+\x08~\x8a\xa1\x90\xcc\x02_;\x8e\xd82w\xd4\xa6\xb4\
+\x01[Q|\x8c\xe1\x86y\x95\x8c\xcd\x1b\xd7oH\x0a\
+\xc9z\x89y\xe3\xca\x18\x96\xe5\xe1\xd9\xd8\xa6q\xc5\x8c\
+\xa1\x0d\xd7dT\x92\xeeY\x8bX\xf6\xc7\xcb\x87\xd6\xbe\
+\x96\x91\x91\xfd\xe1\xf2\x8c\x1d\xb3W\x06\x9b\xe9\x841\xd4\
+\xe1\xb3\x03f\xc7\x923\x0e\x821z\x16u\xac\xb8I\
+\xc6A0Fj\xfe]\xad\xcc\xd3\x96\x99l\xf2k\xe6\
+\xa5\xe3.\x06\x91LV4\xe4\xf0\x0d\x83\x87NC\xfd\
+\x9d\xad\x18xc\xf6\x08W\xa4\x81\xf2\xbc\xbf\xeb\x87\xae\
+l\xc0\xc2\x1a'\xcf7\x0d\x1fpO\x93G\xd6V\xd9\
+\xcf\x01\x1ar&\xad\xc7$\xcf\x03u\x0e|h\x8eI\
+\x9e\x07\xeeR\xe9(g\x5cp?\xc9\xfb\x07\xa6a\x95\
+\x19\x17[\x81\x85\xfe;\xf9#\xa7\xd1\x17J?\xcd3\
+\xb9\x09\xc9\x8co\xf2<\xd2=l\x22\xb9\xda\xe8c\x8e\
+W7\xee\x17\x85\xd3\xbf\x1f\xa0\xf3\x08\x9a\x85s\xc8\xd3\
+G\x8aoxX\xe0\xf1E\xe0\x00\x8d\xe2i\xea/U\
+\xcc\xebMRx\xde\xd1N\x82\xef\x8aL\xc6O\xa4\xe3\
+\xden\xc9\xd3{n\x88\x14\xb2\xc9?>\xffL\xaa6\
+\xf8\xb6\xec\x80\xfcCG<\x820.;\xad\xff\xfel\
+\xb9\x0e\xfae\x0f~\x1d8C3)\xfbC\xe9\xfd\xa9\
+Z\x09\x07wK\xaf+x\x158D\xb3\xfc\x0a\x05\xf6\
+\xf2\xb8*?\xde>J\xca\x1fY\x09\x9c\xa2U\xc1\x84\
+\xa5[\xc7\xe7\x05]\xbc=\xba[\xf1s\xd7<\x82\xe0\
+V\x15\x93\x0f\x5cV\xb7\x1e\xef??_\xfb\x88w\xfb\
+\x83\x9d\xed\xe5\xca\x9f\xb2\x9b\xdd\xc09\x136\x03i\xba\
+\xdc\x99\xf5\x9bk\xf7<\xa6\xeaD\x167\xeb\xc0\xa3\xa4\
+\x82U\xc5J=x|\xf0\xf8D\x8b\xc7YP\x1b4\
+\xfb\x1a<\xee\x055B\xf8\x10J#}\x12\xd4\x0b\xdf\
+\xc0x\x5c\xed\x05u\xc3\x1d\x88\xa3\x9cu\x83\xfa\xa1\xac\
+0\x9f\x8e\xf1\x93\xa0\x9e\xb8PS\xca\xd9(\xa8+\xa2\
+\x17\xf2)\xe5\xf3\x1f\x82:\xe3\xb6\xa4}\x8d\x1fu\x83\
+\x9aC\x86\xca\x1c\xd0\xf8\x87\xca\x0c\x03\xfb\xe9x.h\
+|j\x02w\xab\xb8\xac>~\x16\xcc\x15\xa2\x8b\xa3\xed\
+<\x99\xd5\xad\x93w\xc1<\x22|;8\xda\xd9\xdc|\
+\xfdzssk\xe7d\xff< \x10\x08\x04\x02\x81@\
+ \x10\x08\x04\x02\x81@ \x10\x08\x04\x02\x81@ \x10\
+\x08\x04\x02\x81@ \x10\x08x\xf8\x1b\x5c\xb7\xe54\x9d\
+\xc7\x9c/\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x000\xe3\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4x\xd4\xfa\
+\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\
+\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x00\x07tIME\x07\
+\xe4\x09\x04\x0a\x11\x18\x8eQ8\x82\x00\x00 \x00ID\
+ATx\xda\xed\xdd\x7f\x94\xdfU}\xe7\xf1\xe7\xfd\xce\
+$$\x02\xca\xb1EAP\x02!\x99I\x00\x8b\x94J\
+\x01\xa1\x86z\x96\xa4nk\xd96\xa2\xdd\xade\xc5\x16\
+A\xc8\x81\xee\xd1\xd2mV\xd4R[\xb0\x15\x1b\x11\xa4\
+\x16\x0fu[Ahk\xebi\x09xV\xb0\xfc\xac\xc2\
+\x02\x85\xfc\x98I\xc8\x0f\x04\x04DY\x90\x1f\x09a\xe6\
+{\xf7\x8f\x99h\xc8\xcf\x99\xf9\xde\xcf\xcf\xfb|\x9c\xc3\
+\xe9Q\xecg\xbe\xdf{\xef\xe7\xbe_\xf7~??@\
+\x92$I\x92$I\x92$I\x92$I\x92$I\x92\
+$I\x92$I\x92$I\x92$I\x92$I\x92$\
+I\x92$I\x92$I\x92$I\x92$I\x92$I\
+\x92$I\x92\xa4\x1c\x05\x9b@\x8d2L\x9c\xf0\xffv\
+\xc0\xf1-I\x06\x00\xe5Q\xf4\xa7\xc2\xa0 \xc9\x00 \
+eV\xfc\x0d\x06\x92\x0c\x00\x92\xc5\xdfP \xc9\x00 \
+Y\xfc\x0d\x05\x92\x0c\x00\x92\x01\xc0@ \xc9\x00 Y\
+\xfc\x0d\x04\x92\x0c\x00\x92\x01\xc00 \xc9\x00 \x19\x00\
+\x0c\x03\x92\x0c\x00\x92\xc5\xdf0 \xc9\x00 \x19\x00\x0c\
+\x03\x92*\xd6\xb1\x09$C\x90$\x03\x80$C\x80$\
+\x03\x80$C\x80$\x03\x80$C\x80\xa4V\xe8\xb7\x09\
+\x1a:\xf1\xb7\xf1B1\x8b\x9d$\x95\xc6\xab\x8d\x9b^\
+\x00\xdb\x14\x04\x0c\x00y\x05>I\x95\xf2'\x80\xba\x14\
+\xbe\xa9\x16?\x8b\xa6$\xc9\x00\x90Q\xe17\x04H\x92\
+\x0c\x00\x99\x16~C\x80$\xc9\x00\xd0\xa0\xe2/IR\
+\xc5\xbc\xb0\xa8m\x85\xbf\xa9\x17\x8b\x19\x8c\xda\xd9\xaf\x92\
+j\xcb\xdb\x00\xdbV\xd8\x86\x89\x16\x8b\x09\x16NC\x87\
+$\x03\x80\x5c\xd1\x1a\x0e\xec;I9q\xa5\xd8\xd6\xe2\
+\xdf\xb4]\x80\x22\xda,U\x1b\xd8\x9f\x92\x0c\x00j\xd4\
+\xaa\xbfIE\xa3\xce\x01\xa0\xea\xbe\xb6\xf8K*\x80?\
+\x01\xb4\xb1\xf0\xdb~\xe5\x17e\xc7\x80\xa4\x86\xf16\xc0\
+6\x17/\x8bR\xb9\x81\xc0\x95\xba$w\x00,\xfc\xb5\
+\xfa\x9cU\x16&C\x88$\xd5\x92+\x96\x5c\x8aZ\xd1\
+!\xc0\xeb\x1f\x8ak\x03w\x16$\xb9\x03`\xe1\xb7\x1d\
+2c\xf1\x97d\x00\xb0\xe8\xf5\xfc\xf9\xa7ZL,\xf8\
+\x92d\x00\xb0\xf8g\x10\x02,\xf8\x92d\x00\xb0\xf0\xfb\
+]%I\x06\x00\x8b\x7f\x9bv\x01,\xfa\x8e\x17I\x06\
+\x00e4\x99\xb7\xfd\xfby\xe1\x9c$\x19\x00,\x8c2\
+\xc8H\xd2\x8e|\x12\xa0\xc5_\x92d\x00\xb0\xf8K\x92\
+d\x00\xb0\xf8W\xc3\xad\xdff\xb5\x9d\x01R\x92\x01\xc0\
+\xe2\xdfs\xf1\xdaZ\xc0\x0c\x01\x92\xa4\x02\xe5Yd\x9a\
+\xf4\xdczW\x97\xee\x00\x18\x06%\xb9\x03\x90Y\xf1\x97\
+\xb6\x8eY\x83\xa0$w\x00ZR\xfc'S\xf8\x9d\xfc\
+\xeb\x1d\xa6\xca\xee\x1fC\xa3$\x03@\x06\xc5\xdf\x10P\
+\xff\xa2XU\xdf\x18\x04$\x19\x00\x1aR<{\x9d\xb0\
+\x0d\x01\xf5,\x84U\xf6\x8b!@\xd2\x14\xb5\xffI\x80\
+u(\x9aN\xd2\xb6m\xd1\xe3\xdb1&\xc9\x1d\x80\x96\
+\x17\x7fw\x01\xeaW\xf8\x9b\xfe\xf3\x92$\x03\x80\x01\xa0\
+!\x93q\x9bC@\x13\x0b\x98w\x96L\xadm\x0c+\
+\x92\x01\xa0u\x93r\xd1\x13[\x13\x03\xc0\x80c-\xab\
+6\x9fL\x9b\x18\x04$\x03@+&\xe5\xb2&3\x8b\
+\x8ec\xad\x8e\xfd\xd1K[\x18\x04$\x03\x80\xc5\xbfA\
+\x85\xc7I\xbb\x19;2e\xf4S\x8avp<I\xa5\
+\xe9\xb7\x09,\x82~\xd7\x04mR\xf7\x100L\xf4\x9a\
+\x14I\xee\x00\xb4\xa9 \x96\xf1]-\xfa\xed*\x84)\
+\xfb\xb3\x88\xef\xecx\x93\x0c\x00\xb5\x9f\x88\xeb2Q9\
+\x09\x1b\x02\xca\xee__\x80$\x19\x00\xb2\x9d\x84\xeb6\
+A\xf9\xfb\xab!\xa0\xac>\xcf-`K\x06\x00'\xe0\
+V\x86\x00'YC\xc0D\xc7@\x15\xdf\xc9\xf1)\x19\
+\x00\xdc\x05H\xfc\xdd\x9dX\x0d\x03\x93\x19\x0f\xbe\xef@\
+2\x008\xe9:9\xa9\xa5A`gc\xb9-/\xd2\
+\x92\x94Q\x000\x04\xc8 \xd0\xdbX\xf6\x11\xc7\x92\x01\
+\xc0\x89\xd6\x89I\x19\xee\x08\xd4=\xa0H2\x00\x18\x02\
+\xe4\x185\x00H2\x00\x18\x02\xe485\x04H2\x00\
+\x948\xb9:1\xc9 `\x08\x90\x0c\x00\xee\x02H\x06\
+\x01\xcf5\xc9\x00`\x08\x90\x0c\x01\x9ekRmt\x9c\
+,\xa4\x9a\x8fY\xc7\xad$w\x00\xdc\x05\x90;\x026\
+\x82\xe7\x9ad\x000\x04\xc8\xf1+\xcf5\xc9\x00P\xbb\
+I\xd4II\x06\x01C\x80TS\x1d\x9b\xc0\x09Z\x16\
+<I\x06\x00'O\xc9ql\xe0\x962\xe0\xe4\xe1O\
+\x01r,\x1b\x8a$w\x00$Y\xf8\x12\x7f&\x0b\xb2\
+d\x00p\xd2\x942\x1a\xcf\xdb~\x962?\x97;!\
+\xd2\x84X\xfc\xca\x9a4\x0c\x1aj\xd3x\x9e\xeaX/\
+\xf3sy\xceI\xee\x00\xb8bP\x96;\x01U\x14\xc0\
+=\xfdM\x8b\xb2d\x00\xb0\xf8K-[\x05O\xf4o\
+\x95\xf5\x99<\xb7\xa5\xdd\xca;\x8d\xfbD@9\xd6\xab\
+\x19\xdf\xfe\x14 \xb9\x03 \xa9\xc1Ep\xaa\xc7\xb5(\
+K\xee\x00\xb4~\xf5\xefd\xa76\x8e\xfbTc\xda]\
+8\xc9\x1d\x00\x8b\xbf\xd4\x90\xf1\x98rL{~H\x06\
+\x80V\x16\x7f\xa9M!\xa0\xc9\x0f\xf5\xf1\xbc\x97v\x90\
+W\xfa.{\x12pu\xa36\x9c\x13e\x8cc\x7f\x0a\
+\x90\x0c\x00\xad\x09\x00N4R\xfd\xceO\xcfK\xe9'\
+\xf2\xf9\x09\xc0\xe2/\xc9\x9f\x02\xa4\xcc\x02\x80\xc5_\xaa\
+?\xcf\x1d\xc9\x00\xe0\x04&y\x0e\xb9\x0b \x15\xab\xdf\
+\xd5\xbf\x1a\xd7\x7f\x06-I\xeaY\xbb'R\xb7\xfe\xed\
+\x1f\xfb\xc5\xb1\xe1\xd8\x90\x0c\x00N$\x99\x841\xfb\xcb\
+1\xe38\x902\x0e\x00\x16\x7f\x0b\xbe}\xe8\x18\xb2\xef\
+\xa5\xcc\x02\x80\xc5\xdf\x82o\x9f:\xae\xeco\xc9\x00\xe0\
+\xc4a\xe1\xb7\x8f\x1d_\xf6\xb3\xd4\xf6\x00\xe0\xea\xdf\xa2\
+o\x7f;\xde\xec[\xc9\x00\xe0\x84a\xe1\xb7\xef\x1d{\
+\xf6\xab\xb4\xa3v=\x07\xc0\xe2o\xe1/\xab-,\x18\
+\x92\xdc\x01\xb0\xf8[\xf8\xdd\x11\x90\xe7\xb6\xe4\x0e\x80\x9c\
+p\xdd\x11\x90cQr\x07\xc0\x15\x82\xed\xe8n\x80\x1a\
+1\x16\xed?e\xc6\x97\x0191X\xfcS\xb6\xa1\xed\
+\xe8X\x94\x1a\xa2\xf9?\x018Y\xd8~umSW\
+\x94\x8eG\xa9\xc6B\xa9's\x11\x13\xa2\xb7\x079\xd9\
+\xd6\x99!\xa0\x19c\xd1~\x92\x01\xa0\x82\x13\xb9\x97\x13\
+\xcf\xe2o\xe17\x048\x1e\xed#iJ\xfa+?\x91\
+}\xdf\xbb\xc5?\x976w\x5c;\x16\xa5\xd6\xed\x00T\
+q\x15\xbe\xab\x7f'\x5cw\x03\x1c\x8b\xf6\x89T\x93\x1d\
+\x00\x8b\x97\xed\xa7=\xf7\x83\xef\x91\x90\xd4\x8a\x1d\x806\
+\x9e\xd0\x03>!Q\x8e\xb1,\xc6\xa2\xab\x7f\x19\x00,\
+.\x16\x7f9\xd6,\xfeRN|\x14\xb0\x13n\xb3\x8b\
+d\x93\xbfg.?\x07\xd4\xad\x8f,\xfc\x92;\x00\xad\
+\x9d\x18\x9a\xd6/E\xb5{S\xda\xc1gM\xd8\xd6R\
+\xa3\x02\x80\xdb\xffN\xb8Mk\xe7\xba\xb7\x8dw\x9e\xd8\
+\xb6\x92\x01\xc0\x09\xa2U}R\xc7\xb6\xb5\xad\xf2ig\
+\x8b\xbf\xb4S^\x03\xe0D\x9b\xe7\xc4\xbb\xf5\xb3y\xa1\
+d{\xc7\xa4\x85_*`\x07\xc0\xd5\xbf\x13m\x1b\xdb\
+\xd2\xed\xea\xf6\xb4\xa7\xc5_r\x07\xc0U\x96\x13n\xe3\
+v\x05r\x7fX\x90\x85_*E\xc7\x09\xc3\x15\xab\x93\
+\xeeN\xbeO\xd5\xdf\xc9\x9f&\x1c\x87R\xed\x02\x80\x13\
+\x93\xeaT(\xdb\x5cP<\xd7\x1c\x87R\x81&\x7f\xd2\
+\xb4iRr\xf5\xefJ\xcb\xf6nv\x9bY\xf8\xa5\x12\
+w\x00d1\xcau\x95)\xfbDr\x07\xc0\xc9#\xbb\
+\xe2\xefd[m\x1f8^\x1d\x93R\xa5;\x00\xfe&\
+\xe9JK\xd5\xb4\x87\xe7\x9e\xa4J\x03\x80\x5cy\xea\xa7\
+\xedRv\xdb\x18\x02$\x19\x002,j\x16\x7f\xc7\x92\
+\xedc \x92*\x09\x00\xfe\xf6\xef\xc4\xad\xea\xdb\xca\xa2\
+'\xa95;\x00eN\x9e^H5\xb16\xb2\xf8\x1b\
+\x98l\x1b\xa9\xf5\xea\xf1(\xe0]M\x10)\x0b\x9f\x93\
+\x90mTF\xfb\x95\x11\xd6|T\xb0\xa4\x04&>\x89\
+\x141\xb1\x0d\x94t\x1b\xa2\x0f\xfc1\x00\xb4\xb1\xcf\x9a\
+\xd4_\xde\x0e(54\x00\x14u\xf2\xa6<q\xb7~\
+\xc66M\x06\x16\x7f\xfb\xaeM}\xd6\x84yD\xcaH\
+{\xee\x02\xf0\xb7k'PC\x86$e\x18\x00\x9c\xdc\
+-\xfe\x86*\xcf\x15I\x0d\x08\x00N\x90\x16)\xdb7\
+\xaf\xe2\xe7x\x93\x0c\x00\xaa\xc1\xa4\xeedl\xd1\x93d\
+\x00h\xcd\x0aC\xca1\x04x\x8eJr\x07\xc0\xd5\xbf\
+\xabRe\x19\x86\x0cARC\x02\x80\x05\xa8\xbd\xabQ\
+\xb9\x0b \xc9\x00 'q\x19\xbe$\x19\x00d\x01\x92\
+$5\x22\x00\xb8\x22\xb5\xf8\xab9\xfd\xd0\x94\xf3\xd5\xb1\
+(\xb9\x03 \xc3\x96\xe49$\xe5\x12\x00L\xff\xae\xb8\
+\xec\x0fw\x01$\xb9\x03 I\x92\x0c\x00y\xf2U\xa9\
+\xee\x02\xf8\xfd%\x19\x00$I\x92\x01@r\x15<9\
+9_\x07\xe05\x10\x92\x01\xc0\x09\x0b\xb7Y%IS\
+\x08\x00E\x14&\x0b\x92$I\xee\x00\xa8@\x86\xad\xbc\
+\xfb\xa9\x09[\xe1\x8eQ\xc9\x00 I\x92\x0c\x00\xf9\xf0\
+\x82%\xb9\x12\x96d\x00\x90\x05E\x92d\x00\x90$I\
+\x06\x00I\x93\x94\xebOL\xfe\xb4&\x19\x00\xa4\xc6\xf0\
+g\x1bI\x06\x00W)\x16\x12IR\xd1\xfakQ\xf4\
+,ZR\x9e\x06\x08n\xd9K9\x04\x80\xc9\x04\x03C\
+\x81$\xe7\x14\xa9\xe5\x01`\xa2'\xb0'\xb1$C\x81\
+T`\x00\xa8\xf3\x96\xdc\xb6\x9f\xcd\x93W\x92\xa1@j\
+\xd9\x0e\xc0dN^OX\xb5\x81\xbf\x87\x1b\x0a\xa4\x12\
+uZ{\xc2\xe6Z@$\x153\xc78\xcf\xc8\x00`\
+\x08\x90</\x0c\x02\x92\x01@\x92\x0cV\x92\x01\xc0\x93\
+R\x92$\x03\x80$\xb9\x0b 5&\x004\xf9b2\
+OJI\x92\xdc\x01\x90$\x17\x1c\x92\x01@\x92$\xed\
+6\x00xO\xb9\xa428\xd7H5\xdc\x01\xf0\xc4\x94\
+$)\xc3\x00`\x08\x90\x5c]\xfb9\xa5L\x03\x80'\
+\xa7$C\x80\x94i\x00\xd8zrn\xfdG\xf5\xe4\x15\
+\xc9\xf6\x9f$M\xd0\xd4\xde\x06\xb8\xb3\x10\xe0\xe4%)\
+\xd5.\x80\xf3\x89T\xd3\x00`(\x90d\x10\x90\x0c\x00\
+\x93\x0a\x05\x9e\xd4\x92\xa62\x878oH\x0d\x0a\x00\x13\
+\x0d\x06\x9e\xd8\x92\x5cPH\x19\x04\x00I*2\x18\x18\
+\x0a\xa4L\x03\xc001\xdb\xbb\x15r\xfe\xeeM\xef7\
+\xb9[ \x95\xc8w\x01\xd4m\x82\x92\x1cc\x92\x0c\x00\
+\x92\x94H\x11\xab\x7fC\x96\x0c\x00\x92$\xc9\x00\xa0\xf6\
+\xadtd\x7fI2\x00$\xe76\x9a$I\xee\x00d\
+\xc3\xe0#\xc7\x96$\x03@b\xb9o\xab\xba\xadl?\
+I\x92;\x00\x92$\xc9\x00 \xb9\xfa\x97d\x00P\xa5\
+\x8a\xfc\xad\xd6\x02\xe3\x98\x92\xe7\x82d\x00\x90$\x83\x96\
+T\xbf\x00\xe0\xc9\xe4\xca\xc7~\x91$w\x00\xb2\x9ad\
+\x0d?r,I2\x00\xc8\xd5\xa6\xfd!I\x06\x00\xc9\
+\xe2/I\x06\x80\xd6*z\xeb\xd6\xc2\xe3\x182tI\
+\xaam\x00(b\x02\xf3\xe4\x97\x85H\x92\xdc\x01p\x17\
+@R\xed\xcfU\xc9\x00 C\x80\xednA\x92d\x00\
+pe!\x8b\xbfl{\xa9\xa5\x01\xc0\xeb\x00\x9c\x14e\
+h\x94\xe4\x0e\x80\x0c\x01\xb6\xb3$\x19\x00\x5c\xd1Y\x9c\
+,\xfe\xae\xfe\xf38?%\x03@\xa6\xc5\xce\x10\xe0x\
+\x93} e\x17\x00L\xd8\xb2\xf0x\x9eH*T\xbf\
+MP\xf3]\x802\x8a\xc90\xd1b\xe2\xaa\xb3vm\
+\xe5\x98\x94\x0aU\xdf\x13\xac\xa8\x89\xb4i\x93J\x99\x05\
+\xc5\x09\xd7\xbe\xaa{;M\xe6{\x17\xd1\x1f\x9e#2\
+\x004xBm\xe2\x09la\xb1\x9f,\xfe\x93k\x0f\
+\x17\x10\xd2\x1e\xf9\x13\x80v\x9c8\x9d\xe4\xea\x1d\xd2l\
+\x1f\xdb^J \xbf\xdb\x00\x9b8Y\x94]\x90\x9dP\
+'\xd7V\xee\xd0H2\x008\xd9\x19\x02\x0c\x93\x9e\x0f\
+-\x1dK\xceG2\x008q\xbb\xba\x95\xed\x22\xc9\x00\
+\xa0\xf6\xaf@,v\xd5\xb7\x87\xab\x7fI\x06\x00C\x80\
+\xbb\x01\x15\x163\x8b\xbf\xa4\x96\xc8\xef6\xc0\xb6L\xac\
+U\x16\xe3\x1c\x0bRU\xed\xed\x18\xcd;xK\x05\xaa\
+\xefm\x80n\x1d\xd6\x7fb\xcfaRt\x1cJj\xa9\
+\xfa\xfd\x04\xe0VssV$m\xef\xa7\xaa\xbf\x9f\xab\
+NI\x05\xaa\xd7\x04\xe3mU\xcd-\xc2m*Vu\
+h\xd3\xa6\xb7\xa7\xdb\xffR\xed\xd5\xe3'\x00W\xfc\xbd\
+MNuh\xbf6\xfc,`\x98\x92\xe4\x0e@&\x93\
+\xae\xabV\xdb\xb7n\xed\xe6\xae\x94;\x00R\xeb\x03\x80\
+\xdb\xac\xf9L\xbculg\x03\x93\x01\xc0\xe2/\x03@\
+\xc6\x13D\x1bO\xee\xbaO\xbe>\xcc\xc8\xe2o\x00\x90\
+2\x0c\x00u\x9a\x1c\xda|b7i\x12.\xb2\x1f\x9a\
+\xd2\x0e\xfe\x14e\xdfH\xad\x0e\x00\xfe\xd6\xeaD\x5cD\
+\x1f5\xfd{Z\xfc\xed\x1b\xa9\xd5\x01\xc0\xe2\xef\x84,\
+\x8b\xbf\xfd#\xd5J\xb1\x0f\x02\xaa\xe3C}r:\xa9\
+\x9d\xc0\xec\x1bI\xaa$\x008\xe9\xfa\x9d\xd5\xfe>q\
+\xf5/\x19\x00j=)\xe4|B;\x99\xd9\x17Mo\
+\xb32\xdb\xcd>R&\x8a\x19\xe8\x16\x7fWk\xcac\
+\x0cV\xfd\xc6\xce\xd4\x7f\xdf\xb9B\x06\x80\x96\x14\x19O\
+fC\x80\xe3\xb0\xb9c\xa9\x97v\x9b\xec\xe7r\xae\x90\
+\x01\xa0E\x05\xc6\x13\xda `\xf1o\xf7\xea?\xc5\xe7\
+u\x9e\x90\x01\xa0EE\xc5\x13\xda\x10`\xe1\xb7\xf8K\
+\xda\xa3v\xdd\x05\xe0\xa4a\x9b\xd9\xa6\x92\x94\xd1\x0e\x80\
+\x13\xae\xbb\x01\x16~W\xff\x92&\xa5\xdfIW;\xb4\
+\xa5A\xc01hH\x94\xdc\x01\xa8\xed$a\xe1w\xb2\
+\xb7\xf0\xbb\xfa\x974e\xcd\xbc\x06\xc0I\xc2v\xb6m\
+\x0c\x84\x922\xdb\x01\xb0(Y\x00,\xfc\xed\xec{\xcf\
+m\xa9\x05\x01\xc0\x10`1\xb0\xe8\xdb\xdf\xb6\xb3Tk\
+\xfd6\x81\xa6<Q\xb7=\x08X\x90lk\xc9\x1d\x00\
+w\x01\x94\xc9\xae\x80\xe3\xaa\xfc~\xb5\xcd%\x03\x80\x13\
+\x87E\xc3\xa2\x9fa?\xda\xfeR\x0b\x03\x80\xbb\x00\xaa\
+c p\xdcX\xfc%5<\x008\x81X`\x1c\x1f\
+\xf6\x8d\xa4\x9a\x06\x00w\x01$\x8b\xbf\xe7\xaeT;\xcd\
+\x7f\x19\x90\xf7\xa6K\xcdc\xf1\x972\xd9\x01(\xa3P\
+;\xa1H\xcd\x08\xd3\x9e\xab\x92;\x00\x922+\xfe\x92\
+2\xdc\x01p\x17@\xb2\xf8{\x8e6{\x8c\xd8\x7f\x06\
+\x80ZO4\x035\xb8\xb0\xd1\x93D\x16\x7f\xcf\x8b\xdc\
+\xc7\x86\xfdm\x00h\xdd.\xc0d>\xbf'\x80,\xfe\
+\x9e\x0b\x8e\x0b\xc7\x83\x01\xa0\xe1!\xa0\x97\xcf\xec`W\
+\xce\xc5\xdfs\xc0q\xe1\xf80\x0046a\xa6\xf8\xbc\
+\x0ep\xb9\xfa\x97c\xc21\x93}\x00hJ\x08H\xfd\
+\x19\x1d\xd4\xb2\xf8\xcb\xe2\xef8\xaa\x09o\x03,\xf3\x84\
+\xf0V+\xe5\xc4I[)\xe7\xce\xad\xff\xa8\x05;\x00\
+u\xde\x05\xf0vE\x19n\x1d\xe3\x8e\x07C\xa6;\x00\
+\x0d\xef\xbc\xc9\x0c\xee\xb2\x12\xa6)V\x92\xd2\xed\x0c\xa8\
+\x81\x01\xa0N\x09\xb7\xecA\xe4\xc0\x95\xab\x7f\xc9EU\
+\x85BV\x9d\xb7\xb3\x89\xa9\x0e\x03\xc7\x09Sm:\xdf\
+\x1c\xcf\x13k\xf3\x81\xcc\xe6_\xe7R\x03@\xadV&\
+\xde\xf6\x22\x8b\x91c\xb9\x0em=\xd0\xe2[\xb2\x9dK\
+k\xab\x93\xe5\xc9X\xc7\xedw\xb7\xb0d\xc0hW\x1b\
+\xd4\xf1\xfa#\xa9\x96;\x00N\x1c&X\xb5\xeb<\xcb\
+q\x1c7\xed\xa1am\x9ds\x9dC\x1b\xb8\x03`\xa7\
+\x19\x84\xe4y\x96\xc3\x8a\xdf\xf3_\x06\x009\x09\xc81\
+l\xe1\x97\xaa\x10j{R\xc9\x15\x9b\xdaq\x9e\xb5q\
+\xfc\xb6\xe5vJ\x7f\x02p\x07\xc0\xces\xb2\x91\xc1R\
+5;\x1f\x8b\xfe;\xce+\x06\x00'\xa7\x06M:\x9e\
+\xb0\xb2`z\x0eJ\x89\x84\xda\x9fp2\x1c\xa9\x1d\xe7\
+YS\xc7m\xd5\xf3P\xdd^m\xee\x1ci\x000\x04\
+8\xc8e\x08h\xfd\x98\xad\xcb\xfc3\xd9v\xcb}\xde\
+tn\x9c\x90\xfeFt\xa4!`\xf7'\xb9\x83]\xca\
+w\xf1\xe1\xfc\xa8\xd6\xee\x008\xc8M\xbdr\x17\xc0\xb9\
+\xe6\xd5\xedV\xc7\xcfX\xa7\xc5\x9as\xa1\x01\xc0\x10 \
+\x19\x02\x9cgj0\xf7\x94\xd9\xae\xce\x81\x13\xd6\xdf\xa8\
+\xc1\xe5\xc99\xf1\x09\xcc\x93@\xb2\xf0\xd75\x1c\xd8\xde\
+\xee\x004\xfeDm\xc2\xa06\x08\xc8]\x00\x8b\x7f\x1d\
+\xfb\xb3\xa8vw\xce\x9b\xb0N\xeb\x07Y\x99\x9f\xa3\x8e\
+\x03\xcf{\x97U\xd7s\xac\x0e\xe3\xd2s\xc3\xa2\x9b\xb1\
+\xfe\xc6\x0e\xb6\xaaN\xdc=\x0d\xf4\xba\xfeT\xb1\xedg\
+\xf2d\xadW\xa1\xb1?,\xfe\xb6\xbd*\x10\x1cD\x05\
+\xa5\xdc&\x0cp\x0bO\xbd\xc6\xe7@\x86\xaf\xe7\xae\xea\
+;[\x80\xaa\xed\xc7\x22\xdb\xdfy-\x93\x00\xd0\x84I\
+\xca `\xd17\x04\xd4\xeb;[\xfc\x0d\x00\x02|\x1d\
+p\xf1\x83i\xc0\xa7-fQ\xf4S]ka_\x14\
+\xdfO\xb2\x9f\xd5\x92\x1d\x80\x22'\xcd\xdc\x9e\xc1mr\
+\xaeO\x7f\xd6\xa1/\xdat7\x80\x05!\x9f\x1d\x00\xe7\
+\xb5\xcc\x02@\xea\x01U\xe4\x80\xa9\xfbD\xe4\xc9R\x9f\
+\xbe\xcb\xe5\xf7\xf1\xa2\xbf\xa7\xc5\xbf~\xfd\x97\xcb\xb9d\
+\x00h\xd8\xc4\xe5j\xc4\x93\xa5N\xfd\x94\xc3\xef\xe39\
+\x07nW\xff\xcd\x1dk\x13\xf9\x1e5\x9fK\xdb7\xd1\
+OupU\xd1QMx\xe6\xb8\x05?\x9f\xbeh[\
+\xf17\x00\xb8\xfa/b\xdcM\xe5\xf3\xd7tNm\xef\
+D?\x99N\xaa\xb2s\x0c\x01\xb6{\xceE\xb2\xed\xab\
+\xff\xad\xdf\xaf\xadA\xa4\xa9\x01\xa0\x8a\xcf^\xc39\xb5\
+\xfd+\xbd\xa6<\x80\xa5n\x13\xc4\x80\xcf\x88\xc8\xa2?\
+\xaan\xa7\xb6\x06\x80\x9d}/\xc7ds\xe7\xbaT\x9f\
+\xb9f\xf3\xaa\xbf\xf5Z\xb8\x0cG9\x06\x80\x1c\xaeo\
+\xa8\xdbO\x1am\x1a\xc7\xbd\xf6]\x93B@\xea\xcfZ\
+\xa3\xb9\xd5\xe7\x00\xe4\xb2\xd2kj\x18\xb2\xf8\xa7\x9f\x84\
+r\xbc\xb8\xb1\x0e\xdf\xa9\x0d\xdfy\x80\xd0\xca\xbe\xdb\xd9\
+9\x91\xc1\xfcc\xb1q7\xa0\x9e\x93\x95\x85?}\xbf\
+\xe4\xb6\xbbT\xd7{\xcd\xbd\xfe\xa4\xdemP\xc6\xfb\x5c\
+j\x12\xa2\x0c\x00\x06\x81z\x0dP\x0b\x7f1\xfd\x92\xe3\
+OKu}\x8cq\xce\xc1\xdes\xbdV}a\x000\
+\x08\x18\x00\xda<q\xd4\xa9=\xdb\xf6L\x83\xba\xef\xc6\
+\xd4}\xab\xdes\xbd\xf2>2\x00\x18\x04\xea30\x9d\
+\x10\xd2\xf6O\xce\xc5\xbf\xee\x01\xa0\x88\xcf\xd7\xc4\xdf\xe6\
+=\xe7+\xed7\x03\x80A\xc0\xd5\x7f\xdb&\x0eo)\
+mNP.\xeb\xed\x91+\xd8\x87~f\x10\x98Md\
+\x16\x81\x83\x89\x1cH`6\xd0\x07\x1c@d\xffIT\
+\x8e\xa7\x81'\x81Q\x22\xeb\xe8\xf0\x18\xa3\xac\xa7\xc3S\
+D\xd61\xc0\x8f\x08\x13\xfcn\x9e\xf7\x95\x9d#\x06\x00\
+C\x80\xab\xff\xb6L\x1a\x16\xfe|B\xc0\x9e\xfe\xe6\x03\
+\xecM?s\x98\xce\xe1t\x99O\xe0\x1d\xe3\x05\xff\x10\
+`/`z\x01-\xf1\xfc\xf8\xff\xdd\x08\xac#r?\
+\x81{\x89\xacg3\x8fr4/:\x07\xd4\xeb|1\
+\x00\x18\x00\x0c\x00m\x984,\xfe\xd5\x8e\xab\x14\xdfw\
+O\x9fuw\x7f#\xd2\xcf*\x0ee:G3\xcaq\
+\x04\x8e%2@`\xff\xf1\x15~U^!\xf2#\x02\
+\xf7\x03\xf7\xd2\xe5^\xfa\xb8\x8f9<I`\xc4\xb9\xc0\
+\x00 \x03\x80\x01\xc0\x89,\xef]\x80\xa9\x7f\xb7\xc3\x80\
+\x93\x89\x9c\x04\x1cO`\x160\xb3\xb6c#\xb2\x09\xd8\
+\x00\xfc;\x81\xdb\x81\xdb\x18`\xbdsB5\xe3\xc8\x00\
+`\xf1\xaf~2\xb3\xf8;\x81\x19\x02&n\x05\xfb0\
+\x9d\x05DN%\xb2\x088\x94\xd0\xc0\xb9<\x12\x09\xac\
+\x22\xb2\x1cX\xce\x08\xdf\xe5H^\xc8~~(\xf1\x1c\
+2\x00\x18\x00\x5c\xfd\xab\xdd\xc5\xbf\xcc1VT\x1bD\
+\x02k9\x88.\x8b\x81\x85\xc0I\x84\x1a\xaf\xf4'\xff\
+\xfd\x9e&p'p\x13\x81\x7fe.\x8fe=O\x94\
+t.\x19\x00\x0c\x00\x06\x00\xb5\xb7\xf0\xb7a\x17`\x15\
+G\xd2\xc7b\x22\x0b\x81c\x09-~\x84{\xa4\x0b\xdc\
+\x01,\xa7\xcb\xbf0\x9f\x15Y\xce\x17\x06\x00\x19\x00Z\
+t\x12\xfb:\xd8<B@\xca\xf6X\xc51\x04\xdeK\
+\x87\xf7\x00\x83\x19\xcepC\xc0\x0d\x8cp5G\xf0\x88\
+!\xc0\x00 \x03@3O\xd86NX>x\xa6\x98\
+vy\x8873\x9d\x0f\x00\x1f\x00\xe6f?\xcfEn\
+\x03\xbeN\x1f\xff\xc0\x1c\x1e\xcd*\x08\x14|\x8e\x19\x00\
+,\xfe\xd5N\xeaM?\x81\xdb\xfa\x12\x98\xb6\x15\xfe&\
+\xec\x02\x8c]\xdcw:\x913\x80w8\xc9\xed\xe0&\
+\x22\xd7p-7\xf0I\xbaY\x04\x01\x03\x80\x0c\x00-\
+:!s\x0a<\xb9\x86\x80\xa9\xbd \xe8d\x22g\x12\
+X\x0c-\xba\xb8/\xbdM\xc05\xc0\xb5\x0cp\xbb!\
+\xc0\x00`\x00h\xf2\xe4^\xf7\x93\xb6\x886i\xe2D\
+\xd5\xa6w\xc0\xd7i\x07\xe0{\xccd\x13\xe7\x00g\x01\
+s\x9c\xd8&l-p\x153\xb9\x82\xb7\xb0\xc9\x100\
+5\xfd\x8e#\xa9e\x05\xce\xb6i\x86\xd5,\xe0E>\
+H\xe0\xb7Z}e\x7f1\xe6\x10\xb9\x94\x179\x9aa\
+.g\x80\xef\xbcj\xaczg\x91;\x00\xee\x00\xb8\x03\
+P\xdbB\xd6\x84\x09\xaa\x8d\x85\xbf\x0e\x17\x01F\xfaX\
+\xc3\x99D\x96\x108\xc2\xc9\xacG\x91\xef\x12\xb8\x9a\xb9\
+\x5cM`\xb4\xb5\xbb\x01\x05\x9c\x8f\x06\x00'\xb1\xf6\x05\
+\x00\xefK\xb7\xf8W\xd9\xde\xbbk\xbb\x95\x1cB?K\
+\x80\x0f\x03\xafq2K\xe6%\x02\x9f\x05\x961\x97\xa7\
+\x0d\x01\x13\xe3\xb6\x93\xaa+Hn\xd3\xd5s\x82\xb1\xf8\
+\x17\xf5\x19\x8e\xa3\x9fK\x80\xdf\xb7\xf8'\xf7\x1a\xba\xfc\
+\x11]\x961\xcc\xcf\x95\x12d\xb7\x9e+\x0d>_\x0c\
+\x00\xdaq\xa2\xdc\xf6\x1f\xe5\xb3\xca\xf6\xb7\xfe\xe2\xdap\
+\x88\x85\xc0e\xc0\xe96RA\x02\x81\xc0\xfb\x88|n\
+\xbc\xbd\x8b\x1b\xd7\xd5\xbd\xfc)\xe9\x9c\xecE\x80\x9a\xdc\
+\x80\xab{\x91hZ\x11\x1b T\x1e\xb4\xda^\xf8\xab\
+n\xdf\xd5\x9cE\xe0\x1c\xe0\xad5m\xa1\xe7\x01\x88<\
+E`\xf3\x1e\xff\xd7\x91\x19\x04\xde8\xfe\x9f\xf6\xada\
+\x10x'\x91\xe9\xac\xe1\xf5\xcc\xe5\xab\xaf\x1a\xe3\xbd\x8e\
+\x85]\x9d+u8\x8f\xa7\xd4TrB\xab\xaa\x80\xe4\
+\xfc\xfb\x7f\x1d\xfa3\x87\x15\x7f\xd5\x17\x99\x0e\xf1\x11\x02\
+\x17\x03\xfbU\xde\x16c\xcf\xd9\x7f\x11\xd8\x08<\x02\xac\
+\x07\xd6\xd0\xc7:\xe0\xc7\xf4\xf18[xq\x8f\xc7\x99\
+\xce\xde\x8cr\x10\xf0ZF\x99\xcd\xd8\xd3\x0a\x0f\x03\x0e\
+\x01f\x01{\xd7\xe2\xae\x86\xc8stY\xca|.\xef\
+yLL\xf4\x5ci\xd8K\xa7\x0c\x00Nh\xd5\x0dR\
+\x03@u\xfd\x9a\xcbv\x7f\x95\x13\xf2\x10g\x03\x17m\
+\xb3Z\xae\xa2\x08n\x1a/\xf4\x0f\x12\xb8\x9b\xc8\xfdt\
+\xd8\xc8\x16~\xc0\x11\xbcBH\xd0>\x91\xc0J\xa61\
+\x9d7\xd0e\x16\x81\xb7\x119~|\xc7\xe3\xb0J\xdf\
+Z\x18y\x0a\xf8$\x83\x5c9\xe5q1\xd9s\xa5A\
+/\x9d2\x008\xa1\xb5K\x93\x0b[\x9b\xdeY\x9f\xfb\
+\xea\x7f\x88\x0b\x08,\x05^_\xc17\xdfB\xe4\x01\xe0\
+6\x22\xb71\x83{\xd8\xc8\x0fY\xc0Hi\x9f\xe0V\
+\xfa\x99\xc5\xcf\xb2\x99_ p2p2\x81\xa3\x81\xe9\
+\x15\xb4\xc73D.f\x90\xcb&<Nz9O\x1a\
+\xb4\x0b`\x00pR3\x00\xe4\xd0\xb7\xb9]\xe0Wm\
+\xf1?{|\xdb\xbf\xdc\xe2\x1fy\x0eX\x0e\xdcH\xe0\
+\x16\xe6\xf2\x04a\xbbg\xe6W\xb3\x0a\xef\xb0\x86\x03\x89\
+\x9c\x02\xfc\x0a\xb0\x88\xc0\xeb*\x08\x01Kw\xd8\x09\xc8\
+<\xcc\x1b\x00\x9c\xd8,\xfem\xee\xdf\x5c\xaf\xec\xafj\
+\x15\xb6\x8as\xe9\xb0\xb4\xd4m\xff\xc8z\xe0\xeb\xc0r\
+\xf6\xe2N\x0e\x9d\xc0\x85|U\xd9\xc0\x0c^\xe6D`\
+\x11p\x1a\x81\xc3Jl\xa7\xa7\xe8r\xf1\x0e\xd7\x04d\
+\x1c\x02\x0c\x00Nl\x06\x806\xf6q\xce\xb7\xf4UU\
+\xfc\xc7\xae\xf6\xbf\xa4\xb4\xd5m\xe4\x11:\xdc@\xe0Z\
+\xe6p_\xe3\xfai-\xc7\x10y?]\x16\x138\xa4\
+\xa46{\x8e\x0e\xe7\xfc\xe4\xee\x00\x03\x80\x9c\xe0\x0c\x00\
+\xad\xe9c\xef\xe5\xaff\xe2\x1db!\x81K(\xe7V\
+\xbfg\x89\x5cG\xe0\x1a\xe6rO-\xb6\xf9\xa7^\x90\
+;\xac\xe1\x17\x88\x9cA\xe0}\x94s\xb7\xc4]D\xfe\
+\x98An\xca=\x048Y8\xc1\x19\x00\xda\xd0\xcfm\
+\x0e?\x93\xf9nUL\xb8\xc3\x1cG\xe42\x02\xc7\x17\
+\x5c,#\x81\x9b\x89\x5c\xc33|\x83\x13\xb6y\x0b^\
+\xd3\xdd\xc5L^\xcf\xaf\x118\x83\xc8\xa9\x84\x82\xc7s\
+\xe4\xdb\x04\xceg\x80\xffh\xfc\x1cm\x000\x00\xa8\xe5\
+\xab\xdf]\xf5y\xae?{\xec\xea{\x97\x1d\x00\xc6\x9e\
+\xed\x7f\x09\xc5?\xe1\xefQ\x02\x7f\xcd\x08_b>O\
+\xb4v\x9c\xaf\xe2@:\xfc.\x81\x0f\x01o.8\x04\
+\x5cG\x87%\xafzw@\x13\xe7g\x03\x80!@\xb8\
+\xfd\xedX.w\x8c\x8d\xbd\xd5\xefR\xc6\x9e\xed_\xe4\
+\xaa\xff\xdb\xc0\xe7\x19\xe0\xeb\x19\x8d\x89\xd3\x80\xf3\x88\xbc\
+\xb3\xb0\xdd\x80H\xa4\xc3\x9f0\x87O\xbc\xea-\x82M\
+\x1b\xc7\x06\x00'M\x8b\xbfc\xd91\x5c\xf2\x18\x1b\xe6\
+\xf7\x18{\xbe\x7fq/\xf6\xe9\xf29\xa6q\x05\x87\xb3\
+6\xbb\xf1\xf10sx\x85s\xe8p~\x81\x7f\xe5%\
+\xe0\x02\x06\xf8\xab\xc6\x8e\xe5\x1e\xe6>_\x06d\xc1\x93\
+4\xd9\xf3m-\x0b\x88,)\xac\xf8G\x1e\xa3\xcb\xc7\
+\xe8\xe3\xc2,\x8b?\xc0\xe1\xac\xa5\x8f\x0b\xe9\xf21\x22\
+\x8f\x15\xf4W^C\xe4L\x869.\xc7\xc5\x98\x01\xa0\
+\xe9\x93\x92A@\xae\xfe\xcb\xf5=f\xd2\xe5\xbf\x138\
+\xa2\xa0\xbf\xf0\x10\x81\x8b\x99\xc7g\x98\xcb\xcbY\x8f\x93\
+\xb9\xbc\xcc<>3\xfe`\xa5\x87\x0a\xf9\x1b\x81\xb7\xd3\
+\xe5\x5c\xbe7\x85G\x167|'\xd6\x00`\x10\x90,\
+\xfe\x93Y\xfdo\xe2\x1c\x22\xff\xb5\xa0\xbfv']\x96\
+0\xc0U\x0e\x94W\xf5\xc1UtY\x02\xdcYP\x08\
+\xf8-6qN\xe3\xc6q\x8f\xf3\xbe\x01\xc0  i\
+\xa2\x13\xec0'\x03g\x15\xf4\xb6\xbb[\x88\x5c\xc4<\
+\xbem\xc3\xef\xc4<\xbeM\xe4\x22\xe0\x96\x02\x02@\x07\
+8\x8baN\xcaa\xe5o\x00\xc8!\x08\xe4\x12\x06\x0c\
+=*\xc3\x0a\xf6!r&0\xa7\xa0\xe2\xffq\x06\xf9\
+\x96\x0d\xbd\x1b\x83|\x8b\xc8\xc7\x0b\x09\x01c\xfd\xfa~\
+.\xdaC]\xacK\xf1O0\xef\x19\x00r\x0a\x03\x16\
+JU\xad\xc9\xaf\xb3\x9e\xce\xe9\x04\x16\x17\xf0\x97\xee$\
+\xf2i\x06\x0b\xda\xden_\x08\x18k\xafb~\x0e8\
+\x83\xf7\x17\xd2\xc7\xee\x00\xc8\xdd\x01\xa9\x91\x1e\xe2\xcdD\
+\xce\x80\xe4\xef\xb6\x7f\x88.K]\xf9Oa'\xa0\xcb\
+R\xd2_\x188\x93\xc0\x19\xac-\xf8!D5X\xfd\
+\x1b\x00\x0c\x03\xcd\xdf\x1d0\xc8\xa8\x9c\xd5\xff\x07\x80w\
+$\xfd\x1bc\xb7\xb6}\xc1\xdf\xfc\xa7h\xac\xdd\xbeP\
+\xc0-\x82\x0b\x19\xe57v\xfaoZp\xe1\x9f\x01@\
+\x13\x0b\x04u/\xae\x16\xfffi\xea\x85S\xab8\x06\
+\xf8@\xf2\xe3F\x96y\xb5\x7f\xcfs\xc0UD\x96\x15\
+p\xe4\xd3XY\xd2\x1b\x0a';?'d\x00P3\
+C\x81\xc5_e\x8d\xad\xc0{\x81\xb9\x09\x0b\x7f\xa4\xcb\
+\xe7\xe8+\xa4p\xe5\xa7\x8fet\xf9\x1c1a\xc0\x0c\
+\x9cL?g\xb6}\xb1c\x00P\x9aPPfA\xb6\
+\xf8\xab\xbc\xd5\xff\x91txO\xd2c\x06\xbe\xcd4\xae\
+\xc8\xfe!?\xa9\xcc\xe5e\xa6q\xc5\xf8;\x13RZ\
+\xcc*\x8el\xdb\xaa\x7f[\xfd\x8e\x1e\x95V\x98{\xdd\
+\x02\xb6\xf0\xab\xcc1\x1c\x09\xaca10\x98\xf0/<\
+\x0a|>\xdb\xc7\xfb\x16\xe5p\xd62\xcc\xe7\x81\xc3I\
+\xf7\x16\xc1A:\xfcg`\xc5\xab\xc6GY?e\x95\
+0\xdf\x19\x00T\x9f\x80\xa0\xf6j\xe2\xef\xffk9\x88\
+\xc8\xc2d\xa3v\xec\xeds\x7f\xcd\xdc\x8c\xde\xeaW\xee\
+\xfc\xf2u\x868\x0a\xf8D\xc27\x08.b\x0d\x7f\xcb\
+\xdc\xc2\xdeEP\xe9<\xe9O\x00\x92\xb4\xb3\x89\xb7\xcb\
+b\xe0\xd8d\xc7\x8f\xdc\xcc\x08_\xb2\xa1\x0b\xd4\xe5K\
+DnNx\xc4w\x10yw[\x17I\x06\x00I\xda\
+\xde\x0a\xf6\x01\x16&|\xe4\xef\xb3\x04\xaea>Od\
+\xdb\xa6\x91\x0e+8\x80a\x0eb\x98\x93\x19b\x90\x15\
+\x1c@LX\x87\xe6\xf3\x04\x81k\x80g\x93\x1co\xac\
+\xff\x17\x8e\x8f\x87\xd61\x00H*V\x13\xb6\xffw\xbc\
+\xef\x7f\x01L\xf0\xb9\xf0\x13+~\xd7\xf1\x0c\xdf\xc8\xb6\
+\xf0\xaf\xe5T\x86\xf9K\xfa\xb9\x11\xf8?\xc0\x8d\xc07\
+\x99\xc6\xcd\x0c\xf3E\xd6\xf0\xabD\xa6%\xf9{\xcf\xf0\
+\x0d\x22\xd7%\xfc\xfc'\xd2\xcf\xdbKY\xa5\x97|\xae\
+x\x0d\x80$\xed8\xe9\x9fJH\xf4\xd4\xbf\xc8#\x04\
+\xae\xe1\x046e\xd7\x8ek8\x985|\x84\xc8\x07\x09\
+\xbca\xbb\xd5\xf5\xde\xc0\x9b\x09\xbc\x95\xc8\x7fa\x98k\
+Y\xc5U\xcc\xdf\xe6\xa2\xbb\xa98\x81M\x0cs\x0d\x91\
+E\x84\x04\xf7\xf2\x07\xf6'\xb2\x88b\xde?\xe0\x0e\x80\
+$\xd5f\xf5?\xcca\xe3\x13~*70\x97{\xb2\
+k\xd7\x87\x98G\x97e\xc0\x85;\x14\xff\x1d\xfd\x0c\x81\
+s\xe9p\x19\xab\x13\x5cw1\xd6\xde7$\xfb.\x81\
+E\x0csX)\xbb\x00\x06\x00I\xaa\xa0\xf8\x8f9\x19\
+84\xd1\xea\x7f=]\xae%\xd0\xcd\xaa]\xbf\xc7L\
+\xa6\xf1a\xe0\xd7'Yh\xdfE\xe0\x1c\xd6\xf1\xba\x1e\
+\x0bv\x97.\xd7\x12Y\x9f\xa8\x1f\xe7\x8f\x8f\x0bw\x00\
+$\xa9\x86\x85\xbb\xf7cD\xfa\x89\x9c\x94\xf06\xb2\xaf\
+3\x9f\xfb\xb2\xea\x9b[\xe9\xe7%\x96\x02\xe7M\xa9\x1d\
+\x03\xbf\xcd(g\xf4\xfc9\xc6\xda=\xcd-\x97\x81@\
+\xe4$b\x09?\x9b\x97x\x1d\x80\x01@R3'\xb3\
+\xa9>\x8drw\xff\xdbU\x1c\x0a\x1c\x9fh\xd5\xf8\x1c\
+\xb0<\xbb>\x7f\x13\xe7\x108\xa7\x87\x10\xd5Od1\
+\xebxc\x82O\xb3|\xbc\x1fR\xf8E\xd6r@\xd2\
+\x10Z1/\x02\x94\xe4\xce\xc0V}\x1cM`V\xa2\
+O\xb3\x9c\xbd\x0ayg}}\x0d\xf1\x1e\xe0\x0f\x80\xfd\
+z\x0cO\xc70\xc2Q\xc0S=\x1dg/\xee\xe4e\
+\x96\x03\xefK\xf0\xed\x0ee\x94c\xa0\xc4\x87\x02\xb9\x03\
+ I\xa59\x0e\x92\x5c\xfd\xbf\x05\xb8\x91C\xd9\x9cM\
+\xcb\xadf\x01p!\xf0\xa6\x04G\x9bN7\xc1\x0e\xc0\
+X\xfb\xdf8\xde\x1f\xbd\x09\xcc\xa4\x93\xf0\xc1P\x06\x00\
+I*y\x95\xbf+\x0f\xb07!\xd1\x04\x1fy\x80\xd0\
+\xbe\xdb\xc6vi\x98y\xc0\x12\x02\xbf\x98\xe4x\x81>\
+\x02\xb3\x13\x1d\xeb\x16\x22\x0f$\xfa\xa6\xc7\xf2\x00{\x97\
+\xd0\x9e\xa5\x5c\x07`\x00\x90$\x80~\xe6\x10\x19Ht\
+\xb4\xdb\x98\x9b\xc9S\xffV\xb3/\x91\x8f\xd1\x99\xe4\x15\
+\xff\xbb\x0fP]\x02\xaf$9\xd6\x5c\x9e\xa0\xc3\xbf%\
+\xfa\x5coc\xc66/\x1bj\xf8u\x00\x06\x00I\x02\
+\x98\xce\xe1\x04\xf6OP$6\x11\xb9-\x8b[\xff\xee\
+e\x1a\x81\x0b\x81\xdfI|\xe4H\xe4\xe1D;\x00]\
+F\xb9\x9d\x98\xe0AL\x81\x9f!l\xf3<\x80\x863\
+\x00H*F\xd3\xde\x00\xd8e>\xd0\x97\xe0H\xeb\x99\
+\x91\xc9\x83\x7f\xf6\xe1C\xc0\x05\x09o\x9b\xdc\xea\xfbt\
+Y\x97\xech\xa3\xdc\x03I\x9e\x090\x8d\xd8\x9e\xeb\x00\
+\x0c\x00\x92\xb4\x82}\x08\xbc#\xd1\xd1\x1ed#?\xcc\
+ \xe0\xbd\x8f\xb1\xa7\xfc\xcd,\xe0\xe8w\xf0\x12C\xc9\
+\x8e\xf64?\x04\x1eL\xb4\xa3\xf06\xa2O\x02\x94\xa4\
+v\xe8g\x06\x91\x03{>\xce\xd8o\xd7w\xb3\x80\x91\
+V\xb7\xd7\x10\xa7\x109\x9f\xc0[\x0a8\xfa\xf3\xc0?\
+q,/%;\xe2\x02F\x08\xdcML\xf2\xb3\xccl\
+\x86\xf9\x99\x9f\xfc\xa7\xa2\xae\x03(a\x07\xcd\x00 \xa9\
+9\x8a\x9al\x03\xb3\x93\xbc8\x06^$r\x7f\xab\xfb\
+`\x05\x87\x13\xf8(\x81\xe3\x0a9~\xe4r\x06\xb9\xbe\
+\x80\xe3\xde\x0f\xbc\x90\xe0H\xb3\x92\xdd\xa1\xe0\x0e\x80$\
+U,2\x0b\xd8+\xc1\x916\xd2ac\x8b\x8b\xff\xeb\
+\xe9\xe7\xa3\xc0\xc2\x82\x82\xd8_\x01\x9f-\xa8\xdam\x04\
+\x1eIr\xacn\x92\xa7\x14\x1a\x00$\xa9r\x81\x83\x81\
+\xe9\x09\x8e\xf4\x08[\xf8Ak\xdb\xa9\x9f\xff\x01\xfcn\
+AG\xbf\x89Q>\xcb`A\xd7O\x8c\xf5K\x8a\x00\
+\xb0/}\xed\xb8\x13\xc0G\x01Kj\x8em\x7f\x17M\
+\xf9s@\xe4\xc0DG[\xcf\x11\x89\xee_\xdf\x93u\
+\xbc\x91W8\x92\xb0\xcd\x9b\xf3\x22\xcf\xb2\x99\x15\x1c]\
+@\x08\x19\xe2\x02\x02\x1f\x83\x02~\x86\x89\xfc_\x22\x97\
+2\x8f\xe1\xc2\xda\xeb\x08^a8\xd1\xdb\x01G\xb7y\
+\x16\x80\x01@\x92*\x0c\x03\xbd\x86\x82t\xbf\xe9\xae!\
+\x14|\xf1\xd6j\x8e\xa5\xc3o\xf2\x0a\xa7\x02\x83\xbc\xfa\
+\xd6\xc5\x11f\xb0\x8a!\x96\x13\xf8{\x06\xf8\x8fDm\
+}\x1a\x91s\x0b\xa9\x19\x91\xc7\x81\xcf1\x8f[\x0bm\
+\xb7@d\x885I\x8e\xd5)i\x07`\xfb1\x9e\xf8\
+\x1a\x18\x03\x80$w\x08\xd2\xdc\xff\xff<}\x09\xef]\
+\xdf\xf9*\xfc\xbf\x118\x078~\xa7\xdf.0\x0d\xf8\
+y\xe0\xe7\xe9\xb2\x80!\xfe\x92An\xe8\xb1MO\x22\
+ra!\x0f\xc0\x89l!p\x09\x03\xfcmI#d\
+\x1dcw\x19\xec\xdb\xe3q\xfav(\xcce<\xf7\x22\
+e\xe85\x00Hj}\x18\x98\xd8\x04y@\xa2\xbf\xfa\
+\xe3\x02\x8b\xffo\x03\x97\x03\xaf\x9d\xe0*\xf5D\xe00\
+\x86\x19e\x80\x7f\x9c\xd2\xdf\x5c\xc9\x11\xc0G\x09\xbc\xbd\
+\x90\xef\x14\xf9,Opeic\x22\xf2\xe3Dk\xe8\
+\x03j7\xce\xa7\x10\x08\xbc\x08PR>\xbb\x02\xbb.\
+\x0c)\x1e\x01\xfc\x14}<^\xd0wx;p.a\
+\x82\xc5\xff\xa7\x0e\x04\x960\xcc\xbb&\xfd770\x83\
+>\xce\x03~\xb5\xa0\x9e\xf9;^\xe1\xd2R\x9f\x99\xd0\
+\xe5qb\x8f\xaf\x18N5^\xaa\x1c\xef\x06\x00Iu\
+\x98\x84Z\xf3y\x02\x9b\xd9\xc2\x8b\x05\x1d\xfb7{X\
+\x85\xff\x12\xf0\x11\xd6N\xf2\xc2\xb5-\xfc!\xf0{\x05\
+\xad\xc4\xff\x95\xc8\xa5\xbc\x95\xffW\xea8\xe8\xe3E\xc8\
+\xe0\x15\xcd\x13\x1c\xef\x06\x00I\x86\x92:[\xc5\x81\xc4\
+\x9e\xef\xbb\xffu\xba|\x82{\xb7\xb9c`w\x868\
+\x1b\xf8\xfd\x02\x9e\xf1\x0fp/p\x19\x83\x89\x1e\xcd\xab\
+)\x8f\xdb\xfcS1\x00\x00\x10dIDATw\x03\
+\x80$\xd5\xd94\xde\x0a\x09^S\x1c9\x83}8\x7f\
+\x8f\xcf\xb1_\xcdo\x00\x7f\x04\xecS\xc0\xca\xffGD\
+.e\x90o\xd9\xb1\xd5\x87\x00\x03\x80$'\xc4:\x1b\
+e?b\x82\xbb\x14\x02\x1d\xe0\xe3\x0cs\xf6n\xda\xe7\
+$\x02\xe7\x128\xa8\x80o\xf2\x02\x91Kz\xbe+A\
+\xc9\xc6\xbc\x01@\x92r\x11\xe8\x108\x8f!\x16\xef\xf0\
+\xef\xd6s\x08c\xdb\xfe\xef,\xe4ow\xb9\x82A.\
+\xb3\x13\xea\xc3\x00 )\xbd\x81v\xbc.\xb5\xa5\x06\x81\
+\xdfg\x88\x13\x7f\xf2\xdfl`?\xb6\xf0\x09\xe0\xd7\x0b\
+\xf9\x8b\x91\xbfb3\x7fJh\xf9[\x12\x0d\x00\x92\xa4\
+d\xfax\x96\xc0h\xe2\x9d\x80_$\xf0G\xacd\x0e\
+\x00[8\x1b\xf8\xed\x82\xbe\xc1M\x8cp%o\xe3Y\
+;\xb3^|\x10\x90$\xd5\xd9+<H\x1f\xc3\xc0Q\
+\x89\x8f\xbc\x88>\x1ef\x88\x0dD>EH\xf24\xc4\
+\xedW\xfe\xf7\x13\xf84G\xf2\x80\x1d\xe9\x0e\x80\xa4\x5c\
+\xf83@\x1a\xf3y\x82\xc0M\x85\x1c;p\x1e\xf0\x87\
+\x84B\x9e\xf1\xbf\x8e\xc8\xa7\x19\xe0v\xc7\xbb\x01@\x92\
+\xda+2\x83\xe9\xec]\xd0\xb1\xff\x9e\xc8w\x0b\x0a\x01\
+\xfb\x17\xf0y\xb7\x00W0\x8f\xbf\xafU\x1f\x8d\xb27\
+0\xc3\xc1j\x00\x90\x94\xe3\xaahg\xb7E\x05\x9eN\
+PH\xdf\xc8h!\xb7\xcf\xc1\x00\xdf\x05.'\x16\xf8\
+\xae\x81t\xc5\xbfK\xe0\xcf\x18\xe4\xb35\xacx\x07\x11\
+xc\x82\xbe~\xba\x0d\xbb\x00\x06\x00I\xf9\x85\x80\x1d\
+=\x99\xe88\xaf-\xec\x13\x0e\xf2\xbf\x81O\x10\xd9T\
+\xf3\x00\xf0e\xfa\xf8B-?[H\xd6?O6|\
+\xbc\x1b\x00$\x95\x18\x02\xea=1\xa6\xb8\xca~_F\
+\x99]\xf0\x8c}\x05\x81/\xd6\xb8\xf8\xdfH?\x97p\
+8?\xa8\xe9'\x9cM\xef\xaf\x02\xde\xf3xiH\x08\
+0\x00H*?\x08\xd4m\x82\x8c\xacKt\xa4\xb9{\
+|\xd4noG\x7f\x99.\x17\x11\xf9\xbb\x1a\x16\xff\xbb\
+\x80?e\x0e\x0f\xd74\x9c\x04`n\x92cuY?\
+\xa1\xb1^s\xde\x06(\xa9\xba0\xb03U<\xae7\
+\xf0D\xa2#\x1d\xc6J\xa6\x01[\x0a\xfb\xac\xf3x\x9e\
+\xd5\x5c\x01\xecG\xe0\xdd5)\xae\x8f\x12\xb8\x9c\x01\xee\
+\xa8\xedx[\xc94\xfa9,\xd1\xd2\xf9\xfb\x93\x1e\xe3\
+5|\x0c\xb5\x01@R\xbd\x83A\x19\x13g\xe41\x02\
+[\x80\xe9=\x1e\xe9\x10\xa6\xf3\x06\xe0\xb1B?\xef<\
+\xeeb\x88\xcb\x88\xcc\x22pD\xc5\xc5\x7f3].e\
+>\xd7\xd6z\x5cM\xe7\x0dt9$\xc1\x91\xb6\x10\xa7\
+\xd0\xbfU\x8c\xeb=\xe6\x18I\xca]`#\xf0r\x82\
+#\xcd\xa2\xcb\xacR>\xf3\xd8\x1b\xf5\x96\xc2\x04W\xa3\
+\xc5\x14\xff\x08\xfc\x19\xf3kz\xd1\xdf\xb6\xc6\xfa%E\
+\x00xy|\xbc\xf4\x1et\xb7\xff\xa7\x8c@m\x00\x90\
+\xa4W\x15\xb2uD\x1eIp\xa4\xbd\x09\xbc\xad\xb4\xcf\
+=\xc8?\x01WVxg\xc0\xdf0\xc2_@\x03\xde\
+\xb28\xd6/\xfb$\x18+\x8f$\xbcf\xc4\x1d\x00I\
+\xaa\xd4\x08\x9b\x93\x5c\x07\x10\xe8\x109\x9e[K\xfcy\
+u\x80\x8b\x09,\xab 4\xfd\x0b}\xfc9G\xf2B\
+\xed\xfb\xf7V\xfa\x89\x1c?\xfeJ\xe4^=\xc9\x08\x9b\
+\xcb^\xad\x1b\x00$)\x85\xed\x7f\x7f=\x92\x17\x88\xc9\
+.`{+\xfb\xf3\xb3\xa5~\x9f.\xcb\xe8re\x89\
+\xc5\xff\xdf\xe9\xf2\xe7\xccae#\xfa{\x7f\xde\x04\x1c\
+\x9b\xe8h\xb77\x22\xf4\x18\x00$i\xc2\xb3\xe1*\xd2\
+<\x0f\xe00\xfa\xf8\x85R?\xfb<\xbeO?_\x00\
+n)\xa1\xf8?N\xe03\xcc\xe7\xdf\x1a\xd3\xb7}\xfc\
+\x1cpp\x82#\x8d\x8e\x8f\x93r\x82\xa9\x01@\x92J\
+\xb0\x85\x87\x89I\x1e\x09<\x93\xc0\xc9\xc4\x92\xe7\xd79\
+\xac\xa4\xcb\xff\x22r_\x81\xc5\x7f\x0b\x81\xcb\x18\xe0\x1f\
+\x1b\xd3\xaf\x91\x0e}\x9cD`f\x82c=\xcd\x96\x9a\
+>\xe7\xc0\x00 \xa9u\xca\xfa]t\x84\xb5\x04\x86\x13\
+\x1d\xedd\xd6p`\xe9m5\x8f\xbb\x08|\x1e\xd8P\
+\xc8\xf1\x03\x9fe\xa0\x86\xcf\xf8\xdf\x9d\xd5\x1cNda\
+\xa2\xa3\xada\x84\xb5\x06\x00Ij\xb2\xed\xb7[\x8f\xe6\
+E\x22\xf7&*\x94G\x139\xa5\xa2\xc0t\x0d\x91e\
+D\xba\x89W\xd2W1\x93\xcf\xd0\x84+\xfe\xb7\xd5\xcf\
+)\xc0@\xa2\xa3\xdd\xc3\xd1\xbc\xd8\x96\xf0l\x00\x90\xa4\
+\xad\xfa\xf8\x0e$\xb9\xa5n:\xf0+l\xa8\xe8\xd5\xb3\
+\x03\xfc%c/\x0eJU\xac\xbfE\x87e\xbc\x85g\
+\x1a\xd5\x9f\x1b\x981\xbe\xfa\x9f\x9e\xe0h\x9b\xc6\xc7G\
+k\x18\x00$\xe9\xa7+\xf7\x07\x88\x09\x1e\xf22f\x11\
+/sbE\xdf#\xd2\xe5\x0aB\x92\xa7\xf3\xddG\x97\
+?an\x81\x17\xbf\x15\xe5\x15\xdeE\xe4\x9dI\x8e\x15\
+\xd9H\xe0\x01\x03\x80$\xb5\xd1l6\x00w'*\xc2\
+\xaf\x03\x16U\xf6]\xe6\xf3#\xba|\x8a\xc8\x8d=\x14\
+\xbd\xf5D.c\x1e\xb76\xb2?#\x8b\xc6\xfb!\x85\
+\xbb\xc7\xc7G1*x4\xb0\x01@R\xfd\x15u!\
+\xe0\xf6\x93n`\x84\xc0\xed\x09\xb7\xceOc\x15\xc7T\
+\xd6n\xf3\x18\x06\xfe\x02\xb8s\x0a\xc53\x02\x9fg\x90\
+\xbfm\xe4\x98Y\xc51\xc9.\xfe\x8bD\x02\xb7\x13\x18\
+\x99\xf0\xb8\xda\xfe\x9f\x1a\xf2e@\x92\xf4j\xb71v\
+\x15}\xefo\x8e\x0b\x1cF\x87\xf7\x13y\x80\x90\xf8\xa2\
+\xbc\x89\x1a\xe4\x16\x86\x99\x01|\x92\x89>\x0c'\xb2\x99\
+\xc0g\xf8>\x977t\xe5\xdfa\x98\xf7\x13\x12\xbd\xfd\
+ol<\xdc\xd6\xd3\x0a~g\xff\xbe\xe2W\x06\xbb\x03\
+ I\xaf\x9e\x94\xd7\x13X\x9e\xf0\x88\x8bYS\xf2\x83\
+\x81v\xfcN7\x12\xb9\x90\xc8\x8d\xbb\xdd\xdd\x18\xfbw\
+\xf7\x108\x9f\xb9\x5c\xc4\x82\x09\xaex\xebf\x88_\x02\
+\x16';^`9\x03\xac\x9fr\xf1\x9f\xc8NA\xfa\
+>\xdfc\xb8p\x07@R\xde\x86\x89;L\x96\x81\x9b\
+\xe9\xf2\xc1$\x0f\x8f\x09\x1cB\xe4\x0c\xee\xe2AN\xa8\
+\xec\xa5=co\x0f\xdc\xc0J6\xf3+\xc0/\x13v\
+\xf8i\xe2)\xe0F\x2270X\xe0o\xddE\xbb\x8b\
+\x99\x04~\x87\x90\xe4\xcd\x7f\x10\xd9D\xe4\x9bI\x0b\x7f\
+M\x04\xcf~I\x8d*\xd6\xc5\xac\x90_=\x17\xae`\
+\x1f\xfa\xf9\x07\x02\xff)\xd1_x\x96\xc8\x87\x19\xe4k\
+\xb5h\xc7\xeb\xe9c>\xfb\xbf\xea\xbf\x9b\xc9&f\xf3\
+\x5c\xe3\xc7\xc8\x10\xa7\x13\xf8\x22\xb0_\xa2\x00\xf0MF\
+\xf8\x8d\x9d>\xff\xbf\xce\x01\xc0\x1d\x00I\x9a\x82#y\
+\x81!n\x22\xf2\xaeDo\x90\xdb\x8f\xc8\x19\xac\xe26\
+\xe6'x\xeb`\xaf\xde\xcb(\xf0d\xeb\xfam5\x03\
+\xc0\x92\x84\xc5\xbf\x0b\xdc\xd4\xb8\xe2?A^\x03 I\
+;\x9b\xcc;\xdc\x00\x89\x9e\x0c\x08\x108\x95~~\xd7\
+\xc6.P\xe0t\x02'$<\xe2\xbd\xe3\xe3\xa0Y\xc5\
+\x7f\x82\x17\x17\x1a\x00$5G\x99WM\xcf\xe1q\x02\
+7%,N\x81\xc8\x87\x18\xe64;\xb2\x90\x10w\x1a\
+\x81\x0f%=f\xe4f\xe6\xf0x[\x9b\xcc\x00 \xa9\
+\xd9+\xf5\xa2\x8e\x1d\x88\x8cr\x030\x94\xf0\xaf\xbc\x19\
+8\x8f\x87\x99cg&4\xf6\xac\x85\xf3\xc6\xdb7\x95\
+!\x22\xd7\x13\xb6\x1b\x17-\xd8\xfa7\x00H\xb2\xf8\xef\
+\xc9|V\xd0\xe5\x9f\x13\xaf*\xdf\xc9+\x9c\xc3\x1a\xf6\
+\xb2S\x13\xd8\xc0\x0c\xfa8\x07X\x90\xf4\xb8]\xfe\x99\
+\xf9\xachs\xd3\x19\x00$\xd5\xbf\xf0W\xb9\xea\x8a\x5c\
+\x0f\xacIv\xbc@\xa0\xc3\xf9\x8c\xb2\xc4\xceM`3\
+\xe7\x01g&>\xea\x9a\xf1~\xaf>\x84N\xd6$~\
+&3\x00Hr\xd5\xbf\xfb]\x80\xfb\x80\xaf$?n\
+`\x09\xc3\x9ce'\xf74>\xce\x22\x14\x12\xa4\xbe2\
+\xde\xef\xadf\x00\x90\xe4\xaa\x7fO\xb6\xf0\x15\xe0\x8e\xc4\
+\x01\xe0`\xe0#\xacN\xf4\xb6\xba\xfc\xc6\xc8\xbb\x89|\
+l\xbc\x1dS\xba\x83N\x01\x81\xcf\x00 I\x0dX\xf5\
+o\xef(\x1e%p\x0d$\x7f\x92\xdfQt\xb8\x98!\
+~\xd9\x8e\x9f\x84\xb1\xf6\xfa\xc3\x84\xcf\xfa\x1f\x13\xd9L\
+\xe4o\x98\xc3\xa3\x8d\x18\x97\xdb\x9b\xe4]2\x06\x00I\
+\xae\xfa'\xb6\x0b\xf05\xe2N\xee\x09\xef\xdd\x89\x04\xfe\
+'C\x9c\xe8 \x98P\xf1\x1fk/\x0ai\xaf\xeb\x19\
+\xe1\xbaF\x16\x7fw\x00$\xb9\xea/\xc8\x91\xbc@\xe0\
+j`m\x01G?\x85\xc0\xa7\xdc\x09\x98\xc0\xca?\xf0\
+)\xe0\x94\x02\x8e\xbe\x96\xc0\xd5;}\xea_K\x19\x00\
+$i\xa2\x06\xb8\x0d\xb8j\xfc\x11\xb1E\x84\x80Oz\
+M\xc0.C\xe2\xbb\x09|\xb2\x90\xe2?\xd6\x9fW\x8d\
+\xf7o3W\xffSxH\x96\x01@\x92\xab\xff\xc9L\
+\xa03\xb9\x82\xc8W\x0b\xfa\x14'\xd2a\x99w\x07\xec\
+0F\xce\x22\xb2\x0c\x0a\xfa\x99$\xf2U\x9e\xe7\xca\xdc\
+\x9a\xd5\x00 I\x93\xf1\x166\xd1\xcf\x97\x89\xac,\xe8\
+/\x1cEd)\xab\xf9h\xf6\x0f\x0b\xda\xc0\x0cV\xf3\
+Q\x22K\x93_\xf0\xf7\xd3\xe2\xbf\x92~\xbe\xcc\xb1\xbc\
+\xd4\xd8\xd5\xbf\x01@\x92\xab\xff\x82W\xff[\xcd\xe1V\
+\x02\xcb`'E#\x85\xc0\xc1t\xb8\x94\xc8\x9ff\xfb\
+\xd8\xe0U\x1c\xc3\x16.\xa7\xc3\xa5\x05\xdc\xea\xb7\xd5K\
+\x04\x961\x87[\x1b\xddVS|G\x86\x01@R\xde\
+\xa6\xfa\x82\xa1\xb9\x5c\x0d|\xb1\xd0\xcf\x169\x9fQ\xae\
+\xca\xee\x05B\xc3\x9cF\x1f\x7fN\xfa'\xfcm\xef\x8b\
+\xe3\xfdX\xdfpZ\xd4\xf8\x05\xfa=\xfb%Y\xfc\xa7\
+\xb4J\x1fe%\xcb\xe8\xe7 \xe0\xf4\x82v\x02\x02c\
+\xcf\xb8?\x9c!\x8e\xa2\xcb\x97\x98\xcf\x13\xad\xed\x8f\xd5\
+\x0c\x108\x1d\xf8\x10i_\xec\xb33_c\x84e\x04\
+Fs,\xfec\xc3K\x92\xaa[\xe9U7\xd1\xa6z\
+\xb5\xf00\xc7\x01\x97\x01\xc7\x17\xbc\x1b\x10\x09\xdcL\xe4\
+\x1a\x9e\xe1\x1b\x9c\x90\xfc\xa1D\xd5\xb9\x8b\x99\xbc\x9e_\
+\x03\x96\x108\xa1\x84\xbfx7p\x01\x03|\xa7\xf41\
+\xb9\xfd\xb8\x9b\xea\xdfK0~\x0d\x00\x92\xf2\x0a\x00\x03\
+\x05\xcc{C,$p\x09\xf0\xd6\x12\xbe\xc1\xb3D\xae\
+#p\x0ds\xb9\x87P\xc8-\x89\xe5\x88t\x18\xe2\x97\
+\x08\xfc\x0e\x81\xf7\x00\xfb\x95\xf0W\x1f$\xf2\x07\x0cr\
+S%cr\x22\xe3oW\x9f!\xf1\xd85\x00H\xca\
+'\x00\x0c\x148\xe7\xad\xe6,\x02\x97\x10x]I\xc5\
+\xf3\x11\xe0\x06\xba\x5c\xdb\xc8\x17\xd7\xac\xe2\x18:\xbc\x1f\
+XL\xe0\x90\x92\xda\xec9\x22\x7f\xc0<\xae\xaam\xf1\
+/\x91\x01@R\xfb\x03@Y\x13\xef*\xce\xa5\xc3R\
+\x02o,q\x15\xbd\x1e\xf8:\xb0\x9c\xbd\xb8\x93C\xd9\
+\x5c\xdb\xfe\xde\xc0\x0c^\xe1]D\x16\x11YX\xd8\xad\
+};o\xa7\xa7\x08\x5c\xcc\x00\x97W6\x16\x0d\x00\x92\
+\xd4\xe2U\xd7\x10g\x13\xb8\x18x}\xa9\x7f7\xf2\x1c\
+\xb0\x1c\xb8\x91M\xdc\xc2\xd1<Q\x8b\x9f\x07\x22\x1dV\
+s8\xfd\x9cBd!\x91w\x96\xb6K\xf2S\xcf\x10\
+Y\xca\xe0.\x1e\xf6\x93a\xf17\x00H2\x00\x14\x13\
+\x02. \xb0\xb4\xf4\x100f\x0b\x91\x07\x80\xdb\x88\xdc\
+\xc6(\xf7\xf04?d\x01#\xa5}\x82[\xe9g\x7f\
+\xdeD\x1f?G\x1f'\xd1e\x11\x81\xb9\xc0\xf4\x0a\xda\
+\xe3\x19\x22\x173\xc8e\x16\x7f\x03\x80$C@9;\
+\x01pQ\xa9?\x07\xec\xb8\xfa\xde\x04\xac\x07\x1e$p\
+7\x91\xfb\xe9\xb0\x91-\xfc\x80#x\x85\x90\xa0\xdd#\
+\x81\x95Lc:o\xa0\xcb,\x02o#r<p,\
+p0\x81\x99\x15~\xff\xa7\xe8\xf0I\xe6\xee\xe61\xbf\
+\x06\x00Ijq\x00\xa8j\x12\x1e\xe6\x5c\x22\x17W\xb0\
+\xe5\xbd\xb3b\xd8\x05^\x046\x02\x8f\x8c\x07\x835\xc0\
+:\x22?\xa6\xcb\xe3\xf4\xf1\xe2\x1e\x8f3\xca\xdet8\
+\x88\xc0k\x81\xd9\xc0\x5c\xe00\xe0\x90\xf1\x7f\xf6!\xd4\
+\xe0!s\x91\xe7\x08,\xdd\xe5o\xfe\x99\x17\x7f\x03\x80\
+$w\x01z\xfd\x5c{:\xeej\xce\xa2\xc39\x94s\
+\x8b\xe0T<\xff\x93\xd52\x13\xba\x80p\xc66\xbb\x1a\
+\xfb\xd6\xf4;=H\x97+vy\xb5\xbf\xc5\xdf\x00 \
+\xc9]\x80d\x9fgw\xc7\x1e{N\xc0\xc7)\xfaa\
+A\x02\xb8\x9b\xc8\xa7vy\x9f\x7fYc\xcd\x00 I\
+\x0d\x0b\x01\xbd|\x86\xdd\x1d{\xec\x89\x81\x17P\xd4c\
+\x83\x05\xf05\xe0\xb2\x9d>\xe1\xcf\xe2o\x00\x90d\x00\
+(\xfc\xef\xef\xeao\xac\xe4\x10\xfaY\x02|\x18x\x8d\
+\x1d\x9e\xccK\xc0\x17\x19a\x19G\xf0\x88\xc5\xdf\x00 \
+\xc9\x100\xb1\x09\xba\x88\xbf\xb9\xab\x22\x10\xe9c\x0dg\
+\x12YB\xe0\x08;\xbcG\x91\x95\x04\x961\x97\xabw\
+\xfab\x1f\x03\x80\x01@\x92\x01`\xa7\x93t\x91\x7fo\
+w\x85`-\x0b\x18\xe1\x83\x04~\xab\x16W\xcd7\xaf\
+\xf0w\x89|\x95~\xbe\xcc\x1cn\xadm\xb84\x00H\
+R\x0dC@\xd5\xab\xc1{y\x0d\xfbr6p\x160\
+\xc7\x8e\x9f\xb0\xb5\xc0U<\xcf\x95\x1c\xcbK\x16\x7f\x03\
+\x80$C@\xf3B\xc0\xd8w=\x99\xc8\x99\xc0{\x09\
+\xcc\xb0\xf3w\xb9\xea\xdf\x0c\x5cO\xe0j\x06\xb8\xadV\
+\xe3i\xa0y\xf5\xd4\x00 \xc9\x00P\x87\x10\xb0\x82}\
+\x98\xce\xe9D\xce\x00\xde\xe1\x00\xd8\xc1\x1dD\xfe\x86\x11\
+\xae\xe3H^\xa8\xddx2\x00H\x92!\xa0\xa7B\xf1\
+\x10of:\x1f\x00>\xc0\xd8S\xf6r\xb7\x06\xf8\x0a\
+\x1d\xbe\xc2\x1c\x1e\xad\xedX2\x00H\x92! I\xb1\
+X\xc51\x04\xdeK\x87\xf7\x00\x83\x19\xf6\xfc\x10]\xfe\
+\x99\xc8\xf5\xcc\xe7\xbe\xda\x8f#\x03\x80$\x19\x00\x12\x07\
+\x81#\x09\xbc\x97\xc0\xa9\xc0\xb1\xad\xbec`\xec}\x05\
+\xf7\x12\xb9y\xbc\xf0\xafh\xd4X\xf2\x22@I2\x04\
+$-\x1a\x91\xc0Z\x0e\xa2\xcbb`!pR\xa5o\
+\xd9K_\xf87\x01\xb7\x037\xd1\xe1\x06\xe6\xf0x\x92\
+7\x15V1\x8e\xbc\x0dP\x92\x0c\x00\x85\x14\x8e\xb1\x8b\
+\x05\x17\x109\x95\xc8\x22\xe0PB\x03\xe7\xf2H\x046\
+\x10XN\x97o2\xca-S\xba\xb8\xcf\x00`\x00\x90\
+d\x08\xc8*\x08\x8c\xb5\xc9a\xc0\xc9DN\x02\x8e'\
+0\x0bj\xbd3\xb0\x89\xc8F\xc6^\xd8s\x07\x1d\xfe\
+\x8d\x01\xd6\xb7n\x1c\xf9$@I2\x04\x94R@\x22\
+\xfd\xac\xe2P\xa6s4\xa3\x1cG\xe0X\x22\x03\x04\xf6\
+\x07\xfa*\xfc&\xa3D\x9ef\xecJ\xfe{\xe8\xe3;\
+\x04\x1e`6\x1b\x08\x8c\xb4z\x0c\xf92 I2\x04\
+\x94^H\x1e`o\xfa\x99\xc3t\x0e\xa7\xcb|\xe0$\
+\xe0\x00\x02\x87\x00{\x01\xd3\x0b\xf8\xa4[\x80\x97\x89<\
+\x02<\x09\xdcN\x87Ul\xe1aFX\xcb\xd1\xbc\x98\
+\xd5\x182\x00H\x92\x01\xa0\xf2\x82\xb2\x82}\xe8g\x06\
+\x81\xd9Df\x118\x98\xc8\x81\x04f\x8f\xef\x10\x1c@\
+d\xffIT\x8e\xa7\xc7\x8b\xfc(]\xd6\xd3\xe1\xfbD\
+\x1e#\xb0\x91\xc8:F\xd8\x9c\xe4\xf7\xfc\xed\xfb:e\
+Q5\x04\x18\x00$\x19\x02\xb2\x09\x02m\xea\xdb^\xdb\
+\xc1\x9f\x02\x0c\x00\x92\x0c\x01\x06\x81\x86\xf6e\x13B\x80\
+\x01@\x92\x0c\x01\x86\x80\x82\xfa\xae\x97v\xc8\xf8\xe1@\
+\x06\x00I\x86\x00C@\xb3\xfb\xa9\xee;\x015\xed#\
+\x03\x80$C\x80!\xa0\xf9}2\xd56\xc8\xf8g\x80\
+~g\x0eI\x9a\xc4$\x9e{\xd8\xa8k\xf8\x1a\x1e\x7f\
+\xf2\x81\xc1\xd1\x1d\x00I\x16\xa2\xc2Vou,\x1cM\
+\xbbE\xae\xeav(\xf3;\xfa\x13\x80$5,\x04\xec\
+n\xe2\xae[\x91LQd\xda\xb0\x22\xdeS;4\xe5\
+\xa7\x09\x03\x80$UP\xc4&\xf7<\xfez\x14\xcd\xa6\
+\xdc\x17_e[T\xf1\x1dk\x1c\x00:HR\x9b\xf4\
+:\xe1N\xf6\xff\xbf\x0d\xf7\xe3\xb7\xed\xb7\xf0\xed\xbf\xcf\
+0\xd1k7\xdc\x01\x90\xe4N@;W\xd1u\xbe\x0a\
+\xbe\xaa\xf6\xa8\xfa\xbb\xf9(`I\xaay\x10h\xc3\x05\
+tS\xf9\x0e\xae\x8a\x0d\x00\x92\xa4\x0a\x82\x87\x01\xc0\xe2\
+_!\xaf\x01\x90\xa4\x1c\x0b\x80\xc5?\xeb\xe2o\x00\x90\
+\xa4\xa2\x0b\xc1\x80;\xad\x16\x7f\x03\x80$\x19\x04d\xf1\
+7\x00H\x92r,<\xf6A=\xf8.\x00I\xca\x8d\
+\xbf\xff\x1b\xbe\xdc\x01\x90$)\xbf\xe2o\x00\x90$)\
+\xc3\xe2o\x00\x90$)\xc3\xe2o\x00\x90\xa46\xf07\
+\xfd\xf2\x0a\x7f\x8b.\xb8\xf4\xcaQIjk\x91\xae\xd3\
+[\xf1&\xf39\xeb\x18hZx\xa7\x85w\x01H\x92\
+\xa1\xc3\x82\x9aY\xf1w\x07@\x92,\xc6\xf5,\xa0u\
+h\xaf\x96?_\xc1\x00 I\x06\x80z\x16\xcb&\xbe\
+^\xb9A\xfc\x09@\x92d\xa1\xcc\xa8\xf0o\xe5]\x00\
+\x92$\x8bqf\xc5\xdf\x00 I2\x04d\xfa\xb2&\
+\x7f\x02\x90$\x19.2\xe4\x0e\x80$)\xafB\xed\xeb\
+\x99\x01\xef\x02\x90\xa4r\xb4\xf1.\x80\xb2\x8bh\xafm\
+h\xd1w\x07@\x92Z_,mC\xdb\x7f\x0f\xbc\x06\
+@\x92\xd4\xbc\x100\xd1\xdd\x00\x0b\xff.\xd90\x92T\
+\xa66\xfd\x14P\xa7\xe2:L\xb4\xd8\x1b\x00$\xc9\x10\
+\x90[\x00\x90\x01@\x92\x0c\x02\x16\x7f\x19\x00$\xc9 \
+`\x00\x90\x01@\x92\x0c\x03\x06\x00\x19\x00$\xc90`\
+\xf17\x00H\x92\x0c\x04\x16\x7f\x03\x80$\xc9@`\xf1\
+7\x00H\x922\x0e\x05\x16\x7f\x03\x80$)\xa3p`\
+\xe1\x97$I\x92$I\x92$I\x92$I\x92$I\
+\x92$I\x92$I\x92$I\x92$I\x92$I\x92\
+$I\x92$I\x92$I\x92$I\x92$I\x92$\
+I\x92$I\x92$I\x92$I\xcd\xf6\xff\x01fW\
+,\xae\xec\xabt\x8d\x00\x00\x00\x00IEND\xaeB\
+`\x82\
+"
+
+qt_resource_name = b"\
+\x00\x09\
+\x0alxC\
+\x00r\
+\x00e\x00s\x00o\x00u\x00r\x00c\x00e\x00s\
+\x00\x09\
+\x00(\xbf#\
+\x00s\
+\x00t\x00y\x00l\x00e\x00.\x00c\x00s\x00s\
+\x00\x11\
+\x07\x00\x85\x5c\
+\x00d\
+\x00e\x00s\x00c\x00r\x00i\x00p\x00t\x00i\x00o\x00n\x00s\x00.\x00h\x00t\x00m\x00l\
+\
+\x00\x05\
+\x00o\xa6S\
+\x00i\
+\x00c\x00o\x00n\x00s\
+\x00\x12\
+\x05\xf8&G\
+\x00s\
+\x00e\x00t\x00t\x00i\x00n\x00g\x00s\x00-\x00w\x00r\x00o\x00n\x00g\x00.\x00p\x00n\
+\x00g\
+\x00\x09\
+\x06\x98\x83'\
+\x00c\
+\x00l\x00o\x00s\x00e\x00.\x00p\x00n\x00g\
+\x00\x0f\
+\x07?,\xa7\
+\x00s\
+\x00e\x00t\x00t\x00i\x00n\x00g\x00s\x00-\x00o\x00k\x00.\x00p\x00n\x00g\
+"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00\x02\
+\x00\x00\x00\x18\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x00X\x00\x02\x00\x00\x00\x03\x00\x00\x00\x05\
+\x00\x00\x000\x00\x00\x00\x00\x00\x01\x00\x00\x00(\
+\x00\x00\x00h\x00\x00\x00\x00\x00\x01\x00\x00J\xdc\
+\x00\x00\x00\x92\x00\x00\x00\x00\x00\x01\x00\x00f\xc8\
+\x00\x00\x00\xaa\x00\x00\x00\x00\x00\x01\x00\x00r\xdc\
+"
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x01, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x01, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
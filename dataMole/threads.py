@@ -22,14 +22,55 @@
 # along with DataMole.  If not, see <https://www.gnu.org/licenses/>.
 
 import sys
+import threading
 import traceback
-from typing import Tuple, Any, Union
+from enum import IntEnum
+from typing import Tuple, Any, Union, Dict, Hashable, Optional
 
-from PySide2.QtCore import QRunnable, Slot, QObject, Signal
+from PySide2.QtCore import QRunnable, Slot, QObject, Signal, QThreadPool, QThread, Qt
 
 from dataMole import flogging
 
 
+class Priority(IntEnum):
+    """ Priority lanes of background work. Interactive requests run in a separate thread pool, so
+    that they are never queued behind long computations like flow executions. Inside a pool,
+    workers with higher priority are started first """
+    Background = 0
+    Interactive = 10
+
+
+class Cancelled(Exception):
+    """ Raised by executables which stop because their worker was cancelled """
+    pass
+
+
+# Pool of interactive requests, created when first needed
+_interactivePool: Optional[QThreadPool] = None
+_poolLock = threading.Lock()
+# Worker running in the current thread
+_local = threading.local()
+
+
+def pool(priority: Priority = Priority.Background) -> QThreadPool:
+    """ Returns the thread pool of a priority lane. Background work uses the global pool """
+    global _interactivePool
+    if priority < Priority.Interactive:
+        return QThreadPool.globalInstance()
+    with _poolLock:
+        if _interactivePool is None:
+            _interactivePool = QThreadPool()
+            _interactivePool.setMaxThreadCount(max(2, QThread.idealThreadCount() // 2))
+        return _interactivePool
+
+
+def cancellationRequested() -> bool:
+    """ Tells if the worker running in the current thread was cancelled. Long computations may
+    check it and raise :class:`Cancelled` to stop early. Outside workers it is always False """
+    worker: Optional[Worker] = getattr(_local, 'worker', None)
+    return worker is not None and worker.isCancelled
+
+
 class Worker(QRunnable):
     """
     Build a runnable object to execute an operation in a new thread
@@ -61,15 +102,37 @@ class Worker(QRunnable):
         self._executable = executable
         self._args = args
         self._identifier = identifier
+        self._cancelled = threading.Event()
         self.signals = Worker.WorkerSignals()
         self.setAutoDelete(True)
 
+    @property
+    def identifier(self) -> Any:
+        return self._identifier
+
+    @property
+    def isCancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        """ Requests the cancellation of the worker. If it was not started, the executable is not
+        run. Otherwise its result or error is not emitted. In both cases only signal 'finished' is
+        emitted. It is thread safe """
+        self._cancelled.set()
+
     # noinspection PyBroadException
     @Slot()
     def run(self) -> None:
         """ Reimplements QRunnable method to run the executable """
+        _local.worker = self
         try:
+            if self.isCancelled:
+                raise Cancelled()
             result = self._executable.execute(*self._args)
+            if self.isCancelled:
+                raise Cancelled()
+        except Cancelled:
+            flogging.appLogger.debug('Worker cancelled: id={}'.format(self._identifier))
         except Exception:
             flogging.appLogger.debug('Worker got exception: id={}'.format(self._identifier))
             trace: str = traceback.format_exc()
@@ -80,5 +143,66 @@ class Worker(QRunnable):
             flogging.appLogger.debug('Worker emits result: id={}'.format(self._identifier))
             self.signals.result.emit(self._identifier, result)
         finally:
+            _local.worker = None
             flogging.appLogger.debug('Worker finished: id={}'.format(self._identifier))
             self.signals.finished.emit(self._identifier)
+
+
+class RequestScheduler:
+    """
+    Starts workers in a priority lane, coalescing requests: at most one request is kept for every
+    key, and the latest request wins. Submitting a request cancels the pending or running request
+    with the same key, unless it has the same identifier. This class is thread safe
+    """
+
+    def __init__(self, priority: Priority = Priority.Interactive):
+        self.priority: Priority = priority
+        # { key: worker }
+        self.__workers: Dict[Hashable, Worker] = dict()
+        self.__lock = threading.Lock()
+
+    def submit(self, key: Hashable, worker: Worker) -> bool:
+        """
+        Starts a worker, cancelling the request with the same key
+
+        :param key: the request group. E.g. the kind of computation
+        :param worker: the worker to start
+        :return: False if a request with the same key and identifier is already in progress. In
+            this case the worker is not started
+        """
+        with self.__lock:
+            previous = self.__workers.get(key, None)
+            if previous is not None and not previous.isCancelled and \
+                    previous.identifier == worker.identifier:
+                return False
+            if previous is not None:
+                previous.cancel()
+            self.__workers[key] = worker
+        worker.signals.finished.connect(lambda _: self.__forget(key, worker), Qt.DirectConnection)
+        pool(self.priority).start(worker, int(self.priority))
+        return True
+
+    def __forget(self, key: Hashable, worker: Worker) -> None:
+        with self.__lock:
+            if self.__workers.get(key, None) is worker:
+                del self.__workers[key]
+
+    def isPending(self, identifier: Any) -> bool:
+        """ Tells if a request with given identifier is queued or running and not cancelled """
+        with self.__lock:
+            return any(w.identifier == identifier and not w.isCancelled
+                       for w in self.__workers.values())
+
+    def cancel(self, key: Hashable) -> None:
+        """ Cancels the request with given key, if any """
+        with self.__lock:
+            worker = self.__workers.pop(key, None)
+        if worker is not None:
+            worker.cancel()
+
+    def cancelAll(self) -> None:
+        with self.__lock:
+            workers = list(self.__workers.values())
+            self.__workers.clear()
+        for worker in workers:
+            worker.cancel()
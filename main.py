@@ -50,12 +50,14 @@ if __name__ == '__main__':
 
     # Initialize globals and mainWindow
     from dataMole import gui
+    from dataMole.gui import window
+    from dataMole.gui.widgets import notifications, statusbar
 
-    mw = gui.window.MainWindow()
+    mw = window.MainWindow()
     # Create status bar
-    gui.statusBar = gui.widgets.statusbar.StatusBar(mw)
+    gui.statusBar = statusbar.StatusBar(mw)
     mw.setStatusBar(gui.statusBar)
-    gui.notifier = gui.widgets.notifications.Notifier(mw)
+    gui.notifier = notifications.Notifier(mw)
     # Set notifier in main window for update
     mw.notifier = gui.notifier
     gui.notifier.mNotifier.updatePosition()
@@ -42,6 +42,10 @@ class InputDummy(InputGraphOperation):
     def setOptions(self, df: Optional[data.Frame]) -> None:
         self.__df: data.Frame = df
 
+    def sourceVersion(self):
+        # The frame is part of the options, so it is already fingerprinted
+        return 0
+
 
 class OutputDummy(OutputGraphOperation):
     def __init__(self):
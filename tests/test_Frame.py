@@ -1,10 +1,16 @@
+import importlib
+
+import numpy as np
 import pandas as pd
 import pytest
 from numpy import int64
 
-from dataMole.data import Frame, Shape
+from dataMole.data import Frame, Shape, ColumnView
 from dataMole.data.types import Types, IndexType
 
+# The module, which is shadowed by the class with the same name in the package
+frameModule = importlib.import_module('dataMole.data.Frame')
+
 
 #
 # def test_integerToFloat():
@@ -162,3 +168,86 @@ def test_cloneShape():
     }
     assert s.columnsDict == sColDict
     assert s.indexDict == sIndexDict
+
+
+def test_replaceColumns():
+    d = {'col1': [1, 2, 3, 4, 10], 'col2': [3, 4, 5, 6, 0], 'col3': ['q', '2', 'c', '4', 'x'],
+         'cat': pd.Categorical(['a', 'b', 'a', 'c', 'b'])}
+    f = Frame(d)
+    original = f.getRawFrame().copy(True)
+
+    g = f.replaceColumns({0: pd.Series([0, 0, 0, 0, 0]), 2: np.array(['a'] * 5, dtype=object)})
+    assert g.colnames == f.colnames
+    assert g.getRawFrame()['col1'].dtype == float
+    assert g.getRawFrame()['col1'].tolist() == [0] * 5
+    assert g.getRawFrame()['col2'].tolist() == [3, 4, 5, 6, 0]
+    assert g.getRawFrame()['col3'].tolist() == ['a'] * 5
+    # Categorical column is not copied
+    assert g.getRawFrame()['cat'].array is f.getRawFrame()['cat'].array
+    assert f.getRawFrame().equals(original)
+    with pytest.raises(ValueError):
+        f.replaceColumns({0: [1, 2]})
+
+
+def test_columnView():
+    d = {'col1': [1, 2, 3], 'cat': pd.Categorical(['a', 'b', 'a'])}
+    f = Frame(pd.DataFrame(d, index=[5, 6, 7]))
+    columns = ColumnView(f)
+    assert columns[1].dtype == 'category' and columns.columns.tolist() == ['col1', 'cat']
+    columns.replace({0: np.array([4, 5, 6])})
+    # Values are read as they were replaced in the frame
+    assert columns[0].dtype == float and columns[0].name == 'col1'
+    assert columns[0].index.tolist() == [5, 6, 7]
+    columns.replace({0: columns[0] * 2})
+    assert list(columns.replaced.keys()) == [0]
+    assert f.replaceColumns(columns.replaced) == Frame(pd.DataFrame(
+        {'col1': [8.0, 10, 12], 'cat': d['cat']}, index=[5, 6, 7]))
+    assert f.getRawFrame()['col1'].tolist() == [1, 2, 3]
+
+
+def test_withColumns():
+    d = {'col1': [1, 2, 3, 4, 10], 'col2': [3, 4, 5, 6, 0], 'col3': ['q', '2', 'c', '4', 'x']}
+    f = Frame(d)
+
+    g = f.withColumns({'new': [1, 2, 3, 4, 5], 'col2': pd.Series([0.5] * 5)}, drop=['col1'])
+    assert g.colnames == ['col2', 'col3', 'new']
+    assert g.getRawFrame()['col2'].tolist() == [0.5] * 5
+    assert g.getRawFrame()['new'].dtype == float
+    # Object block is shared, since no column in it changed
+    assert not frameModule.SHARE_BLOCKS or np.shares_memory(g.getRawFrame()['col3'].values, f.getRawFrame()['col3'].values)
+    assert f.colnames == ['col1', 'col2', 'col3']
+
+
+def test_assembleWithoutSharing(monkeypatch):
+    d = {'col1': [1, 2, 3, 4, 10], 'col2': [3, 4, 5, 6, 0], 'col3': ['q', '2', 'c', '4', 'x'],
+         'col4': pd.Categorical(['a', 'b', 'a', None, 'b'])}
+    f = Frame(d)
+    expected = [f.replaceColumns({1: pd.Series([0.5] * 5), 3: np.arange(5)}),
+                f.withColumns({'new': ['z'] * 5}, drop=['col1', 'col3']),
+                f.replaceColumns(dict())]
+    # Columns are copied
+    monkeypatch.setattr(frameModule, 'SHARE_BLOCKS', False)
+    results = [f.replaceColumns({1: pd.Series([0.5] * 5), 3: np.arange(5)}),
+               f.withColumns({'new': ['z'] * 5}, drop=['col1', 'col3']),
+               f.replaceColumns(dict())]
+    for r, e in zip(results, expected):
+        pd.testing.assert_frame_equal(r.getRawFrame(), e.getRawFrame())
+    assert not np.shares_memory(results[2].getRawFrame()['col1'].values,
+                                f.getRawFrame()['col1'].values)
+    empty = Frame(pd.DataFrame(index=[1, 2]))
+    assert empty.replaceColumns(dict()).getRawFrame().index.tolist() == [1, 2]
+
+
+def test_copyOnWrite():
+    d = {'col1': [1, 2, 3, 4, 10], 'col2': [3, 4, 5, 6, 0], 'col3': ['q', '2', 'c', '4', 'x']}
+    f = Frame(d)
+    g = f.replaceColumns({2: pd.Series(['a'] * 5)})
+    assert not frameModule.SHARE_BLOCKS or \
+           np.shares_memory(g.getRawFrame()['col1'].values, f.getRawFrame()['col1'].values)
+
+    g['col1'] = pd.Series([0, 0, 0, 0, 0])
+    assert f.getRawFrame()['col1'].tolist() == [1, 2, 3, 4, 10]
+    f['col2'] = pd.Series([1, 1, 1, 1, 1])
+    assert g.getRawFrame()['col2'].tolist() == [3, 4, 5, 6, 0]
+    del f['col1']
+    assert g.colnames == ['col1', 'col2', 'col3']
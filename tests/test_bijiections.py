@@ -1,9 +1,11 @@
 import copy
 
 import numpy as np
+import pandas as pd
 
 from dataMole import data
-from dataMole.operation.cleaner import RemoveBijections
+from dataMole.operation import utils
+from dataMole.operation.cleaner import RemoveBijections, find_duplicates
 from tests.utilities import nan_to_None
 
 
@@ -75,3 +77,54 @@ def test_remove_bijections_with_nan():
     expected = copy.deepcopy(d)
     del expected['col11']
     assert nan_to_None(expected) == nan_to_None(g.to_dict())
+
+
+def test_duplicate_columns_fingerprint():
+    df = pd.DataFrame({
+        'f1': [0.0, np.nan, 2.5, 3.0],
+        'f2': [-0.0, np.nan, 2.5, 3.0],
+        'f3': [0.0, 1.0, 2.5, 3.0],
+        's1': ['a', None, 'b', 'a'],
+        'c1': pd.Categorical(['a', None, 'b', 'a'], categories=['b', 'a']),
+        's2': ['a', np.nan, 'b', 'a'],
+        'm1': [1, 'a', None, 2.0],
+        'm2': [1.0, 'a', None, 2],
+        'i1': np.arange(4),
+        'i2': np.arange(4),
+        'd1': pd.to_datetime(['2020-01-01', None, '2020-01-03', '2020-01-04']),
+        'd2': pd.to_datetime(['2020-01-01', None, '2020-01-03', '2020-01-04'])
+    })
+    # Categories are compared as objects, where missing values are NaN. None and NaN are different
+    assert find_duplicates(df) == ['f2', 's2', 'm2', 'i2', 'd2']
+    assert utils.columnFingerprint(df['s2']) == utils.columnFingerprint(df['c1'])
+    assert utils.columnFingerprint(df['f1']) != utils.columnFingerprint(df['f3'])
+
+
+def test_duplicate_columns_random():
+    rng = np.random.RandomState(5)
+    columns = dict()
+    for i in range(60):
+        kind = rng.randint(3)
+        if kind == 0:
+            values = rng.randint(0, 2, 6).astype(float)
+        elif kind == 1:
+            values = pd.Categorical(rng.choice(['x', 'y'], 6))
+        else:
+            values = rng.choice(['x', 'y'], 6).astype(object)
+        columns['col{:d}'.format(i)] = values
+    df = pd.DataFrame(columns)
+    # Pairwise comparison in column order
+    expected = list()
+    for j in range(df.shape[1]):
+        b = np.asarray(df.iloc[:, j], dtype=object) \
+            if df.dtypes[j].name == 'category' else df.iloc[:, j].values
+        for i in range(j):
+            a = np.asarray(df.iloc[:, i], dtype=object) \
+                if df.dtypes[i].name == 'category' else df.iloc[:, i].values
+            sameType = {df.dtypes[i].name, df.dtypes[j].name} <= {'object', 'category'} \
+                or df.dtypes[i].name == df.dtypes[j].name
+            if sameType and utils.numpy_equal(a, b):
+                expected.append(j)
+                break
+    assert utils.duplicateColumns(df) == expected
+    assert expected
@@ -0,0 +1,187 @@
+import gc
+import weakref
+from typing import Dict
+
+from dataMole.flow.cache import ResultCache
+from dataMole.flow.dag import OperationDag, OperationNode
+from dataMole.flow.executor import FlowExecutor, findInputNodes, findExecutionSet
+from dataMole.flow.runner import HeadlessWorkbench
+from dataMole.operation.input import SetInput
+from .DummyOp import *
+
+
+class CountingOp(DummyOp):
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+        self.factor = 1
+
+    def getOutputShape(self) -> Union[data.Shape, None]:
+        return self._shapes[0]
+
+    def execute(self, df: data.Frame) -> data.Frame:
+        self.count += 1
+        return data.Frame(df.getRawFrame() * self.factor)
+
+    def setOptions(self, factor: int) -> None:
+        self.factor = factor
+
+    def getOptions(self) -> Any:
+        return {'factor': self.factor}
+
+
+class ColumnCountingOp(CountingOp):
+    def isColumnLocal(self) -> bool:
+        return True
+
+    def executeColumns(self, columns: data.ColumnView) -> Dict[int, Any]:
+        self.count += 1
+        return {0: columns[0] * self.factor}
+
+    def execute(self, df: data.Frame) -> data.Frame:
+        return df.replaceColumns(self.executeColumns(data.ColumnView(df)))
+
+
+def buildChain(opType: type = CountingOp, inOp: Optional[InputGraphOperation] = None):
+    if inOp is None:
+        inOp = InputDummy()
+        inOp.setOptions(data.Frame({'col1': [1, 2, 0.5, 4, 10], 'col2': [3, 4, 5, 6, 0]}))
+    dag = OperationDag()
+    ops = [opType(), opType()]
+    outOp = OutputDummy()
+    out = [None]
+    outOp.setOptions(out)
+    nodes = [OperationNode(op) for op in [inOp, *ops, outOp]]
+    for n in nodes:
+        dag.addNode(n)
+    for a, b in zip(nodes[:-1], nodes[1:]):
+        assert dag.addConnection(a.uid, b.uid, 0)
+    return dag, nodes, ops, out
+
+
+def runFlow(dag: OperationDag, fusion: bool = False) -> bool:
+    graph = dag.getNxGraph()
+    toExecute = findExecutionSet(graph, findInputNodes(graph))
+    return FlowExecutor(maxWorkers=2, fusion=fusion).run(graph, toExecute, cache=dag.cache)
+
+
+def test_cached_execution():
+    dag, nodes, ops, out = buildChain()
+    f = nodes[0].operation.getOptions()[0]
+
+    assert runFlow(dag)
+    assert [op.count for op in ops] == [1, 1]
+    assert out[0] == f
+    # Nothing changed
+    out[0] = None
+    assert runFlow(dag)
+    assert [op.count for op in ops] == [1, 1]
+    # Output operations are always executed
+    assert out[0] == f
+
+    # Only the updated node is executed again
+    dag.updateNodeOptions(nodes[2].uid, 2)
+    assert runFlow(dag)
+    assert [op.count for op in ops] == [1, 2]
+    assert out[0] == data.Frame(f.getRawFrame() * 2)
+
+    # Changing the input frame invalidates everything
+    g = data.Frame(f.getRawFrame() + 1)
+    dag.updateNodeOptions(nodes[0].uid, g)
+    assert runFlow(dag)
+    assert [op.count for op in ops] == [2, 3]
+    assert out[0] == data.Frame(g.getRawFrame() * 2)
+
+
+def test_cached_fused_execution():
+    dag, nodes, ops, out = buildChain(ColumnCountingOp)
+    f = nodes[0].operation.getOptions()[0]
+    # The options of the input dummy are hashed with the frame, which is marked as shared by the
+    # first replaceColumns. Share it now, so that its fingerprint does not change between runs
+    f.replaceColumns(dict())
+
+    assert runFlow(dag, fusion=True)
+    assert [op.count for op in ops] == [1, 1]
+    assert out[0] == f
+    assert nodes[2].uid in dag.cache and nodes[1].uid not in dag.cache
+    # The result of the chain is taken from the cache
+    out[0] = None
+    assert runFlow(dag, fusion=True)
+    assert [op.count for op in ops] == [1, 1]
+    assert out[0] == f
+    # Only the result of the last node is cached, so the whole chain is executed again
+    dag.updateNodeOptions(nodes[2].uid, 2)
+    assert runFlow(dag, fusion=True)
+    assert [op.count for op in ops] == [2, 2]
+    assert out[0] == f.replaceColumns({0: f.getRawFrame().iloc[:, 0] * 2})
+    # Without fusion every node is cached. The last result cached by the fused chain is reused
+    assert runFlow(dag)
+    assert [op.count for op in ops] == [3, 2]
+    assert nodes[1].uid in dag.cache
+    # Only the updated node is executed again
+    dag.updateNodeOptions(nodes[2].uid, 3)
+    assert runFlow(dag)
+    assert [op.count for op in ops] == [3, 3]
+    assert out[0] == f.replaceColumns({0: f.getRawFrame().iloc[:, 0] * 3})
+
+
+def test_cached_workbench_input():
+    work = HeadlessWorkbench()
+    f = data.Frame({'col1': [1, 2, 0.5, 4, 10], 'col2': [3, 4, 5, 6, 0]})
+    work.setDataframeByName('f', f)
+    inOp = SetInput(work)
+    inOp.setOptions('f')
+    dag, nodes, ops, out = buildChain(inOp=inOp)
+
+    assert runFlow(dag)
+    assert runFlow(dag)
+    assert [op.count for op in ops] == [1, 1]
+    assert out[0] == f
+
+    # Replacing the frame with the same name invalidates the cached results
+    g = data.Frame(f.getRawFrame() + 1)
+    work.setDataframeByName('f', g)
+    assert runFlow(dag)
+    assert [op.count for op in ops] == [2, 2]
+    assert out[0] == g
+    # The cache does not keep the replaced frame alive
+    ref = weakref.ref(f)
+    del f
+    gc.collect()
+    assert ref() is None
+
+
+def test_cache_eviction():
+    f1 = data.Frame({'col1': [1, 2, 0.5, 4, 10]})
+    f2 = data.Frame({'col1': [3, 4, 5, 6, 0]})
+    cache = ResultCache(maxBytes=f1.memoryUsage() + 1)
+
+    cache.put(1, 'a', f1)
+    cache.put(2, 'b', f2)
+    assert 1 not in cache
+    assert cache.get(2, 'b') is f2
+    assert cache.get(2, 'c') is None
+    assert cache.size == f2.memoryUsage()
+
+    cache.invalidate(2)
+    assert len(cache) == 0 and cache.size == 0
+
+    disabled = ResultCache(maxBytes=0)
+    disabled.put(1, 'a', f1)
+    assert len(disabled) == 0
+
+
+def test_cache_spill(tmp_path):
+    f1 = data.Frame({'col1': [1, 2, 0.5, 4, 10]})
+    f2 = data.Frame({'col1': [3, 4, 5, 6, 0]})
+    cache = ResultCache(maxBytes=f1.memoryUsage() + 1, spillDir=str(tmp_path))
+
+    cache.put(1, 'a', f1)
+    cache.put(2, 'b', f2)
+    assert 1 in cache and cache.size == f2.memoryUsage()
+    assert len(list(tmp_path.iterdir())) == 1
+    # Result is read from disk
+    assert cache.get(1, 'a') == f1
+
+    cache.clear()
+    assert len(list(tmp_path.iterdir())) == 0
@@ -0,0 +1,99 @@
+import numpy as np
+import pandas as pd
+from PySide2.QtCore import Qt, QCoreApplication
+
+from dataMole import data, threads
+from dataMole.gui import cellcache
+from dataMole.gui.cellcache import CellCache, TILE_ROWS, TILE_COLUMNS
+from dataMole.gui.mainmodels import FrameModel, IncrementalRenderFrameModel, SortFilterFrameModel
+
+
+def test_format_columns():
+    df = pd.DataFrame({
+        'f': [1.5, np.nan, np.inf, -0.0, 1e20],
+        'f32': np.array([0.1, 2, 3, 4, 5], dtype=np.float32),
+        'b': [True, False, True, True, False],
+        'd': pd.to_datetime(['2020-01-01', None, '2020-01-02 10:30', '2021-01-01', '1990-01-01']),
+        's': ['a', None, np.nan, 3, 'x'],
+        'c': pd.Categorical(['a', 'b', None, 'a', 'b'])
+    })
+    for j in range(df.shape[1]):
+        assert cellcache.formatColumn(df.iloc[:, j]) == [str(df.iloc[i, j]) for i in range(5)]
+    index = pd.MultiIndex.from_arrays([[1, 2], ['a', 'b']])
+    assert cellcache.formatIndex(index) == ['1  a', '2  b']
+
+
+def test_cell_cache_tiles():
+    nRows, nCols = TILE_ROWS * 3 + 5, TILE_COLUMNS + 3
+    df = pd.DataFrame(np.arange(nRows * nCols, dtype=float).reshape(nRows, nCols)).add_prefix('c')
+    calls = list()
+
+    def source():
+        calls.append(None)
+        return df
+
+    cache = CellCache(source, maxTiles=2, prefetch=False)
+    assert cache.cell(0, 0) == '0.0'
+    assert cache.cell(TILE_ROWS - 1, 1) == str(df.iloc[TILE_ROWS - 1, 1])
+    assert len(calls) == 1 and len(cache) == 1
+    assert cache.cell(nRows - 1, nCols - 1) == str(df.iloc[-1, -1])
+    assert cache.indexLabel(nRows - 1) == str(nRows - 1)
+    assert len(calls) == 3 and len(cache) == 2
+    # The least recently used tile was removed
+    assert cache.cell(1, 1) == str(df.iloc[1, 1])
+    assert len(calls) == 4
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_cell_cache_prefetch():
+    df = pd.DataFrame({'a': np.arange(TILE_ROWS * 4, dtype=float)})
+    cache = CellCache(lambda: df)
+    assert cache.cell(TILE_ROWS + 3, 0) == str(float(TILE_ROWS + 3))
+    threads.pool(threads.Priority.Interactive).waitForDone()
+    # Tiles above and below were formatted in background
+    assert len(cache) == 3
+
+
+def test_frame_model_cells():
+    df = pd.DataFrame({'a': [1.5, np.nan], 'b': ['x', None]},
+                      index=pd.MultiIndex.from_arrays([[1, 2], ['u', 'v']]))
+    model = FrameModel(None, data.Frame(df))
+    assert model.data(model.index(0, 0), Qt.DisplayRole) == '1.5'
+    assert model.data(model.index(1, 1), Qt.DisplayRole) == 'None'
+    proxy = IncrementalRenderFrameModel()
+    proxy.setSourceModel(model)
+    assert proxy.headerData(1, Qt.Vertical, Qt.DisplayRole) == '2  v'
+    model.setFrame(data.Frame(pd.DataFrame({'a': [7.0]})))
+    assert model.data(model.index(0, 0), Qt.DisplayRole) == '7.0'
+    assert proxy.headerData(0, Qt.Vertical, Qt.DisplayRole) == '0'
+
+
+def test_sort_filter_frame_model():
+    # Results are delivered in the event loop
+    app = QCoreApplication.instance() or QCoreApplication([])
+    df = pd.DataFrame({'a': [3.0, np.nan, 1.0, 2.0], 'b': ['x', 'y', 'xz', None]},
+                      index=['r0', 'r1', 'r2', 'r3'])
+    model = FrameModel(None, data.Frame(df))
+    proxy = SortFilterFrameModel()
+    proxy.setSourceModel(model)
+    proxy.setSortKeys([(0, True)])
+    threads.pool(threads.Priority.Interactive).waitForDone()
+    app.processEvents()
+    assert proxy.shownRows.tolist() == [2, 3, 0, 1]
+    assert proxy.rowCount() == 4
+    assert [proxy.data(proxy.index(i, 0), Qt.DisplayRole) for i in range(4)] == \
+           ['1.0', '2.0', '3.0', 'nan']
+    assert proxy.headerData(0, Qt.Vertical, Qt.DisplayRole) == 'r2'
+
+    proxy.setFilters([(1, 'contains', 'x')])
+    threads.pool(threads.Priority.Interactive).waitForDone()
+    app.processEvents()
+    assert proxy.shownRows.tolist() == [2, 0]
+    assert proxy.rowCount() == 2
+    assert proxy.data(proxy.index(1, 1), Qt.DisplayRole) == 'x'
+
+    proxy.sort(-1)
+    proxy.setFilters([])
+    assert proxy.shownRows is None and proxy.rowCount() == 4
+    assert proxy.data(proxy.index(0, 0), Qt.DisplayRole) == '3.0'
@@ -0,0 +1,78 @@
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dataMole import data
+from dataMole.operation import columntasks
+from dataMole.operation.typeconversions import ToTimestamp, ToNumeric
+
+
+@pytest.fixture
+def parallel():
+    columntasks.setParallelism(4)
+    yield
+    columntasks.setParallelism(None)
+
+
+def test_map_columns_order(parallel):
+    threadNames = set()
+
+    def task(k):
+        # Later keys complete first
+        time.sleep(0.01 * (5 - k))
+        threadNames.add(threading.current_thread().name)
+        return k * 2
+
+    result = columntasks.mapColumns(task, [3, 0, 4, 1, 2])
+    assert list(result.items()) == [(3, 6), (0, 0), (4, 8), (1, 2), (2, 4)]
+    assert len(threadNames) > 1 and all(n.startswith('columns') for n in threadNames)
+
+    # Small columns are processed in the calling thread
+    threadNames.clear()
+    assert columntasks.mapColumns(task, [0, 1], rows=10) == {0: 0, 1: 2}
+    assert threadNames == {threading.current_thread().name}
+
+
+def test_map_columns_errors_and_nesting(parallel):
+    def failing(k):
+        if k in (1, 3):
+            raise ValueError(str(k))
+        return k
+
+    with pytest.raises(ValueError) as e:
+        columntasks.mapColumns(failing, [0, 3, 1, 2])
+    assert str(e.value) == '3'
+
+    def nested(k):
+        # Tasks started inside a task run in the same thread
+        inner = columntasks.mapColumns(lambda j: threading.current_thread().name, range(3))
+        return set(inner.values()) == {threading.current_thread().name}
+
+    assert all(columntasks.mapColumns(nested, range(8)).values())
+
+
+def test_parallel_conversions(parallel):
+    rows = columntasks.MIN_PARALLEL_ROWS
+    dates = pd.date_range('2020-01-01', periods=rows, freq='H').strftime('%Y-%m-%d %H:%M')
+    f = data.Frame(pd.DataFrame({'c{}'.format(i): dates for i in range(6)}))
+    op = ToTimestamp()
+    op.setOptions(attributes={i: {'format': '%Y-%m-%d %H:%M'} for i in (4, 0, 2)}, errors='raise')
+    parallelResult = op.execute(f)
+    columntasks.setParallelism(1)
+    assert parallelResult == op.execute(f)
+    assert parallelResult.getRawFrame().columns.to_list() == f.getRawFrame().columns.to_list()
+    assert parallelResult.getRawFrame().iloc[:, 2].dtype.kind == 'M'
+    assert parallelResult.getRawFrame().iloc[:, 1].dtype == object
+
+    columntasks.setParallelism(3)
+    f = data.Frame(pd.DataFrame({'a': ['1', '2.5'] * rows, 'b': ['x'] * 2 * rows,
+                                 'c': np.arange(2 * rows).astype(str)}))
+    op = ToNumeric()
+    op.setOptions(attributes={2: None, 0: None, 1: None}, errors='coerce')
+    result = op.execute(f).getRawFrame()
+    assert result['a'].iloc[:2].to_list() == [1, 2.5]
+    assert result['b'].isna().all()
+    assert (result['c'].values == np.arange(2 * rows)).all()
@@ -1,9 +1,13 @@
 import copy
+import random
 
+import networkx as nx
 import pytest
 
 import dataMole.exceptions as exp
 from dataMole.flow.dag import OperationDag, OperationNode
+from dataMole.flow.runner import HeadlessWorkbench
+from dataMole.operation.input import SetInput
 from .DummyOp import *
 
 
@@ -382,3 +386,122 @@ def test_removeConnection():
     assert node1.operation.getOutputShape() == f.shape
     assert node2.operation.getOutputShape() == f.shape
     assert node2.operation.shapes[0] == f.shape
+
+
+class CountingShapeOp(DummyOp):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def getOutputShape(self) -> Union[data.Shape, None]:
+        self.calls += 1
+        return self._shapes[0]
+
+
+def test_memoized_shapes():
+    f = data.Frame({'col1': [1, 2, 3], 'col2': ['a', 'b', 'c']})
+    dag = OperationDag()
+    inOp = InputDummy()
+    inOp.setOptions(f)
+    ops = [CountingShapeOp() for _ in range(4)]
+    nodes = [OperationNode(op) for op in [inOp, *ops]]
+    for n in nodes:
+        dag.addNode(n)
+    # Chain 0 -> 1 -> 2, and node 1 with two more children
+    assert dag.addConnection(nodes[0].uid, nodes[1].uid, 0)
+    assert dag.addConnection(nodes[1].uid, nodes[2].uid, 0)
+    assert dag.addConnection(nodes[1].uid, nodes[3].uid, 0)
+    assert dag.addConnection(nodes[1].uid, nodes[4].uid, 0)
+    assert ops[0].calls == 1
+    assert all(op.calls == 0 for op in ops[1:])
+
+    # Shape is unchanged, so it is not recomputed in descendants
+    dag.updateNodeOptions(nodes[0].uid, data.Frame({'col1': [4, 5], 'col2': ['d', 'e']}))
+    assert ops[0].calls == 1
+    # Shape changed: it is computed once for the three children of node 1
+    dag.updateNodeOptions(nodes[0].uid, data.Frame({'col1': [4, 5]}))
+    assert [op.calls for op in ops] == [2, 0, 0, 0]
+    assert nodes[4].operation.shapes[0] == data.Frame({'col1': [4, 5]}).shape
+
+    dag.removeConnection(nodes[0].uid, nodes[1].uid)
+    assert nodes[1].outputShape is None
+    assert [op.calls for op in ops] == [3, 0, 0, 0]
+
+
+def test_input_shapes_not_memoized():
+    work = HeadlessWorkbench()
+    work.setDataframeByName('f', data.Frame({'col1': [1, 2, 3]}))
+    dag = OperationDag()
+    inOp = SetInput(work)
+    inOp.setOptions('f')
+    nodes = [OperationNode(op) for op in [inOp, CountingShapeOp()]]
+    for n in nodes:
+        dag.addNode(n)
+    assert nodes[0].outputShape == data.Frame({'col1': [1, 2, 3]}).shape
+
+    # The frame is replaced in the workbench, outside the flow
+    g = data.Frame({'col1': [1, 2, 3], 'col2': ['a', 'b', 'c']})
+    work.setDataframeByName('f', g)
+    assert nodes[0].outputShape == g.shape
+    assert dag.addConnection(nodes[0].uid, nodes[1].uid, 0)
+    assert nodes[1].operation.shapes[0] == g.shape
+
+
+class CountingJoinOp(CountingShapeOp):
+    @staticmethod
+    def maxInputNumber() -> int:
+        return 50
+
+
+def test_incremental_order_and_cycles():
+    rng = random.Random(0)
+    dag = OperationDag()
+    nodes = [OperationNode(CountingJoinOp()) for _ in range(40)]
+    for n in nodes:
+        dag.addNode(n)
+    reference = nx.DiGraph()
+    reference.add_nodes_from(n.uid for n in nodes)
+    for _ in range(300):
+        u, v = rng.sample(nodes, 2)
+        if reference.has_edge(u.uid, v.uid):
+            continue
+        reference.add_edge(u.uid, v.uid)
+        acyclic = nx.is_directed_acyclic_graph(reference)
+        if acyclic:
+            assert dag.addConnection(u.uid, v.uid, dag.getNxGraph().in_degree(v.uid))
+        else:
+            reference.remove_edge(u.uid, v.uid)
+            with pytest.raises(exp.DagException):
+                dag.addConnection(u.uid, v.uid, dag.getNxGraph().in_degree(v.uid))
+        order = {n: i for i, n in enumerate(dag.topologicalOrder())}
+        assert all(order[a] < order[b] for a, b in dag.getNxGraph().edges)
+    assert set(dag.getNxGraph().edges) == set(reference.edges)
+    dag.removeNode(nodes[0].uid)
+    assert len(dag.topologicalOrder()) == len(nodes) - 1
+
+
+def test_update_diamonds_once():
+    f = data.Frame({'col1': [1, 2, 3], 'col2': ['a', 'b', 'c']})
+    dag = OperationDag()
+    inOp = InputDummy()
+    inOp.setOptions(f)
+    first = OperationNode(inOp)
+    dag.addNode(first)
+    # A ladder of diamonds: every join has 2 parents which depend on the previous join
+    joins = list()
+    last = first
+    for _ in range(16):
+        left, right, join = (OperationNode(CountingJoinOp()) for _ in range(3))
+        for n in (left, right, join):
+            dag.addNode(n)
+        assert dag.addConnection(last.uid, left.uid, 0)
+        assert dag.addConnection(last.uid, right.uid, 0)
+        assert dag.addConnection(left.uid, join.uid, 0)
+        assert dag.addConnection(right.uid, join.uid, 1)
+        joins.append(join)
+        last = join
+    calls = [n.operation.calls for n in joins]
+    dag.updateNodeOptions(first.uid, data.Frame({'col1': [4, 5]}))
+    # Every join output shape is computed once. The last one is computed when needed
+    assert [n.operation.calls - c for n, c in zip(joins, calls)] == [1] * (len(joins) - 1) + [0]
+    assert joins[-1].outputShape == data.Frame({'col1': [4, 5]}).shape
@@ -250,6 +250,21 @@ def test_discretize_by_time():
     assert g.getRawFrame()['nan_disc'].dtype.ordered is True
 
 
+
+def test_discretize_by_time_any_date():
+    # Dates before 1970, midnight and times which are equal to interval bounds
+    f = data.Frame({'col': [pd.Timestamp('1850-03-01 05:59:59.999'), pd.Timestamp('2040-07-08 06:00'),
+                            pd.Timestamp('1969-12-31 23:30'), pd.NaT, pd.Timestamp('1901-01-02')]})
+    intervals = withDefaultDate([pd.Timestamp('00:00'), pd.Timestamp('06:00'), pd.Timestamp('23:59')])
+    op = DateDiscretizer()
+    op.addInputShape(f.shape, 0)
+    op.setOptions(selected={0: {'ranges': (intervals, False, True), 'labels': ['night', 'day']}},
+                  suffix=(False, None))
+    g = op.execute(f)
+    assert nan_to_None(g.to_dict()) == {'col': ['night', 'night', 'day', None, None]}
+    assert g.getRawFrame()['col'].cat.categories.to_list() == ['night', 'day']
+
+
 def test_discretize_set_options_exceptions():
     d = {'col2': [3, 4, 5.1, 6, 0],
          'col3': ['123', '2', '0.43', '4', '2021 January'],
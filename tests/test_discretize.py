@@ -2,6 +2,7 @@ from typing import List, Tuple
 
 import numpy as np
 import pytest
+import sklearn.preprocessing as skp
 
 from dataMole import data
 from dataMole import exceptions as exp
@@ -226,3 +227,49 @@ def test_discretize_range_except():
         'table': {},
         'suffix': (True, '_bins')
     }
+
+
+@pytest.mark.parametrize('strategy', [BinStrategy.Uniform, BinStrategy.Quantile])
+def test_discretize_edges_as_sklearn(strategy):
+    rng = np.random.RandomState(7)
+    d = {'col1': rng.normal(size=200), 'col2': rng.randint(0, 3, 200).astype(float),
+         'col3': np.full(200, 2.0)}
+    d['col1'][::7] = np.nan
+    f = data.Frame(d)
+    op = BinsDiscretizer()
+    op.addInputShape(f.shape, 0)
+    op.setOptions(attributes={0: {'bins': '5'}, 1: {'bins': '4'}, 2: {'bins': '3'}},
+                  strategy=strategy, suffix=(True, '_bins'))
+    g = op.execute(f).getRawFrame()
+    edges = op.fittedParameters()
+    for i, (name, k) in enumerate([('col1', 5), ('col2', 4), ('col3', 3)]):
+        values = f.getRawFrame()[name].values
+        notNa = ~np.isnan(values)
+        discretizer = skp.KBinsDiscretizer(n_bins=k, encode='ordinal', strategy=strategy.value)
+        codes = discretizer.fit_transform(values[notNa].reshape(-1, 1))[:, 0]
+        assert np.array_equal(edges[i], discretizer.bin_edges_[0])
+        result = g[name + '_bins']
+        assert result.cat.categories.to_list() == [str(float(c)) for c in range(k)]
+        assert result[~notNa].isna().all()
+        assert result[notNa].astype(str).to_list() == codes.astype(str).tolist()
+
+
+def test_discretize_approximate_quantile():
+    rng = np.random.RandomState(3)
+    f = data.Frame({'col1': rng.exponential(size=5000), 'col2': rng.normal(size=5000)})
+    op = BinsDiscretizer()
+    op.addInputShape(f.shape, 0)
+    op.setOptions(attributes={0: {'bins': '4'}}, strategy=BinStrategy.ApproximateQuantile,
+                  suffix=(False, None))
+    assert op.supportsPartialFit()
+    # Fitted on chunks
+    op.resetFit()
+    for chunk in np.array_split(np.arange(f.nRows), 7):
+        op.partialFit(data.Frame(f.getRawFrame().iloc[chunk]))
+    op.finalizeFit()
+    edges = op.fittedParameters()[0]
+    values = f.getRawFrame()['col1'].values
+    assert edges[0] == values.min() and edges[-1] == values.max()
+    assert np.allclose(edges[1:-1], np.percentile(values, [25, 50, 75]), rtol=0.05)
+    counts = op.transform(f).getRawFrame()['col1'].value_counts()
+    assert counts.size == 4 and (np.abs(counts - 1250) < 100).all()
@@ -0,0 +1,485 @@
+import importlib
+import os
+import threading
+import time
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import dataMole.exceptions as exp
+from dataMole.flow.dag import OperationDag, OperationNode
+from dataMole.flow.executor import FlowExecutor, Schedule, findInputNodes, findExecutionSet
+from dataMole.flow.fusion import findFusableChains, FusionMismatchError
+from dataMole.flow.projection import findNeededColumns, findProjections
+from dataMole.flow.runner import HeadlessWorkbench
+from dataMole.operation.dropcols import DropColumns
+from dataMole.operation.fill import FillNan
+from dataMole.operation.input import SetInput
+from dataMole.operation.onehotencoder import OneHotEncoder
+from dataMole.operation.removenan import RemoveNanRows
+from dataMole.operation.replacevalues import ReplaceValues
+from dataMole.operation.scaling import MinMaxScaler
+from dataMole.operation.typeconversions import ToNumeric
+from .DummyOp import *
+
+
+class Counter:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = 0
+        self.maxRunning = 0
+
+    def enter(self):
+        with self.lock:
+            self.running += 1
+            self.maxRunning = max(self.maxRunning, self.running)
+
+    def exit(self):
+        with self.lock:
+            self.running -= 1
+
+
+class ShapeDummyOp(DummyOp):
+    def getOutputShape(self) -> Union[data.Shape, None]:
+        return self._shapes[0]
+
+
+class SlowOp(ShapeDummyOp):
+    def __init__(self, counter: Counter, barrier: threading.Barrier = None):
+        super().__init__()
+        self.counter = counter
+        self.barrier = barrier
+
+    def execute(self, df: data.Frame) -> data.Frame:
+        self.counter.enter()
+        try:
+            if self.barrier:
+                self.barrier.wait(timeout=5)
+            else:
+                time.sleep(0.05)
+        finally:
+            self.counter.exit()
+        return df
+
+
+class NarrowSlowOp(SlowOp):
+    """ Declares an output with only the first column of its input """
+
+    def getOutputShape(self) -> Union[data.Shape, None]:
+        shape = self._shapes[0].clone()
+        shape.colNames = shape.colNames[:1]
+        shape.colTypes = shape.colTypes[:1]
+        return shape
+
+
+class FailingOp(ShapeDummyOp):
+    def execute(self, df: data.Frame) -> data.Frame:
+        raise ValueError('Failed')
+
+
+class PidOp(ShapeDummyOp):
+    """ Adds a column with the id of the process which executed the operation """
+
+    @staticmethod
+    def isProcessSafe() -> bool:
+        return True
+
+    def execute(self, df: data.Frame) -> data.Frame:
+        return data.Frame(df.getRawFrame().assign(pid=os.getpid()))
+
+
+class RowLocalOp(ShapeDummyOp):
+    """ Records the number of rows of every executed frame """
+
+    def __init__(self, fail: bool = False):
+        super().__init__()
+        self.rows = list()
+        self.fail = fail
+
+    def isRowLocal(self) -> bool:
+        return True
+
+    def execute(self, df: data.Frame) -> data.Frame:
+        self.rows.append(df.nRows)
+        if self.fail and len(self.rows) == 2:
+            raise ValueError('Failed')
+        return data.Frame(df.getRawFrame() * 2)
+
+
+class ColumnLocalOp(ShapeDummyOp):
+    """ Doubles the first column. The column-local version differs if 'mismatch' is True """
+
+    def __init__(self, mismatch: bool = False):
+        super().__init__()
+        self.mismatch = mismatch
+
+    def isColumnLocal(self) -> bool:
+        return True
+
+    def executeColumns(self, columns: data.ColumnView) -> Dict[int, Any]:
+        return {0: columns[0] * (3 if self.mismatch else 2)}
+
+    def execute(self, df: data.Frame) -> data.Frame:
+        return df.replaceColumns({0: df.getRawFrame().iloc[:, 0] * 2})
+
+
+def buildChain(f: data.Frame, *ops: GraphOperation):
+    """ Build a flow input -> ops -> output """
+    dag = OperationDag()
+    inOp = InputDummy()
+    inOp.setOptions(f)
+    out = [None]
+    outOp = OutputDummy()
+    outOp.setOptions(out)
+    nodes = [OperationNode(inOp)] + [OperationNode(op) for op in ops] + [OperationNode(outOp)]
+    for n in nodes:
+        dag.addNode(n)
+    for a, b in zip(nodes, nodes[1:]):
+        assert dag.addConnection(a.uid, b.uid, 0)
+    return dag, out
+
+
+def buildFlow(middle: List[GraphOperation]):
+    """ Build a flow input -> each op in 'middle' -> output """
+    f = data.Frame({'col1': [1, 2, 0.5, 4, 10], 'col2': [3, 4, 5, 6, 0]})
+    dag = OperationDag()
+    inOp = InputDummy()
+    inOp.setOptions(f)
+    inNode = OperationNode(inOp)
+    dag.addNode(inNode)
+    outputs = list()
+    for op in middle:
+        node = OperationNode(op)
+        outOp = OutputDummy()
+        out = [None]
+        outOp.setOptions(out)
+        outNode = OperationNode(outOp)
+        dag.addNode(node)
+        dag.addNode(outNode)
+        assert dag.addConnection(inNode.uid, node.uid, 0)
+        assert dag.addConnection(node.uid, outNode.uid, 0)
+        outputs.append(out)
+    return dag, f, outputs
+
+
+def runFlow(dag: OperationDag, executor: FlowExecutor, **callbacks) -> bool:
+    graph = dag.getNxGraph()
+    toExecute = findExecutionSet(graph, findInputNodes(graph))
+    return executor.run(graph, toExecute, **callbacks)
+
+
+def test_schedule():
+    dag = OperationDag()
+    nodes = [OperationNode(DummyOp()) for _ in range(5)]
+    for n in nodes:
+        dag.addNode(n)
+    u = [n.uid for n in nodes]
+    # 0 -> 1 -> 2 -> 3 and 0 -> 4
+    assert dag.addConnection(u[0], u[1], 0)
+    assert dag.addConnection(u[1], u[2], 0)
+    assert dag.addConnection(u[2], u[3], 0)
+    assert dag.addConnection(u[0], u[4], 0)
+
+    s = Schedule(dag.getNxGraph(), u)
+    assert s.levels == [[u[0]], [u[1], u[4]], [u[2]], [u[3]]] or \
+           s.levels == [[u[0]], [u[4], u[1]], [u[2]], [u[3]]]
+    assert s.priority[u[0]] == 4
+    assert s.priority[u[4]] == 1
+    assert s.criticalPath == [u[0], u[1], u[2], u[3]]
+    # Longest branch goes first
+    assert s.sortKey(u[1]) < s.sortKey(u[4])
+
+
+def test_execute_parallel():
+    counter = Counter()
+    barrier = threading.Barrier(3)
+    dag, f, outputs = buildFlow([SlowOp(counter, barrier) for _ in range(3)])
+
+    started = list()
+    completed = list()
+    assert runFlow(dag, FlowExecutor(maxWorkers=3), onStart=started.append,
+                   onSuccess=lambda i, r: completed.append(i))
+    # Barrier would break if the three operations did not run concurrently
+    assert not barrier.broken
+    assert counter.maxRunning == 3
+    assert len(started) == len(completed) == 7
+    assert all(out[0] == f for out in outputs)
+    # Inputs are cleared after execution
+    for nid in dag.getNxGraph().nodes:
+        assert all(i is None for i in dag[nid].inputs)
+
+
+def test_execute_bounded_workers():
+    counter = Counter()
+    dag, f, outputs = buildFlow([SlowOp(counter) for _ in range(5)])
+
+    assert runFlow(dag, FlowExecutor(maxWorkers=2))
+    assert counter.maxRunning <= 2
+    assert all(out[0] == f for out in outputs)
+
+
+def test_execute_memory_budget():
+    counter = Counter()
+    dag, f, outputs = buildFlow([SlowOp(counter) for _ in range(4)])
+
+    # Budget is smaller than a single frame, so only one node is allowed to run
+    assert runFlow(dag, FlowExecutor(maxWorkers=4, maxMemory=1))
+    assert counter.maxRunning == 1
+    assert all(out[0] == f for out in outputs)
+
+    # The input frame is counted once, and the result of every node is estimated as half of it
+    counter = Counter()
+    dag, f, outputs = buildFlow([NarrowSlowOp(counter) for _ in range(4)])
+    assert runFlow(dag, FlowExecutor(maxWorkers=4, maxMemory=2 * f.memoryUsage()))
+    assert counter.maxRunning == 2
+    assert all(out[0] == f for out in outputs)
+
+
+def test_execute_error():
+    dag, f, outputs = buildFlow([FailingOp(), DummyOp()])
+    failed = dict()
+
+    assert not runFlow(dag, FlowExecutor(maxWorkers=1),
+                       onError=lambda i, e: failed.update({i: e}))
+    assert len(failed) == 1
+    errorType, error, trace = list(failed.values())[0]
+    assert errorType is ValueError and str(error) == 'Failed' and trace
+    # Output of failed branch is never executed
+    assert outputs[0][0] is None
+    for nid in dag.getNxGraph().nodes:
+        assert all(i is None for i in dag[nid].inputs)
+
+
+def test_execute_no_input():
+    dag = OperationDag()
+    dag.addNode(OperationNode(DummyOp()))
+    graph = dag.getNxGraph()
+    with pytest.raises(exp.HandlerException):
+        findExecutionSet(graph, findInputNodes(graph))
+
+
+def test_execute_processes():
+    scaler = MinMaxScaler()
+    scaler.setOptions(attributes={0: {'range': (0, 1)}})
+    dag, f, outputs = buildFlow([PidOp(), scaler, DummyOp()])
+
+    assert runFlow(dag, FlowExecutor(maxWorkers=2, processes=True))
+    # Only safe operations run in a process
+    pid = outputs[0][0].getRawFrame()['pid']
+    assert (pid != os.getpid()).all()
+    assert outputs[0][0].getRawFrame()[['col1', 'col2']].equals(f.getRawFrame())
+    # Results and fitted parameters are sent back
+    expected = MinMaxScaler()
+    expected.setOptions(attributes={0: {'range': (0, 1)}})
+    assert outputs[1][0] == expected.execute(f)
+    assert scaler.fittedParameters() == expected.fittedParameters()
+    assert outputs[2][0] is f
+
+
+def test_execute_partitions():
+    f = data.Frame(pd.DataFrame({'a': np.arange(10.0), 'b': np.arange(10.0)[::-1]},
+                                index=np.arange(10) * 2))
+    op = RowLocalOp()
+    dag, out = buildChain(f, op)
+    completed = list()
+    assert runFlow(dag, FlowExecutor(maxWorkers=2, partitions=3, minPartitionRows=3),
+                   onSuccess=lambda i, r: completed.append(i))
+    assert sorted(op.rows) == [3, 3, 4]
+    assert len(completed) == 3
+    assert out[0] == data.Frame(f.getRawFrame() * 2)
+
+    # Too few rows to split
+    op = RowLocalOp()
+    dag, out = buildChain(f, op)
+    assert runFlow(dag, FlowExecutor(partitions=3, minPartitionRows=6))
+    assert op.rows == [10]
+
+    # Partitions of a failed node are reported once
+    op = RowLocalOp(fail=True)
+    dag, out = buildChain(f, op)
+    failed = list()
+    assert not runFlow(dag, FlowExecutor(maxWorkers=1, partitions=3, minPartitionRows=3),
+                       onError=lambda i, e: failed.append(i))
+    assert len(failed) == 1 and out[0] is None
+
+
+def test_execute_partitions_operations():
+    rng = np.random.RandomState(0)
+    values = rng.normal(size=(1000, 2))
+    values[rng.rand(1000, 2) < 0.3] = np.nan
+    df = pd.DataFrame(values, columns=['x', 'y'], index=rng.permutation(1000))
+    df['c'] = pd.Categorical(rng.choice(['p', 'q', 'r', None], size=1000),
+                             categories=['r', 'q', 'p', 's'])
+    f = data.Frame(df)
+
+    removeNan = RemoveNanRows()
+    removeNan.setOptions(percentage=None, number=0)
+    oneHot = OneHotEncoder()
+    oneHot.setOptions(attributes={2: None}, includeNan=True)
+    oneHot.addInputShape(f.shape, 0)
+    assert oneHot.isRowLocal()
+    for op in (removeNan, oneHot):
+        expected = op.execute(f)
+        for processes in (False, True):
+            dag, out = buildChain(f, op)
+            assert runFlow(dag, FlowExecutor(maxWorkers=3, processes=processes, partitions=4,
+                                             minPartitionRows=100))
+            pd.testing.assert_frame_equal(out[0].getRawFrame(), expected.getRawFrame())
+
+
+def buildColumnOps(shape: data.Shape):
+    """ Builds the operations ToNumeric -> ReplaceValues -> FillNan -> MinMaxScaler """
+    toNumeric = ToNumeric()
+    toNumeric.setOptions(attributes={0: None}, errors='coerce')
+    toNumeric.addInputShape(shape, 0)
+    replace = ReplaceValues()
+    replace.addInputShape(toNumeric.getOutputShape(), 0)
+    replace.setOptions(table={0: {'values': '2 3', 'replace': '-5'}}, inverted=False)
+    fill = FillNan()
+    fill.addInputShape(replace.getOutputShape(), 0)
+    fill.setOptions(selected={0: None, 1: None}, fillMode='mean')
+    scaler = MinMaxScaler()
+    scaler.setOptions(attributes={0: {'range': (0, 1)}, 1: {'range': (-1, 1)}})
+    return [toNumeric, replace, fill, scaler]
+
+
+def test_execute_fusion():
+    rng = np.random.RandomState(0)
+    strings = rng.choice(['1', '2', '3', '4.5', 'x', None], size=500)
+    numbers = rng.normal(size=500)
+    numbers[rng.rand(500) < 0.2] = np.nan
+    f = data.Frame(pd.DataFrame({'s': strings, 'n': numbers, 'i': np.arange(500)}))
+    # Expected result of operations executed one at a time
+    expectedOps = buildColumnOps(f.shape)
+    expected = f
+    for op in expectedOps:
+        expected = op.execute(expected)
+
+    for processes in (False, True):
+        ops = buildColumnOps(f.shape)
+        dag, out = buildChain(f, *ops)
+        graph = dag.getNxGraph()
+        completed = dict()
+        assert runFlow(dag, FlowExecutor(maxWorkers=2, processes=processes, fusion=True,
+                                         checkFusion=True),
+                       onSuccess=lambda i, r: completed.update({i: r}))
+        pd.testing.assert_frame_equal(out[0].getRawFrame(), expected.getRawFrame())
+        assert out[0] == expected
+        # Only the last node of the chain has a result
+        chain = [n for n in graph.nodes if graph.nodes[n]['op'].operation in ops]
+        assert findFusableChains(graph, set(graph.nodes)) == [chain]
+        assert [completed[n] is None for n in chain] == [True, True, True, False]
+        # Fitted parameters are set in every operation
+        for op, expectedOp in zip(ops[2:], expectedOps[2:]):
+            assert op.fittedParameters() == expectedOp.fittedParameters()
+            assert op.logMessage() == expectedOp.logMessage()
+
+    # Unfused execution
+    ops = buildColumnOps(f.shape)
+    dag, out = buildChain(f, *ops)
+    completed = dict()
+    assert runFlow(dag, FlowExecutor(), onSuccess=lambda i, r: completed.update({i: r}))
+    assert out[0] == expected
+    graph = dag.getNxGraph()
+    assert all(completed[n] is not None for n in graph.nodes if graph.nodes[n]['op'].operation in ops)
+
+
+def test_execute_fusion_chains():
+    f = data.Frame(pd.DataFrame({'s': ['1', '2', 'x'], 'n': [1, np.nan, 2]}))
+    ops = buildColumnOps(f.shape)
+    dag, out = buildChain(f, *ops)
+    graph = dag.getNxGraph()
+    u = [n for n in graph.nodes if graph.nodes[n]['op'].operation in ops]
+    # A second child of ReplaceValues splits the chain
+    branch = OperationNode(DummyOp())
+    dag.addNode(branch)
+    assert dag.addConnection(u[1], branch.uid, 0)
+    assert findFusableChains(graph, set(graph.nodes)) == [u[:2], u[2:]]
+    # Nodes which are not executed are not fused
+    assert findFusableChains(graph, set(graph.nodes) - {u[0]}) == [u[2:]]
+
+
+def test_execute_fusion_error():
+    f = data.Frame(pd.DataFrame({'s': ['1', '2', 'x'], 'n': ['1', 'y', '2']}))
+    first = ToNumeric()
+    first.setOptions(attributes={0: None}, errors='coerce')
+    second = ToNumeric()
+    second.setOptions(attributes={1: None}, errors='raise')
+    for processes in (False, True):
+        dag, out = buildChain(f, first, second, DummyOp())
+        graph = dag.getNxGraph()
+        u = [n for n in graph.nodes if graph.nodes[n]['op'].operation in (first, second)]
+        started, completed, failed = list(), list(), dict()
+        assert not runFlow(dag, FlowExecutor(processes=processes, fusion=True),
+                           onStart=started.append,
+                           onSuccess=lambda i, r: completed.append(i),
+                           onError=lambda i, e: failed.update({i: e}))
+        # The error is attributed to the operation which failed
+        assert list(failed.keys()) == [u[1]]
+        assert failed[u[1]][0] is ValueError
+        assert u[0] in completed and u[1] in started
+
+
+def test_execute_fusion_check():
+    f = data.Frame(pd.DataFrame({'a': [1.0, 2, 3], 'b': [4.0, 5, 6]}))
+    for mismatch in (False, True):
+        dag, out = buildChain(f, ColumnLocalOp(), ColumnLocalOp(mismatch))
+        failed = list()
+        assert runFlow(dag, FlowExecutor(fusion=True, checkFusion=True),
+                       onError=lambda i, e: failed.append(e[0])) is not mismatch
+        if mismatch:
+            assert failed == [FusionMismatchError]
+        else:
+            assert out[0] == f.replaceColumns({0: f.getRawFrame().iloc[:, 0] * 4})
+        # Without checks the result of the fused chain is used
+        dag, out = buildChain(f, ColumnLocalOp(), ColumnLocalOp(mismatch))
+        assert runFlow(dag, FlowExecutor(fusion=True))
+        assert out[0].getRawFrame()['a'].tolist() == [x * (6 if mismatch else 4) for x in (1, 2, 3)]
+
+
+@pytest.mark.parametrize('shareBlocks', [True, False])
+def test_execute_projection(tmp_path, monkeypatch, shareBlocks):
+    monkeypatch.setattr(importlib.import_module('dataMole.data.Frame'), 'SHARE_BLOCKS',
+                        shareBlocks)
+    path = str(tmp_path / 'f.csv')
+    df = pd.DataFrame({'a': ['1', '2', 'x', '4'], 'b': [1.5, 2, 3, 4], 'c': list('wxyz'),
+                       'd': [np.nan, 1, 2, 3]})
+    df.to_csv(path, index=False)
+    work = HeadlessWorkbench()
+    lazy = data.LazyFrame.fromCsv(path)
+    work.setDataframeByName('f', lazy)
+    expected = None
+    for projection in (True, False):
+        # Flow input -> ToNumeric -> DropColumns -> output
+        inOp = SetInput(work)
+        inOp.setOptions('f')
+        toNumeric = ToNumeric()
+        toNumeric.setOptions(attributes={0: None}, errors='coerce')
+        drop = DropColumns()
+        drop.setOptions({1: None, 2: None})
+        out = [None]
+        outOp = OutputDummy()
+        outOp.setOptions(out)
+        dag = OperationDag()
+        nodes = [OperationNode(op) for op in (inOp, toNumeric, drop, outOp)]
+        for n in nodes:
+            dag.addNode(n)
+        for a, b in zip(nodes, nodes[1:]):
+            assert dag.addConnection(a.uid, b.uid, 0)
+        graph = dag.getNxGraph()
+        toExecute = findExecutionSet(graph, findInputNodes(graph))
+        u = [n.uid for n in nodes]
+        needed = findNeededColumns(graph, toExecute)
+        assert [needed[n] for n in u] == [{0, 3}, {0, 3}, None, None]
+        assert findProjections(graph, toExecute) == {u[0]: {0, 3}}
+        assert runFlow(dag, FlowExecutor(projection=projection))
+        assert out[0].shape.colNames == ['a', 'd']
+        # Only needed columns are read
+        assert lazy.isLoaded is not projection
+        if expected is None:
+            expected = out[0]
+        else:
+            assert out[0] == expected
+        lazy.release()
@@ -167,3 +167,15 @@ def test_set_index_string():
     assert op.getOutputShape() == s
     j = op.execute(h)
     assert j.shape == s
+
+
+def test_reset_default_index():
+    d = {'index': [1, 2, 3], 'col2': ['a', 'b', 'c']}
+    f = data.Frame(d)
+
+    op = ResetIndex()
+    op.addInputShape(f.shape, 0)
+    s = op.getOutputShape()
+    g = op.execute(f)
+    assert s == g.shape
+    assert s.colNames == g.colnames == ['level_0', 'index', 'col2']
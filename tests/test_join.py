@@ -218,3 +218,18 @@ def test_join_on_cols():
 #
 #     assert h.shape.columnsDict == s
 #     assert h.shape.index == {'Unnamed': IndexType(Types.Numeric)}
+
+
+@pytest.mark.parametrize('joinType', list(jt))
+def test_join_shape_matches_execution(joinType):
+    d = {'col1': ['1', '2', '3', '4', '10'], 'col2': [3, 4, 5, 6, 0], 'col3': ['q', '2', 'c', '4', 'x']}
+    e = {'col2': ['3', '4', '5', '6', '0'], 'cowq': [1, 2, 3, 4.0, 10], 'col3': ['q', '2', 'c', 'w', 'x']}
+    f = data.Frame(d).setIndex('col1')
+    g = data.Frame(e).setIndex('col2')
+
+    for options in [('_l', '_r', True, None, None, joinType), ('_l', '_r', False, 1, 1, joinType)]:
+        op = Join()
+        op.addInputShape(f.shape, 0)
+        op.addInputShape(g.shape, 1)
+        op.setOptions(*options)
+        assert op.getOutputShape() == op.execute(f, g).shape
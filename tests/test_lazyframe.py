@@ -0,0 +1,100 @@
+import importlib
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dataMole import data
+from dataMole.flow.runner import HeadlessWorkbench
+from dataMole.operation.readwrite.csv import CsvLoader
+
+
+def writeCsv(tmp_path, n: int = 25) -> str:
+    path = str(tmp_path / 'f.csv')
+    pd.DataFrame({'col1': np.arange(n), 'col2': ['a', 'b', 'c', 'd', 'e'] * (n // 5),
+                  'col3': np.linspace(0, 1, n)}).to_csv(path, index=False)
+    return path
+
+
+def test_lazy_csv(tmp_path):
+    path = writeCsv(tmp_path)
+    calls = [0]
+    lazy = data.LazyFrame.fromCsv(path, usecols=[0, 2])
+    assert not lazy.isLoaded and lazy.memoryUsage() == 0
+    assert lazy.shape == data.Frame(pd.read_csv(path, usecols=[0, 2])).shape
+
+    f = lazy.load()
+    assert lazy.isLoaded
+    assert lazy.load() is f
+    assert f == data.Frame(pd.read_csv(path, usecols=[0, 2]))
+    assert lazy.release() == f.memoryUsage()
+    assert not lazy.isLoaded and lazy.release() == 0
+    # Data is read again
+    assert lazy.load() == f
+
+    def reader() -> data.Frame:
+        calls[0] += 1
+        return f
+
+    lazy = data.LazyFrame(reader, f.shape)
+    lazy.load()
+    lazy.load()
+    assert calls[0] == 1
+
+
+def test_lazy_chunks(tmp_path):
+    path = writeCsv(tmp_path)
+    chunks = data.LazyFrame.csvChunks(path, 10, usecols=[1, 2])
+    expected = list(pd.read_csv(path, index_col=False, usecols=[1, 2], chunksize=10))
+    assert len(chunks) == 3
+    assert not any(c.isLoaded for c in chunks)
+    for lazy, df in zip(chunks, expected):
+        assert lazy.load() == data.Frame(df)
+
+
+def test_loader_lazy(tmp_path):
+    path = writeCsv(tmp_path)
+    work = HeadlessWorkbench()
+    op = CsvLoader(work)
+    op.setOptions(path, ',', 'f', 10, {0, 1, 2}, True)
+    op.execute()
+    assert work.names == ['f_0', 'f_1', 'f_2']
+    handle = work.getDataframeModelByName('f_2')
+    assert not handle.source.isLoaded
+    assert handle.shape.colNames == ['col1', 'col2', 'col3']
+    assert handle.frame.indexValues == list(range(20, 25))
+
+
+@pytest.mark.parametrize('shareBlocks', [True, False])
+def test_lazy_columns(tmp_path, monkeypatch, shareBlocks):
+    monkeypatch.setattr(importlib.import_module('dataMole.data.Frame'), 'SHARE_BLOCKS',
+                        shareBlocks)
+    path = writeCsv(tmp_path)
+    full = pd.read_csv(path, usecols=[0, 2])
+    lazy = data.LazyFrame.fromCsv(path, usecols=[2, 0])
+    assert lazy.canLoadColumns
+    f = lazy.loadColumns([1])
+    assert not lazy.isLoaded
+    assert f.shape.colNames == ['col1', 'col3']
+    pd.testing.assert_series_equal(f.getRawFrame()['col3'], full['col3'])
+    # Columns which are not read have only missing values
+    assert f.getRawFrame()['col1'].isna().all()
+    assert lazy.memoryUsage() == full['col3'].nbytes
+    # The same columns are not read again
+    assert lazy.loadColumns({1}) is f
+    assert lazy.loadColumns([0, 1]) == data.Frame(full)
+    assert lazy.release() > 0 and lazy.memoryUsage() == 0
+    # When the frame is loaded it is always returned
+    loaded = lazy.load()
+    assert lazy.loadColumns([0]) is loaded
+
+    chunks = data.LazyFrame.csvChunks(path, 10, usecols=[0, 1])
+    expected = list(pd.read_csv(path, index_col=False, usecols=[0, 1], chunksize=10))
+    for lazy, df in zip(chunks, expected):
+        f = lazy.loadColumns([1])
+        pd.testing.assert_series_equal(f.getRawFrame()['col2'], df['col2'])
+        assert f.indexValues == df.index.tolist()
+    # Frames without a column reader are loaded entirely
+    lazy = data.LazyFrame(lambda: data.Frame(full), data.Frame(full).shape)
+    assert not lazy.canLoadColumns
+    assert lazy.loadColumns([0]) == data.Frame(full) and lazy.isLoaded
@@ -0,0 +1,141 @@
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+from dataMole import data
+from dataMole.data import memory
+from dataMole.flow.cache import ResultCache
+from dataMole.gui.mainmodels import FrameModel
+
+
+class Holder(memory.Spillable):
+    def __init__(self, size: int):
+        self.size = size
+        self.spilled = 0
+
+    def memoryUsage(self) -> int:
+        return self.size
+
+    def spill(self, directory: str, required: int) -> int:
+        freed = self.size
+        self.size = 0
+        self.spilled += 1
+        return freed
+
+
+def test_spill_least_recently_used(tmp_path):
+    manager = memory.MemoryManager(maxBytes=100, spillDir=str(tmp_path))
+    a, b, c = Holder(40), Holder(40), Holder(10)
+    manager.register(a)
+    manager.register(b)
+    manager.register(c)
+    assert len(manager) == 3 and manager.usage == 90
+    assert not a.spilled and not b.spilled and not c.spilled
+
+    # 'a' is used, so 'b' is the least recently used
+    manager.touch(a)
+    d = Holder(30)
+    manager.register(d)
+    assert b.spilled == 1 and not a.spilled and not c.spilled and not d.spilled
+    assert manager.usage == 80
+
+    # The updated object is never spilled
+    d.size = 95
+    manager.update(d)
+    assert a.spilled == 1 and c.spilled == 1 and not d.spilled
+    assert manager.usage == 95
+
+    manager.unregister(d)
+    assert d not in manager and manager.usage == 0
+    # Objects are referenced weakly
+    del a
+    assert len(manager) == 2
+
+
+def test_unbounded_manager():
+    manager = memory.MemoryManager(maxBytes=None)
+    h = Holder(10 ** 12)
+    manager.register(h)
+    assert manager.enforce() == 0 and not h.spilled
+
+
+def test_spill_frame(tmp_path):
+    df = pd.DataFrame({'col1': [1.5, np.nan, 3], 'col2': ['a', None, 'c']},
+                      index=pd.Index([3, 5, 7], name='id'))
+    lazy = memory.spillFrame(data.Frame(df), str(tmp_path))
+    assert os.path.isfile(lazy.description) and not lazy.isLoaded
+    assert lazy.shape == data.Frame(df).shape
+    assert lazy.load().getRawFrame().equals(df)
+    memory.removeSpilled(lazy.description)
+    assert not os.path.exists(lazy.description)
+
+
+def test_spill_frame_model(tmp_path):
+    manager = memory.MemoryManager(maxBytes=None, spillDir=str(tmp_path))
+    memory.manager, previous = manager, memory.manager
+    try:
+        f1 = data.Frame(pd.DataFrame({'col1': np.arange(1000), 'col2': ['text'] * 1000}))
+        f2 = data.Frame(pd.DataFrame({'col1': np.arange(1000.0)}))
+        m1 = FrameModel(None, f1)
+        m2 = FrameModel(None, f2)
+        manager.register(m1)
+        manager.register(m2)
+        assert manager.usage == m1.memoryUsage() + m2.memoryUsage() > 0
+
+        manager.maxBytes = m2.memoryUsage()
+        manager.touch(m2)
+        manager.enforce()
+        assert not m1.isLoaded and m2.isLoaded
+        assert manager.usage == m2.memoryUsage()
+        assert len(os.listdir(str(tmp_path))) == 1
+        # Spilled frame is read back when accessed, and the other is spilled
+        assert m1.frame == f1
+        assert m1.isLoaded and not m2.isLoaded
+        assert m2.frame == f2
+
+        # Spilling waits for other threads accessing the data of the model
+        manager.maxBytes = None
+        t = threading.Thread(target=m2.spill, args=(str(tmp_path), 1))
+        m2._dataAccessMutex.lock()
+        try:
+            t.start()
+            t.join(0.2)
+            assert t.is_alive() and m2.isLoaded
+        finally:
+            m2._dataAccessMutex.unlock()
+        t.join()
+        assert not m2.isLoaded
+        assert m2.frame == f2
+
+        # Setting a new frame deletes the spilled file
+        m1.setFrame(data.Frame())
+        m2.setFrame(data.Frame())
+        assert not os.listdir(str(tmp_path))
+    finally:
+        memory.manager = previous
+
+
+def test_spill_result_cache(tmp_path):
+    cache = ResultCache(maxBytes=None)
+    f = data.Frame(pd.DataFrame({'col1': np.arange(100)}))
+    cache.put(1, 'fp1', f)
+    cache.put(2, 'fp2', data.Frame(pd.DataFrame({'col1': np.arange(100)})))
+    assert cache.size > 0
+    freed = cache.spill(str(tmp_path), 1)
+    assert freed == f.memoryUsage()
+    assert cache.size == freed
+    # The least recently used result was moved to disk
+    assert len(os.listdir(str(tmp_path))) == 1
+    assert cache.get(1, 'fp1') == f
+    cache.clear()
+    assert not os.listdir(str(tmp_path))
+
+
+def test_result_cache_deep_size():
+    f = data.Frame(pd.DataFrame({'col1': ['some text'] * 100}))
+    cache = ResultCache(maxBytes=None)
+    cache.put(1, 'fp1', f)
+    # Strings are counted
+    assert cache.size == f.memoryUsage(deep=True) > f.memoryUsage()
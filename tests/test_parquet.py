@@ -0,0 +1,96 @@
+import importlib.util
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dataMole import data, exceptions as exp
+from dataMole.flow.runner import HeadlessWorkbench, readFrame, writeFrame
+from dataMole.operation.readwrite.parquet import ParquetLoader, coerceFilters, parseFilters, \
+    readColumnar, readSchema, writeColumnar
+
+needsArrow = pytest.mark.skipif(importlib.util.find_spec('pyarrow') is None,
+                                reason='pyarrow is not installed')
+
+
+def makeFrame() -> data.Frame:
+    return data.Frame({'col1': np.arange(100, dtype=float), 'col2': ['a', 'b', 'c', 'd'] * 25,
+                       'col3': pd.Categorical(['x', 'y'] * 50),
+                       'date': pd.date_range('2020-01-01', periods=100)})
+
+
+@needsArrow
+@pytest.mark.parametrize('ext', ['parquet', 'feather'])
+def test_roundtrip(tmp_path, ext):
+    f = makeFrame()
+    path = str(tmp_path / 'f.{}'.format(ext))
+    writeFrame(f, path)
+    assert readFrame(path) == f
+    assert readSchema(path).colnames == f.colnames
+
+
+@needsArrow
+@pytest.mark.parametrize('ext', ['parquet', 'feather'])
+def test_projection_and_filters(tmp_path, ext):
+    f = makeFrame()
+    path = str(tmp_path / 'f.{}'.format(ext))
+    writeColumnar(f, path, rowGroupSize=10)
+    g = readColumnar(path, columns=['col2', 'col1'],
+                     filters=parseFilters('col1 >= 20; col1 < 30; col2 == a'))
+    raw = f.getRawFrame()
+    expected = raw[(raw['col1'] >= 20) & (raw['col1'] < 30) & (raw['col2'] == 'a')]
+    assert g.colnames == ['col2', 'col1']
+    assert g.getRawFrame()['col1'].to_list() == expected['col1'].to_list()
+
+
+@needsArrow
+def test_loader(tmp_path):
+    f = makeFrame()
+    path = str(tmp_path / 'f.parquet')
+    writeColumnar(f, path)
+    work = HeadlessWorkbench()
+    op = ParquetLoader(work)
+    op.setOptions(file=path, frameName=' g ', selected={0: None, 3: None}, filters='col1 > 89')
+    op.execute()
+    g = work.getDataframeModelByName('g').frame
+    assert g.colnames == ['col1', 'date']
+    assert g.nRows == 10
+    with pytest.raises(exp.OptionValidationError):
+        op.setOptions(file=path, frameName='g', selected={0: None}, filters='col1 > x')
+
+
+@needsArrow
+@pytest.mark.parametrize('ext', ['parquet', 'feather'])
+def test_typed_filters(tmp_path, ext):
+    f = data.Frame({'n': np.arange(10, dtype=np.int64),
+                    'zip': ['02134', '10001'] * 5})
+    path = str(tmp_path / 'f.{}'.format(ext))
+    writeColumnar(f, path, rowGroupSize=4)
+    g = readColumnar(path, columns=['n'], filters=parseFilters('zip == 02134; n >= 4'))
+    assert g.getRawFrame()['n'].to_list() == [4, 6, 8]
+    g = readColumnar(path, columns=['zip'], filters=parseFilters('n < 2.5'))
+    assert g.getRawFrame()['zip'].to_list() == ['02134', '10001', '02134']
+
+
+def test_parse_filters():
+    assert parseFilters('a >= 1; b == "x" ;') == [('a', '>=', '1'), ('b', '==', 'x')]
+    assert parseFilters('') == list()
+    with pytest.raises(ValueError):
+        parseFilters('a ~ 3')
+    with pytest.raises(ValueError):
+        parseFilters('a <= ')
+
+
+def test_coerce_filters():
+    schema = pd.DataFrame({'n': np.arange(2, dtype=np.int64), 'x': [0.5, 1.0], 'zip': ['1', '2'],
+                           'b': [True, False],
+                           'date': pd.date_range('2020-01-01', periods=2)}).dtypes
+    filters = coerceFilters(parseFilters('n == 3; n < 2.5; x > 1; zip == 02134; b == True; '
+                                         'date >= 2020-01-02'), schema)
+    assert filters == [('n', '==', 3), ('n', '<', 2.5), ('x', '>', 1.0), ('zip', '==', '02134'),
+                       ('b', '==', True), ('date', '>=', pd.Timestamp('2020-01-02'))]
+    assert type(filters[0][2]) is int
+    with pytest.raises(ValueError):
+        coerceFilters(parseFilters('n == a'), schema)
+    with pytest.raises(ValueError):
+        coerceFilters(parseFilters('y == 1'), schema)
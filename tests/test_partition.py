@@ -0,0 +1,31 @@
+import numpy as np
+import pandas as pd
+
+from dataMole import data
+from dataMole.flow.partition import partitionBounds, splitRows, concatRows
+
+
+def test_partition_bounds():
+    assert partitionBounds(10, 3, 2) == [(0, 4), (4, 7), (7, 10)]
+    assert partitionBounds(10, 8, 3) == [(0, 4), (4, 7), (7, 10)]
+    assert partitionBounds(10, 4, 20) == [(0, 10)]
+    assert partitionBounds(0, 4, 1) == [(0, 0)]
+
+
+def test_split_concat_rows():
+    df = pd.DataFrame({'a': np.arange(10.0), 'b': list('abcdefghij')},
+                      index=pd.Index(np.arange(10)[::-1] * 3, name='id'))
+    f = data.Frame(df)
+    parts = splitRows(f, 3, minRows=3)
+    assert [p.nRows for p in parts] == [4, 3, 3]
+    pd.testing.assert_frame_equal(concatRows([p.getRawFrame() for p in parts]), df)
+    assert splitRows(f, 3, minRows=6) == [f]
+
+    # Categories inferred on every partition are merged
+    parts = [pd.DataFrame({'c': pd.Series(v, dtype='category'),
+                           'o': pd.Categorical(['x'] * len(v), categories=['y', 'x'], ordered=True)})
+             for v in (['b', 'a'], ['c'], ['a', None])]
+    result = concatRows(parts)
+    assert result['c'].dtype == pd.CategoricalDtype(['a', 'b', 'c'])
+    assert result['c'].tolist()[:4] == ['b', 'a', 'c', 'a'] and pd.isna(result['c'].iloc[4])
+    assert result['o'].dtype == parts[0]['o'].dtype
@@ -245,3 +245,40 @@ def test_merge_index_val():
     assert g.shape == f.shape
     assert nan_to_None(data.Frame(g.getRawFrame()['col2']).to_dict()) == \
            {'col2': ["h", "h", "5", None, None]}
+
+
+def test_merge_chained():
+    d = {'num': [1, 2, 3, None, 5], 'str': ['a', None, 'b', 'c', 'd'],
+         'cat': pd.Categorical(['a', None, 'b', 'c', 'd'], categories=['d', 'c', 'b', 'a'],
+                               ordered=True)}
+    f = data.Frame(d)
+    op = ReplaceValues()
+    op.addInputShape(f.shape, 0)
+    # Values replaced by a substitution are replaced again by the following ones
+    op.setOptions(table={
+        0: {'values': '1 2; 7 3; nan', 'replace': '7; 8; 0'},
+        1: {'values': 'a; b', 'replace': 'b; c'},
+        2: {'values': 'a; b; nan', 'replace': 'b; c; e'}
+    }, inverted=False)
+    g = op.execute(f)
+    assert nan_to_None(g.to_dict()) == {'num': [8.0, 8.0, 8.0, 0.0, 5.0],
+                                        'str': ['c', None, 'c', 'c', 'd'],
+                                        'cat': ['c', 'e', 'c', 'c', 'd']}
+    # Merged categories keep the position of the existing one, missing values are a new category
+    cat = g.getRawFrame()['cat']
+    assert cat.cat.categories.to_list() == ['d', 'c', 'e'] and cat.dtype.ordered is True
+
+
+def test_merge_inverted_chained():
+    d = {'str': ['a', None, 'b', 'c', 'd'],
+         'cat': pd.Categorical(['a', None, 'b', 'c', 'd'])}
+    f = data.Frame(d)
+    op = ReplaceValues()
+    op.addInputShape(f.shape, 0)
+    op.setOptions(table={
+        0: {'values': 'a b; a x', 'replace': 'x; y'},
+        1: {'values': 'a b; a x', 'replace': 'x; y'}
+    }, inverted=True)
+    g = op.execute(f)
+    assert nan_to_None(g.to_dict()) == {'str': ['a', 'x', 'y', 'x', 'x'],
+                                        'cat': ['a', 'x', 'y', 'x', 'x']}
@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from dataMole import data
+from dataMole.operation.computations.rowview import sortRows, filterRows, parseFilters, RowView
+
+
+def test_sort_rows_as_pandas():
+    rng = np.random.RandomState(0)
+    n = 300
+    df = pd.DataFrame({
+        'f': rng.randint(0, 5, n).astype(float),
+        's': rng.choice(['a', 'b', 'c', None], n),
+        'd': pd.to_datetime(rng.randint(0, 5, n) * 10 ** 15),
+        'c': pd.Categorical(rng.choice(['z', 'y', 'x'], n), categories=['z', 'y', 'x'])
+    })
+    df.loc[rng.rand(n) < .2, 'f'] = np.nan
+    df.loc[rng.rand(n) < .2, 'd'] = pd.NaT
+    for keys in ([(0, True)], [(0, False)], [(1, True), (0, False)], [(3, False), (2, True), (0, True)]):
+        expected = df.sort_values(by=[df.columns[c] for c, _ in keys], ascending=[a for _, a in keys],
+                                  kind='mergesort', na_position='last').index.to_numpy()
+        assert sortRows(df, keys).tolist() == expected.tolist()
+    # Subset of rows
+    rows = np.array([5, 1, 3])
+    assert sortRows(df, [(0, True)], rows).tolist() == \
+           rows[np.argsort(df['f'].to_numpy()[rows], kind='stable')].tolist()
+
+
+def test_sort_mixed_types():
+    df = pd.DataFrame({'a': ['b', 1, None, 'a']})
+    assert sortRows(df, [(0, True)]).tolist() == [1, 3, 0, 2]
+
+
+def test_filter_rows():
+    df = pd.DataFrame({'age': [1, 5, np.nan, 20.], 'name': ['ab', 'cd', None, 'xab'],
+                       'date': pd.to_datetime(['2020-01-01', '2020-02-01', None, '2021-01-01'])})
+    names = list(df.columns)
+    assert filterRows(df, parseFilters('age between 2, 30; name contains ab', names)).tolist() == [3]
+    assert filterRows(df, parseFilters('age is nan', names)).tolist() == [2]
+    assert filterRows(df, parseFilters('name not nan; age < 10', names)).tolist() == [0, 1]
+    assert filterRows(df, parseFilters('name == cd', names)).tolist() == [1]
+    assert filterRows(df, parseFilters('date >= 2020-02-01', names)).tolist() == [1, 3]
+    assert filterRows(df, list()).tolist() == [0, 1, 2, 3]
+
+
+def test_parse_filters():
+    names = ['a', 'a b', 'c']
+    assert parseFilters('a b>=3 ; a != "x y"; c between 1,2', names) == \
+           [(1, '>=', '3'), (0, '!=', 'x y'), (2, 'between', ('1', '2'))]
+    for text in ('d == 1', 'a ~ 2', 'a ==', 'c between 1'):
+        with pytest.raises(ValueError):
+            parseFilters(text, names)
+
+
+def test_row_view():
+    f = data.Frame(pd.DataFrame({'a': [3, 1, 2], 'b': ['x', 'y', 'x']}))
+    op = RowView()
+    op.setOptions(keys=[], filters=[])
+    assert op.execute(f) is None
+    op.setOptions(keys=[(0, False)], filters=[(1, '==', 'x')])
+    assert op.execute(f).tolist() == [0, 2]
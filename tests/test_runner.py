@@ -0,0 +1,141 @@
+import os
+import pickle
+import subprocess
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dataMole import data, exceptions as exp
+from dataMole.__main__ import main
+from dataMole.flow.dag import OperationDag, OperationNode
+from dataMole.flow.runner import HeadlessWorkbench, PipelineRunner, loadFlow, loadLayout, \
+    readFrame, writeFrame, CsvChunkWriter
+from dataMole.operation.dropcols import DropColumns
+from dataMole.operation.input import SetInput
+from dataMole.operation.output import ToVariableOp
+from dataMole.operation.scaling import MinMaxScaler
+
+
+def buildFlow(frame: data.Frame) -> OperationDag:
+    """ Build a flow which reads frame 'in', drops its first column and writes it to 'out' """
+    work = HeadlessWorkbench()
+    work.setDataframeByName('in', frame)
+    dag = OperationDag()
+    inOp = SetInput(work)
+    inOp.setOptions(inputF='in')
+    dropOp = DropColumns(work)
+    outOp = ToVariableOp(work)
+    outOp.setOptions('out')
+    nodes = [OperationNode(op) for op in (inOp, dropOp, outOp)]
+    for n in nodes:
+        dag.addNode(n)
+    assert dag.addConnection(nodes[0].uid, nodes[1].uid, 0)
+    assert dag.addConnection(nodes[1].uid, nodes[2].uid, 0)
+    assert dag.updateNodeOptions(nodes[1].uid, selected={0: None})
+    return dag
+
+
+def test_runner():
+    f = data.Frame({'col1': [1, 2, 0.5, 4, 10], 'col2': [3, 4, 5, 6, 0], 'col3': list('abcde')})
+    dag = buildFlow(f)
+
+    runner = PipelineRunner(dag)
+    runner.workbench.setDataframeByName('in', f)
+    runner.run(inputs=dict(), outputs=dict())
+    assert runner.workbench.getDataframeModelByName('out').frame == data.Frame(
+        f.getRawFrame()[['col2', 'col3']])
+
+
+def test_runner_missing_output():
+    f = data.Frame({'col1': [1, 2, 0.5, 4, 10], 'col2': [3, 4, 5, 6, 0]})
+    runner = PipelineRunner(buildFlow(f))
+    runner.workbench.setDataframeByName('in', f)
+    with pytest.raises(exp.HandlerException):
+        runner.run(inputs=dict(), outputs={'missing': 'file.csv'})
+
+
+def test_csv_round_trip(tmp_path):
+    f = data.Frame({'col1': [1, 2, 0.5, 4, 10], 'col2': list('abcde')})
+    path = str(tmp_path / 'f.csv')
+    writeFrame(f, path)
+    assert readFrame(path) == f
+    # Frames written in chunks are read in the same way
+    writer = CsvChunkWriter(path)
+    raw = f.getRawFrame()
+    writer(data.Frame(raw.iloc[:2]))
+    writer(data.Frame(raw.iloc[2:]))
+    assert readFrame(path) == f
+
+
+def test_cli_run(tmp_path):
+    f = data.Frame({'col1': [1, 2, 0.5, 4, 10], 'col2': [3, 4, 5, 6, 0], 'col3': list('abcde')})
+    flowPath = str(tmp_path / 'flow.pickle')
+    with open(flowPath, 'wb') as file:
+        pickle.dump(buildFlow(f).serialize(), file)
+    inPath = str(tmp_path / 'in.csv')
+    outPath = str(tmp_path / 'out.pickle')
+    f.getRawFrame().to_csv(inPath, index=False)
+
+    assert isinstance(loadFlow(flowPath), OperationDag)
+    assert main(['run', flowPath, '--input', 'in=' + inPath, '--output', 'out=' + outPath]) == 0
+    result = pd.read_pickle(outPath)
+    assert result.equals(f.getRawFrame()[['col2', 'col3']])
+
+    # Missing input frame
+    assert main(['run', flowPath, '--output', 'out=' + outPath]) != 0
+
+
+def test_cli_frozen(tmp_path):
+    train = data.Frame({'col1': [0, 5, 10], 'col2': [1, 2, 3]})
+    test = data.Frame({'col1': [20, 5, np.nan], 'col2': [4, 5, 6]})
+    work = HeadlessWorkbench()
+    work.setDataframeByName('in', train)
+    dag = OperationDag()
+    nodes = [OperationNode(op) for op in (SetInput(work), MinMaxScaler(work), ToVariableOp(work))]
+    nodes[0].operation.setOptions(inputF='in')
+    nodes[2].operation.setOptions('out')
+    for n in nodes:
+        dag.addNode(n)
+    assert dag.addConnection(nodes[0].uid, nodes[1].uid, 0)
+    assert dag.addConnection(nodes[1].uid, nodes[2].uid, 0)
+    assert dag.updateNodeOptions(nodes[1].uid, attributes={0: {'range': (0, 1)}})
+    flowPath = str(tmp_path / 'flow.pickle')
+    with open(flowPath, 'wb') as file:
+        pickle.dump(dag.serialize(), file)
+    trainPath, testPath = str(tmp_path / 'train.csv'), str(tmp_path / 'test.csv')
+    train.getRawFrame().to_csv(trainPath, index=False)
+    test.getRawFrame().to_csv(testPath, index=False)
+    fittedPath = str(tmp_path / 'fitted.pickle')
+    outPath = str(tmp_path / 'out.pickle')
+
+    # Fit on train data and save fitted parameters
+    assert main(['run', flowPath, '-i', 'in=' + trainPath, '-o', 'out=' + outPath,
+                 '--save', fittedPath]) == 0
+    fitted = loadFlow(fittedPath)
+    assert fitted[nodes[1].uid].operation.fittedParameters() == {0: (0.1, 0.0)}
+    assert loadLayout(fittedPath) == {n.uid: (0.0, 0.0) for n in nodes}
+
+    # Frozen flow uses the range of train data
+    assert main(['run', fittedPath, '-i', 'in=' + testPath, '-o', 'out=' + outPath,
+                 '--frozen']) == 0
+    result = pd.read_pickle(outPath)
+    assert np.allclose(result['col1'].values, [2, 0.5, np.nan], equal_nan=True)
+    # Not frozen flow is fitted again
+    assert main(['run', fittedPath, '-i', 'in=' + testPath, '-o', 'out=' + outPath]) == 0
+    result = pd.read_pickle(outPath)
+    assert np.allclose(result['col1'].values, [1, 0, np.nan], equal_nan=True)
+
+
+def test_runner_without_widgets():
+    # Run in a new interpreter, since other tests import the whole interface
+    code = 'import sys, dataMole.flow.runner, dataMole.__main__; ' \
+           'print(*(m for m in sys.modules if m.startswith("PySide2.Qt")))'
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run([sys.executable, '-c', code], cwd=root, check=True,
+                            stdout=subprocess.PIPE, universal_newlines=True)
+    modules = result.stdout.split()
+    assert 'PySide2.QtWidgets' not in modules
+    assert 'PySide2.QtCharts' not in modules
+    assert 'PySide2.QtGui' not in modules
@@ -227,3 +227,31 @@ def test_standardScale_1_attr_all_nan():
     }
     assert nan_to_None(roundValues(g.to_dict(), 4)) == nan_to_None(roundValues(expected, 4))
     assert g.shape == s
+
+
+def test_scalers_finalize_without_data():
+    f = data.Frame({'col1': [1.0, -1.1, 3.0], 'col2': [2.0, 0.5, 1.0]})
+    minMax = MinMaxScaler()
+    minMax.setOptions(attributes={1: {'range': (0, 1)}})
+    standard = StandardScaler()
+    standard.setOptions(attributes={1: None})
+    for op in (minMax, standard):
+        # Nothing was fitted and there is no input shape
+        op.resetFit()
+        op.finalizeFit()
+        assert '|   1    |' in op._logExecutionString
+        # Names are taken from the input shape
+        op.addInputShape(f.shape, 0)
+        op.finalizeFit()
+        assert 'col2' in op._logExecutionString
+        op.execute(f)
+        # Fitted parameters loaded in a new frozen operation are used without fitting
+        other = type(op)()
+        other.setOptions(**op.getOptions())
+        other.addInputShape(f.shape, 0)
+        other.setFittedParameters(op.fittedParameters())
+        other.setFrozen(True)
+        assert other.execute(f) == op.execute(f)
+        assert 'col2' in other.logOptions()
+        other.finalizeFit()
+        assert 'col2' in other._logExecutionString
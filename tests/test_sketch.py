@@ -0,0 +1,36 @@
+import numpy as np
+
+from dataMole.operation.computations.sketch import QuantileSketch
+
+
+def rankError(values: np.ndarray, quantiles: np.ndarray, q: np.ndarray) -> float:
+    return np.abs(np.searchsorted(np.sort(values), quantiles) / values.size - q).max()
+
+
+def test_sketch_quantiles():
+    rng = np.random.RandomState(0)
+    values = rng.lognormal(size=200000)
+    values[::10] = np.nan
+    sketch = QuantileSketch()
+    sketch.update(values)
+    valid = values[~np.isnan(values)]
+    assert sketch.count == valid.size
+    q = np.linspace(0, 1, 21)
+    result = sketch.quantiles(q)
+    assert result[0] == valid.min() and result[-1] == valid.max()
+    assert rankError(valid, result, q) < 0.02
+
+
+def test_sketch_merge():
+    rng = np.random.RandomState(1)
+    values = rng.normal(size=100000)
+    sketch = QuantileSketch()
+    for chunk in np.array_split(values, 13):
+        part = QuantileSketch()
+        part.update(chunk)
+        sketch.merge(part)
+    assert sketch.count == values.size
+    q = np.linspace(0, 1, 11)
+    assert rankError(values, sketch.quantiles(q), q) < 0.02
+    assert sketch.quantiles([0.5]).shape == (1,)
+    assert np.isnan(QuantileSketch().quantiles([0.5])).all()
@@ -0,0 +1,181 @@
+import numpy as np
+import pandas as pd
+from PySide2.QtCore import Qt
+
+from dataMole import data, threads
+from dataMole.data.types import Types
+from dataMole.gui.mainmodels import FrameModel
+from dataMole.operation.computations import statistics
+from dataMole.operation.computations.statistics import frameStatistics, nanQuantiles, \
+    FrameStatistics, AttributeStatistics, SortedColumn, SortAttribute, Hist
+
+
+def test_nan_quantiles():
+    rng = np.random.RandomState(0)
+    block = rng.normal(size=(1001, 4))
+    block[::7, 1] = np.nan
+    block[:, 3] = np.nan
+    q = np.array([0, 0.1, 0.25, 0.5, 0.9, 1])
+    result = nanQuantiles(block, q)
+    for j in range(3):
+        assert np.allclose(result[:, j], np.nanpercentile(block[:, j], q * 100))
+    assert np.isnan(result[:, 3]).all()
+
+
+def test_frame_statistics():
+    df = pd.DataFrame({
+        'num': [1.5, np.nan, 3, -2, 10, np.nan],
+        'int': [1, 2, 3, 4, 5, 6],
+        'cat': pd.Categorical(['a', 'b', 'b', None, 'c', 'b'], categories=['c', 'a', 'b', 'd']),
+        'str': ['x', 'y', 'x', None, 'x', 'y'],
+        'date': pd.to_datetime(['2020-01-02', None, '2019-05-01', '2020-01-02', None, '2021-03-04'])
+    })
+    stats = frameStatistics(df)
+    assert list(stats.keys()) == [0, 1, 2, 3, 4]
+    for c in (0, 1):
+        desc = df.iloc[:, c].describe()
+        s = stats[c]
+        assert s['Min'] == desc['min'] and s['Max'] == desc['max']
+        assert s['Centile 25%'] == desc['25%'] and s['Centile 50%'] == desc['50%'] and \
+               s['Centile 75%'] == desc['75%']
+        assert s['Mean'] == '{:.3f}'.format(desc['mean'])
+        assert s['Std'] == '{:.3f}'.format(desc['std'])
+    assert stats[0]['Nan count'] == '2 (33.33%)'
+    assert stats[1]['Nan count'] == '0 (0.00%)'
+    assert stats[2] == {'Unique': 3, 'Most frequent': 'b (n=3)', 'Nan count': '1 (16.67%)'}
+    assert stats[3] == {'Unique': 2, 'Most frequent': 'x (n=3)', 'Nan count': '1 (16.67%)'}
+    assert stats[4]['Unique'] == 3
+    assert stats[4]['First'] == pd.Timestamp('2019-05-01')
+    assert stats[4]['Last'] == pd.Timestamp('2021-03-04')
+    assert stats[4]['Nan count'] == '2 (33.33%)'
+
+    # Subset of columns and more frequent values
+    stats = frameStatistics(df, columns=[3, 0], topK=2)
+    assert list(stats.keys()) == [3, 0]
+    assert stats[3]['Most frequent'] == 'x (n=3), y (n=2)'
+
+
+def test_frame_statistics_batches(monkeypatch):
+    rng = np.random.RandomState(1)
+    block = rng.normal(size=(200, 7))
+    block[rng.rand(200, 7) < 0.1] = np.nan
+    block[:, 4] = np.nan
+    df = pd.DataFrame(block)
+    df[7] = rng.choice(['a', 'b'], size=200)
+    # Statistics as a frame, where nan values are equal
+    expected = pd.DataFrame(frameStatistics(df))
+    assert expected[6]['Centile 50%'] == np.nanmedian(block[:, 6])
+    # Numeric columns described in batches of 2 and 1 columns
+    for batchBytes in (2 * 8 * 200, 1):
+        monkeypatch.setattr(statistics, 'BATCH_BYTES', batchBytes)
+        assert pd.DataFrame(frameStatistics(df)).equals(expected)
+    # The input is not modified
+    np.testing.assert_array_equal(df.iloc[:, :7].to_numpy(), block)
+
+
+def test_frame_statistics_operation():
+    f = data.Frame(pd.DataFrame({'a': [1, 2, np.nan], 'b': ['x', None, 'x']}))
+    op = FrameStatistics()
+    stats = op.execute(f)
+    assert set(stats.keys()) == {0, 1}
+    single = AttributeStatistics()
+    for c in (0, 1):
+        single.setOptions(attribute=c)
+        assert single.execute(f) == stats[c]
+
+
+def test_frame_model_version():
+    f = data.Frame(pd.DataFrame({'a': [1, 2, np.nan]}))
+    model = FrameModel(None, f)
+    version = model.version
+    model._statistics = {0: {'Unique': 2}}
+    model.setFrame(data.Frame(pd.DataFrame({'a': [3, 4]})))
+    assert model.version == version + 1
+    assert not model.statistics
+    # Results computed on the previous frame are discarded
+    model.onWorkerSuccess((version, None, 'all'), {0: {'Unique': 2}})
+    assert not model.statistics
+    model.onWorkerSuccess((model.version, None, 'all'), {0: {'Unique': 1}})
+    assert model.statistics == {0: {'Unique': 1}}
+
+
+def test_sorted_column_histogram():
+    col = pd.Series([1.5, np.nan, 3, -2, 10, np.nan, 3, 4.25])
+    sortedColumn = SortedColumn(col)
+    assert sortedColumn.values.tolist() == [-2, 1.5, 3, 3, 4.25, 10]
+    for bins in (1, 2, 3, 7, 20):
+        cuts = pd.cut(col, bins=bins, duplicates='drop').value_counts(sort=False)
+        expected = {'{:.2f}'.format(i.left): n for i, n in cuts.items()}
+        assert sortedColumn.histogram(bins) == expected
+
+    dates = pd.Series(pd.to_datetime(['2020-01-02', None, '2019-05-01 10:30', '2021-03-04']))
+    sortedColumn = SortedColumn(dates)
+    assert sortedColumn.isDatetime
+    cuts = pd.cut(dates, bins=4).value_counts(sort=False)
+    assert sortedColumn.histogram(4) == {i.left.strftime('%Y-%m-%d %H:%M'): n
+                                         for i, n in cuts.items()}
+    assert SortedColumn(pd.Series([np.nan, np.nan])).histogram(5) == dict()
+
+
+def test_frame_model_histogram():
+    f = data.Frame(pd.DataFrame({'a': [1, 2, np.nan, 4]}))
+    model = FrameModel(None, f)
+    model.computeHistogram(0, 2)
+    model.computeHistogram(0, 3)
+    threads.pool(threads.Priority.Interactive).waitForDone()
+    # The histogram is computed with the bins requested last while sorting
+    assert model.histogram[0] == {'1.00': 2, '2.00': 0, '3.00': 1}
+    assert 0 in model._sortedColumns
+    # Now it is computed immediately
+    computed = list()
+    model.statisticsComputed.connect(computed.append)
+    model.computeHistogram(0, 1)
+    assert model.histogram[0] == {'1.00': 3}
+    assert computed == [(0, Types.Numeric, 'hist')]
+    # A second worker sorting the same attribute delivers its result later
+    computed.clear()
+    model.onWorkerSuccess((0, model.version, 'sort'), model._sortedColumns[0])
+    assert model.histogram[0] == {'1.00': 3}
+    assert computed == list()
+    model.setFrame(f)
+    assert not model._sortedColumns and not model.histogram
+    assert model.memoryUsage() == f.memoryUsage(deep=True)
+
+
+class CancelledTask:
+    """ Cancels its worker, then executes an operation """
+
+    def __init__(self, operation, frame: data.Frame):
+        self.operation = operation
+        self.frame = frame
+        self.worker = None
+        self.stopped = False
+
+    def execute(self):
+        self.worker.cancel()
+        try:
+            return self.operation.execute(self.frame)
+        except threads.Cancelled:
+            self.stopped = True
+            raise
+
+
+def test_cancelled_sort():
+    f = data.Frame(pd.DataFrame({'a': [3, 1, np.nan, 2], 'b': ['x', 'y', 'x', None]}))
+    sort = SortAttribute()
+    sort.setOptions(attribute=0)
+    numericHist, stringHist = Hist(), Hist()
+    numericHist.setOptions(0, Types.Numeric, 2)
+    stringHist.setOptions(1, Types.String)
+    for op in (sort, numericHist, stringHist):
+        # Not cancelled outside workers
+        assert op.execute(f)
+        task = CancelledTask(op, f)
+        results, finished = list(), list()
+        task.worker = threads.Worker(task, identifier='w')
+        task.worker.setAutoDelete(False)
+        task.worker.signals.result.connect(lambda i, r: results.append(r), Qt.DirectConnection)
+        task.worker.signals.finished.connect(finished.append, Qt.DirectConnection)
+        task.worker.run()
+        assert task.stopped
+        assert not results and finished == ['w']
@@ -0,0 +1,127 @@
+import numpy as np
+import pandas as pd
+
+from dataMole import data
+from dataMole.flow.dag import OperationDag, OperationNode
+from dataMole.flow.runner import HeadlessWorkbench, PipelineRunner
+from dataMole.flow.streaming import StreamPlan
+from dataMole.operation.discretize import BinsDiscretizer, BinStrategy
+from dataMole.operation.fill import FillNan
+from dataMole.operation.input import SetInput
+from dataMole.operation.output import ToVariableOp
+from dataMole.operation.rename import RenameColumns
+from dataMole.operation.scaling import MinMaxScaler, StandardScaler
+
+
+def makeFrame(n: int = 50) -> data.Frame:
+    rng = np.random.RandomState(7)
+    col1 = rng.rand(n) * 100
+    col2 = rng.randn(n)
+    col2[::7] = np.nan
+    return data.Frame({'col1': col1, 'col2': col2, 'col3': rng.choice(list('abc'), n)})
+
+
+def buildFlow(frame: data.Frame, ops, options) -> OperationDag:
+    """ Build a chain from frame 'in' to frame 'out' with the given operations """
+    work = HeadlessWorkbench()
+    work.setDataframeByName('in', frame)
+    dag = OperationDag()
+    inOp = SetInput(work)
+    inOp.setOptions(inputF='in')
+    outOp = ToVariableOp(work)
+    outOp.setOptions('out')
+    nodes = [OperationNode(op) for op in (inOp, *ops, outOp)]
+    for n in nodes:
+        dag.addNode(n)
+    for i, (a, b) in enumerate(zip(nodes[:-1], nodes[1:])):
+        assert dag.addConnection(a.uid, b.uid, 0)
+        if i < len(options):
+            assert dag.updateNodeOptions(b.uid, **options[i])
+    return dag
+
+
+def runBoth(frame: data.Frame, tmp_path, makeOps, options, chunksize: int = 7):
+    """ Runs the same flow in normal and streaming mode and returns both results """
+    inPath = str(tmp_path / 'in.csv')
+    frame.getRawFrame().to_csv(inPath, index=False)
+    expected = PipelineRunner(buildFlow(frame, makeOps(), options))
+    expected.run(inputs={'in': inPath}, outputs=dict())
+    streamed = PipelineRunner(buildFlow(frame, makeOps(), options))
+    streamed.run(inputs={'in': inPath}, outputs=dict(), chunksize=chunksize)
+    return expected.workbench.getDataframeModelByName('out').frame.getRawFrame(), \
+           streamed.workbench.getDataframeModelByName('out').frame.getRawFrame()
+
+
+def test_stateful_chain(tmp_path):
+    f = makeFrame()
+    options = [
+        {'attributes': {0: {'range': (-1, 1)}}},
+        {'attributes': {1: None}},
+        {'selected': {1: None}, 'fillMode': 'mean'},
+        {'attributes': {0: {'bins': '4'}}, 'strategy': BinStrategy.Uniform,
+         'suffix': (True, '_bins')}
+    ]
+    expected, result = runBoth(f, tmp_path, lambda: [MinMaxScaler(), StandardScaler(), FillNan(),
+                                                     BinsDiscretizer()], options)
+    assert result.columns.equals(expected.columns)
+    assert np.allclose(result.iloc[:, :2].values, expected.iloc[:, :2].values)
+    assert result['col1_bins'].equals(expected['col1_bins'])
+    assert result['col3'].equals(expected['col3'])
+
+
+def test_plan(tmp_path):
+    f = makeFrame()
+    ops = [RenameColumns(), MinMaxScaler(), StandardScaler(), BinsDiscretizer()]
+    dag = buildFlow(f, ops, [
+        {'names': {2: 'col3r'}},
+        {'attributes': {0: {'range': (0, 1)}}},
+        {'attributes': {1: None}},
+        {'attributes': {0: {'bins': '3'}}, 'strategy': BinStrategy.Quantile,
+         'suffix': (False, None)}
+    ])
+    g = dag.getNxGraph()
+    uids = list(g.nodes)
+    plan = StreamPlan(g, set(uids), [uids[0]], [uids[-1]])
+    # Quantile bins need the whole frame
+    assert plan.order == uids[:4]
+    assert plan.fitPass == {uids[2]: 0, uids[3]: 1}
+    assert plan.passes == 2
+    assert plan.materialized == {uids[3]}
+
+    inPath = str(tmp_path / 'in.csv')
+    f.getRawFrame().to_csv(inPath, index=False)
+    runner = PipelineRunner(dag)
+    runner.run(inputs={'in': inPath}, outputs=dict(), chunksize=10)
+    result = runner.workbench.getDataframeModelByName('out').frame.getRawFrame()
+    assert result.columns.to_list() == ['col1', 'col2', 'col3r']
+    assert result.shape[0] == f.nRows
+
+
+def test_csv_sink(tmp_path):
+    f = makeFrame()
+    inPath = str(tmp_path / 'in.csv')
+    outPath = str(tmp_path / 'out.csv')
+    f.getRawFrame().to_csv(inPath, index=False)
+    runner = PipelineRunner(buildFlow(f, [RenameColumns()], [{'names': {0: 'c1'}}]))
+    runner.run(inputs={'in': inPath}, outputs={'out': outPath}, chunksize=8)
+    # Output is never materialized
+    assert 'out' not in runner.workbench.names
+    result = pd.read_csv(outPath)
+    expected = f.getRawFrame().rename(columns={'col1': 'c1'})
+    assert result.columns.to_list() == expected.columns.to_list()
+    assert np.allclose(result['c1'].values, expected['c1'].values)
+    assert result['col3'].equals(expected['col3'])
+
+
+def test_partial_fit_matches_execute():
+    f = makeFrame(30)
+    op = BinsDiscretizer()
+    op.addInputShape(f.shape, 0)
+    op.setOptions(attributes={0: {'bins': '5'}, 1: {'bins': '3'}}, strategy=BinStrategy.Uniform,
+                  suffix=(False, None))
+    raw = f.getRawFrame()
+    op.resetFit()
+    for i in range(0, 30, 9):
+        op.partialFit(data.Frame(raw.iloc[i:i + 9]))
+    op.finalizeFit()
+    assert op.transform(f) == op.execute(f)
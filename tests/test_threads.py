@@ -0,0 +1,70 @@
+import threading
+
+from PySide2.QtCore import Qt
+
+from dataMole import threads
+
+
+class Blocking:
+    """ Waits until it is released, and returns its value """
+
+    def __init__(self, value):
+        self.value = value
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.cancelled = False
+
+    def execute(self):
+        self.started.set()
+        self.release.wait(5)
+        self.cancelled = threads.cancellationRequested()
+        return self.value
+
+
+def makeWorker(executable, identifier, results, finished):
+    worker = threads.Worker(executable, identifier=identifier)
+    worker.signals.result.connect(lambda i, r: results.append((i, r)), Qt.DirectConnection)
+    worker.signals.finished.connect(lambda i: finished.append(i), Qt.DirectConnection)
+    return worker
+
+
+def test_cancel_worker_before_start():
+    results, finished = list(), list()
+    task = Blocking(1)
+    task.release.set()
+    worker = makeWorker(task, 'a', results, finished)
+    worker.cancel()
+    worker.setAutoDelete(False)
+    worker.run()
+    assert not task.started.is_set()
+    assert not results and finished == ['a']
+
+
+def test_scheduler_latest_request_wins():
+    scheduler = threads.RequestScheduler(threads.Priority.Interactive)
+    results, finished = list(), list()
+    first, second, other = Blocking(1), Blocking(2), Blocking(3)
+    assert scheduler.submit('k', makeWorker(first, 'first', results, finished))
+    assert first.started.wait(5)
+    # The same request is coalesced
+    assert not scheduler.submit('k', makeWorker(Blocking(0), 'first', results, finished))
+    assert scheduler.isPending('first')
+    # A new request cancels the running one
+    assert scheduler.submit('k', makeWorker(second, 'second', results, finished))
+    assert not scheduler.isPending('first') and scheduler.isPending('second')
+    # Requests with other keys are independent
+    assert scheduler.submit('j', makeWorker(other, 'other', results, finished))
+    for task in (first, second, other):
+        task.release.set()
+    threads.pool(threads.Priority.Interactive).waitForDone()
+    assert first.cancelled and not second.cancelled
+    assert sorted(results) == [('other', 3), ('second', 2)]
+    assert sorted(finished) == ['first', 'other', 'second']
+    assert not scheduler.isPending('second')
+
+    last = Blocking(4)
+    scheduler.submit('k', makeWorker(last, 'last', results, finished))
+    scheduler.cancelAll()
+    last.release.set()
+    threads.pool(threads.Priority.Interactive).waitForDone()
+    assert ('last', 4) not in results
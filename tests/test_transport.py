@@ -0,0 +1,65 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dataMole import data
+from dataMole.flow import transport
+from dataMole.flow.transport import SharedFrame
+
+pytestmark = pytest.mark.skipif(transport.shared_memory is None,
+                                reason='Shared memory is not supported')
+
+
+def test_shared_frame_roundtrip():
+    df = pd.DataFrame({
+        'num': [1.5, np.nan, 3, -2],
+        'bool': [True, False, True, True],
+        'cat': pd.Categorical(['a', None, 'b', 'a'], categories=['b', 'a'], ordered=True),
+        'str': ['x', None, 'y', 'x'],
+        'date': pd.to_datetime(['2020-01-02', None, '2019-05-01', '2021-03-04']),
+        'tz': pd.to_datetime(['2020-01-02 10:00', '2020-01-03', None, '2020-01-04']).tz_localize(
+            'Europe/Rome'),
+    }, index=pd.Index([10, 5, 3, 1], name='id'))
+    df.columns = ['num', 'bool', 'cat', 'str', 'date', 'num']
+    shared = SharedFrame(data.Frame(df))
+    try:
+        assert shared.nbytes > 0
+        # Only the description of the frame is pickled
+        received: SharedFrame = pickle.loads(pickle.dumps(shared))
+        assert received.nbytes == 0
+        assert len(pickle.dumps(shared)) < shared.nbytes + 2048
+        pd.testing.assert_frame_equal(received.load().getRawFrame(), df)
+        pd.testing.assert_frame_equal(shared.load().getRawFrame(), df)
+    finally:
+        shared.release()
+    with pytest.raises(FileNotFoundError):
+        received.load()
+    # Releasing twice is allowed
+    received.release()
+
+
+def test_shared_frame_special():
+    # Frame without rows
+    f = data.Frame(pd.DataFrame({'a': pd.Series([], dtype=float), 'b': pd.Series([], dtype=object)}))
+    shared = SharedFrame(f)
+    assert shared.load() == f
+    shared.release()
+    # Frame without buffers and with a multi-index
+    df = pd.DataFrame({'a': ['x', 'y'], 'b': ['z', 'w'], 'c': ['1', '2']}).set_index(['a', 'b'])
+    shared = SharedFrame(data.Frame(df))
+    assert shared.nbytes == 0
+    pd.testing.assert_frame_equal(pickle.loads(pickle.dumps(shared)).load().getRawFrame(), df)
+    shared.release()
+
+
+def test_share_values():
+    f = data.Frame({'a': [1, 2, 3]})
+    shared = transport.share(f)
+    assert isinstance(shared, SharedFrame)
+    assert transport.receive(shared) == f
+    transport.release(shared)
+    # Other values are not changed
+    assert transport.share(4) == 4 and transport.receive(4) == 4
+    transport.release(4)
@@ -1,10 +1,12 @@
+import pickle
+
 import numpy as np
 import pandas as pd
 import pytest
 
 from dataMole import exceptions as exp
 from dataMole.data import Frame
-from dataMole.data.types import Types
+from dataMole.data.types import Types, IndexType, ALL_TYPES
 from dataMole.operation.typeconversions import ToNumeric, ToCategorical, ToTimestamp, \
     ToString
 from tests.utilities import nan_to_None, roundValues, isDictDeepCopy
@@ -517,3 +519,10 @@ def test_toString():
 
     g = op.execute(f)
     assert op.getOutputShape() == g.shape
+
+
+def test_pickle_types():
+    for t in ALL_TYPES:
+        assert pickle.loads(pickle.dumps(t)) is t
+    indexType = pickle.loads(pickle.dumps(IndexType(Types.Ordinal)))
+    assert isinstance(indexType, IndexType) and indexType.type is Types.Ordinal